@@ -1,7 +1,11 @@
 """Build Environment used for isolation during sdist building
 """
 
+import collections
 import contextlib
+import functools
+import hashlib
+import json
 import logging
 import os
 import pathlib
@@ -11,19 +15,50 @@ import zipfile
 from collections import OrderedDict
 from sysconfig import get_paths
 from types import TracebackType
-from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Set, Tuple, Type
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 from pip._vendor.certifi import where
-from pip._vendor.pkg_resources import Requirement, VersionConflict, WorkingSet
+from pip._vendor.packaging.specifiers import SpecifierSet
+from pip._vendor.packaging.utils import canonicalize_name
+from pip._vendor.packaging.version import parse as parse_version
+from pip._vendor.pkg_resources import (
+    Requirement,
+    UnknownExtra,
+    VersionConflict,
+    WorkingSet,
+)
 
 from pip import __file__ as pip_location
 from pip._internal.cli.spinners import open_spinner
+from pip._internal.exceptions import InstallationError
 from pip._internal.locations import get_platlib, get_prefixed_libs, get_purelib
-from pip._internal.utils.subprocess import call_subprocess
+from pip._internal.utils.logging import indent_log
+from pip._internal.utils.subprocess import (
+    call_subprocess,
+    runner_with_spinner_message,
+    thread_environ,
+)
 from pip._internal.utils.temp_dir import TempDirectory, tempdir_kinds
 
 if TYPE_CHECKING:
+    from pip._internal.cache import BuildEnvironmentStore, WheelCache
     from pip._internal.index.package_finder import PackageFinder
+    from pip._internal.network.session import PipSession
+    from pip._internal.operations.build.backend_workers import BackendWorkerPool
+    from pip._internal.req.req_install import InstallRequirement
+    from pip._internal.req.req_tracker import RequirementTracker
 
 logger = logging.getLogger(__name__)
 
@@ -64,36 +99,166 @@ def _create_standalone_pip() -> Iterator[str]:
         yield os.path.join(pip_zip, "pip")
 
 
+def _get_finder_for_running_python(finder):
+    # type: (PackageFinder) -> PackageFinder
+    """The finder to install build requirements with, which finds them for
+    the running interpreter that runs the builds, even when the command
+    targets another one (e.g. ``pip download --platform``).
+    """
+    from pip._internal.models.target_python import TargetPython
+
+    if finder.target_python.format_given():
+        return finder.for_target_python(TargetPython())
+    return finder
+
+
+def _get_prefix_key(finder, requirements):
+    # type: (PackageFinder, Iterable[str]) -> Optional[str]
+    """A key of what installing the requirements into a prefix installs: the
+    interpreter, the options of the finder, and the candidate each
+    requirement resolves to, so that a new release of one is installed.
+
+    The dependencies of the requirements are not part of the key, see
+    _is_prefix_current().
+
+    Returns None if that cannot be determined, e.g. for direct URLs.
+    """
+    requirements = sorted(requirements)
+    candidates = []  # type: List[str]
+    for requirement in requirements:
+        try:
+            req = Requirement.parse(requirement)
+        except ValueError:
+            return None
+        if req.marker is not None and not req.marker.evaluate({"extra": ""}):
+            continue
+        if req.url:
+            return None
+        result = finder.find_best_candidate(req.name, req.specifier)
+        best = result.best_candidate
+        if best is None:
+            return None
+        candidates.append(
+            f"{best.name}=={best.version} {best.link.url_without_fragment}"
+        )
+
+    key = {
+        # Entries hold generations of prefixes, see BuildEnvironmentStore.
+        "layout": 2,
+        "python": [sys.executable, sys.version],
+        "index_urls": finder.index_urls,
+        "find_links": finder.find_links,
+        "no_binary": sorted(finder.format_control.no_binary),
+        "only_binary": sorted(finder.format_control.only_binary),
+        "pre": finder.allow_all_prereleases,
+        "prefer_binary": finder.prefer_binary,
+        "requirements": requirements,
+        "candidates": sorted(candidates),
+    }
+    data = json.dumps(key, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _is_prefix_current(finder, requirements, lib_dirs):
+    # type: (PackageFinder, Iterable[str], List[str]) -> bool
+    """Whether installing the requirements again would install the same
+    distributions as those in lib_dirs, as far as the finder can tell.
+
+    This looks up the best candidate of each installed distribution, for
+    what the requirements and the other installed distributions require of
+    it, so that a new release of a dependency of a build requirement (e.g.
+    packaging under setuptools_scm) is installed too.
+    """
+    dists = {
+        canonicalize_name(dist.project_name): dist
+        for dist in WorkingSet(lib_dirs)
+    }
+    reqs = []  # type: List[Requirement]
+    for requirement in requirements:
+        req = Requirement.parse(requirement)
+        if req.marker is None or req.marker.evaluate({"extra": ""}):
+            reqs.append(req)
+    extras = collections.defaultdict(set)  # type: Dict[str, Set[str]]
+    for req in reqs:
+        extras[canonicalize_name(req.project_name)].update(req.extras)
+    for name, dist in dists.items():
+        try:
+            reqs.extend(dist.requires(sorted(extras[name])))
+        except UnknownExtra:
+            reqs.extend(dist.requires())
+
+    specifiers = collections.defaultdict(
+        SpecifierSet
+    )  # type: Dict[str, SpecifierSet]
+    for req in reqs:
+        name = canonicalize_name(req.project_name)
+        specifiers[name] &= SpecifierSet(str(req.specifier))
+    for name, dist in dists.items():
+        best = finder.find_best_candidate(
+            dist.project_name, specifiers[name],
+        ).best_candidate
+        # A distribution that cannot be found anymore is kept.
+        if best is not None and best.version != parse_version(dist.version):
+            logger.debug(
+                "%s %s is installed, but %s is available",
+                dist.project_name, dist.version, best.version,
+            )
+            return False
+    return True
+
+
 class BuildEnvironment:
     """Creates and manages an isolated environment to install build deps
     """
 
-    def __init__(self):
-        # type: () -> None
+    def __init__(
+        self,
+        store=None,  # type: Optional[BuildEnvironmentStore]
+        installer=None,  # type: Optional[InProcessInstaller]
+        backend_workers=None,  # type: Optional[BackendWorkerPool]
+    ):
+        # type: (...) -> None
         temp_dir = TempDirectory(
             kind=tempdir_kinds.BUILD_ENV, globally_managed=True
         )
+        self._store = store
+        self._installer = installer
+        self._backend_workers = backend_workers
 
         self._prefixes = OrderedDict(
             (name, _Prefix(os.path.join(temp_dir.path, name)))
             for name in ('normal', 'overlay')
         )
 
-        self._bin_dirs = []  # type: List[str]
-        self._lib_dirs = []  # type: List[str]
-        for prefix in reversed(list(self._prefixes.values())):
-            self._bin_dirs.append(prefix.bin_dir)
-            self._lib_dirs.extend(prefix.lib_dirs)
-
+        self._site_dir = os.path.join(temp_dir.path, 'site')
+        if not os.path.exists(self._site_dir):
+            os.mkdir(self._site_dir)
+        self._write_sitecustomize()
+
+    @property
+    def _bin_dirs(self):
+        # type: () -> List[str]
+        return [
+            prefix.bin_dir for prefix in reversed(list(self._prefixes.values()))
+        ]
+
+    @property
+    def _lib_dirs(self):
+        # type: () -> List[str]
+        return [
+            lib_dir
+            for prefix in reversed(list(self._prefixes.values()))
+            for lib_dir in prefix.lib_dirs
+        ]
+
+    def _write_sitecustomize(self):
+        # type: () -> None
         # Customize site to:
         # - ensure .pth files are honored
         # - prevent access to system site packages
         system_sites = {
             os.path.normcase(site) for site in (get_purelib(), get_platlib())
         }
-        self._site_dir = os.path.join(temp_dir.path, 'site')
-        if not os.path.exists(self._site_dir):
-            os.mkdir(self._site_dir)
         with open(os.path.join(self._site_dir, 'sitecustomize.py'), 'w') as fp:
             fp.write(textwrap.dedent(
                 '''
@@ -122,25 +287,29 @@ class BuildEnvironment:
                 '''
             ).format(system_sites=system_sites, lib_dirs=self._lib_dirs))
 
-    def __enter__(self):
-        # type: () -> None
-        self._save_env = {
-            name: os.environ.get(name, None)
-            for name in ('PATH', 'PYTHONNOUSERSITE', 'PYTHONPATH')
-        }
-
+    def _get_environ(self):
+        # type: () -> Dict[str, str]
+        """The environment variables to run the build subprocesses with."""
         path = self._bin_dirs[:]
-        old_path = self._save_env['PATH']
+        old_path = os.environ.get('PATH')
         if old_path:
             path.extend(old_path.split(os.pathsep))
 
         pythonpath = [self._site_dir]
 
-        os.environ.update({
+        return {
             'PATH': os.pathsep.join(path),
             'PYTHONNOUSERSITE': '1',
             'PYTHONPATH': os.pathsep.join(pythonpath),
-        })
+        }
+
+    def __enter__(self):
+        # type: () -> None
+        self._save_env = {
+            name: os.environ.get(name, None)
+            for name in ('PATH', 'PYTHONNOUSERSITE', 'PYTHONPATH')
+        }
+        os.environ.update(self._get_environ())
 
     def __exit__(
         self,
@@ -155,6 +324,24 @@ class BuildEnvironment:
             else:
                 os.environ[varname] = old_value
 
+    def activate_for_thread(self):
+        # type: () -> ContextManager[None]
+        """Like entering the environment, but only for the subprocesses
+        started on the current thread, so that several builds can run in
+        their own environments at once.
+        """
+        return thread_environ(self._get_environ())
+
+    def get_hook_runner(self, message):
+        # type: (str) -> Callable[..., None]
+        """Provide a subprocess_runner for pep517's Pep517HookCaller, calling
+        the backend hooks in this environment and showing a spinner with the
+        message.
+        """
+        if self._backend_workers is None:
+            return runner_with_spinner_message(message)
+        return self._backend_workers.get_runner(self, message)
+
     def check_requirements(self, reqs):
         # type: (Iterable[str]) -> Tuple[Set[Tuple[str, str]], Set[str]]
         """Return 2 sets:
@@ -187,6 +374,28 @@ class BuildEnvironment:
         prefix.setup = True
         if not requirements:
             return
+        if self._backend_workers is not None:
+            # The worker would not see the new requirements.
+            self._backend_workers.discard(self)
+        if self._store is not None:
+            shared = self._get_shared_prefix(finder, requirements, message)
+            if shared is not None:
+                self._prefixes[prefix_as_string] = shared
+                self._write_sitecustomize()
+                return
+        self._install(finder, requirements, prefix, message)
+
+    def _install(
+        self,
+        finder,  # type: PackageFinder
+        requirements,  # type: Iterable[str]
+        prefix,  # type: _Prefix
+        message,  # type: str
+    ):
+        # type: (...) -> None
+        if self._installer is not None:
+            self._installer.install(requirements, prefix.path, message)
+            return
         with _create_standalone_pip() as standalone_pip:
             self._install_requirements(
                 standalone_pip,
@@ -196,6 +405,45 @@ class BuildEnvironment:
                 message,
             )
 
+    def _get_shared_prefix(
+        self,
+        finder,  # type: PackageFinder
+        requirements,  # type: Iterable[str]
+        message,  # type: str
+    ):
+        # type: (...) -> Optional[_Prefix]
+        """Get a prefix with the requirements installed from the store,
+        installing them into it if no build needed them before.
+        """
+        assert self._store is not None
+        finder = _get_finder_for_running_python(finder)
+        key = _get_prefix_key(finder, requirements)
+        if key is None:
+            return None
+
+        populated = False
+
+        def populate(path):
+            # type: (str) -> None
+            nonlocal populated
+            populated = True
+            self._install(finder, requirements, _Prefix(path), message)
+
+        def is_current(path):
+            # type: (str) -> bool
+            return _is_prefix_current(
+                finder, requirements, _Prefix(path).lib_dirs,
+            )
+
+        path = self._store.get(key, populate, is_current)
+        if path is None:
+            return None
+        if not populated:
+            logger.info("%s: found in the cache", message)
+        prefix = _Prefix(path)
+        prefix.setup = True
+        return prefix
+
     @staticmethod
     def _install_requirements(
         standalone_pip: str,
@@ -239,6 +487,136 @@ class BuildEnvironment:
             call_subprocess(args, spinner=spinner, extra_environ=extra_environ)
 
 
+class InProcessInstaller:
+    """Installs build requirements in the running pip process, rather than
+    with a pip subprocess, reusing the finder, and thus the index pages it has
+    fetched, the session and the requirement tracker of the command.
+
+    The requirements are resolved like ``pip install --ignore-installed``
+    does, for the running interpreter even when the command targets another
+    one (e.g. ``pip download --platform``), since that is what runs the
+    builds. Build requirements of their own that need building are installed
+    the same way, with the tracker detecting recursive builds.
+    """
+
+    def __init__(
+        self,
+        finder,  # type: PackageFinder
+        session,  # type: PipSession
+        req_tracker,  # type: RequirementTracker
+        wheel_cache,  # type: WheelCache
+        build_dir,  # type: str
+        src_dir,  # type: str
+        progress_bar,  # type: str
+        isolated,  # type: bool
+        store=None,  # type: Optional[BuildEnvironmentStore]
+        backend_workers=None,  # type: Optional[BackendWorkerPool]
+    ):
+        # type: (...) -> None
+        from pip._internal.operations.prepare import RequirementPreparer
+
+        finder = _get_finder_for_running_python(finder)
+        self._finder = finder
+        self._wheel_cache = wheel_cache
+        self._isolated = isolated
+        self._preparer = RequirementPreparer(
+            build_dir=build_dir,
+            download_dir=None,
+            src_dir=src_dir,
+            build_isolation=True,
+            req_tracker=req_tracker,
+            session=session,
+            progress_bar=progress_bar,
+            download_jobs=1,
+            finder=finder,
+            require_hashes=False,
+            use_user_site=False,
+            lazy_wheel=False,
+            in_tree_build=False,
+            build_env_store=store,
+            build_env_installer=self,
+            backend_workers=backend_workers,
+        )
+
+    def install(self, requirements, prefix, message):
+        # type: (Iterable[str], str, str) -> None
+        from pip._internal.req import install_given_reqs
+        from pip._internal.req.constructors import (
+            install_req_from_line,
+            install_req_from_req_string,
+        )
+        from pip._internal.resolution.resolvelib.resolver import Resolver
+        from pip._internal.wheel_builder import (
+            build,
+            should_build_for_install_command,
+        )
+
+        logger.info(message)
+        with indent_log():
+            resolver = Resolver(
+                preparer=self._preparer,
+                finder=self._finder,
+                wheel_cache=self._wheel_cache,
+                make_install_req=functools.partial(
+                    install_req_from_req_string, isolated=self._isolated,
+                ),
+                use_user_site=False,
+                ignore_dependencies=False,
+                ignore_installed=True,
+                ignore_requires_python=False,
+                force_reinstall=False,
+                upgrade_strategy="to-satisfy-only",
+            )
+            reqs = [
+                install_req_from_line(
+                    requirement, isolated=self._isolated, user_supplied=True,
+                )
+                for requirement in requirements
+            ]
+            requirement_set = resolver.resolve(reqs, check_supported_wheels=True)
+
+            format_control = self._finder.format_control
+
+            def check_binary_allowed(req):
+                # type: (InstallRequirement) -> bool
+                name = canonicalize_name(req.name or "")
+                return "binary" in format_control.get_allowed_formats(name)
+
+            _, build_failures = build(
+                [
+                    req for req in requirement_set.requirements.values()
+                    if should_build_for_install_command(
+                        req, check_binary_allowed
+                    )
+                ],
+                wheel_cache=self._wheel_cache,
+                verify=True,
+                build_options=[],
+                global_options=[],
+            )
+            failed = [
+                req.name  # type: ignore
+                for req in build_failures if req.use_pep517
+            ]  # type: List[str]
+            if failed:
+                raise InstallationError(
+                    "Could not build wheels for {} which use PEP 517 and "
+                    "cannot be installed directly".format(", ".join(failed))
+                )
+
+            install_given_reqs(
+                resolver.get_installation_order(requirement_set),
+                install_options=[],
+                global_options=[],
+                root=None,
+                home=None,
+                prefix=prefix,
+                warn_script_location=False,
+                use_user_site=False,
+                pycompile=True,
+            )
+
+
 class NoOpBuildEnvironment(BuildEnvironment):
     """A no-op drop-in replacement for BuildEnvironment
     """
@@ -260,6 +638,14 @@ class NoOpBuildEnvironment(BuildEnvironment):
         # type: (...) -> None
         pass
 
+    def activate_for_thread(self):
+        # type: () -> ContextManager[None]
+        return thread_environ({})
+
+    def get_hook_runner(self, message):
+        # type: (str) -> Callable[..., None]
+        return runner_with_spinner_message(message)
+
     def cleanup(self):
         # type: () -> None
         pass
@@ -5,7 +5,13 @@ import hashlib
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional, Set
+import shutil
+import stat
+import tempfile
+import uuid
+from base64 import urlsafe_b64encode
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from zipfile import ZipFile
 
 from pip._vendor.packaging.tags import Tag, interpreter_name, interpreter_version
 from pip._vendor.packaging.utils import canonicalize_name
@@ -14,7 +20,14 @@ from pip._internal.exceptions import InvalidWheelFilename
 from pip._internal.models.format_control import FormatControl
 from pip._internal.models.link import Link
 from pip._internal.models.wheel import Wheel
+from pip._internal.utils.compatibility_tags import get_tag_priorities
+from pip._internal.utils.misc import ensure_dir, hash_file, rmtree
 from pip._internal.utils.temp_dir import TempDirectory, tempdir_kinds
+from pip._internal.utils.unpacking import (
+    is_within_directory,
+    set_extracted_file_to_default_mode_plus_executable,
+    zip_item_is_executable,
+)
 from pip._internal.utils.urls import path_to_url
 
 logger = logging.getLogger(__name__)
@@ -163,6 +176,7 @@ class SimpleWheelCache(Cache):
     ):
         # type: (...) -> Link
         candidates = []
+        tag_priorities = None  # type: Optional[Dict[Tag, int]]
 
         if not package_name:
             return link
@@ -182,12 +196,14 @@ class SimpleWheelCache(Cache):
                     wheel_name, link, package_name,
                 )
                 continue
-            if not wheel.supported(supported_tags):
+            if tag_priorities is None:
+                tag_priorities = get_tag_priorities(supported_tags)
+            if not wheel.supported(tag_priorities):
                 # Built for a different python/arch/etc
                 continue
             candidates.append(
                 (
-                    wheel.support_index_min(supported_tags),
+                    wheel.find_most_preferred_tag(supported_tags, tag_priorities),
                     wheel_name,
                     wheel_dir,
                 )
@@ -285,3 +301,316 @@ class WheelCache(Cache):
             return CacheEntry(retval, persistent=False)
 
         return None
+
+
+def _record_hash(path):
+    # type: (str) -> Tuple[str, int]
+    """Return the RECORD-style hash and the size of the file at path."""
+    h, size = hash_file(path)
+    encoded = urlsafe_b64encode(h.digest()).decode("latin1")
+    return "sha256=" + encoded.rstrip("="), size
+
+
+def _make_read_only(path):
+    # type: (str) -> None
+    mode = os.stat(path).st_mode
+    os.chmod(path, mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
+
+class UnpackedWheel:
+    """The files of a wheel, unpacked in an UnpackedWheelStore.
+
+    :param directory: The directory the files are unpacked in.
+    :param hashes: The RECORD-style hash and the size of each file, by its
+        path in the wheel.
+    """
+
+    def __init__(self, directory, hashes):
+        # type: (str, Dict[str, Tuple[str, int]]) -> None
+        self.directory = directory
+        self.hashes = hashes
+
+    def get_path(self, record_path):
+        # type: (str) -> str
+        return os.path.join(self.directory, os.path.normpath(record_path))
+
+
+class _EntryStore:
+    """A base class for stores of directories, each written once and not
+    modified afterwards, keyed by a hex digest.
+
+    An entry is written in a temporary directory in the store, which is
+    renamed into place when it is complete, so that other pip processes
+    only see complete entries. Failing to create the store or to write an
+    entry is logged and otherwise ignored.
+    """
+
+    def __init__(self, directory):
+        # type: (str) -> None
+        assert directory is not None, "Store directory must not be None."
+        self.directory = directory
+
+    def _get_entry_dir(self, key):
+        # type: (str) -> str
+        # Nest the entries like the wheel cache does, to avoid having a
+        # huge number of directories in one directory.
+        parts = [key[:2], key[2:4], key[4:6], key[6:]]
+        return os.path.join(self.directory, *parts)
+
+    def _write_entry(
+        self,
+        entry_dir,  # type: str
+        write,  # type: Callable[[str], None]
+        read_only=False,  # type: bool
+    ):
+        # type: (...) -> bool
+        """Write an entry with write(), which is called with the temporary
+        directory to write into, and rename it to entry_dir.
+
+        Return whether entry_dir exists afterwards, as it does when another
+        pip process wrote it first. The errors write() raises are propagated.
+
+        :param read_only: Whether to make the files of the entry read-only
+            before it is renamed into place.
+        """
+        try:
+            ensure_dir(self.directory)
+            tmp_dir = tempfile.mkdtemp(prefix=".tmp-", dir=self.directory)
+        except OSError as exc:
+            logger.debug("Not storing %s: %s", entry_dir, exc)
+            return False
+        try:
+            write(tmp_dir)
+            try:
+                if read_only:
+                    for dirpath, _, filenames in os.walk(tmp_dir):
+                        for filename in filenames:
+                            path = os.path.join(dirpath, filename)
+                            if not os.path.islink(path):
+                                _make_read_only(path)
+                ensure_dir(os.path.dirname(entry_dir))
+                os.rename(tmp_dir, entry_dir)
+            except OSError as exc:
+                # Unless another pip process stored the entry first.
+                if not os.path.isdir(entry_dir):
+                    logger.debug("Not storing %s: %s", entry_dir, exc)
+                    return False
+        finally:
+            rmtree(tmp_dir, ignore_errors=True)
+        return True
+
+
+class UnpackedWheelStore(_EntryStore):
+    """A store of unpacked wheels, keyed by the sha256 of their archive, so
+    that installing a wheel again does not mean decompressing it again.
+
+    Each entry holds the files of the wheel and a manifest of their hashes,
+    sizes and modification times. Files installed as hardlinks share their
+    contents with the store, so the files are read-only, and before an
+    entry is reused, the files whose size or modification time changed are
+    hashed again. An entry with a modified file is discarded.
+
+    A wheel that cannot be stored is installed from its archive.
+    """
+
+    _manifest_name = "manifest.json"
+
+    def get(self, wheel_path):
+        # type: (str) -> Optional[UnpackedWheel]
+        """Return the files of the wheel, unpacking it into the store if
+        it is not there yet, or None if the store cannot be used.
+        """
+        digest = hash_file(wheel_path)[0].hexdigest()
+        entry_dir = self._get_entry_dir(digest)
+        unpacked = self._load(entry_dir)
+        if unpacked is not None:
+            return unpacked
+
+        hashes = {}  # type: Dict[str, Tuple[str, int]]
+        try:
+            stored = self._write_entry(
+                entry_dir,
+                lambda tmp_dir: self._unpack(wheel_path, tmp_dir, hashes),
+                read_only=True,
+            )
+        except (OSError, ValueError) as exc:
+            logger.debug("Not storing unpacked %s: %s", wheel_path, exc)
+            return None
+        if not stored:
+            return None
+        return UnpackedWheel(os.path.join(entry_dir, "files"), hashes)
+
+    def _load(self, entry_dir):
+        # type: (str) -> Optional[UnpackedWheel]
+        try:
+            with open(os.path.join(entry_dir, self._manifest_name), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        try:
+            manifest = json.loads(data.decode("utf-8"))
+            unpacked = UnpackedWheel(os.path.join(entry_dir, "files"), {})
+            for name, (digest, size, mtime) in manifest["files"].items():
+                path = unpacked.get_path(name)
+                st = os.stat(path)
+                if (
+                    (st.st_size != size or st.st_mtime_ns != mtime) and
+                    _record_hash(path) != (digest, size)
+                ):
+                    raise ValueError(f"{name} was modified")
+                unpacked.hashes[name] = (digest, size)
+        except (OSError, ValueError, TypeError, KeyError) as exc:
+            logger.debug("Discarding unpacked wheel %s: %s", entry_dir, exc)
+            rmtree(entry_dir, ignore_errors=True)
+            return None
+        return unpacked
+
+    def _unpack(self, wheel_path, tmp_dir, hashes):
+        # type: (str, str, Dict[str, Tuple[str, int]]) -> None
+        """Unpack the wheel and write the manifest into tmp_dir, recording
+        the hash and size of each file in hashes.
+        """
+        files_dir = os.path.join(tmp_dir, "files")
+        manifest_files = {}  # type: Dict[str, Tuple[str, int, int]]
+        with ZipFile(wheel_path, allowZip64=True) as z:
+            for info in z.infolist():
+                if info.filename.endswith("/"):
+                    continue
+                path = os.path.join(files_dir, os.path.normpath(info.filename))
+                if not is_within_directory(files_dir, path):
+                    # install_wheel() reports it.
+                    raise ValueError(f"unsafe path {info.filename!r}")
+                ensure_dir(os.path.dirname(path))
+
+                h = hashlib.sha256()
+                size = 0
+                with z.open(info) as src, open(path, "wb") as dest:
+                    for chunk in iter(lambda: src.read(1 << 20), b""):
+                        h.update(chunk)
+                        size += len(chunk)
+                        dest.write(chunk)
+                if zip_item_is_executable(info):
+                    set_extracted_file_to_default_mode_plus_executable(path)
+
+                encoded = urlsafe_b64encode(h.digest()).decode("latin1")
+                hashes[info.filename] = ("sha256=" + encoded.rstrip("="), size)
+                # Making the file read-only later does not change this.
+                manifest_files[info.filename] = hashes[info.filename] + (
+                    os.stat(path).st_mtime_ns,
+                )
+
+        manifest = {"files": manifest_files}
+        with open(os.path.join(tmp_dir, self._manifest_name), "wb") as f:
+            f.write(json.dumps(manifest).encode("utf-8"))
+
+
+class BuildEnvironmentStore(_EntryStore):
+    """A store of the prefixes that build requirements are installed in,
+    keyed by everything that determines what gets installed, so that builds
+    needing the same build requirements share one prefix, across pip
+    invocations.
+
+    The key cannot cover everything the requirements resolve to, such as
+    their own dependencies, so a key holds generations of prefixes, and a
+    caller checks that a generation is still current before it is reused.
+    Otherwise a new generation is installed, and the generations found out
+    of date are removed. The files of a generation are read-only, since
+    several builds may use it at once.
+
+    Builds get a temporary prefix when a prefix cannot be stored.
+    """
+
+    def _get_generations(self, key):
+        # type: (str) -> List[str]
+        """The generations of the entry for the key, newest first."""
+        entry_dir = self._get_entry_dir(key)
+        try:
+            paths = [
+                os.path.join(entry_dir, name) for name in os.listdir(entry_dir)
+            ]
+            generations = [
+                (os.stat(path).st_mtime, path) for path in paths
+                if os.path.isdir(path)
+            ]
+        except OSError:
+            return []
+        return [path for _, path in sorted(generations, reverse=True)]
+
+    def get(
+        self,
+        key,  # type: str
+        populate,  # type: Callable[[str], None]
+        is_current=None,  # type: Optional[Callable[[str], bool]]
+    ):
+        # type: (...) -> Optional[str]
+        """Return the directory of a generation of the entry for the key,
+        creating one with populate() if there is none that is_current()
+        accepts, or None if the store cannot be used.
+
+        populate() is called with the directory to install into, and the
+        errors it raises are propagated.
+        """
+        out_of_date = []
+        for path in self._get_generations(key):
+            if is_current is None or is_current(path):
+                return path
+            logger.debug("Build environment %s is out of date", path)
+            out_of_date.append(path)
+
+        generation_dir = os.path.join(
+            self._get_entry_dir(key), uuid.uuid4().hex,
+        )
+        if not self._write_entry(generation_dir, populate, read_only=True):
+            return None
+        # A build of another pip process may still be using one, but the
+        # new generation is what any build should use from now on.
+        for path in out_of_date:
+            rmtree(path, ignore_errors=True)
+        return generation_dir
+
+
+class SdistMetadataStore(_EntryStore):
+    """A store of the metadata directories generated from source
+    distributions, keyed by the sha256 of the archive and everything else
+    that determines how the metadata is generated, so that resolving the
+    same source distribution again does not mean building its metadata
+    again.
+
+    Each entry holds one ``.dist-info`` or ``.egg-info`` directory. Metadata
+    that cannot be stored is generated again the next time.
+    """
+
+    def get(self, key):
+        # type: (str) -> Optional[str]
+        """Return the directory holding the metadata directory stored for
+        the key, if any.
+        """
+        entry_dir = self._get_entry_dir(key)
+        if not os.path.isdir(entry_dir):
+            return None
+        return entry_dir
+
+    def save(self, key, metadata_directory):
+        # type: (str, str) -> None
+        """Store a copy of the metadata directory for the key, unless it is
+        stored already.
+        """
+        entry_dir = self._get_entry_dir(key)
+        if os.path.isdir(entry_dir):
+            return
+
+        def write(tmp_dir):
+            # type: (str) -> None
+            name = os.path.basename(metadata_directory.rstrip(os.sep))
+            shutil.copytree(metadata_directory, os.path.join(tmp_dir, name))
+
+        try:
+            self._write_entry(entry_dir, write)
+        except (OSError, shutil.Error) as exc:
+            logger.debug("Not storing metadata %s: %s", key, exc)
+
+    def remove(self, key):
+        # type: (str) -> None
+        """Remove the metadata stored for the key, if any."""
+        rmtree(self._get_entry_dir(key), ignore_errors=True)
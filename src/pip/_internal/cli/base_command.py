@@ -26,6 +26,7 @@ from pip._internal.exceptions import (
     PreviousBuildDirError,
     UninstallationError,
 )
+from pip._internal.metadata import select_backend
 from pip._internal.utils.deprecation import deprecated
 from pip._internal.utils.filesystem import check_path_owner
 from pip._internal.utils.logging import BrokenStdoutLoggingError, setup_logging
@@ -169,6 +170,11 @@ class Command(CommandContextMixIn):
                 issue=8333,
             )
 
+        if "dist-info-metadata" in options.features_enabled:
+            select_backend("dist-info")
+        else:
+            select_backend("pkg_resources")
+
         if "2020-resolver" in options.features_enabled:
             logger.warning(
                 "--use-feature=2020-resolver no longer has any effect, "
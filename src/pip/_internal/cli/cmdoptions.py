@@ -235,6 +235,111 @@ progress_bar = partial(
     ),
 )  # type: Callable[..., Option]
 
+
+def _handle_jobs(option, opt_str, value, parser):
+    # type: (Option, str, int, OptionParser) -> None
+    """
+    Handle a provided --download-jobs, --build-jobs, --extract-jobs,
+    --install-jobs or --compile-jobs value.
+    """
+    if value < 1:
+        msg = f"invalid {opt_str} value: {value!r}: must be at least 1"
+        raise_option_error(parser, option=option, msg=msg)
+
+    setattr(parser.values, option.dest, value)
+
+
+download_jobs = partial(
+    Option,
+    "--download-jobs",
+    dest="download_jobs",
+    metavar="n",
+    type="int",
+    action="callback",
+    callback=_handle_jobs,
+    default=1,
+    help=(
+        "Maximum number of wheels to download in parallel, when completing "
+        "the downloads deferred by --use-feature=fast-deps "
+        "(default: %default)."
+    ),
+)  # type: Callable[..., Option]
+
+build_jobs = partial(
+    Option,
+    "--build-jobs",
+    dest="build_jobs",
+    metavar="n",
+    type="int",
+    action="callback",
+    callback=_handle_jobs,
+    default=1,
+    help=(
+        "Maximum number of wheels to build from source distributions in "
+        "parallel. The output of each build is shown once it has finished "
+        "(default: %default)."
+    ),
+)  # type: Callable[..., Option]
+
+build_timeout = partial(
+    Option,
+    "--build-timeout",
+    dest="build_timeout",
+    metavar="sec",
+    type="float",
+    default=None,
+    help=(
+        "Maximum time a build backend hook, such as building a wheel, may "
+        "take, in seconds. Only applies with --use-feature=backend-workers."
+    ),
+)  # type: Callable[..., Option]
+
+extract_jobs = partial(
+    Option,
+    "--extract-jobs",
+    dest="extract_jobs",
+    metavar="n",
+    type="int",
+    action="callback",
+    callback=_handle_jobs,
+    default=1,
+    help=(
+        "Maximum number of threads to decompress and write the files of "
+        "each wheel with, when installing it (default: %default)."
+    ),
+)  # type: Callable[..., Option]
+
+install_jobs = partial(
+    Option,
+    "--install-jobs",
+    dest="install_jobs",
+    metavar="n",
+    type="int",
+    action="callback",
+    callback=_handle_jobs,
+    default=1,
+    help=(
+        "Maximum number of wheels to install in parallel. Installs that "
+        "write to or remove the same files, and those not from wheels, "
+        "still run one after the other (default: %default)."
+    ),
+)  # type: Callable[..., Option]
+
+compile_jobs = partial(
+    Option,
+    "--compile-jobs",
+    dest="compile_jobs",
+    metavar="n",
+    type="int",
+    action="callback",
+    callback=_handle_jobs,
+    default=1,
+    help=(
+        "Maximum number of processes to byte-compile installed Python "
+        "files with (default: %default)."
+    ),
+)  # type: Callable[..., Option]
+
 log = partial(
     PipOption,
     "--log",
@@ -965,7 +1070,19 @@ use_new_feature = partial(
     metavar="feature",
     action="append",
     default=[],
-    choices=["2020-resolver", "fast-deps", "in-tree-build"],
+    choices=[
+        "2020-resolver",
+        "backend-workers",
+        "dist-info-metadata",
+        "fast-deps",
+        "in-process-build-deps",
+        "in-tree-build",
+        "resolution-cache",
+        "sdist-metadata-cache",
+        "shared-build-envs",
+        "speculative-prepare",
+        "unpacked-wheels",
+    ],
     help="Enable new functionality, that may be backward incompatible.",
 )  # type: Callable[..., Option]
 
@@ -10,30 +10,12 @@ import os
 import sys
 from functools import partial
 from optparse import Values
-from typing import Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from pip._internal.cache import WheelCache
 from pip._internal.cli import cmdoptions
 from pip._internal.cli.base_command import Command
 from pip._internal.cli.command_context import CommandContextMixIn
 from pip._internal.exceptions import CommandError, PreviousBuildDirError
-from pip._internal.index.collector import LinkCollector
-from pip._internal.index.package_finder import PackageFinder
-from pip._internal.models.selection_prefs import SelectionPreferences
-from pip._internal.models.target_python import TargetPython
-from pip._internal.network.session import PipSession
-from pip._internal.operations.prepare import RequirementPreparer
-from pip._internal.req.constructors import (
-    install_req_from_editable,
-    install_req_from_line,
-    install_req_from_parsed_requirement,
-    install_req_from_req_string,
-)
-from pip._internal.req.req_file import parse_requirements
-from pip._internal.req.req_install import InstallRequirement
-from pip._internal.req.req_tracker import RequirementTracker
-from pip._internal.resolution.base import BaseResolver
-from pip._internal.self_outdated_check import pip_self_version_check
 from pip._internal.utils.temp_dir import (
     TempDirectory,
     TempDirectoryTypeRegistry,
@@ -41,6 +23,17 @@ from pip._internal.utils.temp_dir import (
 )
 from pip._internal.utils.virtualenv import running_under_virtualenv
 
+if TYPE_CHECKING:
+    from pip._internal.cache import WheelCache
+    from pip._internal.index.package_finder import PackageFinder
+    from pip._internal.models.target_python import TargetPython
+    from pip._internal.network.session import PipSession
+    from pip._internal.operations.build.backend_workers import BackendWorkerPool
+    from pip._internal.operations.prepare import RequirementPreparer
+    from pip._internal.req.req_install import InstallRequirement
+    from pip._internal.req.req_tracker import RequirementTracker
+    from pip._internal.resolution.base import BaseResolver
+
 logger = logging.getLogger(__name__)
 
 
@@ -83,8 +76,10 @@ class SessionCommandMixin(CommandContextMixIn):
 
     def _build_session(self, options, retries=None, timeout=None):
         # type: (Values, Optional[int], Optional[int]) -> PipSession
+        from pip._internal.network import session as network_session
+
         assert not options.cache_dir or os.path.isabs(options.cache_dir)
-        session = PipSession(
+        session = network_session.PipSession(
             cache=(
                 os.path.join(options.cache_dir, "http") if options.cache_dir else None
             ),
@@ -140,6 +135,8 @@ class IndexGroupCommand(Command, SessionCommandMixin):
             return
 
         # Otherwise, check if we're using the latest version of pip available.
+        from pip._internal.self_outdated_check import pip_self_version_check
+
         session = self._build_session(
             options, retries=0, timeout=min(5, options.timeout)
         )
@@ -216,6 +213,9 @@ class RequirementCommand(IndexGroupCommand):
     def __init__(self, *args, **kw):
         # type: (Any, Any) -> None
         super().__init__(*args, **kw)
+        # The requirements files read, by name, so that they are read only
+        # once when the requirements are parsed again.
+        self._requirements_file_contents = {}  # type: Dict[str, str]
 
         self.cmd_opts.add_option(cmdoptions.no_clean())
 
@@ -228,6 +228,20 @@ class RequirementCommand(IndexGroupCommand):
 
         return "2020-resolver"
 
+    def enter_backend_workers(self, options):
+        # type: (Values) -> Optional[BackendWorkerPool]
+        """
+        Create a pool of processes calling build backend hooks, stopped when
+        the command finishes, if --use-feature=backend-workers is given.
+        """
+        from pip._internal.operations.build import backend_workers
+
+        if "backend-workers" not in options.features_enabled:
+            return None
+        return self.enter_context(
+            backend_workers.BackendWorkerPool(options.build_timeout)
+        )
+
     @classmethod
     def make_requirement_preparer(
         cls,
@@ -238,11 +252,16 @@ class RequirementCommand(IndexGroupCommand):
         finder,  # type: PackageFinder
         use_user_site,  # type: bool
         download_dir=None,  # type: str
+        backend_workers=None,  # type: Optional[BackendWorkerPool]
     ):
         # type: (...) -> RequirementPreparer
         """
         Create a RequirementPreparer instance for the given parameters.
         """
+        from pip._internal import cache
+        from pip._internal.build_env import InProcessInstaller
+        from pip._internal.operations import prepare
+
         temp_build_dir_path = temp_build_dir.path
         assert temp_build_dir_path is not None
 
@@ -264,7 +283,42 @@ class RequirementCommand(IndexGroupCommand):
                     "fast-deps has no effect when used with the legacy resolver."
                 )
 
-        return RequirementPreparer(
+        # Like lazy wheels, stored metadata leaves requirements to be prepared
+        # after resolving, which only the 2020 resolver does.
+        sdist_metadata_store = None  # type: Optional[cache.SdistMetadataStore]
+        if (
+            resolver_variant == "2020-resolver"
+            and "sdist-metadata-cache" in options.features_enabled
+            and options.cache_dir
+        ):
+            sdist_metadata_store = cache.SdistMetadataStore(
+                os.path.join(options.cache_dir, "sdist-metadata")
+            )
+
+        build_env_store = None  # type: Optional[cache.BuildEnvironmentStore]
+        if "shared-build-envs" in options.features_enabled and options.cache_dir:
+            build_env_store = cache.BuildEnvironmentStore(
+                os.path.join(options.cache_dir, "build-envs")
+            )
+
+        build_env_installer = None  # type: Optional[InProcessInstaller]
+        if "in-process-build-deps" in options.features_enabled:
+            build_env_installer = InProcessInstaller(
+                finder=finder,
+                session=session,
+                req_tracker=req_tracker,
+                wheel_cache=cache.WheelCache(
+                    options.cache_dir, options.format_control,
+                ),
+                build_dir=temp_build_dir_path,
+                src_dir=options.src_dir,
+                progress_bar=options.progress_bar,
+                isolated=options.isolated_mode,
+                store=build_env_store,
+                backend_workers=backend_workers,
+            )
+
+        return prepare.RequirementPreparer(
             build_dir=temp_build_dir_path,
             src_dir=options.src_dir,
             download_dir=download_dir,
@@ -272,11 +326,16 @@ class RequirementCommand(IndexGroupCommand):
             req_tracker=req_tracker,
             session=session,
             progress_bar=options.progress_bar,
+            download_jobs=options.download_jobs,
             finder=finder,
             require_hashes=options.require_hashes,
             use_user_site=use_user_site,
             lazy_wheel=lazy_wheel,
             in_tree_build="in-tree-build" in options.features_enabled,
+            build_env_store=build_env_store,
+            build_env_installer=build_env_installer,
+            backend_workers=backend_workers,
+            sdist_metadata_store=sdist_metadata_store,
         )
 
     @classmethod
@@ -298,6 +357,8 @@ class RequirementCommand(IndexGroupCommand):
         """
         Create a Resolver instance for the given parameters.
         """
+        from pip._internal.req.constructors import install_req_from_req_string
+
         make_install_req = partial(
             install_req_from_req_string,
             isolated=options.isolated_mode,
@@ -309,6 +370,15 @@ class RequirementCommand(IndexGroupCommand):
         # "Resolver" class being redefined.
         if resolver_variant == "2020-resolver":
             import pip._internal.resolution.resolvelib.resolver
+            from pip._internal.resolution.resolvelib.result_cache import (
+                ResolutionCache,
+            )
+
+            resolution_cache = None  # type: Optional[ResolutionCache]
+            if "resolution-cache" in options.features_enabled and options.cache_dir:
+                resolution_cache = ResolutionCache(
+                    os.path.join(options.cache_dir, "resolutions")
+                )
 
             return pip._internal.resolution.resolvelib.resolver.Resolver(
                 preparer=preparer,
@@ -322,6 +392,10 @@ class RequirementCommand(IndexGroupCommand):
                 force_reinstall=force_reinstall,
                 upgrade_strategy=upgrade_strategy,
                 py_version_info=py_version_info,
+                speculative_prepare=(
+                    "speculative-prepare" in options.features_enabled
+                ),
+                resolution_cache=resolution_cache,
             )
         import pip._internal.resolution.legacy.resolver
 
@@ -343,13 +417,25 @@ class RequirementCommand(IndexGroupCommand):
         self,
         args,  # type: List[str]
         options,  # type: Values
-        finder,  # type: PackageFinder
-        session,  # type: PipSession
+        finder,  # type: Optional[PackageFinder]
+        session,  # type: Optional[PipSession]
     ):
         # type: (...) -> List[InstallRequirement]
         """
         Parse command-line arguments into the corresponding requirements.
+
+        Without a session, requirements files can only be read from the
+        filesystem, and without a finder the index options they contain
+        are ignored. Each requirements file is read only once by a command,
+        however many times the requirements are parsed.
         """
+        from pip._internal.req.constructors import (
+            install_req_from_editable,
+            install_req_from_line,
+            install_req_from_parsed_requirement,
+        )
+        from pip._internal.req.req_file import parse_requirements
+
         requirements = []  # type: List[InstallRequirement]
         for filename in options.constraints:
             for parsed_req in parse_requirements(
@@ -358,6 +444,7 @@ class RequirementCommand(IndexGroupCommand):
                 finder=finder,
                 options=options,
                 session=session,
+                file_contents=self._requirements_file_contents,
             ):
                 req_to_add = install_req_from_parsed_requirement(
                     parsed_req,
@@ -388,7 +475,11 @@ class RequirementCommand(IndexGroupCommand):
         # NOTE: options.require_hashes may be set if --require-hashes is True
         for filename in options.requirements:
             for parsed_req in parse_requirements(
-                filename, finder=finder, options=options, session=session
+                filename,
+                finder=finder,
+                options=options,
+                session=session,
+                file_contents=self._requirements_file_contents,
             ):
                 req_to_add = install_req_from_parsed_requirement(
                     parsed_req,
@@ -445,6 +536,10 @@ class RequirementCommand(IndexGroupCommand):
         :param ignore_requires_python: Whether to ignore incompatible
             "Requires-Python" values in links. Defaults to False.
         """
+        from pip._internal.index import package_finder
+        from pip._internal.index.collector import LinkCollector
+        from pip._internal.models.selection_prefs import SelectionPreferences
+
         link_collector = LinkCollector.create(session, options=options)
         selection_prefs = SelectionPreferences(
             allow_yanked=True,
@@ -454,7 +549,7 @@ class RequirementCommand(IndexGroupCommand):
             ignore_requires_python=ignore_requires_python,
         )
 
-        return PackageFinder.create(
+        return package_finder.PackageFinder.create(
             link_collector=link_collector,
             selection_prefs=selection_prefs,
             target_python=target_python,
@@ -8,7 +8,7 @@ from typing import IO, Iterator
 from pip._vendor.progress import HIDE_CURSOR, SHOW_CURSOR
 
 from pip._internal.utils.compat import WINDOWS
-from pip._internal.utils.logging import get_indentation
+from pip._internal.utils.logging import get_indentation, is_capturing_logs
 
 logger = logging.getLogger(__name__)
 
@@ -134,8 +134,13 @@ def open_spinner(message):
     # through the logging system, but it acts like it has level INFO,
     # i.e. it's only displayed if we're at level INFO or better.
     # Non-interactive spinner goes through the logging system, so it is always
-    # in sync with logging configuration.
-    if sys.stdout.isatty() and logger.getEffectiveLevel() <= logging.INFO:
+    # in sync with logging configuration. So is the spinner of a build whose
+    # logs are captured, to be shown once it has finished.
+    if (
+        sys.stdout.isatty() and
+        logger.getEffectiveLevel() <= logging.INFO and
+        not is_capturing_logs()
+    ):
         spinner = InteractiveSpinner(message)  # type: SpinnerInterface
     else:
         spinner = NonInteractiveSpinner(message)
@@ -162,7 +167,11 @@ def hidden_cursor(file):
     # We don't want to clutter the output with control characters if we're
     # writing to a file, or if the user is running with --quiet.
     # See https://github.com/pypa/pip/issues/3418
-    elif not file.isatty() or logger.getEffectiveLevel() > logging.INFO:
+    elif (
+        not file.isatty() or
+        logger.getEffectiveLevel() > logging.INFO or
+        is_capturing_logs()
+    ):
         yield
     else:
         file.write(HIDE_CURSOR)
@@ -14,7 +14,9 @@ logger = logging.getLogger(__name__)
 
 class CacheCommand(Command):
     """
-    Inspect and manage pip's wheel cache.
+    Inspect and manage pip's wheel cache, its caches of package index pages,
+    resolutions and metadata of source distributions, and its stores of
+    unpacked wheels and build environments.
 
     Subcommands:
 
@@ -22,7 +24,9 @@ class CacheCommand(Command):
     - info: Show information about the cache.
     - list: List filenames of packages stored in the cache.
     - remove: Remove one or more package from the cache.
-    - purge: Remove all items from the cache.
+    - purge: Remove all items from the cache, including cached index pages,
+      resolutions, source distribution metadata, unpacked wheels and build
+      environments.
 
     ``<pattern>`` can be a glob expression or a package name.
     """
@@ -97,11 +101,34 @@ class CacheCommand(Command):
             raise CommandError('Too many arguments')
 
         num_http_files = len(self._find_http_files(options))
+        num_link_files = len(self._find_link_files(options))
+        num_resolution_files = len(self._find_resolution_files(options))
+        num_unpacked_files = len(self._find_unpacked_files(options))
+        num_build_env_files = len(self._find_build_env_files(options))
+        num_sdist_metadata_files = len(
+            self._find_sdist_metadata_files(options)
+        )
         num_packages = len(self._find_wheels(options, '*'))
 
         http_cache_location = self._cache_dir(options, 'http')
+        links_cache_location = self._cache_dir(options, 'links')
+        resolutions_cache_location = self._cache_dir(options, 'resolutions')
+        unpacked_location = self._cache_dir(options, 'unpacked')
+        build_envs_location = self._cache_dir(options, 'build-envs')
+        sdist_metadata_location = self._cache_dir(options, 'sdist-metadata')
         wheels_cache_location = self._cache_dir(options, 'wheels')
         http_cache_size = filesystem.format_directory_size(http_cache_location)
+        links_cache_size = filesystem.format_directory_size(
+            links_cache_location
+        )
+        resolutions_cache_size = filesystem.format_directory_size(
+            resolutions_cache_location
+        )
+        unpacked_size = filesystem.format_directory_size(unpacked_location)
+        build_envs_size = filesystem.format_directory_size(build_envs_location)
+        sdist_metadata_size = filesystem.format_directory_size(
+            sdist_metadata_location
+        )
         wheels_cache_size = filesystem.format_directory_size(
             wheels_cache_location
         )
@@ -110,6 +137,21 @@ class CacheCommand(Command):
             Package index page cache location: {http_cache_location}
             Package index page cache size: {http_cache_size}
             Number of HTTP files: {num_http_files}
+            Parsed index page cache location: {links_cache_location}
+            Parsed index page cache size: {links_cache_size}
+            Number of parsed index pages: {num_link_files}
+            Resolution cache location: {resolutions_cache_location}
+            Resolution cache size: {resolutions_cache_size}
+            Number of resolutions: {num_resolution_files}
+            Unpacked wheels location: {unpacked_location}
+            Unpacked wheels size: {unpacked_size}
+            Number of unpacked wheel files: {num_unpacked_files}
+            Build environments location: {build_envs_location}
+            Build environments size: {build_envs_size}
+            Number of build environment files: {num_build_env_files}
+            Source distribution metadata location: {sdist_metadata_location}
+            Source distribution metadata size: {sdist_metadata_size}
+            Number of source distribution metadata files: {num_sdist_metadata_files}
             Wheels location: {wheels_cache_location}
             Wheels size: {wheels_cache_size}
             Number of wheels: {package_count}
@@ -117,6 +159,21 @@ class CacheCommand(Command):
             http_cache_location=http_cache_location,
             http_cache_size=http_cache_size,
             num_http_files=num_http_files,
+            links_cache_location=links_cache_location,
+            links_cache_size=links_cache_size,
+            num_link_files=num_link_files,
+            resolutions_cache_location=resolutions_cache_location,
+            resolutions_cache_size=resolutions_cache_size,
+            num_resolution_files=num_resolution_files,
+            unpacked_location=unpacked_location,
+            unpacked_size=unpacked_size,
+            num_unpacked_files=num_unpacked_files,
+            build_envs_location=build_envs_location,
+            build_envs_size=build_envs_size,
+            num_build_env_files=num_build_env_files,
+            sdist_metadata_location=sdist_metadata_location,
+            sdist_metadata_size=sdist_metadata_size,
+            num_sdist_metadata_files=num_sdist_metadata_files,
             wheels_cache_location=wheels_cache_location,
             package_count=num_packages,
             wheels_cache_size=wheels_cache_size,
@@ -175,9 +232,16 @@ class CacheCommand(Command):
 
         files = self._find_wheels(options, args[0])
 
-        # Only fetch http files if no specific pattern given
+        # Only fetch http, parsed link, resolution, unpacked wheel, build
+        # environment and source distribution metadata files if no specific
+        # pattern given
         if args[0] == '*':
             files += self._find_http_files(options)
+            files += self._find_link_files(options)
+            files += self._find_resolution_files(options)
+            files += self._find_unpacked_files(options)
+            files += self._find_build_env_files(options)
+            files += self._find_sdist_metadata_files(options)
 
         if not files:
             raise CommandError('No matching packages')
@@ -203,6 +267,31 @@ class CacheCommand(Command):
         http_dir = self._cache_dir(options, 'http')
         return filesystem.find_files(http_dir, '*')
 
+    def _find_link_files(self, options):
+        # type: (Values) -> List[str]
+        links_dir = self._cache_dir(options, 'links')
+        return filesystem.find_files(links_dir, '*')
+
+    def _find_resolution_files(self, options):
+        # type: (Values) -> List[str]
+        resolutions_dir = self._cache_dir(options, 'resolutions')
+        return filesystem.find_files(resolutions_dir, '*')
+
+    def _find_unpacked_files(self, options):
+        # type: (Values) -> List[str]
+        unpacked_dir = self._cache_dir(options, 'unpacked')
+        return filesystem.find_files(unpacked_dir, '*')
+
+    def _find_build_env_files(self, options):
+        # type: (Values) -> List[str]
+        build_envs_dir = self._cache_dir(options, 'build-envs')
+        return filesystem.find_files(build_envs_dir, '*')
+
+    def _find_sdist_metadata_files(self, options):
+        # type: (Values) -> List[str]
+        sdist_metadata_dir = self._cache_dir(options, 'sdist-metadata')
+        return filesystem.find_files(sdist_metadata_dir, '*')
+
     def _find_wheels(self, options, pattern):
         # type: (Values, str) -> List[str]
         wheel_dir = self._cache_dir(options, 'wheels')
@@ -48,6 +48,8 @@ class DownloadCommand(RequirementCommand):
         self.cmd_opts.add_option(cmdoptions.pre())
         self.cmd_opts.add_option(cmdoptions.require_hashes())
         self.cmd_opts.add_option(cmdoptions.progress_bar())
+        self.cmd_opts.add_option(cmdoptions.download_jobs())
+        self.cmd_opts.add_option(cmdoptions.build_timeout())
         self.cmd_opts.add_option(cmdoptions.no_build_isolation())
         self.cmd_opts.add_option(cmdoptions.use_pep517())
         self.cmd_opts.add_option(cmdoptions.no_use_pep517())
@@ -96,6 +98,7 @@ class DownloadCommand(RequirementCommand):
         )
 
         req_tracker = self.enter_context(get_requirement_tracker())
+        backend_workers = self.enter_backend_workers(options)
 
         directory = TempDirectory(
             delete=not options.no_clean,
@@ -113,6 +116,7 @@ class DownloadCommand(RequirementCommand):
             finder=finder,
             download_dir=options.download_dir,
             use_user_site=False,
+            backend_workers=backend_workers,
         )
 
         resolver = self.make_resolver(
@@ -9,7 +9,7 @@ from typing import Iterable, List, Optional
 
 from pip._vendor.packaging.utils import canonicalize_name
 
-from pip._internal.cache import WheelCache
+from pip._internal.cache import UnpackedWheelStore, WheelCache
 from pip._internal.cli import cmdoptions
 from pip._internal.cli.cmdoptions import make_target_python
 from pip._internal.cli.req_command import (
@@ -20,15 +20,20 @@ from pip._internal.cli.req_command import (
 from pip._internal.cli.status_codes import ERROR, SUCCESS
 from pip._internal.exceptions import CommandError, InstallationError
 from pip._internal.locations import get_scheme
-from pip._internal.metadata import get_environment
+from pip._internal.metadata import get_default_environment, get_environment
 from pip._internal.models.format_control import FormatControl
-from pip._internal.operations.check import ConflictDetails, check_install_conflicts
+from pip._internal.operations.check import (
+    ConflictDetails,
+    check_install_conflicts,
+    get_satisfying_distributions,
+)
 from pip._internal.req import install_given_reqs
 from pip._internal.req.req_install import InstallRequirement
 from pip._internal.req.req_tracker import get_requirement_tracker
 from pip._internal.utils.distutils_args import parse_distutils_args
 from pip._internal.utils.filesystem import test_writable_dir
 from pip._internal.utils.misc import (
+    display_path,
     ensure_dir,
     get_pip_version,
     protect_pip_from_modification_on_windows,
@@ -194,6 +199,17 @@ class InstallCommand(RequirementCommand):
             help="Do not compile Python source files to bytecode",
         )
 
+        self.cmd_opts.add_option(
+            "--defer-compile",
+            action="store_true",
+            dest="defer_compile",
+            default=False,
+            help=(
+                "Compile Python source files to bytecode in one pass after "
+                "installing every package, instead of after each one"
+            ),
+        )
+
         self.cmd_opts.add_option(
             "--no-warn-script-location",
             action="store_false",
@@ -214,6 +230,12 @@ class InstallCommand(RequirementCommand):
         self.cmd_opts.add_option(cmdoptions.prefer_binary())
         self.cmd_opts.add_option(cmdoptions.require_hashes())
         self.cmd_opts.add_option(cmdoptions.progress_bar())
+        self.cmd_opts.add_option(cmdoptions.download_jobs())
+        self.cmd_opts.add_option(cmdoptions.build_jobs())
+        self.cmd_opts.add_option(cmdoptions.build_timeout())
+        self.cmd_opts.add_option(cmdoptions.extract_jobs())
+        self.cmd_opts.add_option(cmdoptions.install_jobs())
+        self.cmd_opts.add_option(cmdoptions.compile_jobs())
 
         index_opts = cmdoptions.make_option_group(
             cmdoptions.index_group,
@@ -266,6 +288,9 @@ class InstallCommand(RequirementCommand):
 
         global_options = options.global_options or []
 
+        if self._all_pins_satisfied(args, options):
+            return SUCCESS
+
         session = self.get_default_session(options)
 
         target_python = make_target_python(options)
@@ -278,6 +303,7 @@ class InstallCommand(RequirementCommand):
         wheel_cache = WheelCache(options.cache_dir, options.format_control)
 
         req_tracker = self.enter_context(get_requirement_tracker())
+        backend_workers = self.enter_backend_workers(options)
 
         directory = TempDirectory(
             delete=not options.no_clean,
@@ -299,6 +325,7 @@ class InstallCommand(RequirementCommand):
                 session=session,
                 finder=finder,
                 use_user_site=options.use_user_site,
+                backend_workers=backend_workers,
             )
             resolver = self.make_resolver(
                 preparer=preparer,
@@ -348,6 +375,7 @@ class InstallCommand(RequirementCommand):
                 verify=True,
                 build_options=[],
                 global_options=[],
+                build_jobs=options.build_jobs,
             )
 
             # If we're using PEP 517, we cannot do a direct install
@@ -390,6 +418,12 @@ class InstallCommand(RequirementCommand):
             if options.target_dir:
                 warn_script_location = False
 
+            wheel_store = None
+            if "unpacked-wheels" in options.features_enabled and options.cache_dir:
+                wheel_store = UnpackedWheelStore(
+                    os.path.join(options.cache_dir, "unpacked")
+                )
+
             installed = install_given_reqs(
                 to_install,
                 install_options,
@@ -400,6 +434,11 @@ class InstallCommand(RequirementCommand):
                 warn_script_location=warn_script_location,
                 use_user_site=options.use_user_site,
                 pycompile=options.compile,
+                extract_jobs=options.extract_jobs,
+                install_jobs=options.install_jobs,
+                compile_jobs=options.compile_jobs,
+                defer_compile=options.defer_compile,
+                wheel_store=wheel_store,
             )
 
             lib_locations = get_lib_location_guesses(
@@ -453,6 +492,64 @@ class InstallCommand(RequirementCommand):
         warn_if_run_as_root()
         return SUCCESS
 
+    def _all_pins_satisfied(self, args, options):
+        # type: (List[str], Values) -> bool
+        """Check whether the requirements are all pinned to versions that are
+        installed already, before setting up a session, a finder and the
+        resolver, which would find there is nothing to do.
+
+        Requirements files that are not on the filesystem are left to the
+        resolver, as reading them needs a session. The files read are kept
+        by the command for the requirements to be parsed again with a finder.
+        """
+        if (
+            options.upgrade or
+            options.force_reinstall or
+            options.ignore_installed or
+            options.target_dir or
+            options.prefix_path or
+            options.root_path or
+            options.use_user_site or
+            options.editables or
+            options.constraints
+        ):
+            return False
+
+        try:
+            reqs = self.get_requirements(args, options, None, None)
+        except InstallationError as e:
+            logger.debug("Not checking for installed pins: %s", e)
+            return False
+        # Hashes are required for all the requirements if any has one.
+        require_hashes = options.require_hashes or any(
+            req.has_hash_options for req in reqs
+        )
+        if require_hashes and not all(req.has_hash_options for req in reqs):
+            # Let the resolver report the missing hashes.
+            return False
+
+        satisfied = get_satisfying_distributions(
+            reqs,
+            get_default_environment(),
+            check_dependencies=not options.ignore_dependencies,
+        )
+        if satisfied is None:
+            return False
+        for req, dist in satisfied:
+            # As the resolver reports an installed requirement.
+            assert dist.location is not None
+            logger.info(
+                "Requirement already satisfied: %s in %s%s (%s)",
+                req.req,
+                display_path(dist.location),
+                f" (from {req.comes_from})" if req.comes_from else "",
+                dist.version,
+            )
+        # Nothing was looked up in the index, so don't build a session only
+        # to check pip's version either.
+        options.disable_pip_version_check = True
+        return True
+
     def _handle_target_dir(self, target_dir, target_temp_dir, upgrade):
         # type: (str, TempDirectory, bool) -> None
         ensure_dir(target_dir)
@@ -1,30 +1,57 @@
-import json
+import itertools
 import logging
 from optparse import Values
-from typing import Iterator, List, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
 
-from pip._vendor.pkg_resources import Distribution
+from pip._vendor.packaging.utils import canonicalize_name
 
 from pip._internal.cli import cmdoptions
 from pip._internal.cli.req_command import IndexGroupCommand
 from pip._internal.cli.status_codes import SUCCESS
 from pip._internal.exceptions import CommandError
-from pip._internal.index.collector import LinkCollector
-from pip._internal.index.package_finder import PackageFinder
-from pip._internal.models.selection_prefs import SelectionPreferences
-from pip._internal.network.session import PipSession
-from pip._internal.utils.compat import stdlib_pkgs
-from pip._internal.utils.misc import (
-    dist_is_editable,
-    get_installed_distributions,
-    tabulate,
-    write_output,
+from pip._internal.metadata import (
+    BaseDistribution,
+    BaseEnvironment,
+    get_default_environment,
+    get_environment,
 )
-from pip._internal.utils.packaging import get_installer
+from pip._internal.operations.inspect import iter_installed_info, iter_json_lines
+from pip._internal.utils.compat import stdlib_pkgs
+from pip._internal.utils.misc import tabulate, write_output
 from pip._internal.utils.parallel import map_multithread
 
+if TYPE_CHECKING:
+    from pip._internal.index.package_finder import PackageFinder
+    from pip._internal.metadata.base import DistributionVersion
+    from pip._internal.network.session import PipSession
+
+    class _DistWithLatestInfo(BaseDistribution):
+        """Give the distribution object a couple of extra fields.
+
+        These will be populated during ``get_outdated()``. This is dirty but
+        makes the rest of the code much cleaner.
+        """
+        latest_version: "DistributionVersion"
+        latest_filetype: str
+
+    _ProcessedDists = Sequence[_DistWithLatestInfo]
+
 logger = logging.getLogger(__name__)
 
+# The number of packages written at once with --format=json.
+_JSON_BATCH_SIZE = 500
+
 
 class ListCommand(IndexGroupCommand):
     """
@@ -120,6 +147,11 @@ class ListCommand(IndexGroupCommand):
         """
         Create a package finder appropriate to this list command.
         """
+        # Imported here, as only --outdated and --uptodate need the index.
+        from pip._internal.index import package_finder
+        from pip._internal.index.collector import LinkCollector
+        from pip._internal.models.selection_prefs import SelectionPreferences
+
         link_collector = LinkCollector.create(session, options=options)
 
         # Pass allow_yanked=False to ignore yanked versions.
@@ -128,7 +160,7 @@ class ListCommand(IndexGroupCommand):
             allow_all_prereleases=options.pre,
         )
 
-        return PackageFinder.create(
+        return package_finder.PackageFinder.create(
             link_collector=link_collector,
             selection_prefs=selection_prefs,
         )
@@ -145,14 +177,17 @@ class ListCommand(IndexGroupCommand):
         if options.excludes:
             skip.update(options.excludes)
 
-        packages = get_installed_distributions(
+        if options.path:
+            env = get_environment(options.path)
+        else:
+            env = get_default_environment()
+        packages = cast("_ProcessedDists", list(env.iter_installed_distributions(
             local_only=options.local,
             user_only=options.user,
             editables_only=options.editable,
             include_editables=options.include_editable,
-            paths=options.path,
             skip=skip,
-        )
+        )))
 
         # get_not_required must be called firstly in order to find and
         # filter out all dependencies correctly. Otherwise a package
@@ -166,49 +201,54 @@ class ListCommand(IndexGroupCommand):
         elif options.uptodate:
             packages = self.get_uptodate(packages, options)
 
-        self.output_package_listing(packages, options)
+        self.output_package_listing(packages, env, options)
         return SUCCESS
 
     def get_outdated(self, packages, options):
-        # type: (List[Distribution], Values) -> List[Distribution]
+        # type: (_ProcessedDists, Values) -> _ProcessedDists
         return [
             dist for dist in self.iter_packages_latest_infos(packages, options)
-            if dist.latest_version > dist.parsed_version
+            if dist.latest_version > dist.version
         ]
 
     def get_uptodate(self, packages, options):
-        # type: (List[Distribution], Values) -> List[Distribution]
+        # type: (_ProcessedDists, Values) -> _ProcessedDists
         return [
             dist for dist in self.iter_packages_latest_infos(packages, options)
-            if dist.latest_version == dist.parsed_version
+            if dist.latest_version == dist.version
         ]
 
     def get_not_required(self, packages, options):
-        # type: (List[Distribution], Values) -> List[Distribution]
-        dep_keys = set()  # type: Set[Distribution]
+        # type: (_ProcessedDists, Values) -> _ProcessedDists
+        dep_keys = set()  # type: Set[str]
         for dist in packages:
-            dep_keys.update(requirement.key for requirement in dist.requires())
-
-        # Create a set to remove duplicate packages, and cast it to a list
-        # to keep the return type consistent with get_outdated and
-        # get_uptodate
-        return list({pkg for pkg in packages if pkg.key not in dep_keys})
+            dep_keys.update(
+                canonicalize_name(requirement.name)
+                for requirement in dist.iter_dependencies()
+            )
+
+        # Remove duplicate packages, keeping the list type consistent with
+        # get_outdated and get_uptodate.
+        by_name = {pkg.canonical_name: pkg for pkg in packages}
+        return [
+            pkg for name, pkg in by_name.items() if name not in dep_keys
+        ]
 
     def iter_packages_latest_infos(self, packages, options):
-        # type: (List[Distribution], Values) -> Iterator[Distribution]
+        # type: (_ProcessedDists, Values) -> Iterator[_DistWithLatestInfo]
         with self._build_session(options) as session:
             finder = self._build_package_finder(options, session)
 
             def latest_info(dist):
-                # type: (Distribution) -> Distribution
-                all_candidates = finder.find_all_candidates(dist.key)
+                # type: (_DistWithLatestInfo) -> Optional[_DistWithLatestInfo]
+                all_candidates = finder.find_all_candidates(dist.canonical_name)
                 if not options.pre:
                     # Remove prereleases
                     all_candidates = [candidate for candidate in all_candidates
                                       if not candidate.version.is_prerelease]
 
                 evaluator = finder.make_candidate_evaluator(
-                    project_name=dist.project_name,
+                    project_name=dist.raw_name,
                 )
                 best_candidate = evaluator.sort_best_candidate(all_candidates)
                 if best_candidate is None:
@@ -228,24 +268,46 @@ class ListCommand(IndexGroupCommand):
                 if dist is not None:
                     yield dist
 
-    def output_package_listing(self, packages, options):
-        # type: (List[Distribution], Values) -> None
+    def output_package_listing(self, packages, env, options):
+        # type: (_ProcessedDists, BaseEnvironment, Values) -> None
         packages = sorted(
             packages,
-            key=lambda dist: dist.project_name.lower(),
+            key=lambda dist: dist.raw_name.lower(),
         )
+        fields = {'name', 'version'}
+        if options.verbose >= 1:
+            fields.update(['location', 'installer'])
+        elif options.list_format == 'columns':
+            # Editable packages show their location.
+            fields.update(['location', 'editable'])
+        infos = iter_installed_info(packages, fields, env)
+        if options.outdated:
+            infos = (
+                dict(
+                    info,
+                    latest_version=str(dist.latest_version),
+                    latest_filetype=dist.latest_filetype,
+                )
+                for dist, info in zip(packages, infos)
+            )
+
         if options.list_format == 'columns' and packages:
-            data, header = format_for_columns(packages, options)
+            data, header = format_for_columns(list(infos), options)
             self.output_package_listing_columns(data, header)
         elif options.list_format == 'freeze':
-            for dist in packages:
+            for info in infos:
                 if options.verbose >= 1:
-                    write_output("%s==%s (%s)", dist.project_name,
-                                 dist.version, dist.location)
+                    write_output("%s==%s (%s)", info['name'],
+                                 info['version'], info['location'])
                 else:
-                    write_output("%s==%s", dist.project_name, dist.version)
+                    write_output("%s==%s", info['name'], info['version'])
         elif options.list_format == 'json':
-            write_output(format_for_json(packages, options))
+            # Write the lines in batches, as logging each one is slow.
+            lines = iter_json_lines(infos)
+            batch = list(itertools.islice(lines, _JSON_BATCH_SIZE))
+            while batch:
+                write_output("\n".join(batch))
+                batch = list(itertools.islice(lines, _JSON_BATCH_SIZE))
 
     def output_package_listing_columns(self, data, header):
         # type: (List[List[str]], List[str]) -> None
@@ -263,8 +325,8 @@ class ListCommand(IndexGroupCommand):
             write_output(val)
 
 
-def format_for_columns(pkgs, options):
-    # type: (List[Distribution], Values) -> Tuple[List[List[str]], List[str]]
+def format_for_columns(infos, options):
+    # type: (List[Dict[str, Any]], Values) -> Tuple[List[List[str]], List[str]]
     """
     Convert the package data into something usable
     by output_package_listing_columns.
@@ -277,43 +339,28 @@ def format_for_columns(pkgs, options):
         header = ["Package", "Version"]
 
     data = []
-    if options.verbose >= 1 or any(dist_is_editable(x) for x in pkgs):
+    show_location = (
+        options.verbose >= 1 or any(info.get('editable') for info in infos)
+    )
+    if show_location:
         header.append("Location")
     if options.verbose >= 1:
         header.append("Installer")
 
-    for proj in pkgs:
+    for info in infos:
         # if we're working on the 'outdated' list, separate out the
         # latest_version and type
-        row = [proj.project_name, proj.version]
+        row = [info['name'], info['version']]
 
         if running_outdated:
-            row.append(proj.latest_version)
-            row.append(proj.latest_filetype)
+            row.append(info['latest_version'])
+            row.append(info['latest_filetype'])
 
-        if options.verbose >= 1 or dist_is_editable(proj):
-            row.append(proj.location)
+        if options.verbose >= 1 or info.get('editable'):
+            row.append(info['location'])
         if options.verbose >= 1:
-            row.append(get_installer(proj))
+            row.append(info['installer'])
 
         data.append(row)
 
     return data, header
-
-
-def format_for_json(packages, options):
-    # type: (List[Distribution], Values) -> str
-    data = []
-    for dist in packages:
-        info = {
-            'name': dist.project_name,
-            'version': str(dist.version),
-        }
-        if options.verbose >= 1:
-            info['location'] = dist.location
-            info['installer'] = get_installer(dist)
-        if options.outdated:
-            info['latest_version'] = str(dist.latest_version)
-            info['latest_filetype'] = dist.latest_filetype
-        data.append(info)
-    return json.dumps(data)
@@ -65,6 +65,9 @@ class WheelCommand(RequirementCommand):
         self.cmd_opts.add_option(cmdoptions.no_deps())
         self.cmd_opts.add_option(cmdoptions.build_dir())
         self.cmd_opts.add_option(cmdoptions.progress_bar())
+        self.cmd_opts.add_option(cmdoptions.download_jobs())
+        self.cmd_opts.add_option(cmdoptions.build_jobs())
+        self.cmd_opts.add_option(cmdoptions.build_timeout())
 
         self.cmd_opts.add_option(
             '--no-verify',
@@ -109,6 +112,7 @@ class WheelCommand(RequirementCommand):
         ensure_dir(options.wheel_dir)
 
         req_tracker = self.enter_context(get_requirement_tracker())
+        backend_workers = self.enter_backend_workers(options)
 
         directory = TempDirectory(
             delete=not options.no_clean,
@@ -126,6 +130,7 @@ class WheelCommand(RequirementCommand):
             finder=finder,
             download_dir=options.wheel_dir,
             use_user_site=False,
+            backend_workers=backend_workers,
         )
 
         resolver = self.make_resolver(
@@ -157,6 +162,7 @@ class WheelCommand(RequirementCommand):
             verify=(not options.no_verify),
             build_options=options.build_options or [],
             global_options=options.global_options or [],
+            build_jobs=options.build_jobs,
         )
         for req in build_successes:
             assert req.link and req.link.is_wheel
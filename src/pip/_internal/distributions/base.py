@@ -1,11 +1,16 @@
 import abc
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from pip._vendor.pkg_resources import Distribution
 
 from pip._internal.index.package_finder import PackageFinder
 from pip._internal.req import InstallRequirement
 
+if TYPE_CHECKING:
+    from pip._internal.build_env import InProcessInstaller
+    from pip._internal.cache import BuildEnvironmentStore
+    from pip._internal.operations.build.backend_workers import BackendWorkerPool
+
 
 class AbstractDistribution(metaclass=abc.ABCMeta):
     """A base class for handling installable artifacts.
@@ -34,6 +39,13 @@ class AbstractDistribution(metaclass=abc.ABCMeta):
         raise NotImplementedError()
 
     @abc.abstractmethod
-    def prepare_distribution_metadata(self, finder, build_isolation):
-        # type: (PackageFinder, bool) -> None
+    def prepare_distribution_metadata(
+        self,
+        finder,  # type: PackageFinder
+        build_isolation,  # type: bool
+        build_env_store=None,  # type: Optional[BuildEnvironmentStore]
+        build_env_installer=None,  # type: Optional[InProcessInstaller]
+        backend_workers=None,  # type: Optional[BackendWorkerPool]
+    ):
+        # type: (...) -> None
         raise NotImplementedError()
@@ -1,10 +1,15 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from pip._vendor.pkg_resources import Distribution
 
 from pip._internal.distributions.base import AbstractDistribution
 from pip._internal.index.package_finder import PackageFinder
 
+if TYPE_CHECKING:
+    from pip._internal.build_env import InProcessInstaller
+    from pip._internal.cache import BuildEnvironmentStore
+    from pip._internal.operations.build.backend_workers import BackendWorkerPool
+
 
 class InstalledDistribution(AbstractDistribution):
     """Represents an installed package.
@@ -17,6 +22,13 @@ class InstalledDistribution(AbstractDistribution):
         # type: () -> Optional[Distribution]
         return self.req.satisfied_by
 
-    def prepare_distribution_metadata(self, finder, build_isolation):
-        # type: (PackageFinder, bool) -> None
+    def prepare_distribution_metadata(
+        self,
+        finder,  # type: PackageFinder
+        build_isolation,  # type: bool
+        build_env_store=None,  # type: Optional[BuildEnvironmentStore]
+        build_env_installer=None,  # type: Optional[InProcessInstaller]
+        backend_workers=None,  # type: Optional[BackendWorkerPool]
+    ):
+        # type: (...) -> None
         pass
@@ -1,5 +1,5 @@
 import logging
-from typing import Set, Tuple
+from typing import TYPE_CHECKING, Optional, Set, Tuple
 
 from pip._vendor.pkg_resources import Distribution
 
@@ -7,7 +7,11 @@ from pip._internal.build_env import BuildEnvironment
 from pip._internal.distributions.base import AbstractDistribution
 from pip._internal.exceptions import InstallationError
 from pip._internal.index.package_finder import PackageFinder
-from pip._internal.utils.subprocess import runner_with_spinner_message
+
+if TYPE_CHECKING:
+    from pip._internal.build_env import InProcessInstaller
+    from pip._internal.cache import BuildEnvironmentStore
+    from pip._internal.operations.build.backend_workers import BackendWorkerPool
 
 logger = logging.getLogger(__name__)
 
@@ -23,20 +27,35 @@ class SourceDistribution(AbstractDistribution):
         # type: () -> Distribution
         return self.req.get_dist()
 
-    def prepare_distribution_metadata(self, finder, build_isolation):
-        # type: (PackageFinder, bool) -> None
+    def prepare_distribution_metadata(
+        self,
+        finder,  # type: PackageFinder
+        build_isolation,  # type: bool
+        build_env_store=None,  # type: Optional[BuildEnvironmentStore]
+        build_env_installer=None,  # type: Optional[InProcessInstaller]
+        backend_workers=None,  # type: Optional[BackendWorkerPool]
+    ):
+        # type: (...) -> None
         # Load pyproject.toml, to determine whether PEP 517 is to be used
         self.req.load_pyproject_toml()
 
         # Set up the build isolation, if this requirement should be isolated
         should_isolate = self.req.use_pep517 and build_isolation
         if should_isolate:
-            self._setup_isolation(finder)
+            self._setup_isolation(
+                finder, build_env_store, build_env_installer, backend_workers
+            )
 
         self.req.prepare_metadata()
 
-    def _setup_isolation(self, finder):
-        # type: (PackageFinder) -> None
+    def _setup_isolation(
+        self,
+        finder,  # type: PackageFinder
+        build_env_store,  # type: Optional[BuildEnvironmentStore]
+        build_env_installer,  # type: Optional[InProcessInstaller]
+        backend_workers,  # type: Optional[BackendWorkerPool]
+    ):
+        # type: (...) -> None
         def _raise_conflicts(conflicting_with, conflicting_reqs):
             # type: (str, Set[Tuple[str, str]]) -> None
             format_string = (
@@ -58,7 +77,9 @@ class SourceDistribution(AbstractDistribution):
         pyproject_requires = self.req.pyproject_requires
         assert pyproject_requires is not None
 
-        self.req.build_env = BuildEnvironment()
+        self.req.build_env = BuildEnvironment(
+            build_env_store, build_env_installer, backend_workers
+        )
         self.req.build_env.install_requirements(
             finder, pyproject_requires, "overlay", "Installing build dependencies"
         )
@@ -81,7 +102,9 @@ class SourceDistribution(AbstractDistribution):
         # This must be done in a second pass, as the pyproject.toml
         # dependencies must be installed before we can call the backend.
         with self.req.build_env:
-            runner = runner_with_spinner_message("Getting requirements to build wheel")
+            runner = self.req.build_env.get_hook_runner(
+                "Getting requirements to build wheel"
+            )
             backend = self.req.pep517_backend
             assert backend is not None
             with backend.subprocess_runner(runner):
@@ -1,3 +1,4 @@
+from typing import TYPE_CHECKING, Optional
 from zipfile import ZipFile
 
 from pip._vendor.pkg_resources import Distribution
@@ -6,6 +7,11 @@ from pip._internal.distributions.base import AbstractDistribution
 from pip._internal.index.package_finder import PackageFinder
 from pip._internal.utils.wheel import pkg_resources_distribution_for_wheel
 
+if TYPE_CHECKING:
+    from pip._internal.build_env import InProcessInstaller
+    from pip._internal.cache import BuildEnvironmentStore
+    from pip._internal.operations.build.backend_workers import BackendWorkerPool
+
 
 class WheelDistribution(AbstractDistribution):
     """Represents a wheel distribution.
@@ -29,6 +35,13 @@ class WheelDistribution(AbstractDistribution):
                 z, self.req.name, self.req.local_file_path
             )
 
-    def prepare_distribution_metadata(self, finder, build_isolation):
-        # type: (PackageFinder, bool) -> None
+    def prepare_distribution_metadata(
+        self,
+        finder,  # type: PackageFinder
+        build_isolation,  # type: bool
+        build_env_store=None,  # type: Optional[BuildEnvironmentStore]
+        build_env_installer=None,  # type: Optional[InProcessInstaller]
+        backend_workers=None,  # type: Optional[BackendWorkerPool]
+    ):
+        # type: (...) -> None
         pass
@@ -7,21 +7,27 @@ import collections
 import functools
 import html
 import itertools
+import json
 import logging
 import os
 import re
 import urllib.parse
 import urllib.request
 import xml.etree.ElementTree
+from html.parser import HTMLParser
 from optparse import Values
 from typing import (
+    Any,
     Callable,
+    Dict,
     Iterable,
     List,
+    Mapping,
     MutableMapping,
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Union,
 )
 
@@ -30,12 +36,14 @@ from pip._vendor.requests import Response
 from pip._vendor.requests.exceptions import RetryError, SSLError
 
 from pip._internal.exceptions import NetworkConnectionError
+from pip._internal.index.link_cache import LinkCache
 from pip._internal.models.link import Link
 from pip._internal.models.search_scope import SearchScope
 from pip._internal.network.session import PipSession
 from pip._internal.network.utils import raise_for_status
 from pip._internal.utils.filetypes import is_archive_file
 from pip._internal.utils.misc import pairwise, redact_auth_from_url
+from pip._internal.utils.parallel import map_multithread
 from pip._internal.vcs import vcs
 
 from .sources import CandidatesFromPage, LinkSource, build_source
@@ -43,7 +51,10 @@ from .sources import CandidatesFromPage, LinkSource, build_source
 logger = logging.getLogger(__name__)
 
 HTMLElement = xml.etree.ElementTree.Element
+AnchorAttributes = Dict[str, str]
 ResponseHeaders = MutableMapping[str, str]
+# The ETag and Last-Modified headers of a page.
+PageValidators = Tuple[Optional[str], Optional[str]]
 
 
 def _match_vcs_scheme(url):
@@ -58,7 +69,21 @@ def _match_vcs_scheme(url):
     return None
 
 
-class _NotHTML(Exception):
+# The PEP 691 JSON and HTML content types of the simple repository API,
+# and plain HTML for servers that do not implement PEP 691.
+SIMPLE_API_JSON = "application/vnd.pypi.simple.v1+json"
+SIMPLE_API_HTML = "application/vnd.pypi.simple.v1+html"
+SIMPLE_API_CONTENT_TYPES = (SIMPLE_API_JSON, SIMPLE_API_HTML, "text/html")
+
+# Prefer JSON, which is both smaller and cheaper to parse than HTML.
+SIMPLE_API_ACCEPT = ", ".join([
+    SIMPLE_API_JSON,
+    f"{SIMPLE_API_HTML}; q=0.1",
+    "text/html; q=0.01",
+])
+
+
+class _NotAPIContent(Exception):
     def __init__(self, content_type, request_desc):
         # type: (str, str) -> None
         super().__init__(content_type, request_desc)
@@ -66,27 +91,30 @@ class _NotHTML(Exception):
         self.request_desc = request_desc
 
 
-def _ensure_html_header(response):
+def _ensure_api_header(response):
     # type: (Response) -> None
-    """Check the Content-Type header to ensure the response contains HTML.
+    """Check the Content-Type header to ensure the response contains a
+    simple repository page, either as HTML or as PEP 691 JSON.
 
-    Raises `_NotHTML` if the content type is not text/html.
+    Raises `_NotAPIContent` if the content type is not one of
+    SIMPLE_API_CONTENT_TYPES.
     """
     content_type = response.headers.get("Content-Type", "")
-    if not content_type.lower().startswith("text/html"):
-        raise _NotHTML(content_type, response.request.method)
+    if not content_type.lower().startswith(SIMPLE_API_CONTENT_TYPES):
+        raise _NotAPIContent(content_type, response.request.method)
 
 
 class _NotHTTP(Exception):
     pass
 
 
-def _ensure_html_response(url, session):
+def _ensure_api_response(url, session):
     # type: (str, PipSession) -> None
-    """Send a HEAD request to the URL, and ensure the response contains HTML.
+    """Send a HEAD request to the URL, and ensure the response contains a
+    simple repository page.
 
     Raises `_NotHTTP` if the URL is not available for a HEAD request, or
-    `_NotHTML` if the content type is not text/html.
+    `_NotAPIContent` if the content type is not supported.
     """
     scheme, netloc, path, query, fragment = urllib.parse.urlsplit(url)
     if scheme not in {'http', 'https'}:
@@ -95,32 +123,35 @@ def _ensure_html_response(url, session):
     resp = session.head(url, allow_redirects=True)
     raise_for_status(resp)
 
-    _ensure_html_header(resp)
+    _ensure_api_header(resp)
 
 
 def _get_html_response(url, session):
     # type: (str, PipSession) -> Response
-    """Access an HTML page with GET, and return the response.
+    """Access a simple repository page with GET, and return the response.
+
+    The PEP 691 JSON form of the page is requested, with HTML as a fallback
+    for servers that do not offer it.
 
     This consists of three parts:
 
     1. If the URL looks suspiciously like an archive, send a HEAD first to
-       check the Content-Type is HTML, to avoid downloading a large file.
-       Raise `_NotHTTP` if the content type cannot be determined, or
-       `_NotHTML` if it is not HTML.
+       check the Content-Type is supported, to avoid downloading a large
+       file. Raise `_NotHTTP` if the content type cannot be determined, or
+       `_NotAPIContent` if it is not supported.
     2. Actually perform the request. Raise HTTP exceptions on network failures.
-    3. Check the Content-Type header to make sure we got HTML, and raise
-       `_NotHTML` otherwise.
+    3. Check the Content-Type header to make sure we got a supported
+       response, and raise `_NotAPIContent` otherwise.
     """
     if is_archive_file(Link(url).filename):
-        _ensure_html_response(url, session=session)
+        _ensure_api_response(url, session=session)
 
     logger.debug('Getting page %s', redact_auth_from_url(url))
 
     resp = session.get(
         url,
         headers={
-            "Accept": "text/html",
+            "Accept": SIMPLE_API_ACCEPT,
             # We don't want to blindly returned cached data for
             # /simple/, because authors generally expecting that
             # twine upload && pip install will function, but if
@@ -144,7 +175,7 @@ def _get_html_response(url, session):
     # requirement of an url. Unless we issue a HEAD request on every
     # url we cannot know ahead of time for sure if something is HTML
     # or not. However we can check after we've downloaded it.
-    _ensure_html_header(resp)
+    _ensure_api_header(resp)
 
     return resp
 
@@ -247,7 +278,7 @@ def _clean_link(url):
 
 
 def _create_link_from_element(
-    anchor,    # type: HTMLElement
+    anchor,    # type: Union[HTMLElement, AnchorAttributes]
     page_url,  # type: str
     base_url,  # type: str
 ):
@@ -267,16 +298,83 @@ def _create_link_from_element(
     if yanked_reason:
         yanked_reason = html.unescape(yanked_reason)
 
+    dist_info_metadata = anchor.get('data-dist-info-metadata')
+
     link = Link(
         url,
         comes_from=page_url,
         requires_python=pyrequire,
         yanked_reason=yanked_reason,
+        dist_info_metadata=dist_info_metadata,
     )
 
     return link
 
 
+# The hashes that can be carried in a link's URL fragment, most preferred
+# first.
+_FRAGMENT_HASH_NAMES = ('sha256', 'sha384', 'sha512', 'sha224', 'sha1', 'md5')
+
+
+def _format_hash(hashes):
+    # type: (Dict[str, str]) -> Optional[str]
+    """Pick the preferred hash out of a PEP 691 hashes dictionary, and format
+    it as "<hashname>=<hexdigest>".
+    """
+    for hash_name in _FRAGMENT_HASH_NAMES:
+        if hash_name in hashes:
+            return f"{hash_name}={hashes[hash_name]}"
+    return None
+
+
+def _create_link_from_file(
+    file,      # type: Dict[str, Any]
+    page_url,  # type: str
+):
+    # type: (...) -> Optional[Link]
+    """
+    Convert a file in a PEP 691 JSON simple repository page to a Link.
+    """
+    file_url = file.get("url")
+    if not file_url:
+        return None
+
+    url = _clean_link(urllib.parse.urljoin(page_url, file_url))
+
+    # The file's hash goes in the URL fragment, where it is also found on
+    # links from HTML pages.
+    file_hash = _format_hash(file.get("hashes") or {})
+    if file_hash is not None and Link(url).hash is None:
+        url = f"{url.split('#', 1)[0]}#{file_hash}"
+
+    # "yanked" is either a boolean, or a string with the reason.
+    yanked = file.get("yanked")
+    if isinstance(yanked, str):
+        yanked_reason = yanked  # type: Optional[str]
+    elif yanked:
+        yanked_reason = ""
+    else:
+        yanked_reason = None
+
+    # "dist-info-metadata" is either a boolean, or a dictionary of hashes;
+    # store it the way PEP 658 spells it in HTML.
+    metadata = file.get("dist-info-metadata")
+    if isinstance(metadata, dict):
+        dist_info_metadata = _format_hash(metadata) or "true"  # type: Optional[str]
+    elif metadata:
+        dist_info_metadata = "true"
+    else:
+        dist_info_metadata = None
+
+    return Link(
+        url,
+        comes_from=page_url,
+        requires_python=file.get("requires-python"),
+        yanked_reason=yanked_reason,
+        dist_info_metadata=dist_info_metadata,
+    )
+
+
 class CacheablePageContent:
     def __init__(self, page):
         # type: (HTMLPage) -> None
@@ -318,11 +416,41 @@ def with_cached_html_pages(
     return wrapper_wrapper
 
 
-@with_cached_html_pages
-def parse_links(page):
+class HTMLLinkParser(HTMLParser):
+    """
+    Collect the anchors and the base URL of an HTML document.
+
+    Unlike html5lib, this does not build a tree of the document: only the
+    attributes of ``<a>`` tags and the first ``<base>`` tag with an href are
+    kept, which is all a simple repository page needs.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        super().__init__(convert_charrefs=True)
+        self.base_url = None  # type: Optional[str]
+        self.anchors = []  # type: List[AnchorAttributes]
+
+    def handle_starttag(self, tag, attrs):
+        # type: (str, List[Tuple[str, Optional[str]]]) -> None
+        if tag == "a":
+            self.anchors.append(self._get_attributes(attrs))
+        elif tag == "base" and self.base_url is None:
+            self.base_url = self._get_attributes(attrs).get("href")
+
+    @staticmethod
+    def _get_attributes(attrs):
+        # type: (List[Tuple[str, Optional[str]]]) -> AnchorAttributes
+        # Like html5lib, keep the first of duplicated attributes, and give
+        # attributes without a value (e.g. "data-yanked") an empty one.
+        return {name: value or "" for name, value in reversed(attrs)}
+
+
+def _parse_links_html5lib(page):
     # type: (HTMLPage) -> Iterable[Link]
     """
-    Parse an HTML document, and yield its anchor elements as Link objects.
+    Parse an HTML document with html5lib, and yield its anchor elements as
+    Link objects.
     """
     document = html5lib.parse(
         page.content,
@@ -343,6 +471,72 @@ def parse_links(page):
         yield link
 
 
+def _get_json_page_files(page):
+    # type: (HTMLPage) -> Optional[List[Dict[str, Any]]]
+    """
+    Return the files listed on a PEP 691 JSON page, or None if the page is
+    not valid (e.g. truncated).
+    """
+    try:
+        data = json.loads(page.content)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    files = data.get("files", [])
+    if not isinstance(files, list):
+        return None
+    return [file for file in files if isinstance(file, dict)]
+
+
+@with_cached_html_pages
+def parse_links(page):
+    # type: (HTMLPage) -> Iterable[Link]
+    """
+    Parse a simple repository page, and yield the files it lists as Link
+    objects.
+
+    PEP 691 JSON pages are read directly. HTML documents go through
+    HTMLLinkParser, which is much cheaper than building an html5lib tree for
+    pages listing thousands of files. If the page cannot be handled that way
+    (most notably, when it is not valid in the encoding it was served with),
+    html5lib is used instead.
+    """
+    if page.is_json:
+        files = _get_json_page_files(page)
+        if files is None:
+            logger.warning("Could not parse the JSON page %s", page)
+            return
+        for file in files:
+            link = _create_link_from_file(file, page_url=page.url)
+            if link is None:
+                continue
+            yield link
+        return
+
+    parser = HTMLLinkParser()
+    try:
+        parser.feed(page.content.decode(page.encoding or "utf-8"))
+        parser.close()
+    # AssertionError is how html.parser reports some malformed markup.
+    except (UnicodeDecodeError, LookupError, AssertionError):
+        logger.debug("Falling back to html5lib to parse %s", page)
+        yield from _parse_links_html5lib(page)
+        return
+
+    url = page.url
+    base_url = parser.base_url or url
+    for anchor in parser.anchors:
+        link = _create_link_from_element(
+            anchor,
+            page_url=url,
+            base_url=base_url,
+        )
+        if link is None:
+            continue
+        yield link
+
+
 class HTMLPage:
     """Represents one page, along with its URL"""
 
@@ -352,6 +546,9 @@ class HTMLPage:
         encoding,                 # type: Optional[str]
         url,                      # type: str
         cache_link_parsing=True,  # type: bool
+        content_type="text/html",  # type: str
+        etag=None,                # type: Optional[str]
+        last_modified=None,       # type: Optional[str]
     ):
         # type: (...) -> None
         """
@@ -360,11 +557,23 @@ class HTMLPage:
         :param cache_link_parsing: whether links parsed from this page's url
                                    should be cached. PyPI index urls should
                                    have this set to False, for example.
+        :param content_type: the page's Content-Type; the page is either
+            HTML, or PEP 691 JSON.
+        :param etag: the page's ETag header, if any.
+        :param last_modified: the page's Last-Modified header, if any.
         """
         self.content = content
         self.encoding = encoding
         self.url = url
         self.cache_link_parsing = cache_link_parsing
+        self.content_type = content_type
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def is_json(self):
+        # type: () -> bool
+        return self.content_type.lower().startswith(SIMPLE_API_JSON)
 
     def __str__(self):
         # type: () -> str
@@ -389,7 +598,10 @@ def _make_html_page(response, cache_link_parsing=True):
         response.content,
         encoding=encoding,
         url=response.url,
-        cache_link_parsing=cache_link_parsing)
+        cache_link_parsing=cache_link_parsing,
+        content_type=response.headers.get("Content-Type", "text/html"),
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"))
 
 
 def _get_html_page(link, session=None):
@@ -425,11 +637,12 @@ def _get_html_page(link, session=None):
             'Skipping page %s because it looks like an archive, and cannot '
             'be checked by a HTTP HEAD request.', link,
         )
-    except _NotHTML as exc:
+    except _NotAPIContent as exc:
         logger.warning(
-            'Skipping page %s because the %s request got Content-Type: %s.'
-            'The only supported Content-Type is text/html',
+            'Skipping page %s because the %s request got Content-Type: %s. '
+            'The only supported Content-Types are %s',
             link, exc.request_desc, exc.content_type,
+            ', '.join(SIMPLE_API_CONTENT_TYPES),
         )
     except NetworkConnectionError as exc:
         _handle_get_page_fail(link, exc)
@@ -467,10 +680,19 @@ class LinkCollector:
         self,
         session,       # type: PipSession
         search_scope,  # type: SearchScope
+        link_cache=None,  # type: Optional[LinkCache]
     ):
         # type: (...) -> None
+        """
+        :param link_cache: A persistent cache of the links parsed from pages,
+            or None to always parse fetched pages.
+        """
         self.search_scope = search_scope
         self.session = session
+        self.link_cache = link_cache
+        # The validators of each page fetched, by URL, or None for pages
+        # that could not be fetched.
+        self.page_validators = {}  # type: Dict[str, Optional[PageValidators]]
 
     @classmethod
     def create(cls, session, options, suppress_no_index=False):
@@ -494,8 +716,17 @@ class LinkCollector:
         search_scope = SearchScope.create(
             find_links=find_links, index_urls=index_urls,
         )
+
+        cache_dir = getattr(options, "cache_dir", None)
+        if cache_dir:
+            link_cache = LinkCache(
+                os.path.join(cache_dir, "links")
+            )  # type: Optional[LinkCache]
+        else:
+            link_cache = None
+
         link_collector = LinkCollector(
-            session=session, search_scope=search_scope,
+            session=session, search_scope=search_scope, link_cache=link_cache,
         )
         return link_collector
 
@@ -509,7 +740,52 @@ class LinkCollector:
         """
         Fetch an HTML page containing package links.
         """
-        return _get_html_page(location, session=self.session)
+        page = _get_html_page(location, session=self.session)
+        if page is None:
+            self.page_validators[location.url] = None
+        else:
+            self.page_validators[location.url] = (page.etag, page.last_modified)
+        return page
+
+    def fetch_unchanged_links(self, page_validators):
+        # type: (Mapping[str, PageValidators]) -> Optional[List[Link]]
+        """
+        Fetch the pages at the given URLs again, and return the links on
+        them if they all still have the given validators, or None if any
+        of them changed or could not be fetched.
+        """
+        def fetch(url):
+            # type: (str) -> Tuple[str, Optional[HTMLPage]]
+            return url, self.fetch_page(Link(url, cache_link_parsing=False))
+
+        pages = dict(map_multithread(fetch, page_validators))
+        links = []  # type: List[Link]
+        for url, validators in page_validators.items():
+            page = pages[url]
+            if page is None or (page.etag, page.last_modified) != validators:
+                logger.debug("Page %s changed", redact_auth_from_url(url))
+                return None
+            links.extend(self.parse_links(page))
+        return links
+
+    def parse_links(self, page):
+        # type: (HTMLPage) -> List[Link]
+        """
+        Parse the links on a page returned by fetch_page(), reusing the
+        links parsed from the same page earlier if they are in the link
+        cache.
+        """
+        if self.link_cache is None:
+            return list(parse_links(page))
+
+        links = self.link_cache.get(page)
+        if links is None:
+            links = list(parse_links(page))
+            # A page that could not be parsed has no links either, and is
+            # parsed again next time.
+            if links:
+                self.link_cache.set(page, links)
+        return links
 
     def collect_sources(
         self,
@@ -0,0 +1,185 @@
+"""Persistent cache of the links parsed from simple repository pages.
+"""
+
+import hashlib
+import logging
+import os
+import struct
+import urllib.parse
+import zlib
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+
+from pip._internal.models.link import Link
+from pip._internal.network.cache import suppressed_cache_errors
+from pip._internal.utils.filesystem import adjacent_tmp_file, replace
+from pip._internal.utils.misc import ensure_dir
+
+if TYPE_CHECKING:
+    from pip._internal.index.collector import HTMLPage
+
+logger = logging.getLogger(__name__)
+
+# An entry is a magic string and a format version, followed by a
+# zlib-compressed sequence of length-prefixed UTF-8 strings: the page URL,
+# then LINK_FIELDS for each link. Missing values get the _NONE length.
+_MAGIC = b"pip-links"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("!9sB")
+_LENGTH = struct.Struct("!I")
+_NONE = 0xFFFFFFFF
+
+LINK_FIELDS = ("url", "requires_python", "yanked_reason", "dist_info_metadata")
+
+
+def _pack_str(value):
+    # type: (Optional[str]) -> bytes
+    if value is None:
+        return _LENGTH.pack(_NONE)
+    encoded = value.encode("utf-8")
+    return _LENGTH.pack(len(encoded)) + encoded
+
+
+def _unpack_strs(data):
+    # type: (bytes) -> Iterator[Optional[str]]
+    offset = 0
+    while offset < len(data):
+        length, = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        if length == _NONE:
+            yield None
+            continue
+        if offset + length > len(data):
+            raise ValueError("truncated entry")
+        yield data[offset:offset + length].decode("utf-8")
+        offset += length
+
+
+def serialize_links(page_url, links):
+    # type: (str, List[Link]) -> bytes
+    """Encode the links parsed from the page at page_url."""
+    parts = [_pack_str(page_url)]
+    for link in links:
+        parts.extend(_pack_str(getattr(link, name)) for name in LINK_FIELDS)
+    body = zlib.compress(b"".join(parts))
+    return _HEADER.pack(_MAGIC, _FORMAT_VERSION) + body
+
+
+def deserialize_links(data):
+    # type: (bytes) -> Tuple[str, List[Link]]
+    """Decode an entry produced by serialize_links(), returning the page URL
+    and its links.
+
+    Raises ValueError if the entry is not valid.
+    """
+    try:
+        magic, version = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("unknown entry format")
+        values = list(_unpack_strs(zlib.decompress(data[_HEADER.size:])))
+    except (struct.error, zlib.error, UnicodeDecodeError) as exc:
+        raise ValueError(f"corrupted entry: {exc}") from exc
+
+    if not values or values[0] is None:
+        raise ValueError("missing page URL")
+    page_url = values[0]
+    fields = values[1:]
+    if len(fields) % len(LINK_FIELDS):
+        raise ValueError("truncated entry")
+
+    links = []
+    for i in range(0, len(fields), len(LINK_FIELDS)):
+        url, requires_python, yanked_reason, dist_info_metadata = (
+            fields[i:i + len(LINK_FIELDS)]
+        )
+        if url is None:
+            raise ValueError("missing link URL")
+        links.append(Link(
+            url,
+            comes_from=page_url,
+            requires_python=requires_python,
+            yanked_reason=yanked_reason,
+            dist_info_metadata=dist_info_metadata,
+        ))
+    return page_url, links
+
+
+class LinkCache:
+    """
+    A cache of the links parsed from simple repository pages, which persists
+    across pip invocations.
+
+    Entries are keyed by the page's URL and HTTP validators (ETag and
+    Last-Modified headers). When the HTTP cache revalidates a page and the
+    server answers that it did not change, the links parsed from it the
+    last time are reused, without parsing the page again. Pages without
+    validators, and non-HTTP pages, are not cached.
+
+    When the cache directory cannot be read or written, pages are parsed as
+    if they were not cached.
+    """
+
+    def __init__(self, directory):
+        # type: (str) -> None
+        assert directory is not None, "Cache directory must not be None."
+        self.directory = directory
+
+    def _get_cache_path(self, page):
+        # type: (HTMLPage) -> Optional[str]
+        scheme = urllib.parse.urlsplit(page.url).scheme
+        if scheme not in {"http", "https"}:
+            return None
+        if not page.etag and not page.last_modified:
+            return None
+
+        key = "\0".join([
+            page.url,
+            page.content_type,
+            page.etag or "",
+            page.last_modified or "",
+        ])
+        hashed = hashlib.sha224(key.encode("utf-8")).hexdigest()
+
+        # Nest the entries like the wheel cache does, to avoid having a
+        # huge number of files in one directory.
+        parts = [hashed[:2], hashed[2:4], hashed[4:6], hashed[6:]]
+        return os.path.join(self.directory, *parts)
+
+    def get(self, page):
+        # type: (HTMLPage) -> Optional[List[Link]]
+        """Return the links cached for page, or None if there are none."""
+        path = self._get_cache_path(page)
+        if path is None:
+            return None
+
+        data = None
+        with suppressed_cache_errors():
+            with open(path, "rb") as f:
+                data = f.read()
+        if data is None:
+            return None
+
+        try:
+            page_url, links = deserialize_links(data)
+        except ValueError as exc:
+            logger.debug("Ignoring cached links for %s: %s", page, exc)
+            return None
+        if page_url != page.url:
+            return None
+
+        logger.debug("Using %d cached links for %s", len(links), page)
+        return links
+
+    def set(self, page, links):
+        # type: (HTMLPage, List[Link]) -> None
+        """Store the links parsed from page."""
+        path = self._get_cache_path(page)
+        if path is None:
+            return
+
+        with suppressed_cache_errors():
+            ensure_dir(os.path.dirname(path))
+
+            with adjacent_tmp_file(path) as f:
+                f.write(serialize_links(page.url, links))
+
+            replace(f.name, path)
@@ -3,17 +3,32 @@
 # The following comment should be removed at some point in the future.
 # mypy: strict-optional=False
 
+import contextlib
 import functools
 import itertools
 import logging
 import re
-from typing import FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from pip._vendor.packaging import specifiers
 from pip._vendor.packaging.tags import Tag
 from pip._vendor.packaging.utils import canonicalize_name
 from pip._vendor.packaging.version import _BaseVersion
 from pip._vendor.packaging.version import parse as parse_version
+from pip._vendor.requests.adapters import DEFAULT_POOLSIZE
 
 from pip._internal.exceptions import (
     BestVersionAlreadyInstalled,
@@ -21,7 +36,7 @@ from pip._internal.exceptions import (
     InvalidWheelFilename,
     UnsupportedWheel,
 )
-from pip._internal.index.collector import LinkCollector, parse_links
+from pip._internal.index.collector import LinkCollector, PageValidators
 from pip._internal.models.candidate import InstallationCandidate
 from pip._internal.models.format_control import FormatControl
 from pip._internal.models.link import Link
@@ -30,6 +45,7 @@ from pip._internal.models.selection_prefs import SelectionPreferences
 from pip._internal.models.target_python import TargetPython
 from pip._internal.models.wheel import Wheel
 from pip._internal.req import InstallRequirement
+from pip._internal.utils.compatibility_tags import get_tag_priorities
 from pip._internal.utils.filetypes import WHEEL_EXTENSION
 from pip._internal.utils.hashes import Hashes
 from pip._internal.utils.logging import indent_log
@@ -44,6 +60,11 @@ __all__ = ['FormatControl', 'BestCandidateResult', 'PackageFinder']
 logger = logging.getLogger(__name__)
 
 BuildTag = Union[Tuple[()], Tuple[int, str]]
+# Whether a link is a candidate, and its version or the reason it is not.
+LinkEvaluation = Tuple[bool, Optional[str]]
+# The attributes of a link that its evaluation depends on.
+LinkEvaluationKey = Tuple[str, Optional[str], Optional[str]]
+LinkEvaluations = Dict[LinkEvaluationKey, LinkEvaluation]
 CandidateSortingKey = (
     Tuple[int, int, int, _BaseVersion, Optional[int], BuildTag]
 )
@@ -112,6 +133,7 @@ class LinkEvaluator:
         target_python,   # type: TargetPython
         allow_yanked,    # type: bool
         ignore_requires_python=None,  # type: Optional[bool]
+        evaluations=None,  # type: Optional[LinkEvaluations]
     ):
         # type: (...) -> None
         """
@@ -130,20 +152,26 @@ class LinkEvaluator:
         :param ignore_requires_python: Whether to ignore incompatible
             PEP 503 "data-requires-python" values in HTML links. Defaults
             to False.
+        :param evaluations: A cache of the results of evaluate_link(),
+            which may be shared with other evaluators made with the same
+            arguments (apart from project_name).
         """
         if ignore_requires_python is None:
             ignore_requires_python = False
+        if evaluations is None:
+            evaluations = {}
 
         self._allow_yanked = allow_yanked
         self._canonical_name = canonical_name
         self._ignore_requires_python = ignore_requires_python
         self._formats = formats
         self._target_python = target_python
+        self._evaluations = evaluations
 
         self.project_name = project_name
 
     def evaluate_link(self, link):
-        # type: (Link) -> Tuple[bool, Optional[str]]
+        # type: (Link) -> LinkEvaluation
         """
         Determine whether a link is a candidate for installation.
 
@@ -152,6 +180,25 @@ class LinkEvaluator:
             `is_candidate` is False, an optional string to log the reason
             the link fails to qualify.
         """
+        key = (link.url, link.requires_python, link.yanked_reason)
+        result = self._evaluations.get(key)
+        if result is None:
+            result = self._evaluations[key] = self._evaluate_link(link)
+        return result
+
+    def evaluate_links(self, links):
+        # type: (Iterable[Link]) -> List[Tuple[Link, LinkEvaluation]]
+        """
+        Evaluate the links of a page in one pass, like evaluate_link().
+
+        Links that were already evaluated, e.g. for the same project on
+        another page or by another evaluator sharing the same cache, are
+        not evaluated again.
+        """
+        return [(link, self.evaluate_link(link)) for link in links]
+
+    def _evaluate_link(self, link):
+        # type: (Link) -> LinkEvaluation
         version = None
         if link.is_yanked and not self._allow_yanked:
             reason = link.yanked_reason or '<none given>'
@@ -182,7 +229,7 @@ class LinkEvaluator:
                         self.project_name)
                     return (False, reason)
 
-                supported_tags = self._target_python.get_tags()
+                supported_tags = self._target_python.get_tag_priorities()
                 if not wheel.supported(supported_tags):
                     # Include the wheel's tags in the reason string to
                     # simplify troubleshooting compatibility issues.
@@ -413,6 +460,7 @@ class CandidateEvaluator:
             prefer_binary=prefer_binary,
             allow_all_prereleases=allow_all_prereleases,
             hashes=hashes,
+            tag_priorities=target_python.get_tag_priorities(),
         )
 
     def __init__(
@@ -423,11 +471,15 @@ class CandidateEvaluator:
         prefer_binary=False,  # type: bool
         allow_all_prereleases=False,  # type: bool
         hashes=None,                  # type: Optional[Hashes]
+        tag_priorities=None,  # type: Optional[Dict[Tag, int]]
     ):
         # type: (...) -> None
         """
         :param supported_tags: The PEP 425 tags supported by the target
             Python in order of preference (most preferred first).
+        :param tag_priorities: A mapping from each of supported_tags to its
+            index, computed from supported_tags if not given. TargetPython
+            computes it once for all the projects.
         """
         self._allow_all_prereleases = allow_all_prereleases
         self._hashes = hashes
@@ -438,9 +490,9 @@ class CandidateEvaluator:
         # Since the index of the tag in the _supported_tags list is used
         # as a priority, precompute a map from tag to index/priority to be
         # used in wheel.find_most_preferred_tag.
-        self._wheel_tag_preferences = {
-            tag: idx for idx, tag in enumerate(supported_tags)
-        }
+        if tag_priorities is None:
+            tag_priorities = get_tag_priorities(supported_tags)
+        self._wheel_tag_preferences = tag_priorities
 
     def get_applicable_candidates(
         self,
@@ -503,7 +555,7 @@ class CandidateEvaluator:
         If not finding wheels, they are sorted by version only.
         If finding wheels, then the sort order is by version, then:
           1. existing installs
-          2. wheels ordered via Wheel.support_index_min(self._supported_tags)
+          2. wheels ordered via Wheel.find_most_preferred_tag()
           3. source archives
         If prefer_binary was set, then all wheels are sorted above sources.
 
@@ -619,6 +671,20 @@ class PackageFinder:
         # These are boring links that have already been logged somehow.
         self._logged_links = set()  # type: Set[Link]
 
+        # The results of evaluating links, shared by the link evaluators
+        # made for the same project and formats.
+        self._link_evaluations = (
+            {}
+        )  # type: Dict[Tuple[str, FrozenSet[str]], LinkEvaluations]
+
+        # Background fetches of project pages, see prefetch_candidates().
+        # A None value marks a project already looked up in the foreground.
+        self._prefetcher = None  # type: Optional[ThreadPoolExecutor]
+        self._prefetched = (
+            {}
+        )  # type: Dict[str, Optional[Future[List[InstallationCandidate]]]]
+        self._prefetch_lock = threading.Lock()
+
     # Don't include an allow_yanked default value to make sure each call
     # site considers whether yanked releases are allowed. This also causes
     # that decision to be made explicit in the calling code, which helps
@@ -656,6 +722,25 @@ class PackageFinder:
             ignore_requires_python=selection_prefs.ignore_requires_python,
         )
 
+    def for_target_python(self, target_python):
+        # type: (TargetPython) -> PackageFinder
+        """Create a finder like this one, but finding candidates for another
+        target Python.
+
+        The finders share their link collector, and so the pages it fetched.
+        """
+        return PackageFinder(
+            link_collector=self._link_collector,
+            target_python=target_python,
+            allow_yanked=self._allow_yanked,
+            format_control=self.format_control,
+            candidate_prefs=CandidatePreferences(
+                prefer_binary=self.prefer_binary,
+                allow_all_prereleases=self.allow_all_prereleases,
+            ),
+            ignore_requires_python=self._ignore_requires_python,
+        )
+
     @property
     def target_python(self):
         # type: () -> TargetPython
@@ -681,6 +766,15 @@ class PackageFinder:
         # type: () -> List[str]
         return self.search_scope.index_urls
 
+    @property
+    def page_validators(self):
+        # type: () -> Dict[str, Optional[PageValidators]]
+        return self._link_collector.page_validators
+
+    def fetch_unchanged_links(self, page_validators):
+        # type: (Mapping[str, PageValidators]) -> Optional[List[Link]]
+        return self._link_collector.fetch_unchanged_links(page_validators)
+
     @property
     def trusted_hosts(self):
         # type: () -> Iterable[str]
@@ -710,6 +804,11 @@ class PackageFinder:
         canonical_name = canonicalize_name(project_name)
         formats = self.format_control.get_allowed_formats(canonical_name)
 
+        # The other arguments are the same for all the evaluators.
+        evaluations = self._link_evaluations.setdefault(
+            (canonical_name, formats), {}
+        )
+
         return LinkEvaluator(
             project_name=project_name,
             canonical_name=canonical_name,
@@ -717,6 +816,7 @@ class PackageFinder:
             target_python=self._target_python,
             allow_yanked=self._allow_yanked,
             ignore_requires_python=self._ignore_requires_python,
+            evaluations=evaluations,
         )
 
     def _sort_links(self, links):
@@ -750,7 +850,18 @@ class PackageFinder:
         If the link is a candidate for install, convert it to an
         InstallationCandidate and return it. Otherwise, return None.
         """
-        is_candidate, result = link_evaluator.evaluate_link(link)
+        return self._make_install_candidate(
+            link_evaluator, link, link_evaluator.evaluate_link(link)
+        )
+
+    def _make_install_candidate(
+        self,
+        link_evaluator,  # type: LinkEvaluator
+        link,  # type: Link
+        evaluation,  # type: LinkEvaluation
+    ):
+        # type: (...) -> Optional[InstallationCandidate]
+        is_candidate, result = evaluation
         if not is_candidate:
             if result:
                 self._log_skipped_link(link, reason=result)
@@ -768,8 +879,11 @@ class PackageFinder:
         Convert links that are candidates to InstallationCandidate objects.
         """
         candidates = []
-        for link in self._sort_links(links):
-            candidate = self.get_install_candidate(link_evaluator, link)
+        evaluations = link_evaluator.evaluate_links(self._sort_links(links))
+        for link, evaluation in evaluations:
+            candidate = self._make_install_candidate(
+                link_evaluator, link, evaluation
+            )
             if candidate is not None:
                 candidates.append(candidate)
 
@@ -784,7 +898,7 @@ class PackageFinder:
         if html_page is None:
             return []
 
-        page_links = list(parse_links(html_page))
+        page_links = self._link_collector.parse_links(html_page)
 
         with indent_log():
             package_links = self.evaluate_links(
@@ -794,6 +908,50 @@ class PackageFinder:
 
         return package_links
 
+    @contextlib.contextmanager
+    def prefetching(self, max_workers=DEFAULT_POOLSIZE):
+        # type: (int) -> Iterator[None]
+        """Allow project pages to be fetched in the background.
+
+        While this context is active, ``prefetch_candidates()`` submits
+        lookups to a pool of ``max_workers`` threads. The threads share the
+        link collector's session, so the number of workers defaults to the
+        size of the session's connection pool. Lookups still pending when
+        the context exits are cancelled.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            self._prefetcher = executor
+            try:
+                yield
+            finally:
+                self._prefetcher = None
+                with self._prefetch_lock:
+                    for future in self._prefetched.values():
+                        if future is not None:
+                            future.cancel()
+
+    def prefetch_candidates(self, project_names):
+        # type: (Iterable[str]) -> None
+        """Start looking up candidates for the given projects.
+
+        This is a no-op outside of a ``prefetching()`` context. Projects that
+        were already looked up, or are being looked up, are skipped. Results
+        are picked up by ``find_all_candidates()``, so the names should be
+        given in the same form (i.e. canonicalized) as they will be later
+        requested.
+        """
+        executor = self._prefetcher
+        if executor is None:
+            return
+        with self._prefetch_lock:
+            for project_name in project_names:
+                if project_name in self._prefetched:
+                    continue
+                logger.debug("Prefetching candidates for %s", project_name)
+                self._prefetched[project_name] = executor.submit(
+                    self._find_all_candidates, project_name,
+                )
+
     @functools.lru_cache(maxsize=None)
     def find_all_candidates(self, project_name):
         # type: (str) -> List[InstallationCandidate]
@@ -805,6 +963,15 @@ class PackageFinder:
         See LinkEvaluator.evaluate_link() for details on which files
         are accepted.
         """
+        with self._prefetch_lock:
+            future = self._prefetched.setdefault(project_name, None)
+        if future is not None and not future.cancelled():
+            # Wait for the lookup already in flight instead of starting over.
+            return future.result()
+        return self._find_all_candidates(project_name)
+
+    def _find_all_candidates(self, project_name):
+        # type: (str) -> List[InstallationCandidate]
         link_evaluator = self.make_link_evaluator(project_name)
 
         collected_sources = self._link_collector.collect_sources(
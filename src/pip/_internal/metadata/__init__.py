@@ -1,7 +1,34 @@
-from typing import List, Optional
+from typing import List, Optional, Type
 
 from .base import BaseDistribution, BaseEnvironment
 
+BACKENDS = ["pkg_resources", "dist-info"]
+
+_backend = "pkg_resources"
+
+
+def select_backend(name):
+    # type: (str) -> None
+    """Select the backend of the environments returned by the functions below.
+
+    ``pkg_resources`` (the default) builds environments from pkg_resources
+    working sets. ``dist-info`` reads the metadata directories on the paths
+    directly, parsing the metadata of a distribution only when it is needed.
+    """
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown metadata backend: {name}")
+    _backend = name
+
+
+def _get_environment_class():
+    # type: () -> Type[BaseEnvironment]
+    if _backend == "dist-info":
+        from . import dist_info
+        return dist_info.Environment
+    from . import pkg_resources
+    return pkg_resources.Environment
+
 
 def get_default_environment():
     # type: () -> BaseEnvironment
@@ -11,9 +38,7 @@ def get_default_environment():
     Environment instance should be built from ``sys.path`` and may use caching
     to share instance state accorss calls.
     """
-    from .pkg_resources import Environment
-
-    return Environment.default()
+    return _get_environment_class().default()
 
 
 def get_environment(paths):
@@ -24,17 +49,16 @@ def get_environment(paths):
     given import paths. The backend must build a fresh instance representing
     the state of installed distributions when this function is called.
     """
-    from .pkg_resources import Environment
-
-    return Environment.from_paths(paths)
+    return _get_environment_class().from_paths(paths)
 
 
 def get_wheel_distribution(wheel_path, canonical_name):
     # type: (str, str) -> BaseDistribution
     """Get the representation of the specified wheel's distribution metadata.
 
-    This returns a Distribution instance from the chosen backend based on
-    the given wheel's ``.dist-info`` directory.
+    This returns a Distribution instance from the pkg_resources backend,
+    whichever backend is chosen, based on the given wheel's ``.dist-info``
+    directory.
 
     :param canonical_name: Normalized project name of the given wheel.
     """
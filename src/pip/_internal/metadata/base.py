@@ -1,10 +1,24 @@
+import email.message
 import logging
 import re
-from typing import Container, Iterator, List, Optional, Union
-
+from typing import (
+    TYPE_CHECKING,
+    Collection,
+    Container,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from pip._vendor.packaging.utils import canonicalize_name
 from pip._vendor.packaging.version import LegacyVersion, Version
 
-from pip._internal.utils.misc import stdlib_pkgs  # TODO: Move definition here.
+from pip._internal.models.direct_url import DirectUrl
+from pip._internal.utils.compat import stdlib_pkgs
+
+if TYPE_CHECKING:
+    from pip._vendor.packaging.requirements import Requirement
 
 DistributionVersion = Union[LegacyVersion, Version]
 
@@ -23,6 +37,14 @@ class BaseDistribution:
         """
         raise NotImplementedError()
 
+    @property
+    def info_location(self):
+        # type: () -> Optional[str]
+        """Where the distribution's metadata directory (``.dist-info`` or
+        ``.egg-info``) is, if it is not in memory.
+        """
+        raise NotImplementedError()
+
     @property
     def metadata_version(self):
         # type: () -> Optional[str]
@@ -34,6 +56,14 @@ class BaseDistribution:
         # type: () -> str
         raise NotImplementedError()
 
+    @property
+    def raw_name(self):
+        # type: () -> str
+        """The name of the distribution as it is displayed, which is not
+        normalized like ``canonical_name``.
+        """
+        raise NotImplementedError()
+
     @property
     def version(self):
         # type: () -> DistributionVersion
@@ -59,6 +89,53 @@ class BaseDistribution:
         # type: () -> bool
         raise NotImplementedError()
 
+    @property
+    def direct_url(self):
+        # type: () -> Optional[DirectUrl]
+        """The PEP 610 reference the distribution was installed from.
+
+        ``None`` if the distribution has no ``direct_url.json`` metadata, or
+        if it is invalid.
+        """
+        raise NotImplementedError()
+
+    @property
+    def metadata(self):
+        # type: () -> email.message.Message
+        """The headers of the core metadata (``METADATA`` or ``PKG-INFO``)."""
+        raise NotImplementedError()
+
+    def read_text(self, name):
+        # type: (str) -> Optional[str]
+        """Read a file of the metadata directory, such as ``RECORD``.
+
+        ``None`` if the distribution does not have the file.
+        """
+        raise NotImplementedError()
+
+    def iter_dependencies(self, extras=()):
+        # type: (Collection[str]) -> Iterator[Requirement]
+        """Dependencies of the distribution that apply to this environment.
+
+        :param extras: Extras whose dependencies are included as well. Extras
+            the distribution does not provide are ignored.
+        :raises InvalidRequirement: if the dependencies cannot be parsed.
+        """
+        raise NotImplementedError()
+
+    def iter_dependencies_on(self, names):
+        # type: (Container[str]) -> Iterator[Requirement]
+        """Dependencies of the distribution that apply to this environment,
+        on the distributions with the given canonical names.
+
+        Backends can avoid parsing the other dependencies.
+
+        :raises InvalidRequirement: if the dependencies cannot be parsed.
+        """
+        for req in self.iter_dependencies():
+            if canonicalize_name(req.name) in names:
+                yield req
+
 
 class BaseEnvironment:
     """An environment containing distributions to introspect."""
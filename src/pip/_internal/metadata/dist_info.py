@@ -0,0 +1,175 @@
+"""A metadata backend reading the ``.dist-info`` and ``.egg-info`` entries of
+the environment directly, like importlib.metadata does.
+
+Unlike pkg_resources, nothing is read when the environment is created: the
+paths are scanned the first time a distribution is looked up, and the
+metadata of a distribution is only parsed when a field that is not part of
+its directory name is accessed.
+"""
+
+import email.message
+import json
+import logging
+import re
+import sys
+from typing import Collection, Container, Iterator, List, Optional
+
+from pip._vendor.packaging.requirements import Requirement
+from pip._vendor.packaging.version import parse as parse_version
+
+from pip._internal.locations import user_site
+from pip._internal.models.direct_url import (
+    DIRECT_URL_METADATA_NAME,
+    DirectUrl,
+    DirectUrlValidationError,
+)
+from pip._internal.utils import misc
+
+from .base import BaseDistribution, BaseEnvironment, DistributionVersion
+from .installed import InstalledIndex, InstalledProject, get_default_index
+
+logger = logging.getLogger(__name__)
+
+
+def _safe_name(name):
+    # type: (str) -> str
+    """Convert a name the way pkg_resources.safe_name() does."""
+    return re.sub("[^A-Za-z0-9.]+", "-", name)
+
+
+class Distribution(BaseDistribution):
+    def __init__(self, project):
+        # type: (InstalledProject) -> None
+        self._project = project
+
+    def __repr__(self):
+        # type: () -> str
+        return f"<Distribution {self._project.name!r} in {self.location!r}>"
+
+    @property
+    def location(self):
+        # type: () -> Optional[str]
+        return self._project.location
+
+    @property
+    def info_location(self):
+        # type: () -> Optional[str]
+        return self._project.info_path
+
+    @property
+    def metadata_version(self):
+        # type: () -> Optional[str]
+        return self._project.metadata.get("Metadata-Version")
+
+    @property
+    def canonical_name(self):
+        # type: () -> str
+        return self._project.canonical_name
+
+    @property
+    def raw_name(self):
+        # type: () -> str
+        return _safe_name(self._project.name)
+
+    @property
+    def version(self):
+        # type: () -> DistributionVersion
+        return parse_version(self._project.version)
+
+    @property
+    def installer(self):
+        # type: () -> str
+        text = self._project.read_text("INSTALLER") or ""
+        for line in text.splitlines():
+            if line.strip():
+                return line.strip()
+        return ""
+
+    @property
+    def editable(self):
+        # type: () -> bool
+        name = _safe_name(self._project.name)
+        index = get_default_index()
+        return any(index.has_egg_link(path_item, name) for path_item in sys.path)
+
+    def _site_location(self):
+        # type: () -> str
+        """Where the distribution is installed, which for develop-installed
+        distributions is where their egg-link is rather than their source.
+        """
+        egg_link = misc.project_egg_link_path(_safe_name(self._project.name))
+        return misc.normalize_path(egg_link or self._project.location)
+
+    @property
+    def local(self):
+        # type: () -> bool
+        return misc.is_local(self._site_location())
+
+    @property
+    def in_usersite(self):
+        # type: () -> bool
+        if user_site is None:
+            return False
+        return self._site_location().startswith(misc.normalize_path(user_site))
+
+    @property
+    def direct_url(self):
+        # type: () -> Optional[DirectUrl]
+        text = self._project.read_text(DIRECT_URL_METADATA_NAME)
+        if text is None:
+            return None
+        try:
+            return DirectUrl.from_json(text)
+        except (DirectUrlValidationError, json.JSONDecodeError) as e:
+            logger.warning(
+                "Error parsing %s for %s: %s",
+                DIRECT_URL_METADATA_NAME,
+                self._project.name,
+                e,
+            )
+            return None
+
+    @property
+    def metadata(self):
+        # type: () -> email.message.Message
+        return self._project.metadata
+
+    def read_text(self, name):
+        # type: (str) -> Optional[str]
+        return self._project.read_text(name)
+
+    def iter_dependencies(self, extras=()):
+        # type: (Collection[str]) -> Iterator[Requirement]
+        return self._project.iter_requires(extras)
+
+    def iter_dependencies_on(self, names):
+        # type: (Container[str]) -> Iterator[Requirement]
+        return self._project.iter_requires(names=names)
+
+
+class Environment(BaseEnvironment):
+    def __init__(self, index):
+        # type: (InstalledIndex) -> None
+        self._index = index
+
+    @classmethod
+    def default(cls):
+        # type: () -> BaseEnvironment
+        return cls(get_default_index())
+
+    @classmethod
+    def from_paths(cls, paths):
+        # type: (Optional[List[str]]) -> BaseEnvironment
+        return cls(InstalledIndex(sys.path if paths is None else paths))
+
+    def get_distribution(self, name):
+        # type: (str) -> Optional[BaseDistribution]
+        project = self._index.get(name)
+        if project is None:
+            return None
+        return Distribution(project)
+
+    def _iter_distributions(self):
+        # type: () -> Iterator[BaseDistribution]
+        for project in self._index:
+            yield Distribution(project)
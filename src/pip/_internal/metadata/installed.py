@@ -0,0 +1,313 @@
+"""An index of the distributions installed on a set of paths.
+
+The index is built from a single scan of the ``.dist-info`` and ``.egg-info``
+entries of each path, and does not need pkg_resources.
+"""
+
+import email.parser
+import logging
+import os
+import re
+import sys
+import threading
+from email.message import Message
+from typing import (
+    Collection,
+    Container,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+)
+
+from pip._vendor.packaging.requirements import Requirement
+from pip._vendor.packaging.utils import canonicalize_name
+
+logger = logging.getLogger(__name__)
+
+_INFO_SUFFIXES = (".dist-info", ".egg-info")
+
+# The name at the start of a PEP 508 requirement.
+_REQUIREMENT_NAME_RE = re.compile(r"\s*([A-Z0-9][A-Z0-9._-]*)", re.IGNORECASE)
+
+
+def _safe_extra(extra):
+    # type: (str) -> str
+    """Normalize an extra name the way pkg_resources.safe_extra() does."""
+    return re.sub("[^A-Za-z0-9.-]+", "_", extra).lower()
+
+
+def _parse_requires_txt(text):
+    # type: (str) -> Iterator[str]
+    """Convert the lines of an egg-info ``requires.txt`` to PEP 508
+    requirements, moving the extra and marker of each section to the
+    requirements in it.
+    """
+    condition = ""
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            extra, _, marker = line[1:-1].partition(":")
+            conditions = []
+            if extra:
+                conditions.append(f'extra == "{_safe_extra(extra)}"')
+            if marker:
+                conditions.append(f"({marker})")
+            condition = " and ".join(conditions)
+            continue
+        if condition:
+            yield f"{line}; {condition}"
+        else:
+            yield line
+
+
+class InstalledProject:
+    """A distribution found by InstalledIndex.
+
+    Scanning only looks at the name of its metadata directory; the metadata
+    itself is read the first time the requirements, the extras or (for
+    ``.egg-info`` entries) the version are needed.
+    """
+
+    def __init__(self, location, info_name):
+        # type: (str, str) -> None
+        self.location = location
+        self.info_path = os.path.join(location, info_name)
+        stem, suffix = os.path.splitext(info_name)
+        name, _, rest = stem.partition("-")
+        self.name = name
+        self.canonical_name = canonicalize_name(name)
+        self.is_dist_info = suffix == ".dist-info"
+        self._version = None  # type: Optional[str]
+        if self.is_dist_info and rest:
+            # Dashes are escaped as underscores in directory names.
+            self._version = rest.replace("_", "-")
+        self._metadata = None  # type: Optional[Message]
+        self._requires = {}  # type: Dict[str, Requirement]
+
+    def __repr__(self):
+        # type: () -> str
+        return f"<InstalledProject {self.name!r} in {self.location!r}>"
+
+    def _get_path(self, name):
+        # type: (str) -> Optional[str]
+        if os.path.isdir(self.info_path):
+            return os.path.join(self.info_path, name)
+        if name == "PKG-INFO":
+            # A single-file .egg-info is the PKG-INFO itself.
+            return self.info_path
+        return None
+
+    def read_text(self, name):
+        # type: (str) -> Optional[str]
+        """Read a file of the metadata directory, or None if it is missing."""
+        path = self._get_path(name)
+        if path is None:
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    @property
+    def metadata(self):
+        # type: () -> Message
+        """The headers of the core metadata."""
+        if self._metadata is None:
+            name = "METADATA" if self.is_dist_info else "PKG-INFO"
+            path = self._get_path(name)
+            lines = []
+            try:
+                if path is not None:
+                    with open(path, encoding="utf-8") as f:
+                        # Stop before the description, which can be long.
+                        # A line of whitespace continues a header (like the
+                        # blank lines of a multi-line License), only an
+                        # empty line ends the headers.
+                        for line in f:
+                            if line in ("\n", "\r\n"):
+                                break
+                            lines.append(line)
+            except FileNotFoundError:
+                pass
+            self._metadata = email.parser.Parser().parsestr(
+                "".join(lines), headersonly=True,
+            )
+        return self._metadata
+
+    @property
+    def version(self):
+        # type: () -> str
+        if self._version is None:
+            self._version = self.metadata.get("Version", "")
+        return self._version
+
+    @property
+    def extras(self):
+        # type: () -> List[str]
+        if self.is_dist_info:
+            return [
+                _safe_extra(extra)
+                for extra in self.metadata.get_all("Provides-Extra", [])
+            ]
+        text = self.read_text("requires.txt") or ""
+        extras = []
+        for line in text.splitlines():
+            line = line.strip()
+            if line.startswith("[") and not line.startswith("[:"):
+                extra = _safe_extra(line[1:-1].partition(":")[0])
+                if extra not in extras:
+                    extras.append(extra)
+        return extras
+
+    def _requirement_lines(self):
+        # type: () -> List[str]
+        if self.is_dist_info:
+            return self.metadata.get_all("Requires-Dist", [])
+        return list(_parse_requires_txt(self.read_text("requires.txt") or ""))
+
+    def _parse_requirement(self, line):
+        # type: (str) -> Requirement
+        req = self._requires.get(line)
+        if req is None:
+            req = self._requires[line] = Requirement(line)
+        return req
+
+    @property
+    def requires(self):
+        # type: () -> List[Requirement]
+        """All the requirements of the distribution, with their markers.
+
+        :raises InvalidRequirement: if any of them cannot be parsed.
+        """
+        return [self._parse_requirement(line) for line in self._requirement_lines()]
+
+    def iter_requires(self, extras=(), names=None):
+        # type: (Collection[str], Optional[Container[str]]) -> Iterator[Requirement]
+        """The requirements that apply to this environment when the given
+        extras are requested.
+
+        :param names: Only the requirements on these canonical names are
+            wanted, so the others are not parsed.
+        """
+        environments = [
+            {"extra": _safe_extra(extra)} for extra in extras
+        ] or [{"extra": ""}]
+        for line in self._requirement_lines():
+            if names is not None:
+                match = _REQUIREMENT_NAME_RE.match(line)
+                # Invalid lines are parsed, to raise the parsing error.
+                if match and canonicalize_name(match.group(1)) not in names:
+                    continue
+            req = self._parse_requirement(line)
+            if req.marker is None or any(
+                req.marker.evaluate(env) for env in environments
+            ):
+                yield req
+
+
+class InstalledIndex:
+    """The distributions installed on some paths, by canonical name.
+
+    Like the pkg_resources working set, a distribution found on an earlier
+    path hides those of the same name on later paths.
+
+    The paths are scanned on first use. Call invalidate() after installing
+    or uninstalling distributions, and they are scanned again when next
+    needed.
+    """
+
+    def __init__(self, paths):
+        # type: (Sequence[str]) -> None
+        self._paths = list(paths)
+        self._lock = threading.Lock()
+        self._projects = None  # type: Optional[Dict[str, InstalledProject]]
+        self._egg_links = {}  # type: Dict[str, Set[str]]
+        # Incremented each time the index is invalidated, so that views
+        # built from it can tell when they are out of date.
+        self.generation = 0
+
+    def _scan(self):
+        # type: () -> Dict[str, InstalledProject]
+        projects = {}  # type: Dict[str, InstalledProject]
+        for location in self._paths:
+            try:
+                names = sorted(os.listdir(location or os.curdir))
+            except OSError:
+                # e.g. zip files on sys.path, or missing directories.
+                continue
+            for info_name in names:
+                if not info_name.endswith(_INFO_SUFFIXES):
+                    continue
+                project = InstalledProject(location, info_name)
+                projects.setdefault(project.canonical_name, project)
+        return projects
+
+    def has_egg_link(self, location, project_name):
+        # type: (str, str) -> bool
+        """Whether the directory has an ``.egg-link`` file for the project.
+
+        Each directory is only listed once, until the index is invalidated.
+        """
+        egg_links = self._egg_links.get(location)
+        if egg_links is None:
+            try:
+                names = os.listdir(location or os.curdir)
+            except OSError:
+                names = []
+            egg_links = {name for name in names if name.endswith(".egg-link")}
+            self._egg_links[location] = egg_links
+        return project_name + ".egg-link" in egg_links
+
+    @property
+    def _by_name(self):
+        # type: () -> Dict[str, InstalledProject]
+        projects = self._projects
+        if projects is None:
+            with self._lock:
+                if self._projects is None:
+                    self._projects = self._scan()
+                projects = self._projects
+        return projects
+
+    def invalidate(self):
+        # type: () -> None
+        with self._lock:
+            self._projects = None
+            self._egg_links = {}
+            self.generation += 1
+
+    def get(self, name):
+        # type: (str) -> Optional[InstalledProject]
+        return self._by_name.get(canonicalize_name(name))
+
+    def __contains__(self, name):
+        # type: (str) -> bool
+        return canonicalize_name(name) in self._by_name
+
+    def __iter__(self):
+        # type: () -> Iterator[InstalledProject]
+        return iter(list(self._by_name.values()))
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._by_name)
+
+
+_default_index = None  # type: Optional[InstalledIndex]
+
+
+def get_default_index():
+    # type: () -> InstalledIndex
+    """Get the index of the distributions installed on ``sys.path``, shared
+    for the whole invocation.
+    """
+    global _default_index
+    if _default_index is None:
+        _default_index = InstalledIndex(sys.path)
+    return _default_index
@@ -1,15 +1,22 @@
+import email.message
+import email.parser
+import sys
 import zipfile
-from typing import Iterator, List, Optional
+from typing import Collection, Dict, Iterator, List, Optional
 
 from pip._vendor import pkg_resources
+from pip._vendor.packaging.requirements import InvalidRequirement, Requirement
 from pip._vendor.packaging.utils import canonicalize_name
 from pip._vendor.packaging.version import parse as parse_version
 
+from pip._internal.models.direct_url import DirectUrl
 from pip._internal.utils import misc  # TODO: Move definition here.
+from pip._internal.utils.direct_url_helpers import dist_get_direct_url
 from pip._internal.utils.packaging import get_installer
 from pip._internal.utils.wheel import pkg_resources_distribution_for_wheel
 
 from .base import BaseDistribution, BaseEnvironment, DistributionVersion
+from .installed import InstalledIndex, get_default_index
 
 
 class Distribution(BaseDistribution):
@@ -29,6 +36,11 @@ class Distribution(BaseDistribution):
         # type: () -> Optional[str]
         return self._dist.location
 
+    @property
+    def info_location(self):
+        # type: () -> Optional[str]
+        return self._dist.egg_info
+
     @property
     def metadata_version(self):
         # type: () -> Optional[str]
@@ -42,6 +54,11 @@ class Distribution(BaseDistribution):
         # type: () -> str
         return canonicalize_name(self._dist.project_name)
 
+    @property
+    def raw_name(self):
+        # type: () -> str
+        return self._dist.project_name
+
     @property
     def version(self):
         # type: () -> DistributionVersion
@@ -67,21 +84,67 @@ class Distribution(BaseDistribution):
         # type: () -> bool
         return misc.dist_in_usersite(self._dist)
 
+    @property
+    def direct_url(self):
+        # type: () -> Optional[DirectUrl]
+        return dist_get_direct_url(self._dist)
+
+    @property
+    def metadata(self):
+        # type: () -> email.message.Message
+        text = self.read_text(self._dist.PKG_INFO) or ""
+        return email.parser.Parser().parsestr(text, headersonly=True)
+
+    def read_text(self, name):
+        # type: (str) -> Optional[str]
+        if not self._dist.has_metadata(name):
+            return None
+        return self._dist.get_metadata(name)
+
+    def iter_dependencies(self, extras=()):
+        # type: (Collection[str]) -> Iterator[Requirement]
+        # pkg_resources raises UnknownExtra for extras that are not provided.
+        provided = set(self._dist.extras)
+        extras = [
+            e for e in extras if pkg_resources.safe_extra(e) in provided
+        ]
+        try:
+            return iter(self._dist.requires(extras))
+        except pkg_resources.RequirementParseError as e:
+            raise InvalidRequirement(str(e))
+
 
 class Environment(BaseEnvironment):
-    def __init__(self, ws):
-        # type: (pkg_resources.WorkingSet) -> None
+    def __init__(self, ws, index):
+        # type: (pkg_resources.WorkingSet, InstalledIndex) -> None
         self._ws = ws
+        # Scanning the installed metadata directories is cheaper than
+        # searching the working set, so use it to tell which distributions
+        # are installed at all.
+        self._index = index
+        self._by_name = None  # type: Optional[Dict[str, BaseDistribution]]
+        self._generation = index.generation
 
     @classmethod
     def default(cls):
         # type: () -> BaseEnvironment
-        return cls(pkg_resources.working_set)
+        global _default_environment
+        if (
+            _default_environment is None or
+            _default_environment._ws is not pkg_resources.working_set
+        ):
+            _default_environment = cls(
+                pkg_resources.working_set, get_default_index(),
+            )
+        return _default_environment
 
     @classmethod
     def from_paths(cls, paths):
         # type: (Optional[List[str]]) -> BaseEnvironment
-        return cls(pkg_resources.WorkingSet(paths))
+        return cls(
+            pkg_resources.WorkingSet(paths),
+            InstalledIndex(sys.path if paths is None else paths),
+        )
 
     def _search_distribution(self, name):
         # type: (str) -> Optional[BaseDistribution]
@@ -90,11 +153,13 @@ class Environment(BaseEnvironment):
         This searches from *all* distributions available in the environment, to
         match the behavior of ``pkg_resources.get_distribution()``.
         """
-        canonical_name = canonicalize_name(name)
-        for dist in self.iter_distributions():
-            if dist.canonical_name == canonical_name:
-                return dist
-        return None
+        if self._by_name is None or self._generation != self._index.generation:
+            self._generation = self._index.generation
+            by_name = {}  # type: Dict[str, BaseDistribution]
+            for dist in self.iter_distributions():
+                by_name.setdefault(dist.canonical_name, dist)
+            self._by_name = by_name
+        return self._by_name.get(canonicalize_name(name))
 
     def get_distribution(self, name):
         # type: (str) -> Optional[BaseDistribution]
@@ -104,6 +169,11 @@ class Environment(BaseEnvironment):
         if dist:
             return dist
 
+        # Distributions missing from the working set can only be found below
+        # if their metadata is installed.
+        if name not in self._index:
+            return None
+
         # If distribution could not be found, call working_set.require to
         # update the working set, and try to find the distribution again.
         # This might happen for e.g. when you install a package twice, once
@@ -118,9 +188,13 @@ class Environment(BaseEnvironment):
             self._ws.require(name)
         except pkg_resources.DistributionNotFound:
             return None
+        self._by_name = None
         return self._search_distribution(name)
 
     def _iter_distributions(self):
         # type: () -> Iterator[BaseDistribution]
         for dist in self._ws:
             yield Distribution(dist)
+
+
+_default_environment = None  # type: Optional[Environment]
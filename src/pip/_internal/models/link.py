@@ -28,6 +28,7 @@ class Link(KeyBasedCompareMixin):
         "comes_from",
         "requires_python",
         "yanked_reason",
+        "dist_info_metadata",
         "cache_link_parsing",
     ]
 
@@ -38,6 +39,7 @@ class Link(KeyBasedCompareMixin):
         requires_python=None,  # type: Optional[str]
         yanked_reason=None,    # type: Optional[str]
         cache_link_parsing=True,  # type: bool
+        dist_info_metadata=None,  # type: Optional[str]
     ):
         # type: (...) -> None
         """
@@ -59,6 +61,10 @@ class Link(KeyBasedCompareMixin):
                                    should be cached. PyPI index urls should
                                    generally have this set to False, for
                                    example.
+        :param dist_info_metadata: the value of the PEP 658
+            "data-dist-info-metadata" attribute (or its PEP 691 JSON
+            equivalent), if present: "true", or a "<hashname>=<hexdigest>"
+            string, if the index serves the file's metadata separately.
         """
 
         # url can be a UNC windows share
@@ -73,6 +79,7 @@ class Link(KeyBasedCompareMixin):
         self.comes_from = comes_from
         self.requires_python = requires_python if requires_python else None
         self.yanked_reason = yanked_reason
+        self.dist_info_metadata = dist_info_metadata
 
         super().__init__(key=url, defining_class=Link)
 
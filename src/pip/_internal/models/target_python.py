@@ -1,9 +1,13 @@
 import sys
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from pip._vendor.packaging.tags import Tag
 
-from pip._internal.utils.compatibility_tags import get_supported, version_info_to_nodot
+from pip._internal.utils.compatibility_tags import (
+    get_supported,
+    get_tag_priorities,
+    version_info_to_nodot,
+)
 from pip._internal.utils.misc import normalize_version_info
 
 
@@ -22,6 +26,7 @@ class TargetPython:
         "py_version",
         "py_version_info",
         "_valid_tags",
+        "_tag_priorities",
     ]
 
     def __init__(
@@ -62,8 +67,10 @@ class TargetPython:
         self.py_version = py_version
         self.py_version_info = py_version_info
 
-        # This is used to cache the return value of get_tags().
+        # These are used to cache the return values of get_tags() and
+        # get_tag_priorities().
         self._valid_tags = None  # type: Optional[List[Tag]]
+        self._tag_priorities = None  # type: Optional[Dict[Tag, int]]
 
     def format_given(self):
         # type: () -> str
@@ -112,3 +119,14 @@ class TargetPython:
             self._valid_tags = tags
 
         return self._valid_tags
+
+    def get_tag_priorities(self):
+        # type: () -> Dict[Tag, int]
+        """
+        Return a mapping from each tag returned by get_tags() to its
+        priority, where lower priorities are more preferred.
+        """
+        if self._tag_priorities is None:
+            self._tag_priorities = get_tag_priorities(self.get_tags())
+
+        return self._tag_priorities
@@ -2,7 +2,7 @@
 name that have meaning.
 """
 import re
-from typing import Dict, Iterable, List
+from typing import Container, Dict, List
 
 from pip._vendor.packaging.tags import Tag
 
@@ -87,9 +87,11 @@ class Wheel:
         )
 
     def supported(self, tags):
-        # type: (Iterable[Tag]) -> bool
+        # type: (Container[Tag]) -> bool
         """Return whether the wheel is compatible with one of the given tags.
 
-        :param tags: the PEP 425 tags to check the wheel against.
+        :param tags: the PEP 425 tags to check the wheel against. Pass a set
+            or a mapping, e.g. from TargetPython.get_tag_priorities(), rather
+            than a list to avoid linear scans.
         """
-        return not self.file_tags.isdisjoint(tags)
+        return any(tag in tags for tag in self.file_tags)
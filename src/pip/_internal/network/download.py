@@ -1,24 +1,32 @@
 """Download files with progress indicators.
 """
 import cgi
+import collections
 import logging
 import mimetypes
 import os
-from typing import Iterable, Optional, Tuple
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from pip._vendor.requests.adapters import DEFAULT_POOLSIZE
 from pip._vendor.requests.models import CONTENT_CHUNK_SIZE, Response
 
-from pip._internal.cli.progress_bars import DownloadProgressProvider
+from pip._internal.cli.progress_bars import BAR_TYPES, DownloadProgressProvider
 from pip._internal.exceptions import NetworkConnectionError
 from pip._internal.models.index import PyPI
 from pip._internal.models.link import Link
 from pip._internal.network.cache import is_from_cache
 from pip._internal.network.session import PipSession
 from pip._internal.network.utils import HEADERS, raise_for_status, response_chunks
+from pip._internal.utils.hashes import Hashes
 from pip._internal.utils.misc import format_size, redact_auth_from_url, splitext
 
 logger = logging.getLogger(__name__)
 
+# How often the progress of parallel downloads is refreshed, in seconds.
+_PROGRESS_INTERVAL = 0.1
+
 
 def _get_http_response_size(resp):
     # type: (Response) -> Optional[int]
@@ -28,12 +36,9 @@ def _get_http_response_size(resp):
         return None
 
 
-def _prepare_download(
-    resp,  # type: Response
-    link,  # type: Link
-    progress_bar  # type: str
-):
-    # type: (...) -> Iterable[bytes]
+def _log_download(resp, link):
+    # type: (Response, Link) -> Optional[int]
+    """Log the start of a download, returning its size if it is known."""
     total_length = _get_http_response_size(resp)
 
     if link.netloc == PyPI.file_storage_domain:
@@ -51,6 +56,17 @@ def _prepare_download(
     else:
         logger.info("Downloading %s", logged_url)
 
+    return total_length
+
+
+def _prepare_download(
+    resp,  # type: Response
+    link,  # type: Link
+    progress_bar  # type: str
+):
+    # type: (...) -> Iterable[bytes]
+    total_length = _log_download(resp, link)
+
     if logger.getEffectiveLevel() > logging.INFO:
         show_progress = False
     elif is_from_cache(resp):
@@ -72,6 +88,39 @@ def _prepare_download(
     )(chunks)
 
 
+def _write_chunks(chunks, f):
+    # type: (Iterable[bytes], BinaryIO) -> Iterator[bytes]
+    """Write chunks to f, passing them through."""
+    for chunk in chunks:
+        f.write(chunk)
+        yield chunk
+
+
+class _CombinedProgress:
+    """Count the bytes received by the workers of a parallel download, for
+    the main thread to display.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self._lock = threading.Lock()
+        self._received = 0
+
+    def track(self, chunks):
+        # type: (Iterable[bytes]) -> Iterator[bytes]
+        for chunk in chunks:
+            with self._lock:
+                self._received += len(chunk)
+            yield chunk
+
+    def consume(self):
+        # type: () -> int
+        """Return the number of bytes received since the last call."""
+        with self._lock:
+            received, self._received = self._received, 0
+        return received
+
+
 def sanitize_content_filename(filename):
     # type: (str) -> str
     """
@@ -166,31 +215,125 @@ class BatchDownloader:
         self,
         session,  # type: PipSession
         progress_bar,  # type: str
+        max_workers=1,  # type: int
     ):
         # type: (...) -> None
         self._session = session
         self._progress_bar = progress_bar
+        # Each worker holds a connection while it downloads, so stay within
+        # the adapters' pool size to have them reuse keep-alive connections
+        # rather than opening (and discarding) new ones.
+        self._max_workers = max(1, min(max_workers, DEFAULT_POOLSIZE))
 
-    def __call__(self, links, location):
-        # type: (Iterable[Link], str) -> Iterable[Tuple[Link, Tuple[str, str]]]
-        """Download the files given by links into location."""
-        for link in links:
-            try:
-                resp = _http_get_download(self._session, link)
-            except NetworkConnectionError as e:
-                assert e.response is not None
-                logger.critical(
-                    "HTTP error %s while getting %s",
-                    e.response.status_code, link,
+    def __call__(
+        self,
+        links,  # type: Iterable[Link]
+        location,  # type: str
+        hashes=None,  # type: Optional[Dict[Link, Hashes]]
+    ):
+        # type: (...) -> Iterable[Tuple[Link, Tuple[str, str]]]
+        """Download the files given by links into location.
+
+        If hashes maps a link to the hashes it is expected to have, the file
+        is checked against them as it is written, raising HashMismatch.
+        Results are yielded in the order of links.
+        """
+        links = list(links)
+        if hashes is None:
+            hashes = {}
+        if self._max_workers == 1 or len(links) < 2:
+            for link in links:
+                yield link, self._download_one(
+                    link, location, hashes.get(link), self._progress_bar,
                 )
-                raise
+        else:
+            yield from self._download_parallel(links, location, hashes)
 
-            filename = _get_http_response_filename(resp, link)
-            filepath = os.path.join(location, filename)
+    def _download_one(
+        self,
+        link,  # type: Link
+        location,  # type: str
+        hashes,  # type: Optional[Hashes]
+        progress_bar,  # type: Optional[str]
+        progress=None,  # type: Optional[_CombinedProgress]
+    ):
+        # type: (...) -> Tuple[str, str]
+        try:
+            resp = _http_get_download(self._session, link)
+        except NetworkConnectionError as e:
+            assert e.response is not None
+            logger.critical(
+                "HTTP error %s while getting %s",
+                e.response.status_code, link,
+            )
+            raise
 
-            chunks = _prepare_download(resp, link, self._progress_bar)
-            with open(filepath, 'wb') as content_file:
-                for chunk in chunks:
-                    content_file.write(chunk)
-            content_type = resp.headers.get('Content-Type', '')
-            yield link, (filepath, content_type)
+        filename = _get_http_response_filename(resp, link)
+        filepath = os.path.join(location, filename)
+
+        if progress_bar is None:
+            _log_download(resp, link)
+            chunks = response_chunks(
+                resp, CONTENT_CHUNK_SIZE
+            )  # type: Iterable[bytes]
+        else:
+            chunks = _prepare_download(resp, link, progress_bar)
+        if progress is not None:
+            chunks = progress.track(chunks)
+        with open(filepath, 'wb') as content_file:
+            written = _write_chunks(chunks, content_file)
+            if hashes:
+                hashes.check_against_chunks(written)
+            else:
+                collections.deque(written, maxlen=0)
+        content_type = resp.headers.get('Content-Type', '')
+        return filepath, content_type
+
+    def _download_parallel(
+        self,
+        links,  # type: List[Link]
+        location,  # type: str
+        hashes,  # type: Dict[Link, Hashes]
+    ):
+        # type: (...) -> Iterable[Tuple[Link, Tuple[str, str]]]
+        # Per-file progress bars would overwrite each other, so the workers
+        # report to a single display for the whole batch instead.
+        progress = _CombinedProgress()
+        show_progress = logger.getEffectiveLevel() <= logging.INFO
+        if show_progress:
+            bar = BAR_TYPES[self._progress_bar][1]()  # type: Any
+            bar.message = "{}{} files".format(bar.message, len(links))
+
+        max_workers = min(self._max_workers, len(links))
+        logger.debug("Downloading %d files with %d workers", len(links), max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._download_one,
+                    link, location, hashes.get(link), None, progress,
+                )
+                for link in links
+            ]
+            try:
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(
+                        pending,
+                        timeout=_PROGRESS_INTERVAL,
+                        return_when=FIRST_EXCEPTION,
+                    )
+                    if show_progress:
+                        bar.next(progress.consume())
+                    if any(f.exception() is not None for f in done):
+                        break
+            finally:
+                # Do not start any more downloads if one failed, or if the
+                # user interrupted the batch.
+                for future in futures:
+                    future.cancel()
+                if show_progress:
+                    bar.finish()
+
+            for link, future in zip(links, futures):
+                if not future.cancelled():
+                    yield link, future.result()
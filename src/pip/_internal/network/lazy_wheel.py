@@ -2,10 +2,13 @@
 
 __all__ = ['HTTPRangeRequestUnsupported', 'dist_from_wheel_url']
 
+import cgi
+import re
+import struct
 from bisect import bisect_left, bisect_right
 from contextlib import contextmanager
 from tempfile import NamedTemporaryFile
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from zipfile import BadZipfile, ZipFile
 
 from pip._vendor.pkg_resources import Distribution
@@ -15,11 +18,73 @@ from pip._internal.network.session import PipSession
 from pip._internal.network.utils import HEADERS, raise_for_status, response_chunks
 from pip._internal.utils.wheel import pkg_resources_distribution_for_wheel
 
+# How much of the end of a wheel to fetch up front.  This holds the central
+# directory, and usually the .dist-info files written just before it, of
+# all but the largest wheels.
+READ_AHEAD_SIZE = 64 * 1024
+
+# The fixed-size part of the end of central directory record.
+_END_OF_CENTRAL_DIR = struct.Struct("<4s4H2LH")
+_END_OF_CENTRAL_DIR_SIGNATURE = b"PK\005\006"
+_ZIP64_OFFSET = 0xFFFFFFFF
+
+_CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)")
+
 
 class HTTPRangeRequestUnsupported(Exception):
     pass
 
 
+def _parse_content_range(value):
+    # type: (str) -> Optional[Tuple[int, int, Optional[int]]]
+    """Parse a Content-Range header value into its first and last byte
+    positions and the complete length, which may not be known.
+
+    Return None if the value is not a satisfied byte range.
+    """
+    match = _CONTENT_RANGE_RE.match(value.strip())
+    if match is None:
+        return None
+    start, end, length = match.groups()
+    return int(start), int(end), None if length == "*" else int(length)
+
+
+def _parse_multipart_byteranges(body, boundary):
+    # type: (bytes, str) -> Iterator[Tuple[int, bytes]]
+    """Parse the body of a multipart/byteranges response into the first
+    byte position and content of each part.
+
+    Raise ValueError if the body is malformed.
+    """
+    delimiter = b"--" + boundary.encode("ascii")
+    pos = body.find(delimiter)
+    while pos != -1:
+        pos += len(delimiter)
+        if body.startswith(b"--", pos):
+            # This is the close delimiter.
+            return
+        headers_end = body.find(b"\r\n\r\n", pos)
+        if headers_end == -1:
+            raise ValueError("unterminated part headers")
+
+        content_range = None
+        for line in body[pos:headers_end].decode("latin-1").split("\r\n"):
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-range":
+                content_range = _parse_content_range(value)
+        if content_range is None:
+            raise ValueError("part without a valid Content-Range")
+
+        start, end, _ = content_range
+        data_start = headers_end + 4
+        data = body[data_start:data_start + end - start + 1]
+        if len(data) != end - start + 1:
+            raise ValueError("truncated part")
+        yield start, data
+        pos = body.find(delimiter, data_start + len(data))
+    raise ValueError("missing close delimiter")
+
+
 def dist_from_wheel_url(name, url, session):
     # type: (str, str, PipSession) -> Distribution
     """Return a pkg_resources.Distribution from the given wheel URL.
@@ -49,18 +114,31 @@ class LazyZipOverHTTP:
 
     def __init__(self, url, session, chunk_size=CONTENT_CHUNK_SIZE):
         # type: (str, PipSession, int) -> None
-        head = session.head(url, headers=HEADERS)
-        raise_for_status(head)
-        assert head.status_code == 200
         self._session, self._url, self._chunk_size = session, url, chunk_size
-        self._length = int(head.headers['Content-Length'])
         self._file = NamedTemporaryFile()
-        self.truncate(self._length)
         self._left = []  # type: List[int]
         self._right = []  # type: List[int]
-        if 'bytes' not in head.headers.get('Accept-Ranges', 'none'):
+        # Whether the server may answer several ranges in one response.
+        self._multirange = True
+
+        # Fetch the end of the file first, as a suffix range request.  Its
+        # response also tells the file's length, and whether the server
+        # supports range requests at all.
+        tail = self._stream_response(f"-{max(chunk_size, READ_AHEAD_SIZE)}")
+        raise_for_status(tail)
+        content_range = _parse_content_range(
+            tail.headers.get("Content-Range", "")
+        )
+        start, end, length = content_range or (0, 0, None)
+        if tail.status_code != 206 or length is None:
+            tail.close()
             raise HTTPRangeRequestUnsupported('range request is not supported')
-        self._check_zip()
+        self._length = length
+        self.truncate(self._length)
+        with self._stay():
+            self._write_chunks(start, response_chunks(tail, self._chunk_size))
+        self._left, self._right = [start], [end]
+        self._read_ahead()
 
     @property
     def mode(self):
@@ -164,27 +242,69 @@ class LazyZipOverHTTP:
         finally:
             self.seek(pos)
 
-    def _check_zip(self):
+    def _central_directory(self):
+        # type: () -> Optional[Tuple[int, int]]
+        """Return the offset and size of the central directory, if its end
+        record is in the downloaded tail of the file.
+        """
+        with self._stay():
+            self.seek(self._left[-1])
+            tail = self._file.read()
+        pos = tail.rfind(_END_OF_CENTRAL_DIR_SIGNATURE)
+        if pos == -1 or len(tail) - pos < _END_OF_CENTRAL_DIR.size:
+            return None
+        fields = _END_OF_CENTRAL_DIR.unpack_from(tail, pos)
+        size, offset = fields[5], fields[6]
+        if offset == _ZIP64_OFFSET or offset + size > self._length:
+            # Leave ZIP64 archives, and anything unexpected, to ZipFile.
+            return None
+        return offset, size
+
+    def _read_ahead(self):
         # type: () -> None
-        """Check and download until the file is a valid ZIP."""
-        end = self._length - 1
-        for start in reversed(range(0, end, self._chunk_size)):
-            self._download(start, end)
-            with self._stay():
-                try:
-                    # For read-only ZIP files, ZipFile only needs
-                    # methods read, seek, seekable and tell.
-                    ZipFile(self)  # type: ignore
-                except BadZipfile:
-                    pass
-                else:
-                    break
-
-    def _stream_response(self, start, end, base_headers=HEADERS):
-        # type: (int, int, Dict[str, str]) -> Response
-        """Return HTTP response to a range request from start to end."""
+        """Download the central directory and the .dist-info entries.
+
+        This takes at most two requests past the initial one, rather than
+        letting ZipFile fetch each of them as it reads it.
+        """
+        tail_start = self._left[-1]
+        central_directory = self._central_directory()
+        if central_directory is not None and central_directory[0] < tail_start:
+            # Wheel builders write the .dist-info entries last, right
+            # before the central directory, so fetch what precedes it in
+            # the same request.  Like the central directory, RECORD grows
+            # with the number of files in the wheel.
+            offset, size = central_directory
+            start = max(0, offset - max(size, READ_AHEAD_SIZE))
+            self._download(start, tail_start - 1)
+
+        with self._stay():
+            try:
+                # For read-only ZIP files, ZipFile only needs
+                # methods read, seek, seekable and tell.
+                zip_file = ZipFile(self)  # type: ignore
+            except BadZipfile:
+                # Let the caller report it, when reading the file.
+                return
+
+        # An entry's data spans until the next entry, or the central
+        # directory for the last one.
+        infos = zip_file.infolist()
+        offsets = sorted({info.header_offset for info in infos})
+        offsets.append(zip_file.start_dir)
+        intervals = []
+        for info in infos:
+            if not info.filename.split("/", 1)[0].endswith(".dist-info"):
+                continue
+            i = bisect_right(offsets, info.header_offset)
+            intervals.append((info.header_offset, offsets[i] - 1))
+        self._download_intervals(sorted(intervals))
+
+    def _stream_response(self, byte_ranges, base_headers=HEADERS):
+        # type: (str, Dict[str, str]) -> Response
+        """Return HTTP response to a request for the given byte ranges."""
         headers = base_headers.copy()
-        headers['Range'] = f'bytes={start}-{end}'
+        headers['Range'] = f'bytes={byte_ranges}'
         # TODO: Get range requests to be correctly cached
         headers['Cache-Control'] = 'no-cache'
         return self._session.get(self._url, headers=headers, stream=True)
@@ -210,15 +330,88 @@ class LazyZipOverHTTP:
             yield i, end
         self._left[left:right], self._right[left:right] = [start], [end]
 
+    def _write_chunks(self, start, chunks):
+        # type: (int, Iterable[bytes]) -> None
+        self.seek(start)
+        for chunk in chunks:
+            self._file.write(chunk)
+
+    def _fetch_multirange(self, intervals):
+        # type: (List[Tuple[int, int]]) -> List[Tuple[int, int]]
+        """Fetch intervals in a single request, returning those that the
+        response did not cover.
+        """
+        response = self._stream_response(
+            ",".join(f"{start}-{end}" for start, end in intervals)
+        )
+        raise_for_status(response)
+        content_type, params = cgi.parse_header(
+            response.headers.get("Content-Type", "")
+        )
+        content_range = _parse_content_range(
+            response.headers.get("Content-Range", "")
+        )
+        received = []  # type: List[Tuple[int, int]]
+        if response.status_code != 206:
+            response.close()
+        elif content_type == "multipart/byteranges" and "boundary" in params:
+            body = b"".join(response_chunks(response, self._chunk_size))
+            try:
+                parts = list(_parse_multipart_byteranges(body, params["boundary"]))
+            except ValueError:
+                parts = []
+            for start, data in parts:
+                self._write_chunks(start, [data])
+                received.append((start, start + len(data) - 1))
+        elif content_range is not None:
+            # The server answered with a single range, probably the first
+            # one requested or the union of them all.
+            start, end, _ = content_range
+            self._write_chunks(start, response_chunks(response, self._chunk_size))
+            received.append((start, end))
+        else:
+            response.close()
+
+        missing = [
+            (start, end) for start, end in intervals
+            if not any(i <= start and end <= j for i, j in received)
+        ]
+        if missing and len(received) < 2:
+            # Do not try to fetch several ranges at once again, since the
+            # server does not answer multipart/byteranges.
+            self._multirange = False
+        return missing
+
+    def _fetch(self, intervals):
+        # type: (List[Tuple[int, int]]) -> None
+        """Fetch the given intervals, which must not be downloaded yet."""
+        if len(intervals) > 1 and self._multirange:
+            intervals = self._fetch_multirange(intervals)
+        for start, end in intervals:
+            response = self._stream_response(f"{start}-{end}")
+            response.raise_for_status()
+            self._write_chunks(start, response_chunks(response, self._chunk_size))
+
+    def _download_intervals(self, intervals):
+        # type: (Iterable[Tuple[int, int]]) -> None
+        """Download the given sorted intervals, inclusively.
+
+        Where the server supports it, the missing parts are all fetched
+        with a single request.
+        """
+        missing = []  # type: List[Tuple[int, int]]
+        with self._stay():
+            for start, end in intervals:
+                left = bisect_left(self._right, start)
+                right = bisect_right(self._left, end)
+                for start, end in self._merge(start, end, left, right):
+                    if missing and missing[-1][1] + 1 == start:
+                        # Request adjacent intervals as one.
+                        start = missing.pop()[0]
+                    missing.append((start, end))
+            self._fetch(missing)
+
     def _download(self, start, end):
         # type: (int, int) -> None
         """Download bytes from start to end inclusively."""
-        with self._stay():
-            left = bisect_left(self._right, start)
-            right = bisect_right(self._left, end)
-            for start, end in self._merge(start, end, left, right):
-                response = self._stream_response(start, end)
-                response.raise_for_status()
-                self.seek(start)
-                for chunk in response_chunks(response, self._chunk_size):
-                    self._file.write(chunk)
+        self._download_intervals([(start, end)])
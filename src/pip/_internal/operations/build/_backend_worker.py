@@ -0,0 +1,95 @@
+"""A long-lived process calling the hooks of PEP 517 build backends, for
+pip._internal.operations.build.backend_workers.
+
+This is run as a script with the Python of a build environment, and must not
+import pip. It reads requests from stdin, one JSON object per line, with:
+
+- cmd: the command the hook would be run with in a new process, as given
+  to pep517 subprocess runners: the Python executable, the path of pep517's
+  _in_process.py script, the name of the hook and the control directory.
+- cwd: the directory to call the hook in.
+- extra_environ: the environment variables to set while calling the hook.
+- log: the file to append the output of the hook to.
+
+Once the hook returns, it writes a JSON object with the "returncode" the
+process would have exited with to stdout, on one line. The output of the
+hooks never goes to stdout, so that it cannot mix with these responses.
+"""
+
+import json
+import os
+import runpy
+import sys
+import traceback
+from typing import Any, Dict, List
+
+
+def _call(script, argv):
+    # type: (Dict[str, Any], List[str]) -> int
+    sys.argv = argv
+    try:
+        script["main"]()
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def _serve(request, scripts, devnull):
+    # type: (Dict[str, Any], Dict[str, Dict[str, Any]], int) -> int
+    _, path, *args = request["cmd"]
+    script = scripts.get(path)
+    if script is None:
+        script = scripts[path] = runpy.run_path(path)
+        # Like when the script is run, its directory comes first on sys.path.
+        sys.path.insert(0, os.path.dirname(path))
+
+    environ = dict(os.environ)
+    cwd = os.getcwd()
+    log = os.open(request["log"], os.O_WRONLY | os.O_APPEND)
+    os.dup2(log, 1)
+    os.dup2(log, 2)
+    os.close(log)
+    try:
+        os.environ.update(request["extra_environ"] or {})
+        os.chdir(request["cwd"] or cwd)
+        return _call(script, [path] + args)
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(devnull, 1)
+        os.dup2(devnull, 2)
+        os.chdir(cwd)
+        os.environ.clear()
+        os.environ.update(environ)
+
+
+def main():
+    # type: () -> None
+    # The directory of this script is not meant to be importable.
+    del sys.path[0]
+
+    # Keep stdin and stdout for the requests and responses, and let the
+    # hooks neither read from nor write to them.
+    requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    responses = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+
+    scripts = {}  # type: Dict[str, Dict[str, Any]]
+    for line in requests:
+        returncode = _serve(json.loads(line), scripts, devnull)
+        responses.write(json.dumps({"returncode": returncode}) + "\n")
+        responses.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""Long-lived processes calling the hooks of PEP 517 build backends.
+"""
+
+import collections
+import json
+import logging
+import os
+import queue
+import subprocess
+import threading
+import time
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    Mapping,
+    Optional,
+    Type,
+)
+
+from pip._internal.cli.spinners import SpinnerInterface, open_spinner
+from pip._internal.exceptions import (
+    InstallationError,
+    InstallationSubprocessError,
+)
+from pip._internal.utils.logging import subprocess_logger
+from pip._internal.utils.subprocess import (
+    format_command_args,
+    get_thread_environ,
+    make_subprocess_output_error,
+)
+
+if TYPE_CHECKING:
+    from pip._internal.build_env import BuildEnvironment
+
+_WORKER_SCRIPT = os.path.join(os.path.dirname(__file__), "_backend_worker.py")
+
+# How often to look for new output and update the spinner while waiting for
+# a hook to return, in seconds.
+_POLL_INTERVAL = 0.1
+
+
+class _Worker:
+    """A process calling the hooks of the backends of one build environment,
+    in turn.
+    """
+
+    def __init__(self, python):
+        # type: (str) -> None
+        self.python = python
+        env = os.environ.copy()
+        env.update(get_thread_environ())
+        self._proc = subprocess.Popen(
+            [python, _WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            encoding="utf-8",
+        )
+        self._responses = queue.Queue()  # type: queue.Queue[Optional[int]]
+        threading.Thread(target=self._read_responses, daemon=True).start()
+
+    def _read_responses(self):
+        # type: () -> None
+        assert self._proc.stdout is not None
+        for line in self._proc.stdout:
+            self._responses.put(json.loads(line)["returncode"])
+        # The process exited.
+        self._responses.put(None)
+
+    def send(self, request):
+        # type: (Mapping[str, Any]) -> None
+        assert self._proc.stdin is not None
+        self._proc.stdin.write(json.dumps(request) + "\n")
+        self._proc.stdin.flush()
+
+    def receive(self, timeout):
+        # type: (float) -> Optional[int]
+        """Wait for the return code of the hook called last, which is None if
+        the process exited instead.
+
+        Raises queue.Empty if it did not arrive in time.
+        """
+        return self._responses.get(timeout=timeout)
+
+    @property
+    def returncode(self):
+        # type: () -> int
+        return self._proc.wait()
+
+    def is_alive(self):
+        # type: () -> bool
+        return self._proc.poll() is None
+
+    def stop(self):
+        # type: () -> None
+        assert self._proc.stdin is not None
+        try:
+            # The worker exits once it has read all the requests.
+            self._proc.stdin.close()
+            self._proc.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            self.kill()
+
+    def kill(self):
+        # type: () -> None
+        self._proc.kill()
+        self._proc.wait()
+
+
+class BackendWorkerPool:
+    """Calls the hooks of PEP 517 build backends in long-lived worker
+    processes, one per build environment, rather than in a new process for
+    each hook, which imports the backend again.
+
+    The worker of an environment is replaced when a hook fails, crashes or
+    times out, so that a broken backend does not affect the next calls, and
+    when build dependencies are installed into the environment. The workers
+    used least recently are stopped beyond the given number.
+    """
+
+    def __init__(self, timeout=None, max_workers=8):
+        # type: (Optional[float], int) -> None
+        """
+        :param timeout: The time after which a hook is stopped and fails, in
+            seconds, or None for no limit.
+        :param max_workers: The number of workers to keep alive between hook
+            calls.
+        """
+        self._timeout = timeout
+        self._max_workers = max_workers
+        self._workers = (
+            collections.OrderedDict()
+        )  # type: collections.OrderedDict[BuildEnvironment, _Worker]
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        # type: () -> BackendWorkerPool
+        return self
+
+    def __exit__(
+        self,
+        exc_type,  # type: Optional[Type[BaseException]]
+        exc_val,  # type: Optional[BaseException]
+        exc_tb  # type: Optional[TracebackType]
+    ):
+        # type: (...) -> None
+        self.close()
+
+    def close(self):
+        # type: () -> None
+        with self._lock:
+            workers = list(self._workers.values())
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
+
+    def discard(self, build_env):
+        # type: (BuildEnvironment) -> None
+        """Stop the worker of the build environment, if it has one."""
+        with self._lock:
+            worker = self._workers.pop(build_env, None)
+        if worker is not None:
+            worker.stop()
+
+    def get_runner(self, build_env, message):
+        # type: (BuildEnvironment, str) -> Callable[..., None]
+        """Provide a subprocess_runner for pep517's Pep517HookCaller, calling
+        the hooks in the worker of the build environment and showing a
+        spinner with the message.
+
+        Like the subprocesses of the hooks, the worker is started with the
+        environment variables of the calling thread, so the build environment
+        must be active.
+        """
+
+        def runner(
+            cmd,  # type: List[str]
+            cwd=None,  # type: Optional[str]
+            extra_environ=None,  # type: Optional[Mapping[str, Any]]
+        ):
+            # type: (...) -> None
+            with open_spinner(message) as spinner:
+                self._call(build_env, cmd, cwd, extra_environ, spinner)
+
+        return runner
+
+    def _acquire(self, build_env, python):
+        # type: (BuildEnvironment, str) -> _Worker
+        with self._lock:
+            worker = self._workers.pop(build_env, None)
+        if worker is not None:
+            if worker.python == python and worker.is_alive():
+                return worker
+            worker.kill()
+        return _Worker(python)
+
+    def _release(self, build_env, worker):
+        # type: (BuildEnvironment, _Worker) -> None
+        stopped = []
+        with self._lock:
+            if build_env in self._workers:
+                # Another thread called a hook of the environment meanwhile.
+                stopped.append(worker)
+            else:
+                self._workers[build_env] = worker
+            while len(self._workers) > self._max_workers:
+                stopped.append(self._workers.popitem(last=False)[1])
+        for worker in stopped:
+            worker.stop()
+
+    def _call(
+        self,
+        build_env,  # type: BuildEnvironment
+        cmd,  # type: List[str]
+        cwd,  # type: Optional[str]
+        extra_environ,  # type: Optional[Mapping[str, Any]]
+        spinner,  # type: SpinnerInterface
+    ):
+        # type: (...) -> None
+        # The output is logged like call_subprocess() does.
+        showing_subprocess = subprocess_logger.getEffectiveLevel() <= logging.DEBUG
+        command_desc = format_command_args(cmd)
+        subprocess_logger.debug("Running command %s in a worker", command_desc)
+
+        # The hook output goes next to the input and output files of pep517,
+        # in the control directory it removes after the call.
+        log_path = os.path.join(cmd[-1], "output.log")
+        open(log_path, "w").close()
+
+        worker = self._acquire(build_env, cmd[0])
+        worker.send({
+            "cmd": cmd,
+            "cwd": cwd,
+            "extra_environ": dict(extra_environ or {}),
+            "log": log_path,
+        })
+        returncode = None  # type: Optional[int]
+        timed_out = False
+        finished = False
+        all_output = []  # type: List[str]
+        pending = ""
+        start = time.monotonic()
+        with open(log_path, errors="backslashreplace") as log:
+            while not finished:
+                try:
+                    returncode = worker.receive(_POLL_INTERVAL)
+                    finished = True
+                except queue.Empty:
+                    elapsed = time.monotonic() - start
+                    if self._timeout is not None and elapsed > self._timeout:
+                        worker.kill()
+                        timed_out = finished = True
+
+                # Show the complete lines written so far.
+                lines = (pending + log.read()).splitlines(keepends=True)
+                pending = ""
+                if lines and not lines[-1].endswith("\n") and not finished:
+                    pending = lines.pop()
+                for line in lines:
+                    line = line.rstrip()
+                    all_output.append(line + "\n")
+                    subprocess_logger.debug(line)
+                if not showing_subprocess:
+                    spinner.spin()
+
+        if returncode == 0:
+            self._release(build_env, worker)
+            if not showing_subprocess:
+                spinner.finish("done")
+            return
+
+        # The state of the worker is unknown after a failure.
+        worker.kill()
+        if returncode is None:
+            # The worker exited, or was killed as the hook timed out.
+            returncode = worker.returncode
+        if not showing_subprocess:
+            spinner.finish("error")
+            subprocess_logger.error(make_subprocess_output_error(
+                cmd_args=cmd,
+                cwd=cwd,
+                lines=all_output,
+                exit_status=returncode,
+            ))
+        if timed_out:
+            message = "Command timed out after {} seconds: {}".format(
+                self._timeout, command_desc,
+            )
+            # Failures to build wheels are not shown, so show this here.
+            subprocess_logger.error(message)
+            raise InstallationError(message)
+        raise InstallationSubprocessError(returncode, command_desc)
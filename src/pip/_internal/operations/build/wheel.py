@@ -4,13 +4,14 @@ from typing import Optional
 
 from pip._vendor.pep517.wrappers import Pep517HookCaller
 
-from pip._internal.utils.subprocess import runner_with_spinner_message
+from pip._internal.build_env import BuildEnvironment
 
 logger = logging.getLogger(__name__)
 
 
 def build_wheel_pep517(
     name,  # type: str
+    build_env,  # type: BuildEnvironment
     backend,  # type: Pep517HookCaller
     metadata_directory,  # type: str
     tempd,  # type: str
@@ -24,7 +25,7 @@ def build_wheel_pep517(
     try:
         logger.debug('Destination directory: %s', tempd)
 
-        runner = runner_with_spinner_message(
+        runner = build_env.get_hook_runner(
             f'Building wheel for {name} (PEP 517)'
         )
         with backend.subprocess_runner(runner):
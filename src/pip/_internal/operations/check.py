@@ -3,18 +3,33 @@
 
 import logging
 from collections import namedtuple
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
-
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from pip._vendor.packaging.requirements import InvalidRequirement
 from pip._vendor.packaging.utils import canonicalize_name
-from pip._vendor.pkg_resources import RequirementParseError
 
-from pip._internal.distributions import make_distribution_for_install_requirement
-from pip._internal.req.req_install import InstallRequirement
-from pip._internal.utils.misc import get_installed_distributions
+from pip._internal.metadata import (
+    BaseDistribution,
+    BaseEnvironment,
+    get_default_environment,
+)
+from pip._internal.models.direct_url import ArchiveInfo
 
 if TYPE_CHECKING:
     from pip._vendor.packaging.utils import NormalizedName
 
+    from pip._internal.req.req_install import InstallRequirement
+
 logger = logging.getLogger(__name__)
 
 # Shorthands
@@ -39,11 +54,14 @@ def create_package_set_from_installed(**kwargs: Any) -> Tuple["PackageSet", bool
 
     package_set = {}
     problems = False
-    for dist in get_installed_distributions(**kwargs):
-        name = canonicalize_name(dist.project_name)
+    env = get_default_environment()
+    for dist in env.iter_installed_distributions(**kwargs):
+        name = canonicalize_name(dist.canonical_name)
         try:
-            package_set[name] = PackageDetails(dist.version, dist.requires())
-        except (OSError, RequirementParseError) as e:
+            package_set[name] = PackageDetails(
+                str(dist.version), list(dist.iter_dependencies()),
+            )
+        except (OSError, InvalidRequirement) as e:
             # Don't crash on unreadable or broken metadata
             logger.warning("Error parsing requirements for %s: %s", name, e)
             problems = True
@@ -70,7 +88,7 @@ def check_package_set(package_set, should_ignore=None):
             continue
 
         for req in package_detail.requires:
-            name = canonicalize_name(req.project_name)
+            name = canonicalize_name(req.name)
 
             # Check if it's missing
             if name not in package_set:
@@ -94,6 +112,99 @@ def check_package_set(package_set, should_ignore=None):
     return missing, conflicting
 
 
+def _is_pin(req):
+    # type: (InstallRequirement) -> bool
+    if req.editable or req.link is not None or req.req is None:
+        return False
+    specifiers = list(req.req.specifier)
+    if len(specifiers) != 1:
+        return False
+    specifier = specifiers[0]
+    if specifier.operator == "===":
+        return True
+    return specifier.operator == "==" and not specifier.version.endswith(".*")
+
+
+def _archive_hash_allowed(req, dist):
+    # type: (InstallRequirement, BaseDistribution) -> bool
+    hashes = req.hashes(trust_internet=False)
+    if not hashes:
+        return True
+    direct_url = dist.direct_url
+    if direct_url is None or not isinstance(direct_url.info, ArchiveInfo):
+        return True
+    if not direct_url.info.hash or "=" not in direct_url.info.hash:
+        return True
+    hash_name, hex_digest = direct_url.info.hash.split("=", 1)
+    return hashes.is_hash_allowed(hash_name, hex_digest)
+
+
+def get_satisfying_distributions(
+    requirements,  # type: List[InstallRequirement]
+    environment,  # type: BaseEnvironment
+    check_dependencies=True,  # type: bool
+):
+    # type: (...) -> Optional[List[Tuple[InstallRequirement, BaseDistribution]]]
+    """Find the installed distributions satisfying requirements that are all
+    pinned to exact versions, without looking at any index.
+
+    Return None if any requirement is not pinned with ``==`` or ``===``,
+    is not installed at its pinned version, allows hashes that exclude the
+    archive the distribution recorded being installed from, or (with
+    check_dependencies) has dependencies that are not installed at a
+    version they accept. Requirements whose markers do not match are left
+    out.
+    """
+    satisfied = []  # type: List[Tuple[InstallRequirement, BaseDistribution]]
+    to_check = []  # type: List[Tuple[BaseDistribution, FrozenSet[str]]]
+    for req in requirements:
+        if req.constraint or not _is_pin(req):
+            logger.debug("%s is not pinned to a version", req)
+            return None
+        if not req.match_markers():
+            continue
+        assert req.req is not None
+        dist = environment.get_distribution(req.req.name)
+        if dist is None or not req.req.specifier.contains(
+            str(dist.version), prereleases=True
+        ):
+            logger.debug("%s is not installed", req)
+            return None
+        if not _archive_hash_allowed(req, dist):
+            logger.debug("%s is installed from an archive with another hash",
+                         req)
+            return None
+        satisfied.append((req, dist))
+        to_check.append((dist, frozenset(req.extras)))
+
+    checked = set()  # type: Set[Tuple[str, FrozenSet[str]]]
+    while check_dependencies and to_check:
+        dist, extras = to_check.pop()
+        if (dist.canonical_name, extras) in checked:
+            continue
+        checked.add((dist.canonical_name, extras))
+        try:
+            dependencies = list(dist.iter_dependencies(extras))
+        except (OSError, InvalidRequirement) as e:
+            logger.debug("Error parsing requirements for %s: %s",
+                         dist.canonical_name, e)
+            return None
+        for dependency in dependencies:
+            dependency_dist = environment.get_distribution(dependency.name)
+            if (
+                dependency.url or
+                dependency_dist is None or
+                not dependency.specifier.contains(
+                    str(dependency_dist.version), prereleases=True,
+                )
+            ):
+                logger.debug("%s of %s is not installed",
+                             dependency, dist.canonical_name)
+                return None
+            to_check.append((dependency_dist, frozenset(dependency.extras)))
+    return satisfied
+
+
 def check_install_conflicts(to_install):
     # type: (List[InstallRequirement]) -> ConflictDetails
     """For checking if the dependency graph would be consistent after \
@@ -119,6 +230,9 @@ def _simulate_installation_of(to_install, package_set):
     # type: (List[InstallRequirement], PackageSet) -> Set[NormalizedName]
     """Computes the version of packages after installing to_install.
     """
+    from pip._internal.distributions import (
+        make_distribution_for_install_requirement,
+    )
 
     # Keep track of packages that were installed
     installed = set()
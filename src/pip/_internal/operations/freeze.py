@@ -17,11 +17,6 @@ from pip._vendor.packaging.utils import canonicalize_name
 from pip._vendor.pkg_resources import Distribution, Requirement, RequirementParseError
 
 from pip._internal.exceptions import BadCommand, InstallationError
-from pip._internal.req.constructors import (
-    install_req_from_editable,
-    install_req_from_line,
-)
-from pip._internal.req.req_file import COMMENT_RE
 from pip._internal.utils.direct_url_helpers import (
     direct_url_as_pep440_direct_reference,
     dist_get_direct_url,
@@ -73,6 +68,14 @@ def freeze(
         installations[req.canonical_name] = req
 
     if requirement:
+        # Imported here, as parsing requirements needs most of pip, while
+        # freezing the environment alone does not.
+        from pip._internal.req.constructors import (
+            install_req_from_editable,
+            install_req_from_line,
+        )
+        from pip._internal.req.req_file import COMMENT_RE
+
         # the options that don't get turned into an InstallRequirement
         # should only be emitted once, even if the same option is in multiple
         # requirements files, so we need to keep track of what has been emitted
@@ -0,0 +1,179 @@
+"""Collection of the details of installed distributions, for show and list.
+"""
+
+import collections
+import json
+import logging
+import os
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+)
+
+from pip._vendor.packaging.utils import canonicalize_name
+
+from pip._internal.metadata import BaseDistribution, BaseEnvironment
+
+logger = logging.getLogger(__name__)
+
+# The fields read from the headers of the core metadata.
+_METADATA_FIELDS = {
+    'metadata-version': 'Metadata-Version',
+    'summary': 'Summary',
+    'home-page': 'Home-page',
+    'author': 'Author',
+    'author-email': 'Author-email',
+    'license': 'License',
+}
+
+FIELDS = frozenset([
+    'name', 'version', 'location', 'editable', 'installer', 'requires',
+    'required_by', 'classifiers', 'entry_points', 'files',
+    *_METADATA_FIELDS,
+])
+
+
+def _non_empty_lines(text):
+    # type: (str) -> List[str]
+    """The lines of a metadata file, like pkg_resources.yield_lines()."""
+    lines = (line.strip() for line in text.splitlines())
+    return [line for line in lines if line and not line.startswith('#')]
+
+
+def _get_files(dist):
+    # type: (BaseDistribution) -> Optional[List[str]]
+    """The files of the distribution, relative to its location.
+
+    They are listed by the ``RECORD`` of ``.dist-info`` directories, and by
+    the ``installed-files.txt`` pip writes in ``.egg-info`` directories, which
+    is relative to the metadata directory.
+    """
+    location = dist.location
+    if location is None:
+        return None
+    text = dist.read_text('RECORD')
+    if text is not None:
+        root = location
+        paths = [line.split(',')[0] for line in _non_empty_lines(text)]
+    else:
+        text = dist.read_text('installed-files.txt')
+        if text is None or dist.info_location is None:
+            return None
+        root = dist.info_location
+        paths = _non_empty_lines(text)
+    return [
+        os.path.relpath(os.path.join(root, path), location) for path in paths
+    ]
+
+
+def _get_required_by(environment, names):
+    # type: (BaseEnvironment, Set[str]) -> Dict[str, List[str]]
+    """Map the given canonical names to the names of the distributions that
+    depend on them, reading the dependencies of every distribution once.
+    """
+    # Imported here, as importing the requirement parser is slow, and most
+    # fields do not need it.
+    from pip._vendor.packaging.requirements import InvalidRequirement
+
+    required_by = collections.defaultdict(list)  # type: Dict[str, List[str]]
+    for dist in environment.iter_distributions():
+        try:
+            required = {
+                canonicalize_name(req.name)
+                for req in dist.iter_dependencies_on(names)
+            }
+        except InvalidRequirement as e:
+            logger.warning(
+                "Ignoring the dependencies of %s: %s", dist.raw_name, e,
+            )
+            continue
+        for name in required:
+            required_by[name].append(dist.raw_name)
+    return required_by
+
+
+def iter_installed_info(
+    distributions,  # type: Iterable[BaseDistribution]
+    fields,  # type: Collection[str]
+    environment,  # type: BaseEnvironment
+):
+    # type: (...) -> Iterator[Dict[str, Any]]
+    """Collect the requested fields of each distribution, in one pass.
+
+    A metadata file is only read if a requested field needs it, and at most
+    once per distribution. ``required_by`` needs the dependencies of every
+    distribution in the environment on the given ones, which are read up
+    front.
+
+    The ``files`` and ``entry_points`` fields are left out for
+    distributions that do not record them.
+    """
+    unknown = set(fields) - FIELDS
+    if unknown:
+        raise ValueError(
+            "Unknown fields: {}".format(", ".join(sorted(unknown)))
+        )
+    required_by = {}  # type: Dict[str, List[str]]
+    if 'required_by' in fields:
+        distributions = list(distributions)
+        required_by = _get_required_by(
+            environment, {dist.canonical_name for dist in distributions},
+        )
+
+    for dist in distributions:
+        info = {}  # type: Dict[str, Any]
+        if 'name' in fields:
+            info['name'] = dist.raw_name
+        if 'version' in fields:
+            info['version'] = str(dist.version)
+        if 'location' in fields:
+            info['location'] = dist.location
+        if 'editable' in fields:
+            info['editable'] = dist.editable
+        if 'installer' in fields:
+            info['installer'] = dist.installer
+        if 'requires' in fields:
+            info['requires'] = [
+                req.name for req in dist.iter_dependencies()
+            ]
+        if 'required_by' in fields:
+            info['required_by'] = required_by.get(dist.canonical_name, [])
+        if (set(_METADATA_FIELDS) | {'classifiers'}) & set(fields):
+            metadata = dist.metadata
+            for field, header in _METADATA_FIELDS.items():
+                if field in fields:
+                    info[field] = metadata.get(header)
+            if 'classifiers' in fields:
+                info['classifiers'] = metadata.get_all('Classifier', [])
+        if 'entry_points' in fields:
+            text = dist.read_text('entry_points.txt')
+            if text is not None:
+                info['entry_points'] = _non_empty_lines(text)
+        if 'files' in fields:
+            files = _get_files(dist)
+            if files:
+                info['files'] = sorted(files)
+        yield info
+
+
+def iter_json_lines(items):
+    # type: (Iterable[Dict[str, Any]]) -> Iterator[str]
+    """Serialize the items as a JSON array, one item per line, so that the
+    output for large environments can be written as it is collected.
+    """
+    items = iter(items)
+    first = next(items, None)
+    if first is None:
+        yield '[]'
+        return
+    line = '[' + json.dumps(first)
+    for item in items:
+        yield line + ','
+        line = json.dumps(item)
+    yield line + ']'
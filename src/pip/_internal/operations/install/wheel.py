@@ -5,14 +5,25 @@ import collections
 import compileall
 import contextlib
 import csv
+import errno
+import hashlib
 import importlib
 import logging
 import os.path
 import re
 import shutil
+import stat
 import sys
+import threading
 import warnings
 from base64 import urlsafe_b64encode
+from concurrent.futures import (
+    FIRST_EXCEPTION,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
 from email.message import Message
 from itertools import chain, filterfalse, starmap
 from typing import (
@@ -37,7 +48,7 @@ from zipfile import ZipFile, ZipInfo
 
 from pip._vendor import pkg_resources
 from pip._vendor.distlib.scripts import ScriptMaker
-from pip._vendor.distlib.util import get_export_entry
+from pip._vendor.distlib.util import FileOperator, get_export_entry
 from pip._vendor.pkg_resources import Distribution
 from pip._vendor.six import ensure_str, ensure_text, reraise
 
@@ -47,6 +58,7 @@ from pip._internal.models.direct_url import DIRECT_URL_METADATA_NAME, DirectUrl
 from pip._internal.models.scheme import SCHEME_KEYS, Scheme
 from pip._internal.utils.filesystem import adjacent_tmp_file, replace
 from pip._internal.utils.misc import captured_stdout, ensure_dir, hash_file, partition
+from pip._internal.utils.parallel import LACK_SEM_OPEN
 from pip._internal.utils.unpacking import (
     current_umask,
     is_within_directory,
@@ -58,6 +70,8 @@ from pip._internal.utils.wheel import parse_wheel, pkg_resources_distribution_fo
 if TYPE_CHECKING:
     from typing import Protocol
 
+    from pip._internal.cache import UnpackedWheel, UnpackedWheelStore
+
     class File(Protocol):
         src_record_path = None  # type: RecordPath
         dest_path = None  # type: str
@@ -74,16 +88,29 @@ RecordPath = NewType('RecordPath', str)
 InstalledCSVRow = Tuple[RecordPath, str, Union[int, str]]
 
 
-def rehash(path, blocksize=1 << 20):
-    # type: (str, int) -> Tuple[str, str]
-    """Return (encoded_digest, length) for path using hashlib.sha256()"""
-    h, length = hash_file(path, blocksize)
+def _encode_hash(h, length):
+    # type: (Any, int) -> Tuple[str, str]
     digest = 'sha256=' + urlsafe_b64encode(
         h.digest()
     ).decode('latin1').rstrip('=')
     return (digest, str(length))
 
 
+def rehash(path, blocksize=1 << 20):
+    # type: (str, int) -> Tuple[str, str]
+    """Return (encoded_digest, length) for path using hashlib.sha256()"""
+    h, length = hash_file(path, blocksize)
+    return _encode_hash(h, length)
+
+
+def hash_bytes(data):
+    # type: (bytes) -> Tuple[str, str]
+    """Return (encoded_digest, length) for data, like rehash() does for the
+    contents of a file.
+    """
+    return _encode_hash(hashlib.sha256(data), len(data))
+
+
 def csv_io_kwargs(mode):
     # type: (str) -> Dict[str, Any]
     """Return keyword arguments to properly open a CSV file
@@ -92,25 +119,33 @@ def csv_io_kwargs(mode):
     return {'mode': mode, 'newline': '', 'encoding': 'utf-8'}
 
 
-def fix_script(path):
-    # type: (str) -> bool
+def _fix_script(path):
+    # type: (str) -> Optional[Tuple[str, str]]
     """Replace #!python with #!/path/to/python
-    Return True if file was changed.
+    Return the RECORD hash and size of the new contents if the file was
+    changed, or None.
     """
-    # XXX RECORD hashes will need to be updated
     assert os.path.isfile(path)
 
     with open(path, 'rb') as script:
         firstline = script.readline()
         if not firstline.startswith(b'#!python'):
-            return False
+            return None
         exename = sys.executable.encode(sys.getfilesystemencoding())
         firstline = b'#!' + exename + os.linesep.encode("ascii")
         rest = script.read()
     with open(path, 'wb') as script:
         script.write(firstline)
         script.write(rest)
-    return True
+    return hash_bytes(firstline + rest)
+
+
+def fix_script(path):
+    # type: (str) -> bool
+    """Replace #!python with #!/path/to/python
+    Return True if file was changed.
+    """
+    return _fix_script(path) is not None
 
 
 def wheel_root_is_purelib(metadata):
@@ -269,12 +304,19 @@ def get_csv_rows_for_installed(
     changed,  # type: Set[RecordPath]
     generated,  # type: List[str]
     lib_dir,  # type: str
+    known_hashes=None,  # type: Optional[Dict[RecordPath, Tuple[str, str]]]
 ):
     # type: (...) -> List[InstalledCSVRow]
     """
     :param installed: A map from archive RECORD path to installation RECORD
         path.
+    :param known_hashes: The hashes and sizes of files that were computed
+        as they were written, by installation RECORD path. Other changed and
+        generated files are read back to hash them, and other files keep
+        the hashes of the wheel's RECORD.
     """
+    if known_hashes is None:
+        known_hashes = {}
     installed_rows = []  # type: List[InstalledCSVRow]
     for row in old_csv_rows:
         if len(row) > 3:
@@ -282,14 +324,18 @@ def get_csv_rows_for_installed(
         old_record_path = _parse_record_path(row[0])
         new_record_path = installed.pop(old_record_path, old_record_path)
         if new_record_path in changed:
-            digest, length = rehash(_record_to_fs_path(new_record_path))
+            digest, length = known_hashes.get(new_record_path) or rehash(
+                os.path.join(lib_dir, _record_to_fs_path(new_record_path))
+            )
+        elif len(row) > 1 and row[1] and new_record_path in known_hashes:
+            digest, length = known_hashes[new_record_path]
         else:
             digest = row[1] if len(row) > 1 else ''
             length = row[2] if len(row) > 2 else ''
         installed_rows.append((new_record_path, digest, length))
     for f in generated:
         path = _fs_to_record_path(f, lib_dir)
-        digest, length = rehash(f)
+        digest, length = known_hashes.get(path) or rehash(f)
         installed_rows.append((path, digest, length))
     for installed_record_path in installed.values():
         installed_rows.append((installed_record_path, '', ''))
@@ -382,6 +428,9 @@ def get_console_script_specs(console):
     return scripts_to_generate
 
 
+_zip_open_lock = threading.Lock()
+
+
 class ZipBackedFile:
     def __init__(self, src_record_path, dest_path, zip_file):
         # type: (RecordPath, str, ZipFile) -> None
@@ -415,14 +464,124 @@ class ZipBackedFile:
 
         zipinfo = self._getinfo()
 
-        with self._zip_file.open(zipinfo) as f:
+        # ZipFile keeps an unlocked count of the members open for reading,
+        # so opening and closing them is serialized when extracting on
+        # several threads; reading them is safe.
+        with _zip_open_lock:
+            f = self._zip_file.open(zipinfo)
+        try:
             with open(self.dest_path, "wb") as dest:
                 shutil.copyfileobj(f, dest)
+        finally:
+            with _zip_open_lock:
+                f.close()
 
         if zip_item_is_executable(zipinfo):
             set_extracted_file_to_default_mode_plus_executable(self.dest_path)
 
 
+# The FICLONE ioctl of Linux, which makes a copy-on-write clone of a file on
+# filesystems that support it (e.g. Btrfs, XFS).
+_FICLONE = 0x40049409
+
+# The errors that mean a way of linking files is not supported between the
+# source and destination, rather than that the destination is unwritable.
+_LINK_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EPERM,
+    errno.EINVAL,
+    errno.ENOTTY,
+    errno.EMLINK,
+    errno.EOPNOTSUPP,
+    getattr(errno, "ENOTSUP", errno.EOPNOTSUPP),
+}
+
+
+def _reflink_file(src, dest):
+    # type: (str, str) -> None
+    import fcntl
+
+    with open(src, "rb") as src_file, open(dest, "wb") as dest_file:
+        fcntl.ioctl(dest_file.fileno(), _FICLONE, src_file.fileno())
+    _copy_mode_writable(src, dest)
+
+
+def _hardlink_file(src, dest):
+    # type: (str, str) -> None
+    os.link(src, dest)
+
+
+def _copy_file(src, dest):
+    # type: (str, str) -> None
+    shutil.copyfile(src, dest)
+    _copy_mode_writable(src, dest)
+
+
+def _copy_mode_writable(src, dest):
+    # type: (str, str) -> None
+    # The files of the store are read-only, unlike independent copies.
+    os.chmod(dest, stat.S_IMODE(os.stat(src).st_mode) | stat.S_IWUSR)
+
+
+class FileLinker:
+    """Materializes files from an unpacked wheel with a reflink, else a
+    hardlink, else a copy, dropping the ways that the filesystems involved
+    turn out not to support.
+
+    Hardlinks share the read-only mode of the files of the store.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self._lock = threading.Lock()
+        self._methods = [_hardlink_file, _copy_file]
+        if sys.platform.startswith("linux"):
+            self._methods.insert(0, _reflink_file)
+
+    def link(self, src, dest):
+        # type: (str, str) -> None
+        for method in list(self._methods):
+            try:
+                method(src, dest)
+            except OSError as exc:
+                if (
+                    method is _copy_file or
+                    exc.errno not in _LINK_UNSUPPORTED_ERRNOS
+                ):
+                    raise
+                logger.debug(
+                    "Could not %s to %s: %s", method.__name__, dest, exc,
+                )
+                with self._lock:
+                    if method in self._methods:
+                        self._methods.remove(method)
+                # A failed reflink leaves an empty file behind.
+                if os.path.lexists(dest):
+                    os.unlink(dest)
+            else:
+                return
+
+
+class LinkedFile:
+    """A file of the wheel, materialized from an UnpackedWheel."""
+
+    def __init__(self, src_record_path, dest_path, src_path, linker):
+        # type: (RecordPath, str, str, FileLinker) -> None
+        self.src_record_path = src_record_path
+        self.dest_path = dest_path
+        self._src_path = src_path
+        self._linker = linker
+        self.changed = False
+
+    def save(self):
+        # type: () -> None
+        ensure_dir(os.path.dirname(self.dest_path))
+        # Unlink like ZipBackedFile does, which also lets os.link() work.
+        if os.path.lexists(self.dest_path):
+            os.unlink(self.dest_path)
+        self._linker.link(self._src_path, self.dest_path)
+
+
 class ScriptFile:
     def __init__(self, file):
         # type: (File) -> None
@@ -430,11 +589,183 @@ class ScriptFile:
         self.src_record_path = self._file.src_record_path
         self.dest_path = self._file.dest_path
         self.changed = False
+        # The RECORD hash and size of the script, once changed.
+        self.record_hash = None  # type: Optional[Tuple[str, str]]
 
     def save(self):
         # type: () -> None
         self._file.save()
-        self.changed = fix_script(self.dest_path)
+        self.record_hash = _fix_script(self.dest_path)
+        self.changed = self.record_hash is not None
+
+
+def _save_files(files, jobs):
+    # type: (List[File], int) -> None
+    """Save the files, decompressing and writing them on up to ``jobs``
+    threads.
+
+    Files with the same destination (e.g. a file in .data that maps to
+    the location of a file in the wheel root) are saved one after the
+    other, in order, so the last one wins as when saving sequentially.
+    """
+    if jobs <= 1 or len(files) <= 1:
+        for file in files:
+            file.save()
+        return
+
+    by_dest = collections.OrderedDict()  # type: Dict[str, List[File]]
+    for file in files:
+        by_dest.setdefault(os.path.normcase(file.dest_path), []).append(file)
+
+    def save_all(group):
+        # type: (List[File]) -> None
+        for file in group:
+            file.save()
+
+    max_workers = min(jobs, len(by_dest))
+    logger.debug("Extracting %d files with %d workers", len(files), max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(save_all, group) for group in by_dest.values()
+        ]
+        try:
+            wait(futures, return_when=FIRST_EXCEPTION)
+        finally:
+            # Do not write any more files if one failed, or if the user
+            # interrupted the installation.
+            for future in futures:
+                future.cancel()
+    for future in futures:
+        if not future.cancelled():
+            future.result()
+
+
+# captured_stdout() and warnings.catch_warnings() swap process-wide state, so
+# wheels installed on several threads are byte-compiled one at a time in this
+# process.
+_compile_lock = threading.Lock()
+
+
+def _compile_file(path):
+    # type: (str) -> Tuple[bool, str]
+    """Byte-compile a file, returning whether it succeeded and what
+    compileall printed about it.
+    """
+    with captured_stdout() as stdout:
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore')
+            # Python 2's `compileall.compile_file` requires a str in
+            # error cases, so we must convert to the native type.
+            path_arg = ensure_str(path, encoding=sys.getfilesystemencoding())
+            success = compileall.compile_file(path_arg, force=True, quiet=True)
+    return bool(success), stdout.getvalue()
+
+
+def _add_to_record(record_path, lib_dir, paths):
+    # type: (str, str, Iterable[str]) -> None
+    """Add rows for files installed in lib_dir to an installed RECORD."""
+    with open(record_path, **csv_io_kwargs('r')) as f:
+        rows = [tuple(row) for row in csv.reader(f)]
+    rows.extend((_fs_to_record_path(path, lib_dir), '', '') for path in paths)
+
+    with adjacent_tmp_file(record_path, **csv_io_kwargs('w')) as f:
+        writer = csv.writer(cast('IO[str]', f))
+        writer.writerows(_normalized_outrows(
+            cast(List[InstalledCSVRow], rows)
+        ))
+    os.chmod(f.name, 0o666 & ~current_umask())
+    replace(f.name, record_path)
+
+
+class BytecodeCompiler:
+    """Byte-compiles the Python files installed from wheels, on up to
+    ``jobs`` processes.
+
+    With ``defer``, install_wheel() only hands the files over, and they are
+    compiled in a single pass by finish(), which also adds the compiled
+    files to the RECORD of their wheel.
+    """
+
+    def __init__(self, jobs=1, defer=False):
+        # type: (int, bool) -> None
+        self.jobs = jobs
+        self.defer = defer
+        self._executor = None  # type: Optional[ProcessPoolExecutor]
+        self._lock = threading.Lock()
+        # (paths, lib_dir, RECORD path) of each wheel, for finish().
+        self._deferred = []  # type: List[Tuple[List[str], str, str]]
+
+    def _get_executor(self):
+        # type: () -> Optional[ProcessPoolExecutor]
+        with self._lock:
+            if self._executor is None and self.jobs > 1 and not LACK_SEM_OPEN:
+                self._executor = ProcessPoolExecutor(max_workers=self.jobs)
+            return self._executor
+
+    def compile(self, paths):
+        # type: (List[str]) -> Dict[str, str]
+        """Byte-compile the files, and return the path of the .pyc file
+        written for each one that compiled successfully.
+        """
+        executor = None
+        if len(paths) > 1:
+            executor = self._get_executor()
+
+        results = None  # type: Optional[List[Tuple[bool, str]]]
+        if executor is not None:
+            chunksize = max(1, len(paths) // (self.jobs * 4))
+            try:
+                results = list(
+                    executor.map(_compile_file, paths, chunksize=chunksize)
+                )
+            except BrokenProcessPool:
+                logger.debug("Byte-compiling in a worker process failed, "
+                             "compiling in this process instead")
+        if results is None:
+            with _compile_lock:
+                results = [_compile_file(path) for path in paths]
+
+        compiled = {}  # type: Dict[str, str]
+        for path, (success, output) in zip(paths, results):
+            if output:
+                logger.debug(output)
+            if success:
+                pyc_path = importlib.util.cache_from_source(path)
+                assert os.path.exists(pyc_path)
+                compiled[path] = pyc_path
+        return compiled
+
+    def add(self, paths, lib_dir, record_path):
+        # type: (List[str], str, str) -> None
+        """Defer compiling the files of a wheel installed in lib_dir, with
+        its RECORD at record_path, to finish().
+        """
+        with self._lock:
+            self._deferred.append((paths, lib_dir, record_path))
+
+    def finish(self):
+        # type: () -> None
+        """Compile the deferred files, add them to the RECORD of their
+        wheel, and stop the worker processes.
+        """
+        with self._lock:
+            deferred, self._deferred = self._deferred, []
+        try:
+            if deferred:
+                # Wheels installed over one another can share files.
+                all_paths = collections.OrderedDict.fromkeys(
+                    path for paths, _, _ in deferred for path in paths
+                )
+                compiled = self.compile(list(all_paths))
+                for paths, lib_dir, record_path in deferred:
+                    pyc_paths = [
+                        compiled[path] for path in paths if path in compiled
+                    ]
+                    _add_to_record(record_path, lib_dir, pyc_paths)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
 
 
 class MissingCallableSuffix(InstallationError):
@@ -455,7 +786,32 @@ def _raise_for_invalid_entrypoint(specification):
         raise MissingCallableSuffix(str(entry))
 
 
+class _HashingFileOperator(FileOperator):
+    """Record the RECORD hash and size of each file written, by path."""
+
+    def __init__(self):
+        # type: () -> None
+        super().__init__()
+        self.hashes = {}  # type: Dict[str, Tuple[str, str]]
+
+    def write_binary_file(self, path, data):
+        # type: (str, bytes) -> None
+        super().write_binary_file(path, data)
+        self.hashes[path] = hash_bytes(data)
+
+
 class PipScriptMaker(ScriptMaker):
+    def __init__(self, source_dir, target_dir):
+        # type: (Optional[str], str) -> None
+        self._hashing_fileop = _HashingFileOperator()
+        super().__init__(source_dir, target_dir, fileop=self._hashing_fileop)
+
+    @property
+    def hashes(self):
+        # type: () -> Dict[str, Tuple[str, str]]
+        """The RECORD hashes and sizes of the scripts made, by path."""
+        return self._hashing_fileop.hashes
+
     def make(self, specification, options=None):
         # type: (str, Dict[str, Any]) -> List[str]
         _raise_for_invalid_entrypoint(specification)
@@ -471,6 +827,9 @@ def _install_wheel(
     warn_script_location=True,  # type: bool
     direct_url=None,  # type: Optional[DirectUrl]
     requested=False,  # type: bool
+    extract_jobs=1,  # type: int
+    compiler=None,  # type: Optional[BytecodeCompiler]
+    unpacked=None,  # type: Optional[UnpackedWheel]
 ):
     # type: (...) -> None
     """Install a wheel.
@@ -483,6 +842,11 @@ def _install_wheel(
     :param pycompile: Whether to byte-compile installed Python files
     :param warn_script_location: Whether to check that scripts are installed
         into a directory on PATH
+    :param extract_jobs: Maximum number of threads to extract files with
+    :param compiler: BytecodeCompiler to byte-compile installed Python
+        files with, instead of compiling them one after the other
+    :param unpacked: The files of the wheel, already unpacked, to link to
+        instead of extracting them from wheel_zip
     :raises UnsupportedWheel:
         * when the directory holds an unpacked wheel with incompatible
           Wheel-Version
@@ -502,6 +866,9 @@ def _install_wheel(
     installed = {}  # type: Dict[RecordPath, RecordPath]
     changed = set()  # type: Set[RecordPath]
     generated = []  # type: List[str]
+    # Hashes of changed and generated files, computed from what was written
+    # rather than by reading the files back.
+    known_hashes = {}  # type: Dict[RecordPath, Tuple[str, str]]
 
     def record_installed(srcfile, destfile, modified=False):
         # type: (RecordPath, str, bool) -> None
@@ -509,7 +876,7 @@ def _install_wheel(
         newpath = _fs_to_record_path(destfile, lib_dir)
         installed[srcfile] = newpath
         if modified:
-            changed.add(_fs_to_record_path(destfile))
+            changed.add(newpath)
 
     def all_paths():
         # type: () -> Iterable[RecordPath]
@@ -535,19 +902,40 @@ def _install_wheel(
                 message.format(wheel_path, target_path, dest_dir_path)
             )
 
-    def root_scheme_file_maker(zip_file, dest):
-        # type: (ZipFile, str) -> Callable[[RecordPath], File]
+    def make_zip_backed_file(record_path, dest_path):
+        # type: (RecordPath, str) -> File
+        return ZipBackedFile(record_path, dest_path, wheel_zip)
+
+    if unpacked is None:
+        make_file = make_zip_backed_file
+    else:
+        linker = FileLinker()
+
+        def make_file(record_path, dest_path):
+            # type: (RecordPath, str) -> File
+            assert unpacked is not None
+            src_path = unpacked.get_path(record_path)
+            return LinkedFile(record_path, dest_path, src_path, linker)
+
+    def root_scheme_file_maker(
+        make_file,  # type: Callable[[RecordPath, str], File]
+        dest,  # type: str
+    ):
+        # type: (...) -> Callable[[RecordPath], File]
         def make_root_scheme_file(record_path):
             # type: (RecordPath) -> File
             normed_path = os.path.normpath(record_path)
             dest_path = os.path.join(dest, normed_path)
             assert_no_path_traversal(dest, dest_path)
-            return ZipBackedFile(record_path, dest_path, zip_file)
+            return make_file(record_path, dest_path)
 
         return make_root_scheme_file
 
-    def data_scheme_file_maker(zip_file, scheme):
-        # type: (ZipFile, Scheme) -> Callable[[RecordPath], File]
+    def data_scheme_file_maker(
+        make_file,  # type: Callable[[RecordPath, str], File]
+        scheme,  # type: Scheme
+    ):
+        # type: (...) -> Callable[[RecordPath], File]
         scheme_paths = {}
         for key in SCHEME_KEYS:
             encoded_key = ensure_text(key)
@@ -582,7 +970,7 @@ def _install_wheel(
 
             dest_path = os.path.join(scheme_path, dest_subpath)
             assert_no_path_traversal(scheme_path, dest_path)
-            return ZipBackedFile(record_path, dest_path, zip_file)
+            return make_file(record_path, dest_path)
 
         return make_data_scheme_file
 
@@ -597,7 +985,7 @@ def _install_wheel(
     )
 
     make_root_scheme_file = root_scheme_file_maker(
-        wheel_zip,
+        make_file,
         ensure_text(lib_dir, encoding=sys.getfilesystemencoding()),
     )
     files = map(make_root_scheme_file, root_scheme_paths)
@@ -615,7 +1003,7 @@ def _install_wheel(
         is_script_scheme_path, data_scheme_paths
     )
 
-    make_data_scheme_file = data_scheme_file_maker(wheel_zip, scheme)
+    make_data_scheme_file = data_scheme_file_maker(make_file, scheme)
     other_scheme_files = map(make_data_scheme_file, other_scheme_paths)
     files = chain(files, other_scheme_files)
 
@@ -642,16 +1030,35 @@ def _install_wheel(
         # Ignore setuptools-generated scripts
         return (matchname in console or matchname in gui)
 
-    script_scheme_files = map(make_data_scheme_file, script_scheme_paths)
+    # Scripts are rewritten in place by fix_script(), so they are never
+    # linked to the files of an unpacked wheel.
+    make_script_scheme_file = data_scheme_file_maker(
+        make_zip_backed_file, scheme
+    )
+    script_scheme_files = map(make_script_scheme_file, script_scheme_paths)
     script_scheme_files = filterfalse(
         is_entrypoint_wrapper, script_scheme_files
     )
     script_scheme_files = map(ScriptFile, script_scheme_files)
     files = chain(files, script_scheme_files)
 
-    for file in files:
-        file.save()
+    # Decide where every file goes, and check that it is allowed to, before
+    # writing any of them.
+    files_to_save = list(files)
+    _save_files(files_to_save, extract_jobs)
+    # Record in the order of the wheel's contents, however the files were
+    # written.
+    for file in files_to_save:
         record_installed(file.src_record_path, file.dest_path, file.changed)
+        if isinstance(file, ScriptFile) and file.record_hash is not None:
+            script_record_path = _fs_to_record_path(file.dest_path, lib_dir)
+            known_hashes[script_record_path] = file.record_hash
+        elif isinstance(file, LinkedFile):
+            # The store hashed the file as it unpacked it.
+            assert unpacked is not None
+            digest, size = unpacked.hashes[file.src_record_path]
+            linked_record_path = _fs_to_record_path(file.dest_path, lib_dir)
+            known_hashes[linked_record_path] = (digest, str(size))
 
     def pyc_source_file_paths():
         # type: () -> Iterator[str]
@@ -667,34 +1074,20 @@ def _install_wheel(
                 continue
             yield full_installed_path
 
-    def pyc_output_path(path):
-        # type: (str) -> str
-        """Return the path the pyc file would have been written to.
-        """
-        return importlib.util.cache_from_source(path)
-
     # Compile all of the pyc files for the installed files
+    deferred_source_paths = []  # type: List[str]
     if pycompile:
-        with captured_stdout() as stdout:
-            with warnings.catch_warnings():
-                warnings.filterwarnings('ignore')
-                for path in pyc_source_file_paths():
-                    # Python 2's `compileall.compile_file` requires a str in
-                    # error cases, so we must convert to the native type.
-                    path_arg = ensure_str(
-                        path, encoding=sys.getfilesystemencoding()
-                    )
-                    success = compileall.compile_file(
-                        path_arg, force=True, quiet=True
-                    )
-                    if success:
-                        pyc_path = pyc_output_path(path)
-                        assert os.path.exists(pyc_path)
-                        pyc_record_path = cast(
-                            "RecordPath", pyc_path.replace(os.path.sep, "/")
-                        )
-                        record_installed(pyc_record_path, pyc_path)
-        logger.debug(stdout.getvalue())
+        if compiler is None:
+            compiler = BytecodeCompiler()
+        source_paths = list(pyc_source_file_paths())
+        if compiler.defer:
+            deferred_source_paths = source_paths
+        else:
+            for pyc_path in compiler.compile(source_paths).values():
+                pyc_record_path = cast(
+                    "RecordPath", pyc_path.replace(os.path.sep, "/")
+                )
+                record_installed(pyc_record_path, pyc_path)
 
     maker = PipScriptMaker(None, scheme.scripts)
 
@@ -723,6 +1116,8 @@ def _install_wheel(
     generated.extend(
         maker.make_multiple(gui_scripts_to_generate, {'gui': True})
     )
+    for path, record_hash in maker.hashes.items():
+        known_hashes[_fs_to_record_path(path, lib_dir)] = record_hash
 
     if warn_script_location:
         msg = message_about_scripts_not_on_PATH(generated_console_scripts)
@@ -746,13 +1141,20 @@ def _install_wheel(
     with _generate_file(installer_path) as installer_file:
         installer_file.write(b'pip\n')
     generated.append(installer_path)
+    known_hashes[_fs_to_record_path(installer_path, lib_dir)] = hash_bytes(
+        b'pip\n'
+    )
 
     # Record the PEP 610 direct URL reference
     if direct_url is not None:
         direct_url_path = os.path.join(dest_info_dir, DIRECT_URL_METADATA_NAME)
+        direct_url_data = direct_url.to_json().encode("utf-8")
         with _generate_file(direct_url_path) as direct_url_file:
-            direct_url_file.write(direct_url.to_json().encode("utf-8"))
+            direct_url_file.write(direct_url_data)
         generated.append(direct_url_path)
+        known_hashes[_fs_to_record_path(direct_url_path, lib_dir)] = (
+            hash_bytes(direct_url_data)
+        )
 
     # Record the REQUESTED file
     if requested:
@@ -760,6 +1162,9 @@ def _install_wheel(
         with open(requested_path, "wb"):
             pass
         generated.append(requested_path)
+        known_hashes[_fs_to_record_path(requested_path, lib_dir)] = (
+            hash_bytes(b'')
+        )
 
     record_text = distribution.get_metadata('RECORD')
     record_rows = list(csv.reader(record_text.splitlines()))
@@ -769,7 +1174,8 @@ def _install_wheel(
         installed=installed,
         changed=changed,
         generated=generated,
-        lib_dir=lib_dir)
+        lib_dir=lib_dir,
+        known_hashes=known_hashes)
 
     # Record details of all files installed
     record_path = os.path.join(dest_info_dir, 'RECORD')
@@ -781,6 +1187,10 @@ def _install_wheel(
         writer = csv.writer(cast('IO[str]', record_file))
         writer.writerows(_normalized_outrows(rows))
 
+    if deferred_source_paths:
+        assert compiler is not None
+        compiler.add(deferred_source_paths, lib_dir, record_path)
+
 
 @contextlib.contextmanager
 def req_error_context(req_description):
@@ -803,8 +1213,14 @@ def install_wheel(
     warn_script_location=True,  # type: bool
     direct_url=None,  # type: Optional[DirectUrl]
     requested=False,  # type: bool
+    extract_jobs=1,  # type: int
+    compiler=None,  # type: Optional[BytecodeCompiler]
+    wheel_store=None,  # type: Optional[UnpackedWheelStore]
 ):
     # type: (...) -> None
+    unpacked = None
+    if wheel_store is not None:
+        unpacked = wheel_store.get(wheel_path)
     with ZipFile(wheel_path, allowZip64=True) as z:
         with req_error_context(req_description):
             _install_wheel(
@@ -816,4 +1232,56 @@ def install_wheel(
                 warn_script_location=warn_script_location,
                 direct_url=direct_url,
                 requested=requested,
+                extract_jobs=extract_jobs,
+                compiler=compiler,
+                unpacked=unpacked,
             )
+
+
+def get_wheel_install_paths(name, wheel_path, scheme):
+    # type: (str, str, Scheme) -> Set[str]
+    """Return the paths that installing the wheel with the given scheme
+    writes to, apart from byte-compiled files.
+
+    Unlike install_wheel(), this does not check the contents of the wheel:
+    files that install_wheel() rejects are left out.
+    """
+    with ZipFile(wheel_path, allowZip64=True) as z:
+        info_dir, metadata = parse_wheel(z, name)
+        distribution = pkg_resources_distribution_for_wheel(
+            z, name, wheel_path
+        )
+        console, gui = get_entrypoints(distribution)
+        names = z.namelist()
+
+    if wheel_root_is_purelib(metadata):
+        lib_dir = scheme.purelib
+    else:
+        lib_dir = scheme.platlib
+
+    paths = set()
+    for record_path in map(ensure_text, names):
+        if record_path.endswith("/"):
+            continue
+        normed_path = os.path.normpath(record_path)
+        if not record_path.split("/", 1)[0].endswith(".data"):
+            paths.add(os.path.join(lib_dir, normed_path))
+            continue
+        parts = normed_path.split(os.path.sep, 2)
+        if len(parts) == 3 and parts[1] in SCHEME_KEYS:
+            paths.add(os.path.join(getattr(scheme, parts[1]), parts[2]))
+
+    dest_info_dir = os.path.join(lib_dir, info_dir)
+    for metadata_name in ["INSTALLER", "REQUESTED", DIRECT_URL_METADATA_NAME]:
+        paths.add(os.path.join(dest_info_dir, metadata_name))
+
+    # Entry point wrappers, with the variants made on Windows.
+    script_names = [
+        spec.split("=", 1)[0].strip()
+        for spec in get_console_script_specs(console)
+    ]
+    script_names.extend(gui)
+    for script_name in script_names:
+        for suffix in ["", ".exe", "-script.py", "-script.pyw"]:
+            paths.add(os.path.join(scheme.scripts, script_name + suffix))
+    return paths
@@ -4,14 +4,19 @@
 # The following comment should be removed at some point in the future.
 # mypy: strict-optional=False
 
+import hashlib
+import json
 import logging
 import mimetypes
 import os
 import shutil
-from typing import Dict, Iterable, List, Optional, Tuple
+import sys
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
 from pip._vendor.packaging.utils import canonicalize_name
-from pip._vendor.pkg_resources import Distribution
+from pip._vendor.pkg_resources import Distribution, find_distributions
 
 from pip._internal.distributions import make_distribution_for_install_requirement
 from pip._internal.distributions.installed import InstalledDistribution
@@ -37,13 +42,19 @@ from pip._internal.req.req_install import InstallRequirement
 from pip._internal.req.req_tracker import RequirementTracker
 from pip._internal.utils.deprecation import deprecated
 from pip._internal.utils.filesystem import copy2_fixed
+from pip._internal.utils.filetypes import is_archive_file
 from pip._internal.utils.hashes import Hashes, MissingHashes
 from pip._internal.utils.logging import indent_log
-from pip._internal.utils.misc import display_path, hide_url, rmtree
+from pip._internal.utils.misc import display_path, hash_file, hide_url, rmtree
 from pip._internal.utils.temp_dir import TempDirectory
 from pip._internal.utils.unpacking import unpack_file
 from pip._internal.vcs import vcs
 
+if TYPE_CHECKING:
+    from pip._internal.build_env import InProcessInstaller
+    from pip._internal.cache import BuildEnvironmentStore, SdistMetadataStore
+    from pip._internal.operations.build.backend_workers import BackendWorkerPool
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,15 +63,41 @@ def _get_prepared_distribution(
     req_tracker,  # type: RequirementTracker
     finder,  # type: PackageFinder
     build_isolation,  # type: bool
+    build_env_store=None,  # type: Optional[BuildEnvironmentStore]
+    build_env_installer=None,  # type: Optional[InProcessInstaller]
+    backend_workers=None,  # type: Optional[BackendWorkerPool]
 ):
     # type: (...) -> Distribution
     """Prepare a distribution for installation."""
     abstract_dist = make_distribution_for_install_requirement(req)
     with req_tracker.track(req):
-        abstract_dist.prepare_distribution_metadata(finder, build_isolation)
+        abstract_dist.prepare_distribution_metadata(
+            finder,
+            build_isolation,
+            build_env_store,
+            build_env_installer,
+            backend_workers,
+        )
     return abstract_dist.get_pkg_resources_distribution()
 
 
+def _summarize_metadata(dist):
+    # type: (Distribution) -> Tuple[str, str, Dict[str, List[str]]]
+    """Return what the resolver takes from the metadata of a distribution:
+    its name, its version and the requirements of each of its extras.
+    """
+    return (
+        canonicalize_name(dist.project_name),
+        str(dist.parsed_version),
+        {
+            extra: sorted(
+                str(r) for r in dist.requires([extra] if extra else [])
+            )
+            for extra in [""] + sorted(dist.extras)
+        },
+    )
+
+
 def unpack_vcs_link(link, location):
     # type: (Link, str) -> None
     vcs_backend = vcs.get_backend_for_scheme(link.scheme)
@@ -290,11 +327,16 @@ class RequirementPreparer:
         req_tracker,  # type: RequirementTracker
         session,  # type: PipSession
         progress_bar,  # type: str
+        download_jobs,  # type: int
         finder,  # type: PackageFinder
         require_hashes,  # type: bool
         use_user_site,  # type: bool
         lazy_wheel,  # type: bool
         in_tree_build,  # type: bool
+        build_env_store=None,  # type: Optional[BuildEnvironmentStore]
+        build_env_installer=None,  # type: Optional[InProcessInstaller]
+        backend_workers=None,  # type: Optional[BackendWorkerPool]
+        sdist_metadata_store=None,  # type: Optional[SdistMetadataStore]
     ):
         # type: (...) -> None
         super().__init__()
@@ -304,7 +346,9 @@ class RequirementPreparer:
         self.req_tracker = req_tracker
         self._session = session
         self._download = Downloader(session, progress_bar)
-        self._batch_download = BatchDownloader(session, progress_bar)
+        self._batch_download = BatchDownloader(
+            session, progress_bar, max_workers=download_jobs,
+        )
         self.finder = finder
 
         # Where still-packed archives should be written to. If None, they are
@@ -314,6 +358,21 @@ class RequirementPreparer:
         # Is build isolation allowed?
         self.build_isolation = build_isolation
 
+        # Where isolated build environments are shared between builds, if
+        # anywhere.
+        self.build_env_store = build_env_store
+
+        # What installs build requirements in this process, if anything.
+        self.build_env_installer = build_env_installer
+
+        # What calls the build backend hooks in long-lived processes, if
+        # anything.
+        self.backend_workers = backend_workers
+
+        # Where the metadata generated from source distributions is kept
+        # for later runs, if anywhere.
+        self.sdist_metadata_store = sdist_metadata_store
+
         # Should hash-checking be required?
         self.require_hashes = require_hashes
 
@@ -323,9 +382,20 @@ class RequirementPreparer:
         # Should wheels be downloaded lazily?
         self.use_lazy_wheel = lazy_wheel
 
+        # Metadata of remote wheels fetched by prefetch_metadata(), as
+        # mapping of link: future of the distribution.
+        self._prefetched_metadata = (
+            {}
+        )  # type: Dict[Link, Future[Optional[Distribution]]]
+        self._prefetched_metadata_lock = threading.Lock()
+
         # Should in-tree builds be used for local paths?
         self.in_tree_build = in_tree_build
 
+        # Metadata returned by get_stored_sdist_metadata(), as mapping of
+        # url: distribution, to check against the prepared distributions.
+        self._stored_sdist_metadata = {}  # type: Dict[str, Distribution]
+
         # Memoized downloaded files, as mapping of url: (path, mime type)
         self._downloaded = {}  # type: Dict[str, Tuple[str, str]]
 
@@ -418,34 +488,142 @@ class RequirementPreparer:
         # showing the user what the hash should be.
         return req.hashes(trust_internet=False) or MissingHashes()
 
-    def _fetch_metadata_using_lazy_wheel(self, link):
-        # type: (Link) -> Optional[Distribution]
-        """Fetch metadata using lazy wheel, if possible."""
+    def _can_use_lazy_wheel(self, link):
+        # type: (Link) -> bool
         if not self.use_lazy_wheel:
-            return None
+            return False
         if self.require_hashes:
             logger.debug('Lazy wheel is not used as hash checking is required')
-            return None
+            return False
         if link.is_file or not link.is_wheel:
             logger.debug(
                 'Lazy wheel is not used as '
                 '%r does not points to a remote wheel',
                 link,
             )
+            return False
+        return True
+
+    def _fetch_lazy_wheel(self, link):
+        # type: (Link) -> Optional[Distribution]
+        wheel = Wheel(link.filename)
+        url = link.url.split('#', 1)[0]
+        try:
+            return dist_from_wheel_url(
+                canonicalize_name(wheel.name), url, self._session,
+            )
+        except HTTPRangeRequestUnsupported:
+            logger.debug('%s does not support range requests', url)
+            return None
+
+    def _fetch_metadata_using_lazy_wheel(self, link):
+        # type: (Link) -> Optional[Distribution]
+        """Fetch metadata using lazy wheel, if possible."""
+        if not self._can_use_lazy_wheel(link):
             return None
 
         wheel = Wheel(link.filename)
-        name = canonicalize_name(wheel.name)
         logger.info(
             'Obtaining dependency information from %s %s',
-            name, wheel.version,
+            canonicalize_name(wheel.name), wheel.version,
         )
-        url = link.url.split('#', 1)[0]
+        with self._prefetched_metadata_lock:
+            future = self._prefetched_metadata.pop(link, None)
+        if future is not None:
+            try:
+                return future.result()
+            except Exception as exc:
+                # Fetch again, so that the error surfaces here as usual.
+                logger.debug('Prefetching metadata of %s failed: %s', link, exc)
+        return self._fetch_lazy_wheel(link)
+
+    def prefetch_metadata(self, link):
+        # type: (Link) -> None
+        """Fetch the metadata of the file at link for a later preparation,
+        if that has no side effects.
+
+        This is safe to call from other threads: only the metadata of remote
+        wheels is fetched, with the range requests of lazy wheels, and kept
+        for prepare_linked_requirement(). Nothing is downloaded, built or
+        shown otherwise.
+        """
+        if not self._can_use_lazy_wheel(link):
+            return
+        future = Future()  # type: Future[Optional[Distribution]]
+        with self._prefetched_metadata_lock:
+            if link in self._prefetched_metadata:
+                return
+            self._prefetched_metadata[link] = future
         try:
-            return dist_from_wheel_url(name, url, self._session)
-        except HTTPRangeRequestUnsupported:
-            logger.debug('%s does not support range requests', url)
+            future.set_result(self._fetch_lazy_wheel(link))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    def _get_sdist_metadata_key(self, req):
+        # type: (InstallRequirement) -> Optional[str]
+        """Return the key of the metadata generated from the source
+        distribution archive of the requirement in the sdist metadata store,
+        or None if it should not be stored.
+
+        Besides the archive, which names the build backend and its build
+        requirements, the metadata depends on the interpreter and on the
+        options running the backend.
+        """
+        link = req.link
+        if self.sdist_metadata_store is None:
+            return None
+        if self.require_hashes or req.has_hash_options:
+            # The archive has to be checked against the hashes anyway.
+            return None
+        if not self.build_isolation:
+            # The metadata may depend on what is installed in the
+            # environment, which the key does not cover.
+            return None
+        if link.is_wheel or link.is_vcs or not is_archive_file(link.filename):
+            return None
+        if link.hash_name == "sha256":
+            digest = link.hash
+        elif link.is_file and os.path.isfile(link.file_path):
+            digest = hash_file(link.file_path)[0].hexdigest()
+        else:
             return None
+        key = {
+            "sha256": digest,
+            "python": [sys.executable, sys.version],
+            "use_pep517": req.use_pep517,
+            "global_options": req.global_options,
+        }
+        data = json.dumps(key, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def get_stored_sdist_metadata(self, req):
+        # type: (InstallRequirement) -> Optional[Distribution]
+        """Get the metadata an earlier preparation generated from the
+        source distribution archive of the requirement, if it is stored,
+        without downloading or building anything.
+
+        The requirement then needs more preparation to be installed.
+        """
+        assert req.link
+        if not req.name:
+            # The requirement is named after its generated metadata.
+            return None
+        key = self._get_sdist_metadata_key(req)
+        if key is None:
+            return None
+        entry_dir = self.sdist_metadata_store.get(key)
+        if entry_dir is None:
+            return None
+        dist = next(find_distributions(entry_dir), None)
+        if dist is None:
+            return None
+
+        self._log_preparing_link(req)
+        with indent_log():
+            logger.info("Using cached metadata of %s", req.link.filename)
+        req.needs_more_preparation = True
+        self._stored_sdist_metadata[req.link.url] = dist
+        return dist
 
     def _complete_partial_requirements(
         self,
@@ -462,18 +640,25 @@ class RequirementPreparer:
         # `req.local_file_path` on the appropriate requirement after passing
         # all the links at once into BatchDownloader.
         links_to_fully_download = {}  # type: Dict[Link, InstallRequirement]
+        hashes = {}  # type: Dict[Link, Hashes]
         for req in partially_downloaded_reqs:
             assert req.link
             links_to_fully_download[req.link] = req
+            hashes[req.link] = self._get_linked_req_hashes(req)
 
+        # Each file is checked against its hashes as it is downloaded.
         batch_download = self._batch_download(
             links_to_fully_download.keys(),
             temp_dir,
+            hashes=hashes,
         )
-        for link, (filepath, _) in batch_download:
+        for link, (filepath, content_type) in batch_download:
             logger.debug("Downloading link %s to %s", link, filepath)
             req = links_to_fully_download[link]
             req.local_file_path = filepath
+            # Record the download, so that it is not downloaded again when
+            # the requirement is prepared below.
+            self._downloaded[link.url] = filepath, content_type
 
         # This step is necessary to ensure all lazy wheels are processed
         # successfully by the 'download', 'wheel', and 'install' commands.
@@ -512,8 +697,12 @@ class RequirementPreparer:
         """Prepare linked requirements more, if needed."""
         reqs = [req for req in reqs if req.needs_more_preparation]
         for req in reqs:
+            if req.link.is_file:
+                # The requirement was prepared from stored metadata, and its
+                # archive needs no download.
+                req.needs_more_preparation = False
             # Determine if any of these requirements were already downloaded.
-            if self.download_dir is not None and req.link.is_wheel:
+            elif self.download_dir is not None and req.link.is_wheel:
                 hashes = self._get_linked_req_hashes(req)
                 file_path = _check_download_dir(req.link, self.download_dir, hashes)
                 if file_path is not None:
@@ -540,6 +729,10 @@ class RequirementPreparer:
         assert req.link
         link = req.link
 
+        # Like when looking the metadata up, before the preparation sets
+        # req.use_pep517 from the pyproject.toml of the archive.
+        sdist_metadata_key = self._get_sdist_metadata_key(req)
+
         self._ensure_link_req_src_dir(req, parallel_builds)
         hashes = self._get_linked_req_hashes(req)
 
@@ -568,8 +761,32 @@ class RequirementPreparer:
             req.local_file_path = local_file.path
 
         dist = _get_prepared_distribution(
-            req, self.req_tracker, self.finder, self.build_isolation,
+            req,
+            self.req_tracker,
+            self.finder,
+            self.build_isolation,
+            self.build_env_store,
+            self.build_env_installer,
+            self.backend_workers,
         )
+        stored_dist = self._stored_sdist_metadata.pop(link.url, None)
+        if stored_dist is not None and (
+            _summarize_metadata(stored_dist) != _summarize_metadata(dist)
+        ):
+            # The requirement was resolved with the stored metadata, which
+            # cannot be trusted anymore.
+            if sdist_metadata_key is not None:
+                self.sdist_metadata_store.remove(sdist_metadata_key)
+            raise InstallationError(
+                f"The metadata generated for {req} does not match the "
+                f"stored metadata of {link.filename} its dependencies were "
+                f"resolved with. The stored metadata has been removed; "
+                f"run pip again to resolve with the generated metadata."
+            )
+        if sdist_metadata_key is not None and req.metadata_directory:
+            self.sdist_metadata_store.save(
+                sdist_metadata_key, req.metadata_directory
+            )
         return dist
 
     def save_linked_requirement(self, req):
@@ -620,7 +837,13 @@ class RequirementPreparer:
             req.update_editable()
 
             dist = _get_prepared_distribution(
-                req, self.req_tracker, self.finder, self.build_isolation,
+                req,
+                self.req_tracker,
+                self.finder,
+                self.build_isolation,
+                self.build_env_store,
+                self.build_env_installer,
+                self.backend_workers,
             )
 
             req.check_if_exists(self.use_user_site)
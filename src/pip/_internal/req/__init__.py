@@ -1,13 +1,30 @@
 import collections
 import logging
-from typing import Iterator, List, Optional, Sequence, Tuple
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
+from pip._internal.metadata.installed import get_default_index
+from pip._internal.operations.install.wheel import BytecodeCompiler
 from pip._internal.utils.logging import indent_log
 
 from .req_file import parse_requirements
 from .req_install import InstallRequirement
 from .req_set import RequirementSet
 
+if TYPE_CHECKING:
+    from pip._internal.cache import UnpackedWheelStore
+
 __all__ = [
     "RequirementSet", "InstallRequirement",
     "parse_requirements", "install_given_reqs",
@@ -35,6 +52,93 @@ def _validate_requirements(
         yield req.name, req
 
 
+def _parent_dirs(path):
+    # type: (str) -> Iterator[str]
+    parent = os.path.dirname(path)
+    while parent != path:
+        yield parent
+        path, parent = parent, os.path.dirname(parent)
+
+
+def _find_conflicts(claims):
+    # type: (List[Optional[Set[str]]]) -> List[Set[int]]
+    """Given the paths claimed by each install, in order, return for each
+    install the earlier ones that it conflicts with.
+
+    Two installs conflict when they claim the same path, or one claims a
+    path within a directory claimed by the other. An install that claims
+    None conflicts with every other one.
+    """
+    claimed_by = collections.defaultdict(set)  # type: Dict[str, Set[int]]
+    claimed_within = collections.defaultdict(set)  # type: Dict[str, Set[int]]
+    last_exclusive = None  # type: Optional[int]
+
+    conflicts = []  # type: List[Set[int]]
+    for index, paths in enumerate(claims):
+        if paths is None:
+            conflicts.append(set(range(index)))
+            last_exclusive = index
+            continue
+        found = set()  # type: Set[int]
+        if last_exclusive is not None:
+            # That one already waits for all the installs before it.
+            found.add(last_exclusive)
+        for path in paths:
+            found.update(claimed_by[path])
+            found.update(claimed_within[path])
+            for parent in _parent_dirs(path):
+                found.update(claimed_by[parent])
+        for path in paths:
+            claimed_by[path].add(index)
+            for parent in _parent_dirs(path):
+                claimed_within[parent].add(index)
+        conflicts.append(found)
+    return conflicts
+
+
+def _install_concurrently(
+    names,  # type: List[str]
+    install,  # type: Callable[[int], None]
+    conflicts,  # type: List[Set[int]]
+    max_workers,  # type: int
+):
+    # type: (...) -> List[InstallationResult]
+    """Run install() for every index into names on up to max_workers
+    threads, each after the earlier installs it conflicts with.
+
+    After an install fails, no more are started; the first failure, in
+    order, is raised once the running ones have finished.
+    """
+    pending = list(range(len(names)))
+    running = {}  # type: Dict[Future[None], int]
+    succeeded = set()  # type: Set[int]
+    errors = {}  # type: Dict[int, BaseException]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            if not errors:
+                for index in list(pending):
+                    if len(running) >= max_workers:
+                        break
+                    if conflicts[index] <= succeeded:
+                        pending.remove(index)
+                        running[executor.submit(install, index)] = index
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                error = future.exception()
+                if error is None:
+                    succeeded.add(index)
+                else:
+                    errors[index] = error
+
+    if errors:
+        raise errors[min(errors)]
+    return [InstallationResult(names[index]) for index in sorted(succeeded)]
+
+
 def install_given_reqs(
     requirements,  # type: List[InstallRequirement]
     install_options,  # type: List[str]
@@ -45,12 +149,28 @@ def install_given_reqs(
     warn_script_location,  # type: bool
     use_user_site,  # type: bool
     pycompile,  # type: bool
+    extract_jobs=1,  # type: int
+    install_jobs=1,  # type: int
+    compile_jobs=1,  # type: int
+    defer_compile=False,  # type: bool
+    wheel_store=None,  # type: Optional[UnpackedWheelStore]
 ):
     # type: (...) -> List[InstallationResult]
     """
     Install everything in the given list.
 
     (to be called after having downloaded and unpacked the packages)
+
+    With install_jobs above 1, wheels are installed on that many threads,
+    except those that conflict with an earlier install in the list, which
+    wait for it to finish.
+
+    The files installed from wheels are byte-compiled on up to compile_jobs
+    processes, after each wheel is installed or, with defer_compile, all
+    together once every wheel is installed.
+
+    With a wheel_store, wheels are unpacked into it, and their files are
+    linked from there rather than extracted.
     """
     to_install = collections.OrderedDict(_validate_requirements(requirements))
 
@@ -60,39 +180,77 @@ def install_given_reqs(
             ', '.join(to_install.keys()),
         )
 
-    installed = []
+    compiler = BytecodeCompiler(jobs=compile_jobs, defer=defer_compile)
 
-    with indent_log():
-        for req_name, requirement in to_install.items():
-            if requirement.should_reinstall:
-                logger.info('Attempting uninstall: %s', req_name)
-                with indent_log():
-                    uninstalled_pathset = requirement.uninstall(
-                        auto_confirm=True
-                    )
-            else:
-                uninstalled_pathset = None
-
-            try:
-                requirement.install(
-                    install_options,
-                    global_options,
+    def install(req_name, requirement):
+        # type: (str, InstallRequirement) -> None
+        if requirement.should_reinstall:
+            logger.info('Attempting uninstall: %s', req_name)
+            with indent_log():
+                uninstalled_pathset = requirement.uninstall(
+                    auto_confirm=True
+                )
+        else:
+            uninstalled_pathset = None
+
+        try:
+            requirement.install(
+                install_options,
+                global_options,
+                root=root,
+                home=home,
+                prefix=prefix,
+                warn_script_location=warn_script_location,
+                use_user_site=use_user_site,
+                pycompile=pycompile,
+                extract_jobs=extract_jobs,
+                compiler=compiler,
+                wheel_store=wheel_store,
+            )
+        except Exception:
+            # if install did not succeed, rollback previous uninstall
+            if uninstalled_pathset and not requirement.install_succeeded:
+                uninstalled_pathset.rollback()
+            raise
+        else:
+            if uninstalled_pathset and requirement.install_succeeded:
+                uninstalled_pathset.commit()
+        finally:
+            get_default_index().invalidate()
+
+    try:
+        if install_jobs > 1 and len(to_install) > 1:
+            names = list(to_install)
+            reqs = list(to_install.values())
+            conflicts = _find_conflicts([
+                req.get_install_paths(
                     root=root,
                     home=home,
                     prefix=prefix,
-                    warn_script_location=warn_script_location,
                     use_user_site=use_user_site,
-                    pycompile=pycompile,
                 )
-            except Exception:
-                # if install did not succeed, rollback previous uninstall
-                if uninstalled_pathset and not requirement.install_succeeded:
-                    uninstalled_pathset.rollback()
-                raise
-            else:
-                if uninstalled_pathset and requirement.install_succeeded:
-                    uninstalled_pathset.commit()
-
-            installed.append(InstallationResult(req_name))
-
-    return installed
+                for req in reqs
+            ])
+
+            def install_one(index):
+                # type: (int) -> None
+                # The indentation of log messages is kept per thread.
+                with indent_log():
+                    install(names[index], reqs[index])
+
+            return _install_concurrently(
+                names, install_one, conflicts, install_jobs,
+            )
+
+        installed = []
+
+        with indent_log():
+            for req_name, requirement in to_install.items():
+                install(req_name, requirement)
+                installed.append(InstallationResult(req_name))
+
+        return installed
+    finally:
+        # Also compile the files of the wheels installed before a failure,
+        # as they are when compiling right after each install.
+        compiler.finish()
@@ -123,23 +123,29 @@ class ParsedLine:
 
 def parse_requirements(
     filename,  # type: str
-    session,  # type: PipSession
+    session,  # type: Optional[PipSession]
     finder=None,  # type: Optional[PackageFinder]
     options=None,  # type: Optional[optparse.Values]
     constraint=False,  # type: bool
+    file_contents=None,  # type: Optional[Dict[str, str]]
 ):
     # type: (...) -> Iterator[ParsedRequirement]
     """Parse a requirements file and yield ParsedRequirement instances.
 
     :param filename:    Path or url of requirements file.
-    :param session:     PipSession instance.
+    :param session:     PipSession instance. Without one, only files on
+        the filesystem can be read.
     :param finder:      Instance of pip.index.PackageFinder.
     :param options:     cli options.
     :param constraint:  If true, parsing a constraint file rather than
         requirements file.
+    :param file_contents: The contents of the files read so far, by name.
+        Files in it are not read again, and the files read are added to it,
+        so that a file which can only be read once, like a pipe, can be
+        parsed again.
     """
     line_parser = get_line_parser(finder)
-    parser = RequirementsFileParser(session, line_parser)
+    parser = RequirementsFileParser(session, line_parser, file_contents)
 
     for parsed_line in parser.parse(filename, constraint):
         parsed_req = handle_line(
@@ -320,12 +326,16 @@ def handle_line(
 class RequirementsFileParser:
     def __init__(
         self,
-        session,  # type: PipSession
+        session,  # type: Optional[PipSession]
         line_parser,  # type: LineParser
+        file_contents=None,  # type: Optional[Dict[str, str]]
     ):
         # type: (...) -> None
         self._session = session
         self._line_parser = line_parser
+        if file_contents is None:
+            file_contents = {}
+        self._file_contents = file_contents
 
     def parse(self, filename, constraint):
         # type: (str, bool) -> Iterator[ParsedLine]
@@ -365,7 +375,10 @@ class RequirementsFileParser:
 
     def _parse_file(self, filename, constraint):
         # type: (str, bool) -> Iterator[ParsedLine]
-        _, content = get_file_content(filename, self._session)
+        content = self._file_contents.get(filename)
+        if content is None:
+            _, content = get_file_content(filename, self._session)
+            self._file_contents[filename] = content
 
         lines_enum = preprocess(content)
 
@@ -528,7 +541,7 @@ def expand_env_variables(lines_enum):
 
 
 def get_file_content(url, session):
-    # type: (str, PipSession) -> Tuple[str, str]
+    # type: (str, Optional[PipSession]) -> Tuple[str, str]
     """Gets the content of a file; it may be a filename, file: URL, or
     http: URL.  Returns (location, content).  Content is unicode.
     Respects # -*- coding: declarations on the retrieved files.
@@ -539,6 +552,10 @@ def get_file_content(url, session):
     scheme = get_url_scheme(url)
 
     if scheme in ['http', 'https']:
+        if session is None:
+            raise InstallationError(
+                f'Could not fetch requirements file {url}: no session'
+            )
         # FIXME: catch some errors
         resp = session.get(url)
         raise_for_status(resp)
@@ -7,7 +7,17 @@ import shutil
 import sys
 import uuid
 import zipfile
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
 
 from pip._vendor import pkg_resources, six
 from pip._vendor.packaging.markers import Marker
@@ -20,9 +30,10 @@ from pip._vendor.pep517.wrappers import Pep517HookCaller
 from pip._vendor.pkg_resources import Distribution
 
 from pip._internal.build_env import BuildEnvironment, NoOpBuildEnvironment
-from pip._internal.exceptions import InstallationError
+from pip._internal.exceptions import InstallationError, UninstallationError
 from pip._internal.locations import get_scheme
 from pip._internal.models.link import Link
+from pip._internal.models.scheme import SCHEME_KEYS, Scheme
 from pip._internal.operations.build.metadata import generate_metadata
 from pip._internal.operations.build.metadata_legacy import (
     generate_metadata as generate_metadata_legacy,
@@ -32,9 +43,13 @@ from pip._internal.operations.install.editable_legacy import (
 )
 from pip._internal.operations.install.legacy import LegacyInstallFailure
 from pip._internal.operations.install.legacy import install as install_legacy
-from pip._internal.operations.install.wheel import install_wheel
+from pip._internal.operations.install.wheel import (
+    BytecodeCompiler,
+    get_wheel_install_paths,
+    install_wheel,
+)
 from pip._internal.pyproject import load_pyproject_toml, make_pyproject_path
-from pip._internal.req.req_uninstall import UninstallPathSet
+from pip._internal.req.req_uninstall import UninstallPathSet, compress_for_rename
 from pip._internal.utils.deprecation import deprecated
 from pip._internal.utils.direct_url_helpers import direct_url_from_link
 from pip._internal.utils.hashes import Hashes
@@ -47,6 +62,7 @@ from pip._internal.utils.misc import (
     dist_in_usersite,
     get_distribution,
     hide_url,
+    normalize_path,
     redact_auth_from_url,
 )
 from pip._internal.utils.packaging import get_metadata
@@ -54,6 +70,9 @@ from pip._internal.utils.temp_dir import TempDirectory, tempdir_kinds
 from pip._internal.utils.virtualenv import running_under_virtualenv
 from pip._internal.vcs import vcs
 
+if TYPE_CHECKING:
+    from pip._internal.cache import UnpackedWheelStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -732,6 +751,58 @@ class InstallRequirement:
 
         logger.info('Saved %s', display_path(archive_path))
 
+    def get_install_paths(
+        self,
+        root=None,  # type: Optional[str]
+        home=None,  # type: Optional[str]
+        prefix=None,  # type: Optional[str]
+        use_user_site=False,  # type: bool
+    ):
+        # type: (...) -> Optional[Set[str]]
+        """Return the normalized paths that install() and the uninstall
+        before it write to or remove, or None if they cannot be known
+        without running them.
+
+        The paths removed by the uninstall include whole directories, when
+        it moves them away.
+        """
+        if self.editable or not self.is_wheel or not self.local_file_path:
+            return None
+        assert self.req
+
+        scheme = get_scheme(
+            self.name,
+            user=use_user_site,
+            home=home,
+            root=root,
+            isolated=self.isolated,
+            prefix=prefix,
+        )
+        # Normalize the directories like UninstallPathSet does, once rather
+        # than for every file.
+        scheme = Scheme(**{
+            key: normalize_path(getattr(scheme, key)) for key in SCHEME_KEYS
+        })
+        try:
+            wheel_paths = get_wheel_install_paths(
+                self.name, self.local_file_path, scheme,
+            )
+        except (InstallationError, zipfile.BadZipFile):
+            # Let install() report the problem.
+            return None
+        paths = {os.path.normcase(path) for path in wheel_paths}
+
+        if self.should_reinstall:
+            dist = get_distribution(self.req.name)
+            if dist:
+                try:
+                    pathset = UninstallPathSet.from_dist(dist)
+                except UninstallationError:
+                    return None
+                paths.update(compress_for_rename(pathset.paths))
+                paths.update(pathset.pth)
+        return paths
+
     def install(
         self,
         install_options,  # type: List[str]
@@ -741,7 +812,10 @@ class InstallRequirement:
         prefix=None,  # type: Optional[str]
         warn_script_location=True,  # type: bool
         use_user_site=False,  # type: bool
-        pycompile=True  # type: bool
+        pycompile=True,  # type: bool
+        extract_jobs=1,  # type: int
+        compiler=None,  # type: Optional[BytecodeCompiler]
+        wheel_store=None,  # type: Optional[UnpackedWheelStore]
     ):
         # type: (...) -> None
         scheme = get_scheme(
@@ -788,6 +862,9 @@ class InstallRequirement:
                 warn_script_location=warn_script_location,
                 direct_url=direct_url,
                 requested=self.user_supplied,
+                extract_jobs=extract_jobs,
+                compiler=compiler,
+                wheel_store=wheel_store,
             )
             self.install_succeeded = True
             return
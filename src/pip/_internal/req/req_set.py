@@ -93,7 +93,7 @@ class RequirementSet:
         # single requirements file.
         if install_req.link and install_req.link.is_wheel:
             wheel = Wheel(install_req.link.filename)
-            tags = compatibility_tags.get_supported()
+            tags = set(compatibility_tags.get_supported())
             if (self.check_supported_wheels and not wheel.supported(tags)):
                 raise InstallationError(
                     "{} is not a supported wheel on this platform.".format(
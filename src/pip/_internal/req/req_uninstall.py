@@ -12,6 +12,7 @@ from pip._vendor.pkg_resources import Distribution
 
 from pip._internal.exceptions import UninstallationError
 from pip._internal.locations import get_bin_prefix, get_bin_user
+from pip._internal.metadata.installed import get_default_index
 from pip._internal.utils.compat import WINDOWS
 from pip._internal.utils.logging import indent_log
 from pip._internal.utils.misc import (
@@ -389,6 +390,7 @@ class UninstallPathSet:
                 for pth in self.pth.values():
                     pth.remove()
 
+                get_default_index().invalidate()
                 logger.info('Successfully uninstalled %s', dist_name_version)
 
     def _allowed_to_proceed(self, verbose):
@@ -435,6 +437,7 @@ class UninstallPathSet:
         self._moved_paths.rollback()
         for pth in self.pth.values():
             pth.rollback()
+        get_default_index().invalidate()
 
     def commit(self):
         # type: () -> None
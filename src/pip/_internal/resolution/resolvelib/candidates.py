@@ -302,7 +302,11 @@ class LinkCandidate(_InstallRequirementBackedCandidate):
 
     def _prepare_distribution(self):
         # type: () -> Distribution
-        return self._factory.preparer.prepare_linked_requirement(
+        preparer = self._factory.preparer
+        dist = preparer.get_stored_sdist_metadata(self._ireq)
+        if dist is not None:
+            return dist
+        return preparer.prepare_linked_requirement(
             self._ireq, parallel_builds=True
         )
 
@@ -1,5 +1,7 @@
+import contextlib
 import functools
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Dict,
@@ -18,6 +20,7 @@ from typing import (
 
 from pip._vendor.packaging.specifiers import SpecifierSet
 from pip._vendor.packaging.utils import NormalizedName, canonicalize_name
+from pip._vendor.packaging.version import parse as parse_version
 from pip._vendor.pkg_resources import Distribution
 from pip._vendor.resolvelib import ResolutionImpossible
 
@@ -62,6 +65,7 @@ from .requirements import (
     SpecifierRequirement,
     UnsatisfiableRequirement,
 )
+from .result_cache import Pin
 
 if TYPE_CHECKING:
     from typing import Protocol
@@ -76,6 +80,9 @@ logger = logging.getLogger(__name__)
 C = TypeVar("C")
 Cache = Dict[Link, C]
 
+# Speculation only fetches index pages and wheel metadata over the network.
+SPECULATIVE_WORKERS = 4
+
 
 class Factory:
     def __init__(
@@ -110,6 +117,11 @@ class Factory:
             {}
         )  # type: Dict[Tuple[int, FrozenSet[str]], ExtrasCandidate]
 
+        # Projects whose best candidates were looked up speculatively.
+        self._speculator = None  # type: Optional[ThreadPoolExecutor]
+        self._speculations = []  # type: List[Future[None]]
+        self._speculated_names = set()  # type: Set[str]
+
         if not ignore_installed:
             self._installed_dists = {
                 canonicalize_name(dist.project_name): dist
@@ -201,6 +213,92 @@ class Factory:
             return base
         return self._make_extras_candidate(base, extras)
 
+    def _speculate(self, name, specifier, hashes):
+        # type: (NormalizedName, SpecifierSet, Hashes) -> None
+        result = self._finder.find_best_candidate(
+            project_name=name,
+            specifier=specifier,
+            hashes=hashes,
+        )
+        best = result.best_candidate
+        if best is not None:
+            self.preparer.prefetch_metadata(best.link)
+
+    @contextlib.contextmanager
+    def speculating(self, max_workers=SPECULATIVE_WORKERS):
+        # type: (int) -> Iterator[None]
+        """Allow candidates to be looked up speculatively in the background.
+
+        While this context is active, ``speculate()`` submits lookups to a
+        pool of ``max_workers`` threads. Lookups not started when the
+        context exits are cancelled.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            self._speculator = executor
+            try:
+                yield
+            finally:
+                self._speculator = None
+                for future in self._speculations:
+                    future.cancel()
+
+    def speculate(self, requirements):
+        # type: (Iterable[Requirement]) -> None
+        """Start looking up the best candidate of each of ``requirements``,
+        and fetching its metadata if that has no side effects.
+
+        This is a no-op outside of a ``speculating()`` context. Only the
+        first requirement seen for each project is considered.
+
+        The background threads only warm the finder's caches and prefetch
+        the metadata of remote wheels with range requests, see
+        ``RequirementPreparer.prefetch_metadata()``. Candidates, and any
+        sdist builds, are still made by the resolver's own thread, so the
+        resolution does not depend on which lookups finished in time.
+        """
+        executor = self._speculator
+        if executor is None:
+            return
+        for req in requirements:
+            ireq = req.get_candidate_lookup()[1]
+            if ireq is None or ireq.req is None or ireq.editable:
+                continue
+            name = canonicalize_name(ireq.req.name)
+            if name in self._speculated_names:
+                continue
+            self._speculated_names.add(name)
+
+            # The resolver is likely to keep an installed distribution.
+            installed_dist = self._installed_dists.get(name)
+            if (
+                installed_dist is not None
+                and not self._force_reinstall
+                and ireq.req.specifier.contains(
+                    installed_dist.version, prereleases=True
+                )
+            ):
+                continue
+            future = executor.submit(
+                self._speculate,
+                name,
+                ireq.req.specifier,
+                ireq.hashes(trust_internet=False),
+            )
+            self._speculations.append(future)
+
+    def prefetch_candidates(self, requirements):
+        # type: (Iterable[Requirement]) -> None
+        """Start fetching index pages for the projects of ``requirements``.
+
+        Only requirements that are looked up on the index are considered;
+        explicit (URL) requirements do not need an index page.
+        """
+        self._finder.prefetch_candidates(
+            req.project_name
+            for req in requirements
+            if req.get_candidate_lookup()[1] is not None
+        )
+
     def _iter_found_candidates(
         self,
         ireqs: Sequence[InstallRequirement],
@@ -310,7 +408,7 @@ class Factory:
                 wheel = Wheel(link.filename)
                 # Check whether the provided wheel is compatible with the target
                 # platform.
-                if not wheel.supported(self._finder.target_python.get_tags()):
+                if not wheel.supported(self._finder.target_python.get_tag_priorities()):
                     # We are constrained to install a wheel that is incompatible with
                     # the target architecture, so there are no valid candidates.
                     # Return early, with no candidates.
@@ -368,7 +466,7 @@ class Factory:
             return SpecifierRequirement(ireq)
         if ireq.link.is_wheel:
             wheel = Wheel(ireq.link.filename)
-            if not wheel.supported(self._finder.target_python.get_tags()):
+            if not wheel.supported(self._finder.target_python.get_tag_priorities()):
                 msg = "{} is not a supported wheel on this platform.".format(
                     wheel.filename,
                 )
@@ -399,13 +497,62 @@ class Factory:
     def make_requirement_from_spec(
         self,
         specifier,  # type: str
-        comes_from,  # type: InstallRequirement
+        comes_from,  # type: Optional[InstallRequirement]
         requested_extras=(),  # type: Iterable[str]
     ):
         # type: (...) -> Optional[Requirement]
         ireq = self._make_install_req_from_spec(specifier, comes_from)
         return self.make_requirement_from_install_req(ireq, requested_extras)
 
+    def get_installed_version(self, name):
+        # type: (str) -> Optional[str]
+        dist = self._installed_dists.get(canonicalize_name(name))
+        if dist is None:
+            return None
+        return dist.version
+
+    def make_candidate_from_pin(
+        self,
+        pin,  # type: Pin
+        template,  # type: Optional[InstallRequirement]
+        link,  # type: Optional[Link]
+        mapping,  # type: Mapping[str, Candidate]
+    ):
+        # type: (...) -> Optional[Candidate]
+        """Make the candidate pinned by a cached resolution again.
+
+        Like the resolver, prefer an installed distribution of the pinned
+        version unless reinstalls are forced. ``link`` is where the pinned
+        version is served, and ``mapping`` holds the candidates already
+        made, by identifier. Return None if the candidate cannot be made.
+        """
+        kind = pin["kind"]
+        if kind == "python":
+            return self._python_candidate
+        if kind == "extras":
+            base = mapping.get(pin["base"])
+            if base is None:
+                return None
+            return self._make_extras_candidate(
+                cast(BaseCandidate, base), frozenset(pin["extras"])
+            )
+
+        assert template is not None
+        name = canonicalize_name(pin["name"])
+        version = parse_version(pin["version"])
+        dist = self._installed_dists.get(name)
+        if (
+            dist is not None
+            and not self._force_reinstall
+            and parse_version(dist.version) == version
+        ):
+            return self._make_candidate_from_dist(dist, frozenset(), template)
+        if kind != "link" or link is None:
+            return None
+        return self._make_candidate_from_link(
+            link, frozenset(), template, name=name, version=version
+        )
+
     def make_requires_python_requirement(self, specifier):
         # type: (Optional[SpecifierSet]) -> Optional[Requirement]
         if self._ignore_requires_python or specifier is None:
@@ -172,4 +172,11 @@ class PipProvider(_ProviderBase):
     def get_dependencies(self, candidate):
         # type: (Candidate) -> Sequence[Requirement]
         with_requires = not self._ignore_dependencies
-        return [r for r in candidate.iter_dependencies(with_requires) if r is not None]
+        dependencies = [
+            r for r in candidate.iter_dependencies(with_requires) if r is not None
+        ]
+        # Newly discovered projects are likely to be looked up soon, and
+        # their best candidates to be pinned.
+        self._factory.prefetch_candidates(dependencies)
+        self._factory.speculate(dependencies)
+        return dependencies
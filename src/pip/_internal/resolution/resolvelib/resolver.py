@@ -1,14 +1,28 @@
+import contextlib
 import functools
 import logging
 import os
-from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
 
+from pip._vendor.packaging.markers import default_environment
 from pip._vendor.packaging.utils import canonicalize_name
 from pip._vendor.packaging.version import parse as parse_version
 from pip._vendor.resolvelib import BaseReporter, ResolutionImpossible
 from pip._vendor.resolvelib import Resolver as RLResolver
+from pip._vendor.resolvelib.resolvers import Result as RLResult
 from pip._vendor.resolvelib.structs import DirectedGraph
 
+from pip import __version__
 from pip._internal.cache import WheelCache
 from pip._internal.exceptions import InstallationError
 from pip._internal.index.package_finder import PackageFinder
@@ -30,10 +44,9 @@ from pip._internal.utils.misc import dist_is_editable
 
 from .base import Candidate, Constraint, Requirement
 from .factory import Factory
+from .result_cache import Pin, ResolutionCache, make_cache_key, make_pin
 
 if TYPE_CHECKING:
-    from pip._vendor.resolvelib.resolvers import Result as RLResult
-
     Result = RLResult[Requirement, Candidate, str]
 
 
@@ -56,10 +69,14 @@ class Resolver(BaseResolver):
         force_reinstall,  # type: bool
         upgrade_strategy,  # type: str
         py_version_info=None,  # type: Optional[Tuple[int, ...]]
+        speculative_prepare=False,  # type: bool
+        resolution_cache=None,  # type: Optional[ResolutionCache]
     ):
         super().__init__()
         assert upgrade_strategy in self._allowed_strategies
 
+        self.finder = finder
+
         self.factory = Factory(
             finder=finder,
             preparer=preparer,
@@ -73,8 +90,22 @@ class Resolver(BaseResolver):
         )
         self.ignore_dependencies = ignore_dependencies
         self.upgrade_strategy = upgrade_strategy
+        self.speculative_prepare = speculative_prepare
+        self.resolution_cache = resolution_cache
         self._result = None  # type: Optional[Result]
 
+        # Everything, besides the requirements, the target and the indexes,
+        # that the result of a resolution depends on.
+        self._cache_inputs = {
+            "use_user_site": use_user_site,
+            "ignore_dependencies": ignore_dependencies,
+            "ignore_installed": ignore_installed,
+            "ignore_requires_python": ignore_requires_python,
+            "force_reinstall": force_reinstall,
+            "upgrade_strategy": upgrade_strategy,
+            "py_version_info": py_version_info,
+        }  # type: Dict[str, Any]
+
     def resolve(self, root_reqs, check_supported_wheels):
         # type: (List[InstallRequirement], bool) -> RequirementSet
 
@@ -106,34 +137,49 @@ class Resolver(BaseResolver):
                 if r is not None:
                     requirements.append(r)
 
-        provider = PipProvider(
-            factory=self.factory,
-            constraints=constraints,
-            ignore_dependencies=self.ignore_dependencies,
-            upgrade_strategy=self.upgrade_strategy,
-            user_requested=user_requested,
-        )
-        if "PIP_RESOLVER_DEBUG" in os.environ:
-            reporter = PipDebuggingReporter()  # type: BaseReporter
-        else:
-            reporter = PipReporter()
-        resolver = RLResolver(
-            provider,
-            reporter,
-        )  # type: RLResolver[Requirement, Candidate, str]
-
-        try:
-            try_to_avoid_resolution_too_deep = 2000000
-            result = self._result = resolver.resolve(
-                requirements, max_rounds=try_to_avoid_resolution_too_deep
+        cache_key = self._make_cache_key(root_reqs)
+        result = None  # type: Optional[Result]
+        if cache_key is not None:
+            result = self._result = self._load_cached_result(cache_key, root_reqs)
+
+        if result is None:
+            provider = PipProvider(
+                factory=self.factory,
+                constraints=constraints,
+                ignore_dependencies=self.ignore_dependencies,
+                upgrade_strategy=self.upgrade_strategy,
+                user_requested=user_requested,
             )
+            if "PIP_RESOLVER_DEBUG" in os.environ:
+                reporter = PipDebuggingReporter()  # type: BaseReporter
+            else:
+                reporter = PipReporter()
+            resolver = RLResolver(
+                provider,
+                reporter,
+            )  # type: RLResolver[Requirement, Candidate, str]
+
+            try:
+                try_to_avoid_resolution_too_deep = 2000000
+                with contextlib.ExitStack() as stack:
+                    stack.enter_context(self.finder.prefetching())
+                    self.factory.prefetch_candidates(requirements)
+                    if self.speculative_prepare:
+                        stack.enter_context(self.factory.speculating())
+                        self.factory.speculate(requirements)
+                    result = self._result = resolver.resolve(
+                        requirements, max_rounds=try_to_avoid_resolution_too_deep
+                    )
 
-        except ResolutionImpossible as e:
-            error = self.factory.get_installation_error(
-                cast("ResolutionImpossible[Requirement, Candidate]", e),
-                constraints,
-            )
-            raise error from e
+            except ResolutionImpossible as e:
+                error = self.factory.get_installation_error(
+                    cast("ResolutionImpossible[Requirement, Candidate]", e),
+                    constraints,
+                )
+                raise error from e
+
+            if cache_key is not None:
+                self._store_result(cache_key, result)
 
         req_set = RequirementSet(check_supported_wheels=check_supported_wheels)
         for candidate in result.mapping.values():
@@ -215,6 +261,178 @@ class Resolver(BaseResolver):
         self.factory.preparer.prepare_linked_requirements_more(reqs)
         return req_set
 
+    def _make_cache_key(self, root_reqs):
+        # type: (List[InstallRequirement]) -> Optional[str]
+        """Return the key of the cached resolution of root_reqs, or None if
+        their resolution should not be cached.
+        """
+        if self.resolution_cache is None:
+            return None
+        # Local files and directories, and direct URLs, can change without
+        # the index pages changing.
+        if self.finder.find_links:
+            return None
+        requirements = []
+        for req in root_reqs:
+            if req.editable or req.link is not None or req.req is None:
+                return None
+            requirements.append(
+                [str(req.req), req.constraint, req.user_supplied, req.hash_options]
+            )
+
+        format_control = self.finder.format_control
+        inputs = dict(
+            self._cache_inputs,
+            pip_version=__version__,
+            requirements=requirements,
+            tags=[str(tag) for tag in self.finder.target_python.get_tags()],
+            environment=default_environment(),
+            index_urls=self.finder.index_urls,
+            no_binary=sorted(format_control.no_binary),
+            only_binary=sorted(format_control.only_binary),
+            allow_all_prereleases=self.finder.allow_all_prereleases,
+            prefer_binary=self.finder.prefer_binary,
+        )
+        return make_cache_key(inputs)
+
+    def _load_cached_result(self, key, root_reqs):
+        # type: (str, List[InstallRequirement]) -> Optional[Result]
+        """Make the result of a cached resolution again, if the index pages
+        it was made from are unchanged and still serve the pinned links, and
+        the installed distributions it depends on are unchanged.
+        """
+        assert self.resolution_cache is not None
+        entry = self.resolution_cache.get(key)
+        if entry is None:
+            return None
+        try:
+            return self._make_cached_result(entry, root_reqs)
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.debug("Ignoring cached resolution %s: %s", key, exc)
+            return None
+
+    def _make_cached_result(self, entry, root_reqs):
+        # type: (Dict[str, Any], List[InstallRequirement]) -> Optional[Result]
+        pins = entry["pins"]  # type: Dict[str, Pin]
+
+        # Installing a pinned version is the only change to the environment
+        # that does not change the result.
+        for identifier, recorded in entry["installed"].items():
+            pin = pins[identifier]
+            installed = self.factory.get_installed_version(pin["name"])
+            if installed is None:
+                if recorded is not None:
+                    return None
+                continue
+            allowed = {parse_version(pin["version"])}
+            if recorded is not None:
+                allowed.add(parse_version(recorded))
+            if parse_version(installed) not in allowed:
+                return None
+
+        graph = DirectedGraph()  # type: DirectedGraph[Optional[str]]
+        graph.add(None)
+        for identifier in pins:
+            graph.add(identifier)
+        for parent, child in entry["graph"]:
+            graph.connect(parent, child)
+
+        links = self.finder.fetch_unchanged_links({
+            url: (etag, last_modified)
+            for url, (etag, last_modified) in entry["pages"].items()
+        })
+        if links is None:
+            return None
+        served = {link.url: link for link in links}
+
+        root_ireqs = {}  # type: Dict[str, InstallRequirement]
+        for req in root_reqs:
+            if req.constraint or not req.match_markers():
+                continue
+            assert req.name, "Cached requirements must be named"
+            root_ireqs.setdefault(canonicalize_name(req.name), req)
+
+        # Extras candidates are made from their base candidates.
+        candidates = {}  # type: Dict[str, Candidate]
+        for identifier in sorted(pins, key=lambda i: pins[i]["kind"] == "extras"):
+            pin = pins[identifier]
+            template = None
+            link = None
+            if "name" in pin:
+                template = root_ireqs.get(canonicalize_name(pin["name"]))
+                if template is None:
+                    template = self._make_pinned_template(
+                        pin, graph.iter_parents(identifier), candidates
+                    )
+            if "url" in pin:
+                link = served.get(pin["url"])
+                if link is None:
+                    logger.debug("Pinned link %s is no longer served", pin["url"])
+                    return None
+            candidate = self.factory.make_candidate_from_pin(
+                pin, template, link, candidates
+            )
+            if candidate is None:
+                return None
+            candidates[identifier] = candidate
+
+        logger.info("Using the cached resolution of the requirements")
+        mapping = {identifier: candidates[identifier] for identifier in pins}
+        # The criteria are only needed to explain a failed resolution.
+        result = RLResult(  # type: ignore
+            mapping=mapping, graph=graph, criteria={}
+        )
+        return cast("Result", result)
+
+    def _make_pinned_template(
+        self,
+        pin,  # type: Pin
+        parents,  # type: Iterable[Optional[str]]
+        candidates,  # type: Dict[str, Candidate]
+    ):
+        # type: (...) -> Optional[InstallRequirement]
+        """Make the requirement that the pinned candidate is made from when it
+        is not a root requirement, as a dependency of one of its parents.
+        """
+        comes_from = None
+        for parent in parents:
+            if parent in candidates:
+                comes_from = candidates[parent].get_install_requirement()
+                if comes_from is not None:
+                    break
+        spec = "{}=={}".format(pin["name"], pin["version"])
+        requirement = self.factory.make_requirement_from_spec(spec, comes_from)
+        if requirement is None:
+            return None
+        return requirement.get_candidate_lookup()[1]
+
+    def _store_result(self, key, result):
+        # type: (str, Result) -> None
+        """Cache result, unless it pins candidates that cannot be made again
+        without resolving, or was made from pages without validators.
+        """
+        assert self.resolution_cache is not None
+        pins = {}  # type: Dict[str, Pin]
+        for identifier, candidate in result.mapping.items():
+            pin = make_pin(candidate)
+            if pin is None:
+                return
+            pins[identifier] = pin
+
+        pages = {}  # type: Dict[str, List[Optional[str]]]
+        for url, validators in self.finder.page_validators.items():
+            if validators is None or validators == (None, None):
+                return
+            pages[url] = list(validators)
+
+        installed = {
+            identifier: self.factory.get_installed_version(pin["name"])
+            for identifier, pin in pins.items()
+            if "name" in pin
+        }
+        graph = [[parent, child] for parent, child in result.graph.iter_edges()]
+        self.resolution_cache.set(key, pins, graph, pages, installed)
+
     def get_installation_order(self, req_set):
         # type: (RequirementSet) -> List[InstallRequirement]
         """Get order for installation of requirements in RequirementSet.
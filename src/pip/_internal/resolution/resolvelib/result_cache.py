@@ -0,0 +1,149 @@
+"""Persistent cache of the results of dependency resolution.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from pip._internal.network.cache import suppressed_cache_errors
+from pip._internal.utils.filesystem import adjacent_tmp_file, replace
+from pip._internal.utils.misc import ensure_dir
+
+from .base import Candidate
+from .candidates import (
+    AlreadyInstalledCandidate,
+    ExtrasCandidate,
+    LinkCandidate,
+    RequiresPythonCandidate,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump this when the format of the entries changes.
+_FORMAT_VERSION = 1
+
+Pin = Dict[str, Any]
+
+
+def make_cache_key(inputs):
+    # type: (Dict[str, Any]) -> str
+    """Return the key of the entry for a resolution of the given inputs,
+    which must be serializable to JSON.
+    """
+    inputs = dict(inputs, format_version=_FORMAT_VERSION)
+    s = json.dumps(inputs, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha224(s.encode("utf-8")).hexdigest()
+
+
+def make_pin(candidate):
+    # type: (Candidate) -> Optional[Pin]
+    """Describe a candidate pinned by the resolver, so that it can be made
+    again. Return None for candidates that cannot be made again without
+    resolving, e.g. those from local files.
+    """
+    if isinstance(candidate, RequiresPythonCandidate):
+        return {"kind": "python"}
+    if isinstance(candidate, ExtrasCandidate):
+        return {
+            "kind": "extras",
+            "base": candidate.base.name,
+            "extras": sorted(candidate.extras),
+        }
+    if isinstance(candidate, AlreadyInstalledCandidate):
+        return {
+            "kind": "installed",
+            "name": candidate.project_name,
+            "version": str(candidate.version),
+        }
+    if isinstance(candidate, LinkCandidate):
+        link = candidate.source_link
+        if link is None or link.is_file:
+            return None
+        return {
+            "kind": "link",
+            "name": candidate.project_name,
+            "version": str(candidate.version),
+            "url": link.url,
+        }
+    return None
+
+
+class ResolutionCache:
+    """
+    A cache of the candidates pinned by the resolver, which persists across
+    pip invocations.
+
+    Entries are keyed by everything that was given to the resolver (see
+    make_cache_key()), and record the validators (ETag and Last-Modified
+    headers) of the index pages that were looked at during resolution,
+    so that an entry is only used while the indexes serve the same pages.
+
+    An entry that cannot be read or written only means resolving from
+    scratch.
+    """
+
+    def __init__(self, directory):
+        # type: (str) -> None
+        assert directory is not None, "Cache directory must not be None."
+        self.directory = directory
+
+    def _get_cache_path(self, key):
+        # type: (str) -> str
+        # Nest the entries like the wheel cache does, to avoid having a
+        # huge number of files in one directory.
+        parts = [key[:2], key[2:4], key[4:6], key[6:]]
+        return os.path.join(self.directory, *parts)
+
+    def get(self, key):
+        # type: (str) -> Optional[Dict[str, Any]]
+        """Return the entry stored for key, or None if there is none."""
+        data = None
+        with suppressed_cache_errors():
+            with open(self._get_cache_path(key), "rb") as f:
+                data = f.read()
+        if data is None:
+            return None
+
+        try:
+            entry = json.loads(data.decode("utf-8"))
+            pins = entry["pins"]
+            entry["graph"]
+            entry["pages"]
+            entry["installed"]
+        except (ValueError, TypeError, KeyError) as exc:
+            logger.debug("Ignoring cached resolution %s: %s", key, exc)
+            return None
+        if not isinstance(pins, dict):
+            return None
+        return entry
+
+    def set(
+        self,
+        key,  # type: str
+        pins,  # type: Dict[str, Pin]
+        graph,  # type: List[List[Optional[str]]]
+        pages,  # type: Dict[str, List[Optional[str]]]
+        installed,  # type: Dict[str, Optional[str]]
+    ):
+        # type: (...) -> None
+        """Store the pins of a resolution, by identifier, with the edges of
+        its dependency graph, the validators of the index pages it looked
+        at and the versions installed of the pinned projects.
+        """
+        entry = {
+            "pins": pins,
+            "graph": graph,
+            "pages": pages,
+            "installed": installed,
+        }
+        path = self._get_cache_path(key)
+        with suppressed_cache_errors():
+            ensure_dir(os.path.dirname(path))
+
+            with adjacent_tmp_file(path) as f:
+                # Keep the pins in the order the resolver pinned them.
+                f.write(json.dumps(entry).encode("utf-8"))
+
+            replace(f.name, path)
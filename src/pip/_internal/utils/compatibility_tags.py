@@ -2,7 +2,7 @@
 """
 
 import re
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from pip._vendor.packaging.tags import (
     Tag,
@@ -117,6 +117,20 @@ def _get_custom_interpreter(implementation=None, version=None):
     return f"{implementation}{version}"
 
 
+def get_tag_priorities(tags):
+    # type: (List[Tag]) -> Dict[Tag, int]
+    """Map each of the given tags to its index in the list, i.e. to its
+    priority, where lower is more preferred.
+
+    Looking up a wheel's tags in the mapping replaces linear scans of the
+    (often long) list of supported tags.
+    """
+    priorities = {}  # type: Dict[Tag, int]
+    for priority, tag in enumerate(tags):
+        priorities.setdefault(tag, priority)
+    return priorities
+
+
 def get_supported(
     version=None,  # type: Optional[str]
     platforms=None,  # type: Optional[List[str]]
@@ -9,10 +9,9 @@ from contextlib import contextmanager
 from tempfile import NamedTemporaryFile
 from typing import Any, BinaryIO, Iterator, List, Union, cast
 
-from pip._vendor.tenacity import retry, stop_after_delay, wait_fixed
-
 from pip._internal.utils.compat import get_path_uid
 from pip._internal.utils.misc import format_size
+from pip._internal.utils.retry import retry
 
 
 def check_path_owner(path):
@@ -98,10 +97,7 @@ def adjacent_tmp_file(path, **kwargs):
             os.fsync(result.fileno())
 
 
-# Tenacity raises RetryError by default, explictly raise the original exception
-_replace_retry = retry(reraise=True, stop=stop_after_delay(1), wait=wait_fixed(0.25))
-
-replace = _replace_retry(os.replace)
+replace = retry(wait=0.25, stop_after_delay=1)(os.replace)
 
 
 # test_writable_dir and _test_writable_dir_win are copied from Flit,
@@ -5,7 +5,7 @@ import logging.handlers
 import os
 import sys
 from logging import Filter, getLogger
-from typing import IO, Any, Callable, Iterator, Optional, TextIO, Type, cast
+from typing import IO, Any, Callable, Iterator, List, Optional, TextIO, Type, cast
 
 from pip._internal.utils.compat import WINDOWS
 from pip._internal.utils.deprecation import DEPRECATION_MSG_PREFIX
@@ -85,6 +85,40 @@ def get_indentation():
     return getattr(_log_state, "indentation", 0)
 
 
+@contextlib.contextmanager
+def capture_logs():
+    # type: () -> Iterator[List[logging.LogRecord]]
+    """
+    A context manager holding back the records logged on the current thread
+    inside it, in the list it returns, instead of letting the handlers set up
+    by setup_logging() emit them. They can be emitted later with
+    replay_logs(), so that the logs of concurrent builds are not interleaved.
+    """
+    previous = getattr(_log_state, "captured", None)
+    records = []  # type: List[logging.LogRecord]
+    _log_state.captured = records
+    try:
+        yield records
+    finally:
+        _log_state.captured = previous
+
+
+def is_capturing_logs():
+    # type: () -> bool
+    return getattr(_log_state, "captured", None) is not None
+
+
+def replay_logs(records):
+    # type: (List[logging.LogRecord]) -> None
+    """
+    Emit the records held back by capture_logs(), indented as they were
+    logged, relative to the current indentation.
+    """
+    for record in records:
+        with indent_log(getattr(record, "indentation", 0)):
+            getLogger(record.name).handle(record)
+
+
 class IndentingFormatter(logging.Formatter):
     default_time_format = "%Y-%m-%dT%H:%M:%S"
 
@@ -264,6 +298,26 @@ class ExcludeLoggerFilter(Filter):
         return not super().filter(record)
 
 
+class CaptureFilter(Filter):
+
+    """
+    A logging Filter that holds back the records logged on the threads
+    inside capture_logs().
+    """
+
+    def filter(self, record):
+        # type: (logging.LogRecord) -> bool
+        captured = getattr(_log_state, "captured", None)
+        if captured is None:
+            return True
+        # The handlers share this filter, so a record reaches it once per
+        # handler in a row.
+        if not captured or captured[-1] is not record:
+            record.indentation = get_indentation()
+            captured.append(record)
+        return False
+
+
 def setup_logging(verbosity, no_color, user_log_file):
     # type: (int, bool, Optional[str]) -> int
     """Configures and sets up all of the logging
@@ -329,6 +383,9 @@ def setup_logging(verbosity, no_color, user_log_file):
                     "()": "pip._internal.utils.logging.ExcludeLoggerFilter",
                     "name": subprocess_logger.name,
                 },
+                "capture": {
+                    "()": "pip._internal.utils.logging.CaptureFilter",
+                },
             },
             "formatters": {
                 "indent": {
@@ -347,7 +404,7 @@ def setup_logging(verbosity, no_color, user_log_file):
                     "class": handler_classes["stream"],
                     "no_color": no_color,
                     "stream": log_streams["stdout"],
-                    "filters": ["exclude_subprocess", "exclude_warnings"],
+                    "filters": ["capture", "exclude_subprocess", "exclude_warnings"],
                     "formatter": "indent",
                 },
                 "console_errors": {
@@ -355,7 +412,7 @@ def setup_logging(verbosity, no_color, user_log_file):
                     "class": handler_classes["stream"],
                     "no_color": no_color,
                     "stream": log_streams["stderr"],
-                    "filters": ["exclude_subprocess"],
+                    "filters": ["capture", "exclude_subprocess"],
                     "formatter": "indent",
                 },
                 # A handler responsible for logging to the console messages
@@ -365,7 +422,7 @@ def setup_logging(verbosity, no_color, user_log_file):
                     "class": handler_classes["stream"],
                     "no_color": no_color,
                     "stream": log_streams["stderr"],
-                    "filters": ["restrict_to_subprocess"],
+                    "filters": ["capture", "restrict_to_subprocess"],
                     "formatter": "indent",
                 },
                 "user_log": {
@@ -373,6 +430,7 @@ def setup_logging(verbosity, no_color, user_log_file):
                     "class": handler_classes["file"],
                     "filename": additional_log_file,
                     "delay": True,
+                    "filters": ["capture"],
                     "formatter": "indent_with_timestamp",
                 },
             },
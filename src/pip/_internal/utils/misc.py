@@ -17,6 +17,7 @@ from io import StringIO
 from itertools import filterfalse, tee, zip_longest
 from types import TracebackType
 from typing import (
+    TYPE_CHECKING,
     Any,
     AnyStr,
     BinaryIO,
@@ -34,18 +35,19 @@ from typing import (
     cast,
 )
 
-from pip._vendor.pkg_resources import Distribution
-from pip._vendor.tenacity import retry, stop_after_delay, wait_fixed
-
 from pip import __version__
 from pip._internal.exceptions import CommandError
 from pip._internal.locations import get_major_minor_version, site_packages, user_site
 from pip._internal.utils.compat import WINDOWS, stdlib_pkgs
+from pip._internal.utils.retry import retry
 from pip._internal.utils.virtualenv import (
     running_under_virtualenv,
     virtualenv_no_global,
 )
 
+if TYPE_CHECKING:
+    from pip._vendor.pkg_resources import Distribution
+
 __all__ = [
     "rmtree",
     "display_path",
@@ -128,8 +130,7 @@ def get_prog():
 
 
 # Retry every half second for up to 3 seconds
-# Tenacity raises RetryError by default, explictly raise the original exception
-@retry(reraise=True, stop=stop_after_delay(3), wait=wait_fixed(0.5))
+@retry(wait=0.5, stop_after_delay=3)
 def rmtree(dir, ignore_errors=False):
     # type: (AnyStr, bool) -> None
     shutil.rmtree(dir, ignore_errors=ignore_errors, onerror=rmtree_errorhandler)
@@ -404,13 +405,13 @@ def get_installed_distributions(
 
     Left for compatibility until direct pkg_resources uses are refactored out.
     """
-    from pip._internal.metadata import get_default_environment, get_environment
     from pip._internal.metadata.pkg_resources import Distribution as _Dist
+    from pip._internal.metadata.pkg_resources import Environment
 
     if paths is None:
-        env = get_default_environment()
+        env = Environment.default()
     else:
-        env = get_environment(paths)
+        env = Environment.from_paths(paths)
     dists = env.iter_installed_distributions(
         local_only=local_only,
         skip=skip,
@@ -430,10 +431,10 @@ def get_distribution(req_name):
 
     Left for compatibility until direct pkg_resources uses are refactored out.
     """
-    from pip._internal.metadata import get_default_environment
     from pip._internal.metadata.pkg_resources import Distribution as _Dist
+    from pip._internal.metadata.pkg_resources import Environment
 
-    dist = get_default_environment().get_distribution(req_name)
+    dist = Environment.default().get_distribution(req_name)
     if dist is None:
         return None
     return cast(_Dist, dist)._dist
@@ -442,6 +443,15 @@ def get_distribution(req_name):
 def egg_link_path(dist):
     # type: (Distribution) -> Optional[str]
     """
+    Return the path for the .egg-link file of dist if it exists, otherwise,
+    None. See project_egg_link_path().
+    """
+    return project_egg_link_path(dist.project_name)
+
+
+def project_egg_link_path(project_name):
+    # type: (str) -> Optional[str]
+    """
     Return the path for the .egg-link file if it exists, otherwise, None.
 
     There's 3 scenarios:
@@ -469,7 +479,7 @@ def egg_link_path(dist):
         sites.append(site_packages)
 
     for site in sites:
-        egglink = os.path.join(site, dist.project_name) + ".egg-link"
+        egglink = os.path.join(site, project_name) + ".egg-link"
         if os.path.isfile(egglink):
             return egglink
     return None
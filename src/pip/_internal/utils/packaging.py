@@ -1,3 +1,4 @@
+import functools
 import logging
 from email.message import Message
 from email.parser import FeedParser
@@ -29,6 +30,14 @@ def check_requires_python(requires_python, version_info):
     if requires_python is None:
         # The package provides no information
         return True
+    return _check_requires_python(requires_python, tuple(version_info))
+
+
+# The files of a project usually share a handful of "Requires-Python" values,
+# so only check each of them once.
+@functools.lru_cache(maxsize=512)
+def _check_requires_python(requires_python, version_info):
+    # type: (str, Tuple[int, ...]) -> bool
     requires_python_specifier = specifiers.SpecifierSet(requires_python)
 
     python_version = version.parse(".".join(map(str, version_info)))
@@ -24,8 +24,6 @@ from multiprocessing import pool
 from multiprocessing.dummy import Pool as ThreadPool
 from typing import Callable, Iterable, Iterator, TypeVar, Union
 
-from pip._vendor.requests.adapters import DEFAULT_POOLSIZE
-
 Pool = Union[pool.Pool, pool.ThreadPool]
 S = TypeVar("S")
 T = TypeVar("T")
@@ -90,6 +88,10 @@ def _map_multithread(func, iterable, chunksize=1):
 
     Return an unordered iterator of the results.
     """
+    # Imported here, as requests is slow to import and only needed to match
+    # the size of its connection pools.
+    from pip._vendor.requests.adapters import DEFAULT_POOLSIZE
+
     with closing(ThreadPool(DEFAULT_POOLSIZE)) as pool:
         return pool.imap_unordered(func, iterable, chunksize)
 
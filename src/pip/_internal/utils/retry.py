@@ -0,0 +1,41 @@
+"""Retrying of functions that can fail transiently, such as file operations
+racing with virus scanners on Windows.
+
+This replaces the subset of tenacity that pip needs, since importing tenacity
+also imports asyncio, which is a significant part of pip's startup time.
+"""
+
+import functools
+import time
+from typing import Any, Callable, TypeVar, cast
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def retry(wait, stop_after_delay):
+    # type: (float, float) -> Callable[[F], F]
+    """Decorator calling the function again, with the same arguments, each
+    time it raises until it returns or the time limit is reached. The last
+    exception is then reraised.
+
+    :param wait: The time to wait after an error before retrying, in seconds.
+    :param stop_after_delay: The time after which to stop retrying, in
+        seconds.
+    """
+    def decorator(func):
+        # type: (F) -> F
+        @functools.wraps(func)
+        def wrapped(*args, **kwargs):
+            # type: (*Any, **Any) -> Any
+            start = time.monotonic()
+            while True:
+                try:
+                    return func(*args, **kwargs)
+                except Exception:
+                    if time.monotonic() - start >= stop_after_delay:
+                        raise
+                    time.sleep(wait)
+
+        return cast(F, wrapped)
+
+    return decorator
@@ -1,8 +1,20 @@
+import contextlib
 import logging
 import os
 import shlex
 import subprocess
-from typing import Any, Callable, Iterable, List, Mapping, Optional, Union
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
 
 from pip._internal.cli.spinners import SpinnerInterface, open_spinner
 from pip._internal.exceptions import InstallationSubprocessError
@@ -14,6 +26,31 @@ CommandArgs = List[Union[str, HiddenText]]
 
 LOG_DIVIDER = "----------------------------------------"
 
+# Changes to the environment of the subprocesses started by a thread, which
+# unlike changes to os.environ do not leak into the concurrent builds run by
+# other threads.
+_thread_state = threading.local()
+
+
+@contextlib.contextmanager
+def thread_environ(changes):
+    # type: (Mapping[str, str]) -> Iterator[None]
+    """
+    A context manager applying changes to the environment of the subprocesses
+    started by call_subprocess() on the current thread, inside it.
+    """
+    previous = get_thread_environ()
+    _thread_state.environ = dict(previous, **changes)
+    try:
+        yield
+    finally:
+        _thread_state.environ = previous
+
+
+def get_thread_environ():
+    # type: () -> Dict[str, str]
+    return getattr(_thread_state, "environ", {})
+
 
 def make_command(*args):
     # type: (Union[str, HiddenText, CommandArgs]) -> CommandArgs
@@ -161,6 +198,7 @@ def call_subprocess(
 
     log_subprocess("Running command %s", command_desc)
     env = os.environ.copy()
+    env.update(get_thread_environ())
     if extra_environ:
         env.update(extra_environ)
     for name in unset_environ:
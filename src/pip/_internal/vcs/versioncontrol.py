@@ -213,7 +213,6 @@ class VcsSupport:
             return
         if cls.name not in self._registry:
             self._registry[cls.name] = cls()
-            logger.debug('Registered VCS backend: %s', cls.name)
 
     def unregister(self, name):
         # type: (str) -> None
@@ -5,7 +5,8 @@ import logging
 import os.path
 import re
 import shutil
-from typing import Any, Callable, Iterable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from pip._vendor.packaging.utils import canonicalize_name, canonicalize_version
 from pip._vendor.packaging.version import InvalidVersion, Version
@@ -18,7 +19,7 @@ from pip._internal.models.wheel import Wheel
 from pip._internal.operations.build.wheel import build_wheel_pep517
 from pip._internal.operations.build.wheel_legacy import build_wheel_legacy
 from pip._internal.req.req_install import InstallRequirement
-from pip._internal.utils.logging import indent_log
+from pip._internal.utils.logging import capture_logs, indent_log, replay_logs
 from pip._internal.utils.misc import ensure_dir, hash_file, is_wheel_installed
 from pip._internal.utils.setuptools_build import make_setuptools_clean_args
 from pip._internal.utils.subprocess import call_subprocess
@@ -219,7 +220,7 @@ def _build_one(
         return None
 
     # Install build deps into temporary directory (PEP 518)
-    with req.build_env:
+    with req.build_env.activate_for_thread():
         wheel_path = _build_one_inside_env(
             req, output_dir, build_options, global_options
         )
@@ -254,6 +255,7 @@ def _build_one_inside_env(
                 )
             wheel_path = build_wheel_pep517(
                 name=req.name,
+                build_env=req.build_env,
                 backend=req.pep517_backend,
                 metadata_directory=req.metadata_directory,
                 tempd=temp_dir.path,
@@ -307,19 +309,68 @@ def _clean_one_legacy(req, global_options):
         return False
 
 
+def _build_concurrently(
+    requirements,  # type: List[InstallRequirement]
+    build_one,  # type: Callable[[InstallRequirement], Optional[str]]
+    max_workers,  # type: int
+):
+    # type: (...) -> List[Optional[str]]
+    """Run build_one() for every requirement on up to max_workers threads.
+
+    The logs of each build are held back until it and the builds before it
+    have finished, so that they are emitted in the order of requirements.
+
+    After a build raises, no more are started; the first error, in order, is
+    raised once the running ones have finished.
+    """
+    logs = {}  # type: Dict[int, List[logging.LogRecord]]
+
+    def run(index):
+        # type: (int) -> Optional[str]
+        with capture_logs() as records:
+            logs[index] = records
+            return build_one(requirements[index])
+
+    wheel_files = []  # type: List[Optional[str]]
+    errors = {}  # type: Dict[int, BaseException]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run, i) for i in range(len(requirements))]
+        for index, future in enumerate(futures):
+            if future.cancelled():
+                continue
+            error = future.exception()
+            replay_logs(logs.get(index, []))
+            if error is None:
+                wheel_files.append(future.result())
+                continue
+            errors[index] = error
+            for pending in futures[index + 1:]:
+                pending.cancel()
+
+    if errors:
+        raise errors[min(errors)]
+    return wheel_files
+
+
 def build(
     requirements,  # type: Iterable[InstallRequirement]
     wheel_cache,  # type: WheelCache
     verify,  # type: bool
     build_options,  # type: List[str]
     global_options,  # type: List[str]
+    build_jobs=1,  # type: int
 ):
     # type: (...) -> BuildResult
     """Build wheels.
 
+    With build_jobs above 1, that many wheels are built at once, each in its
+    own build environment. The output of each build is shown once it has
+    finished, in the order of requirements.
+
     :return: The list of InstallRequirement that succeeded to build and
         the list of InstallRequirement that failed to build.
     """
+    requirements = list(requirements)
     if not requirements:
         return [], []
 
@@ -329,13 +380,23 @@ def build(
         ', '.join(req.name for req in requirements),  # type: ignore
     )
 
+    def build_one(req):
+        # type: (InstallRequirement) -> Optional[str]
+        cache_dir = _get_cache_dir(req, wheel_cache)
+        return _build_one(
+            req, cache_dir, verify, build_options, global_options
+        )
+
     with indent_log():
-        build_successes, build_failures = [], []
-        for req in requirements:
-            cache_dir = _get_cache_dir(req, wheel_cache)
-            wheel_file = _build_one(
-                req, cache_dir, verify, build_options, global_options
+        if build_jobs > 1 and len(requirements) > 1:
+            wheel_files = _build_concurrently(
+                requirements, build_one, build_jobs
             )
+        else:
+            wheel_files = [build_one(req) for req in requirements]
+
+        build_successes, build_failures = [], []
+        for req, wheel_file in zip(requirements, wheel_files):
             if wheel_file:
                 # Update the link for this.
                 req.link = Link(path_to_url(wheel_file))
@@ -20,6 +20,31 @@ def http_cache_dir(cache_dir):
     return os.path.normcase(os.path.join(cache_dir, 'http'))
 
 
+@pytest.fixture
+def links_cache_dir(cache_dir):
+    return os.path.normcase(os.path.join(cache_dir, 'links'))
+
+
+@pytest.fixture
+def resolutions_cache_dir(cache_dir):
+    return os.path.normcase(os.path.join(cache_dir, 'resolutions'))
+
+
+@pytest.fixture
+def unpacked_wheels_dir(cache_dir):
+    return os.path.normcase(os.path.join(cache_dir, 'unpacked'))
+
+
+@pytest.fixture
+def build_envs_dir(cache_dir):
+    return os.path.normcase(os.path.join(cache_dir, 'build-envs'))
+
+
+@pytest.fixture
+def sdist_metadata_dir(cache_dir):
+    return os.path.normcase(os.path.join(cache_dir, 'sdist-metadata'))
+
+
 @pytest.fixture
 def wheel_cache_dir(cache_dir):
     return os.path.normcase(os.path.join(cache_dir, 'wheels'))
@@ -186,7 +211,9 @@ def test_cache_dir_too_many_args(script, cache_dir):
 
 @pytest.mark.usefixtures("populate_http_cache", "populate_wheel_cache")
 def test_cache_info(
-        script, http_cache_dir, wheel_cache_dir, wheel_cache_files
+        script, http_cache_dir, links_cache_dir, resolutions_cache_dir,
+        unpacked_wheels_dir, build_envs_dir, sdist_metadata_dir,
+        wheel_cache_dir, wheel_cache_files
 ):
     result = script.pip('cache', 'info')
 
@@ -194,6 +221,24 @@ def test_cache_info(
         f'Package index page cache location: {http_cache_dir}'
         in result.stdout
     )
+    assert (
+        f'Parsed index page cache location: {links_cache_dir}'
+        in result.stdout
+    )
+    assert (
+        f'Resolution cache location: {resolutions_cache_dir}'
+        in result.stdout
+    )
+    assert (
+        f'Unpacked wheels location: {unpacked_wheels_dir}' in result.stdout
+    )
+    assert (
+        f'Build environments location: {build_envs_dir}' in result.stdout
+    )
+    assert (
+        f'Source distribution metadata location: {sdist_metadata_dir}'
+        in result.stdout
+    )
     assert f'Wheels location: {wheel_cache_dir}' in result.stdout
     num_wheels = len(wheel_cache_files)
     assert f'Number of wheels: {num_wheels}' in result.stdout
@@ -0,0 +1,86 @@
+import threading
+from concurrent.futures import wait
+from unittest import mock
+
+import pytest
+
+from pip._internal.resolution.resolvelib import factory as factory_module
+from pip._internal.resolution.resolvelib.base import Constraint
+
+
+@pytest.fixture
+def made_candidates():
+    """Record the threads in which link candidates are made."""
+    threads = []
+    link_candidate = factory_module.LinkCandidate
+
+    def make(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return link_candidate(*args, **kwargs)
+
+    with mock.patch.object(factory_module, "LinkCandidate", side_effect=make):
+        yield threads
+
+
+def find_best(factory, req):
+    candidates = factory.find_candidates(
+        req.name,
+        {req.name: [req]},
+        {},
+        Constraint.empty(),
+        prefers_installed=False,
+    )
+    return next(iter(candidates))
+
+
+@pytest.fixture
+def prefetched(factory):
+    """Record the links and threads of the metadata prefetches."""
+    prefetches = []
+
+    def prefetch(link):
+        prefetches.append((link.filename, threading.current_thread()))
+
+    with mock.patch.object(
+        factory.preparer, "prefetch_metadata", side_effect=prefetch,
+    ):
+        yield prefetches
+
+
+def test_speculate_prefetches_best_candidate(
+    factory, made_candidates, prefetched,
+):
+    req = factory.make_requirement_from_spec("simplewheel", comes_from=None)
+    with factory.speculating():
+        factory.speculate([req])
+        wait(factory._speculations)
+        candidate = find_best(factory, req)
+
+    assert str(candidate.version) == "2.0"
+    [(filename, thread)] = prefetched
+    assert filename == "simplewheel-2.0-1-py2.py3-none-any.whl"
+    assert thread is not threading.main_thread()
+    # Candidates, which may build sdists, are only made by the resolver.
+    assert made_candidates == [threading.main_thread()]
+
+
+def test_speculate_once_per_project(factory, prefetched):
+    req = factory.make_requirement_from_spec("simplewheel", comes_from=None)
+    other = factory.make_requirement_from_spec("simplewheel<2", comes_from=None)
+    with factory.speculating():
+        factory.speculate([req])
+        factory.speculate([other])
+        wait(factory._speculations)
+
+    assert [filename for filename, _ in prefetched] == [
+        "simplewheel-2.0-1-py2.py3-none-any.whl",
+    ]
+
+
+def test_speculate_outside_context(factory, made_candidates, prefetched):
+    req = factory.make_requirement_from_spec("simplewheel", comes_from=None)
+    factory.speculate([req])
+    find_best(factory, req)
+
+    assert prefetched == []
+    assert made_candidates == [threading.main_thread()]
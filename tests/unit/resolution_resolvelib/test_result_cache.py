@@ -0,0 +1,127 @@
+import os
+from unittest import mock
+
+import pytest
+
+from pip._internal.models.search_scope import SearchScope
+from pip._internal.req.constructors import install_req_from_line
+from pip._internal.resolution.resolvelib import resolver as resolver_module
+from pip._internal.resolution.resolvelib.result_cache import (
+    ResolutionCache,
+    make_cache_key,
+)
+
+
+@pytest.fixture
+def resolution_cache(tmpdir):
+    return ResolutionCache(os.path.join(tmpdir, "resolutions"))
+
+
+@pytest.fixture
+def make_resolver(preparer, finder, resolution_cache):
+    # The cache is only used with index pages.
+    finder.search_scope = SearchScope.create(find_links=[], index_urls=[])
+
+    def make_resolver():
+        return resolver_module.Resolver(
+            preparer=preparer,
+            finder=finder,
+            wheel_cache=None,
+            make_install_req=install_req_from_line,
+            use_user_site=False,
+            ignore_dependencies=False,
+            ignore_installed=False,
+            ignore_requires_python=False,
+            force_reinstall=False,
+            upgrade_strategy="to-satisfy-only",
+            resolution_cache=resolution_cache,
+        )
+
+    return make_resolver
+
+
+def make_root_reqs():
+    return [install_req_from_line("pytest", user_supplied=True)]
+
+
+def test_make_cache_key():
+    key = make_cache_key({"requirements": [["a", False, True, {}]]})
+    assert key == make_cache_key({"requirements": [["a", False, True, {}]]})
+    assert key != make_cache_key({"requirements": [["b", False, True, {}]]})
+
+
+def test_cache_roundtrip(resolution_cache):
+    key = make_cache_key({})
+    assert resolution_cache.get(key) is None
+
+    pins = {"a": {"kind": "installed", "name": "a", "version": "1.0"}}
+    resolution_cache.set(key, pins, [[None, "a"]], {}, {"a": "1.0"})
+
+    entry = resolution_cache.get(key)
+    assert entry["pins"] == pins
+    assert entry["graph"] == [[None, "a"]]
+    assert resolution_cache.get(make_cache_key({"other": True})) is None
+
+
+def test_cache_ignores_corrupted_entry(resolution_cache):
+    key = make_cache_key({})
+    resolution_cache.set(key, {}, [], {}, {})
+    with open(resolution_cache._get_cache_path(key), "wb") as f:
+        f.write(b"garbage")
+
+    assert resolution_cache.get(key) is None
+
+
+def test_resolve_uses_cached_result(make_resolver):
+    # pytest and its dependencies are installed, so they are resolved
+    # without looking at any index page.
+    expected = make_resolver()
+    expected.resolve(make_root_reqs(), True)
+
+    resolver = make_resolver()
+    with mock.patch.object(resolver_module, "RLResolver") as rl_resolver:
+        resolver.resolve(make_root_reqs(), True)
+
+    rl_resolver.assert_not_called()
+    assert list(resolver._result.mapping) == list(expected._result.mapping)
+    assert "pytest" in resolver._result.mapping
+    assert sorted(resolver._result.graph.iter_edges(), key=str) == sorted(
+        expected._result.graph.iter_edges(), key=str
+    )
+
+
+def test_cached_result_needs_same_environment(make_resolver):
+    make_resolver().resolve(make_root_reqs(), True)
+
+    resolver = make_resolver()
+    key = resolver._make_cache_key(make_root_reqs())
+    assert resolver._load_cached_result(key, make_root_reqs()) is not None
+    with mock.patch.object(
+        resolver.factory, "get_installed_version", return_value="0.1",
+    ):
+        assert resolver._load_cached_result(key, make_root_reqs()) is None
+
+
+def test_cached_result_needs_unchanged_pages(make_resolver, finder):
+    make_resolver().resolve(make_root_reqs(), True)
+
+    resolver = make_resolver()
+    key = resolver._make_cache_key(make_root_reqs())
+    with mock.patch.object(finder, "fetch_unchanged_links", return_value=None):
+        assert resolver._load_cached_result(key, make_root_reqs()) is None
+
+
+def test_resolve_without_index_pages_validators(make_resolver, finder):
+    resolver = make_resolver()
+    finder.page_validators["https://example.com/simple/pytest/"] = None
+    resolver.resolve(make_root_reqs(), True)
+
+    key = resolver._make_cache_key(make_root_reqs())
+    assert resolver.resolution_cache.get(key) is None
+
+
+def test_find_links_are_not_cached(make_resolver, finder, data):
+    finder.search_scope = SearchScope.create(
+        find_links=[str(data.packages)], index_urls=[],
+    )
+    assert make_resolver()._make_cache_key(make_root_reqs()) is None
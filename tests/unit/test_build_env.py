@@ -0,0 +1,246 @@
+import os
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from pip._vendor.packaging.utils import canonicalize_name
+from pip._vendor.packaging.version import parse as parse_version
+
+from pip._internal.build_env import (
+    BuildEnvironment,
+    InProcessInstaller,
+    _get_prefix_key,
+    _is_prefix_current,
+)
+from pip._internal.cache import BuildEnvironmentStore, WheelCache
+from pip._internal.locations import get_scheme
+from pip._internal.models.format_control import FormatControl
+from pip._internal.models.link import Link
+from pip._internal.models.target_python import TargetPython
+from pip._internal.network.session import PipSession
+from pip._internal.req.req_tracker import get_requirement_tracker
+from pip._internal.utils.temp_dir import global_tempdir_manager
+from tests.lib import make_test_finder
+from tests.lib.wheel import make_wheel
+
+
+class FakeFinder:
+
+    def __init__(self, versions):
+        self.versions = versions
+        self.index_urls = ["https://example.com/simple"]
+        self.find_links = []
+        self.format_control = FormatControl()
+        self.allow_all_prereleases = False
+        self.prefer_binary = False
+        self.target_python = TargetPython()
+
+    def find_best_candidate(self, name, specifier):
+        version = self.versions.get(canonicalize_name(name))
+        best = None
+        if version is not None:
+            best = SimpleNamespace(
+                name=name,
+                version=parse_version(version),
+                link=Link(f"https://example.com/{name}-{version}.tar.gz"),
+            )
+        return SimpleNamespace(best_candidate=best)
+
+
+@pytest.fixture
+def finder():
+    return FakeFinder({"setuptools": "54.0", "wheel": "0.36.2"})
+
+
+def test_prefix_key(finder):
+    key = _get_prefix_key(finder, ["setuptools>=40", "wheel"])
+
+    assert key == _get_prefix_key(finder, ["wheel", "setuptools>=40"])
+    assert key != _get_prefix_key(finder, ["setuptools", "wheel"])
+
+    finder.versions["setuptools"] = "54.1"
+    assert key != _get_prefix_key(finder, ["setuptools>=40", "wheel"])
+
+
+def test_prefix_key_options(finder):
+    key = _get_prefix_key(finder, ["setuptools"])
+
+    finder.prefer_binary = True
+    assert key != _get_prefix_key(finder, ["setuptools"])
+
+
+def test_prefix_key_skips_other_environments(finder):
+    assert _get_prefix_key(
+        finder, ["setuptools", "missing; python_version < '3'"],
+    ) is not None
+
+
+def _write_dist_info(lib_dir, name, version, requires=()):
+    dist_info = os.path.join(lib_dir, f"{name}-{version}.dist-info")
+    os.makedirs(dist_info)
+    with open(os.path.join(dist_info, "METADATA"), "w") as f:
+        f.write(f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n")
+        for req in requires:
+            f.write(f"Requires-Dist: {req}\n")
+
+
+def test_prefix_current(tmpdir, finder):
+    lib_dir = str(tmpdir)
+    _write_dist_info(lib_dir, "setuptools_scm", "6.0", ["packaging>=20"])
+    _write_dist_info(lib_dir, "packaging", "20.9")
+    finder.versions.update({"setuptools-scm": "6.0", "packaging": "20.9"})
+
+    assert _is_prefix_current(finder, ["setuptools_scm"], [lib_dir])
+
+    # A new release of an indirect build requirement.
+    finder.versions["packaging"] = "21.0"
+    assert not _is_prefix_current(finder, ["setuptools_scm"], [lib_dir])
+
+
+def test_prefix_current_keeps_missing_candidates(tmpdir, finder):
+    lib_dir = str(tmpdir)
+    _write_dist_info(lib_dir, "setuptools_scm", "6.0", ["packaging>=20"])
+    _write_dist_info(lib_dir, "packaging", "20.9")
+    finder.versions.update({"setuptools-scm": "6.0"})
+
+    assert _is_prefix_current(finder, ["setuptools_scm"], [lib_dir])
+
+
+@pytest.mark.parametrize("requirements", [
+    ["setuptools", "missing"],
+    ["setuptools", "wheel @ https://example.com/wheel-0.36.2.tar.gz"],
+    ["setuptools", "not a requirement"],
+])
+def test_prefix_key_unknown(finder, requirements):
+    assert _get_prefix_key(finder, requirements) is None
+
+
+def _fake_install(standalone_pip, finder, requirements, prefix, message):
+    os.makedirs(prefix.path, exist_ok=True)
+    with open(os.path.join(prefix.path, "requirements.txt"), "w") as f:
+        f.write("\n".join(requirements))
+
+
+@mock.patch("pip._internal.build_env._create_standalone_pip", mock.MagicMock())
+def test_shared_prefix(tmpdir, finder):
+    store = BuildEnvironmentStore(os.path.join(tmpdir, "build-envs"))
+    with mock.patch.object(
+        BuildEnvironment, "_install_requirements", side_effect=_fake_install,
+    ) as install:
+        first = BuildEnvironment(store)
+        first.install_requirements(finder, ["setuptools"], "overlay", "")
+        second = BuildEnvironment(store)
+        second.install_requirements(finder, ["setuptools"], "overlay", "")
+        second.install_requirements(finder, ["wheel"], "normal", "")
+
+    assert install.call_count == 2
+    overlay = first._prefixes["overlay"].path
+    assert overlay.startswith(store.directory)
+    assert second._prefixes["overlay"].path == overlay
+    assert second._prefixes["normal"].path.startswith(store.directory)
+    with open(os.path.join(overlay, "requirements.txt")) as f:
+        assert f.read() == "setuptools"
+
+    # Each environment still has its own site customization, adding the
+    # shared prefixes.
+    with open(os.path.join(second._site_dir, "sitecustomize.py")) as f:
+        sitecustomize = f.read()
+    for lib_dir in second._lib_dirs:
+        assert repr(lib_dir) in sitecustomize
+    assert first._site_dir != second._site_dir
+
+
+@mock.patch("pip._internal.build_env._create_standalone_pip")
+def test_installer(create_standalone_pip, tmpdir, finder):
+    installer = mock.Mock()
+    env = BuildEnvironment(installer=installer)
+    env.install_requirements(finder, ["setuptools"], "overlay", "Installing")
+
+    installer.install.assert_called_once_with(
+        ["setuptools"], env._prefixes["overlay"].path, "Installing",
+    )
+    create_standalone_pip.assert_not_called()
+
+
+@mock.patch("pip._internal.build_env._create_standalone_pip")
+def test_installer_populates_store(create_standalone_pip, tmpdir, finder):
+    store = BuildEnvironmentStore(os.path.join(tmpdir, "build-envs"))
+    installer = mock.Mock()
+    installer.install.side_effect = lambda requirements, prefix, message: (
+        os.makedirs(prefix, exist_ok=True)
+    )
+    BuildEnvironment(store, installer).install_requirements(
+        finder, ["setuptools"], "overlay", "Installing",
+    )
+    env = BuildEnvironment(store, installer)
+    env.install_requirements(finder, ["setuptools"], "overlay", "Installing")
+
+    assert installer.install.call_count == 1
+    assert env._prefixes["overlay"].path.startswith(store.directory)
+    create_standalone_pip.assert_not_called()
+
+
+@mock.patch("pip._internal.build_env._create_standalone_pip", mock.MagicMock())
+def test_backend_workers(tmpdir, finder):
+    backend_workers = mock.Mock()
+    env = BuildEnvironment(backend_workers=backend_workers)
+    with mock.patch.object(BuildEnvironment, "_install_requirements"):
+        env.install_requirements(finder, ["setuptools"], "overlay", "")
+        env.install_requirements(finder, [], "normal", "")
+
+    # The worker of the environment does not see the new requirements.
+    backend_workers.discard.assert_called_once_with(env)
+    assert env.get_hook_runner("") is backend_workers.get_runner.return_value
+
+
+@pytest.fixture
+def find_links(tmpdir):
+    links = os.path.join(tmpdir, "links")
+    os.makedirs(links)
+    make_wheel(
+        "simple", "1.0", extra_files={"simple/__init__.py": "x = 1\n"},
+    ).save_to_dir(links)
+    # Only installable on another platform.
+    make_wheel(
+        "simple", "2.0", extra_files={"simple/__init__.py": "x = 2\n"},
+    ).save_to(os.path.join(links, "simple-2.0-py3-none-fakeplat.whl"))
+    return links
+
+
+def _install(tmpdir, finder, requirements):
+    prefix = os.path.join(tmpdir, "prefix")
+    session = PipSession()
+    with global_tempdir_manager(), get_requirement_tracker() as tracker:
+        installer = InProcessInstaller(
+            finder=finder,
+            session=session,
+            req_tracker=tracker,
+            wheel_cache=WheelCache(os.path.join(tmpdir, "cache"), FormatControl()),
+            build_dir=os.path.join(tmpdir, "build"),
+            src_dir=os.path.join(tmpdir, "src"),
+            progress_bar="off",
+            isolated=False,
+        )
+        installer.install(requirements, prefix, "Installing")
+    purelib = get_scheme("", prefix=prefix).purelib
+    with open(os.path.join(purelib, "simple", "__init__.py")) as f:
+        return f.read()
+
+
+def test_installer_installs_into_prefix(tmpdir, find_links):
+    finder = make_test_finder(find_links=[find_links])
+
+    assert _install(tmpdir, finder, ["simple"]) == "x = 1\n"
+
+
+def test_installer_resolves_for_running_python(tmpdir, find_links):
+    # As with pip download --platform, which still builds on this machine.
+    finder = make_test_finder(
+        find_links=[find_links],
+        target_python=TargetPython(platforms=["fakeplat"]),
+    )
+    assert str(
+        finder.find_best_candidate("simple").best_candidate.version
+    ) == "2.0"
+
+    assert _install(tmpdir, finder, ["simple"]) == "x = 1\n"
@@ -1,11 +1,20 @@
 import os
+from unittest import mock
 
+import pytest
 from pip._vendor.packaging.tags import Tag
 
-from pip._internal.cache import WheelCache, _hash_dict
+from pip._internal.cache import (
+    BuildEnvironmentStore,
+    SdistMetadataStore,
+    UnpackedWheelStore,
+    WheelCache,
+    _hash_dict,
+)
 from pip._internal.models.format_control import FormatControl
 from pip._internal.models.link import Link
 from pip._internal.utils.misc import ensure_dir
+from tests.lib.wheel import make_wheel
 
 
 def test_falsey_path_none():
@@ -72,3 +81,195 @@ def test_get_cache_entry(tmpdir):
         not wc.get_cache_entry(ephem_link, "ephem", supported_tags).persistent
     )
     assert wc.get_cache_entry(other_link, "other", supported_tags) is None
+
+
+def test_unpacked_wheel_store(tmpdir):
+    wheel_path = make_wheel(
+        "simple", "0.1.0", extra_files={"simple/__init__.py": "x = 1\n"},
+    ).save_to_dir(tmpdir)
+    store = UnpackedWheelStore(os.path.join(tmpdir, "unpacked"))
+
+    unpacked = store.get(wheel_path)
+    path = unpacked.get_path("simple/__init__.py")
+    with open(path) as f:
+        assert f.read() == "x = 1\n"
+    digest, size = unpacked.hashes["simple/__init__.py"]
+    assert digest.startswith("sha256=")
+    assert size == 6
+
+    # The wheel is not unpacked again.
+    with mock.patch("pip._internal.cache.ZipFile") as zip_file:
+        assert store.get(wheel_path).hashes == unpacked.hashes
+    zip_file.assert_not_called()
+
+
+def test_unpacked_wheel_store_discards_modified_entry(tmpdir):
+    wheel_path = make_wheel(
+        "simple", "0.1.0", extra_files={"simple/__init__.py": "x = 1\n"},
+    ).save_to_dir(tmpdir)
+    store = UnpackedWheelStore(os.path.join(tmpdir, "unpacked"))
+    path = store.get(wheel_path).get_path("simple/__init__.py")
+    os.chmod(path, 0o644)
+    with open(path, "w") as f:
+        f.write("x = 2 # edited through a hardlink\n")
+
+    unpacked = store.get(wheel_path)
+    with open(unpacked.get_path("simple/__init__.py")) as f:
+        assert f.read() == "x = 1\n"
+
+
+def test_unpacked_wheel_store_discards_entry_modified_in_place(tmpdir):
+    wheel_path = make_wheel(
+        "simple", "0.1.0", extra_files={"simple/__init__.py": "x = 1\n"},
+    ).save_to_dir(tmpdir)
+    store = UnpackedWheelStore(os.path.join(tmpdir, "unpacked"))
+    path = store.get(wheel_path).get_path("simple/__init__.py")
+    # The files are read-only, since installs may link to them.
+    assert not os.stat(path).st_mode & 0o222
+
+    mtime = os.stat(path).st_mtime_ns
+    os.chmod(path, 0o644)
+    with open(path, "r+") as f:
+        f.write("x = 2\n")
+    # Timestamps may be coarser than the time between the writes.
+    os.utime(path, ns=(mtime + 10 ** 9, mtime + 10 ** 9))
+
+    unpacked = store.get(wheel_path)
+    with open(unpacked.get_path("simple/__init__.py")) as f:
+        assert f.read() == "x = 1\n"
+
+
+def test_unpacked_wheel_store_keeps_touched_entry(tmpdir):
+    wheel_path = make_wheel(
+        "simple", "0.1.0", extra_files={"simple/__init__.py": "x = 1\n"},
+    ).save_to_dir(tmpdir)
+    store = UnpackedWheelStore(os.path.join(tmpdir, "unpacked"))
+    unpacked = store.get(wheel_path)
+    os.utime(unpacked.get_path("simple/__init__.py"))
+
+    # The file is hashed again, and still matches.
+    with mock.patch("pip._internal.cache.ZipFile") as zip_file:
+        assert store.get(wheel_path).hashes == unpacked.hashes
+    zip_file.assert_not_called()
+
+
+def test_unpacked_wheel_store_rejects_unsafe_paths(tmpdir):
+    wheel_path = make_wheel(
+        "simple", "0.1.0", extra_files={"../outside": "x"},
+    ).save_to_dir(tmpdir)
+    store = UnpackedWheelStore(os.path.join(tmpdir, "unpacked"))
+
+    assert store.get(wheel_path) is None
+    assert not os.path.exists(os.path.join(tmpdir, "outside"))
+    assert os.listdir(store.directory) == []
+
+
+def test_build_environment_store(tmpdir):
+    store = BuildEnvironmentStore(os.path.join(tmpdir, "build-envs"))
+    populated = []
+
+    def populate(path):
+        populated.append(path)
+        with open(os.path.join(path, "installed.txt"), "w") as f:
+            f.write("setuptools")
+
+    path = store.get("0123abcd", populate)
+    assert os.path.dirname(path) == os.path.join(
+        store.directory, "01", "23", "ab", "cd",
+    )
+    with open(os.path.join(path, "installed.txt")) as f:
+        assert f.read() == "setuptools"
+    # Builds share the entry, so its files are read-only.
+    assert not os.stat(os.path.join(path, "installed.txt")).st_mode & 0o222
+    # The entry was populated in another directory, which is gone.
+    assert populated[0] != path
+    assert not os.path.exists(populated[0])
+
+    assert store.get("0123abcd", populate) == path
+    assert len(populated) == 1
+
+
+def test_build_environment_store_generations(tmpdir):
+    store = BuildEnvironmentStore(os.path.join(tmpdir, "build-envs"))
+    populate = mock.Mock()
+    first = store.get("0123abcd", populate)
+
+    # An out of date generation is replaced.
+    second = store.get("0123abcd", populate, lambda path: False)
+    assert second != first
+    assert not os.path.exists(first)
+    assert populate.call_count == 2
+
+    assert store.get("0123abcd", populate, lambda path: True) == second
+    assert populate.call_count == 2
+
+    # But only once a new generation is stored.
+    populate.side_effect = RuntimeError("install failed")
+    with pytest.raises(RuntimeError):
+        store.get("0123abcd", populate, lambda path: False)
+    assert os.path.isdir(second)
+
+
+def test_build_environment_store_populate_error(tmpdir):
+    store = BuildEnvironmentStore(os.path.join(tmpdir, "build-envs"))
+
+    def populate(path):
+        with open(os.path.join(path, "partial.txt"), "w") as f:
+            f.write("")
+        raise RuntimeError("install failed")
+
+    with pytest.raises(RuntimeError):
+        store.get("0123abcd", populate)
+    assert os.listdir(store.directory) == []
+
+
+def test_build_environment_store_not_writable(tmpdir):
+    not_a_dir = os.path.join(tmpdir, "file")
+    with open(not_a_dir, "w") as f:
+        f.write("")
+    store = BuildEnvironmentStore(os.path.join(not_a_dir, "build-envs"))
+    populate = mock.Mock()
+
+    assert store.get("0123abcd", populate) is None
+    populate.assert_not_called()
+
+
+def test_sdist_metadata_store(tmpdir):
+    store = SdistMetadataStore(os.path.join(tmpdir, "sdist-metadata"))
+    metadata_directory = os.path.join(tmpdir, "build", "simple.egg-info")
+    ensure_dir(metadata_directory)
+    with open(os.path.join(metadata_directory, "PKG-INFO"), "w") as f:
+        f.write("Name: simple\nVersion: 1.0\n")
+
+    assert store.get("0123abcd") is None
+    store.save("0123abcd", metadata_directory)
+    entry_dir = store.get("0123abcd")
+    assert entry_dir == os.path.join(store.directory, "01", "23", "ab", "cd")
+    assert os.listdir(entry_dir) == ["simple.egg-info"]
+    with open(os.path.join(entry_dir, "simple.egg-info", "PKG-INFO")) as f:
+        assert f.read() == "Name: simple\nVersion: 1.0\n"
+    assert os.listdir(store.directory) == ["01"]
+
+
+def test_sdist_metadata_store_keeps_existing_entry(tmpdir):
+    store = SdistMetadataStore(os.path.join(tmpdir, "sdist-metadata"))
+    first = os.path.join(tmpdir, "first", "simple.dist-info")
+    second = os.path.join(tmpdir, "second", "other.dist-info")
+    ensure_dir(first)
+    ensure_dir(second)
+
+    store.save("0123abcd", first)
+    store.save("0123abcd", second)
+    assert os.listdir(store.get("0123abcd")) == ["simple.dist-info"]
+
+
+def test_sdist_metadata_store_not_writable(tmpdir):
+    not_a_dir = os.path.join(tmpdir, "file")
+    with open(not_a_dir, "w") as f:
+        f.write("")
+    store = SdistMetadataStore(os.path.join(not_a_dir, "sdist-metadata"))
+    metadata_directory = os.path.join(tmpdir, "simple.dist-info")
+    ensure_dir(metadata_directory)
+
+    store.save("0123abcd", metadata_directory)
+    assert store.get("0123abcd") is None
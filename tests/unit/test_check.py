@@ -1,26 +1,121 @@
 """Unit Tests for pip's dependency checking logic
 """
 
+import os
 from unittest import mock
 
+import pytest
+
+from pip._internal.metadata import get_environment
+from pip._internal.models.direct_url import ArchiveInfo, DirectUrl
 from pip._internal.operations import check
+from pip._internal.req.constructors import install_req_from_line
 
 
 class TestInstalledDistributionsCall:
 
     def test_passes_correct_default_kwargs(self, monkeypatch):
-        my_mock = mock.MagicMock(return_value=[])
-        monkeypatch.setattr(check, "get_installed_distributions", my_mock)
+        my_mock = mock.MagicMock()
+        my_mock.iter_installed_distributions.return_value = []
+        monkeypatch.setattr(check, "get_default_environment", lambda: my_mock)
 
         check.create_package_set_from_installed()
 
-        my_mock.assert_called_with(local_only=False, skip=())
+        my_mock.iter_installed_distributions.assert_called_with(
+            local_only=False, skip=(),
+        )
 
     def test_passes_any_given_kwargs(self, monkeypatch):
-        my_mock = mock.MagicMock(return_value=[])
-        monkeypatch.setattr(check, "get_installed_distributions", my_mock)
+        my_mock = mock.MagicMock()
+        my_mock.iter_installed_distributions.return_value = []
+        monkeypatch.setattr(check, "get_default_environment", lambda: my_mock)
 
         obj = object()
         check.create_package_set_from_installed(hi=obj)
 
-        my_mock.assert_called_with(hi=obj)
+        my_mock.iter_installed_distributions.assert_called_with(hi=obj)
+
+
+def _make_dist_info(
+    site, name, version, requires=(), extras=(), direct_url=None,
+):
+    dist_info = os.path.join(site, f"{name}-{version}.dist-info")
+    os.makedirs(dist_info)
+    metadata = [
+        "Metadata-Version: 2.1",
+        f"Name: {name}",
+        f"Version: {version}",
+    ]
+    metadata.extend(f"Provides-Extra: {extra}" for extra in extras)
+    metadata.extend(f"Requires-Dist: {req}" for req in requires)
+    with open(os.path.join(dist_info, "METADATA"), "w") as f:
+        f.write("\n".join(metadata) + "\n")
+    if direct_url is not None:
+        with open(os.path.join(dist_info, "direct_url.json"), "w") as f:
+            f.write(direct_url.to_json())
+
+
+class TestGetSatisfyingDistributions:
+
+    @pytest.fixture
+    def environment(self, tmpdir):
+        site = str(tmpdir)
+        _make_dist_info(
+            site, "a", "1.0", ["b>=2", "c[x]; extra == 'y'"], extras=["y"],
+        )
+        _make_dist_info(site, "b", "2.0")
+        _make_dist_info(site, "c", "1.0", ["d; extra == 'x'"], extras=["x"])
+        _make_dist_info(
+            site,
+            "e",
+            "1.0",
+            direct_url=DirectUrl(
+                url="https://example.com/e-1.0.tar.gz",
+                info=ArchiveInfo(hash="sha256=" + "1" * 64),
+            ),
+        )
+        return get_environment([site])
+
+    def test_satisfied(self, environment):
+        a = install_req_from_line("a==1.0")
+        b = install_req_from_line("b===2.0")
+        skipped = install_req_from_line("d==1.0; python_version < '3'")
+
+        satisfied = check.get_satisfying_distributions(
+            [a, b, skipped], environment,
+        )
+
+        assert [
+            (req, dist.canonical_name) for req, dist in satisfied
+        ] == [(a, "a"), (b, "b")]
+
+    @pytest.mark.parametrize("line", [
+        "a==2.0",
+        "a>=1.0",
+        "a==1.*",
+        "a",
+        "f==1.0",
+        # d, needed by extra x of c, is not installed.
+        "a[y]==1.0",
+    ])
+    def test_not_satisfied(self, environment, line):
+        req = install_req_from_line(line)
+        assert check.get_satisfying_distributions([req], environment) is None
+
+    @pytest.mark.parametrize("digest, satisfied", [
+        ("1" * 64, True),
+        ("2" * 64, False),
+    ])
+    def test_hash_of_recorded_archive(self, environment, digest, satisfied):
+        req = install_req_from_line(
+            "e==1.0", options={"hashes": {"sha256": [digest]}},
+        )
+        assert bool(
+            check.get_satisfying_distributions([req], environment)
+        ) is satisfied
+
+    def test_dependencies_not_checked(self, environment):
+        req = install_req_from_line("a[y]==1.0")
+        assert check.get_satisfying_distributions(
+            [req], environment, check_dependencies=False,
+        )
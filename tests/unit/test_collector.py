@@ -1,4 +1,5 @@
 import itertools
+import json
 import logging
 import os.path
 import re
@@ -14,6 +15,8 @@ from pip._vendor import html5lib, requests
 
 from pip._internal.exceptions import NetworkConnectionError
 from pip._internal.index.collector import (
+    SIMPLE_API_ACCEPT,
+    HTMLLinkParser,
     HTMLPage,
     LinkCollector,
     _clean_link,
@@ -22,8 +25,9 @@ from pip._internal.index.collector import (
     _get_html_page,
     _get_html_response,
     _make_html_page,
-    _NotHTML,
+    _NotAPIContent,
     _NotHTTP,
+    _parse_links_html5lib,
     parse_links,
 )
 from pip._internal.index.sources import _FlatDirectorySource, _IndexDirectorySource
@@ -61,7 +65,8 @@ def test_get_html_response_archive_to_http_scheme(mock_raise_for_status, url,
                                                   content_type):
     """
     `_get_html_response()` should send a HEAD request on an archive-like URL
-    if the scheme supports it, and raise `_NotHTML` if the response isn't HTML.
+    if the scheme supports it, and raise `_NotAPIContent` if the response isn't
+    a simple repository page.
     """
     session = mock.Mock(PipSession)
     session.head.return_value = mock.Mock(**{
@@ -69,7 +74,7 @@ def test_get_html_response_archive_to_http_scheme(mock_raise_for_status, url,
         "headers": {"Content-Type": content_type},
     })
 
-    with pytest.raises(_NotHTML) as ctx:
+    with pytest.raises(_NotAPIContent) as ctx:
         _get_html_response(url, session=session)
 
     session.assert_has_calls([
@@ -132,7 +137,7 @@ def test_get_html_response_archive_to_http_scheme_is_html(
     assert session.mock_calls == [
         mock.call.head(url, allow_redirects=True),
         mock.call.get(url, headers={
-            "Accept": "text/html", "Cache-Control": "max-age=0",
+            "Accept": SIMPLE_API_ACCEPT, "Cache-Control": "max-age=0",
         }),
     ]
     assert mock_raise_for_status.mock_calls == [
@@ -168,7 +173,7 @@ def test_get_html_response_no_head(mock_raise_for_status, url):
     assert session.head.call_count == 0
     assert session.get.mock_calls == [
         mock.call(url, headers={
-            "Accept": "text/html", "Cache-Control": "max-age=0",
+            "Accept": SIMPLE_API_ACCEPT, "Cache-Control": "max-age=0",
         }),
         mock.call().headers.get("Content-Type", ""),
     ]
@@ -450,6 +455,86 @@ def test_parse_links_caches_same_page_by_url():
     assert 'pkg2' in parsed_links_3[0].url
 
 
+@pytest.mark.parametrize(
+    ("html", "expected"),
+    [
+        (b"<html></html>", None),
+        (
+            b"<html><head>"
+            b"<base><base href=\"https://foo.example.com/\">"
+            b"<base href=\"https://bar.example.com/\">"
+            b"</head></html>",
+            "https://foo.example.com/",
+        ),
+    ],
+)
+def test_html_link_parser_base_url(html, expected):
+    parser = HTMLLinkParser()
+    parser.feed(html.decode("utf-8"))
+    assert parser.base_url == expected
+
+
+def test_html_link_parser_anchors():
+    parser = HTMLLinkParser()
+    parser.feed(
+        '<a href="/pkg-1.0.tar.gz" data-yanked data-requires-python="&gt;=3.6">'
+        '<a href="/pkg-2.0.tar.gz" href="/ignored.tar.gz">'
+    )
+    assert parser.anchors == [
+        {
+            "href": "/pkg-1.0.tar.gz",
+            "data-yanked": "",
+            "data-requires-python": ">=3.6",
+        },
+        {"href": "/pkg-2.0.tar.gz"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        b"<html><body>"
+        b"<a href=\"/pkg-1.0.tar.gz\" data-requires-python=\"&gt;=3.6\"></a>"
+        b"<a href=\"pkg 2.0.tar.gz\" data-yanked=\"bad\">pkg</a>"
+        b"<a>no href</a>"
+        b"</body></html>",
+        b"<html><head><base href=\"https://files.example.com/a/\"></head>"
+        b"<body><a href=\"../pkg-1.0.tar.gz#sha256=abc\"></a></body></html>",
+    ],
+)
+def test_parse_links_matches_html5lib(html):
+    page = HTMLPage(
+        html,
+        encoding="utf-8",
+        url="https://example.com/simple/",
+        cache_link_parsing=False,
+    )
+    links = list(parse_links(page))
+    expected = list(_parse_links_html5lib(page))
+    assert links
+    assert [link.url for link in links] == [link.url for link in expected]
+    assert [
+        (link.requires_python, link.yanked_reason) for link in links
+    ] == [(link.requires_python, link.yanked_reason) for link in expected]
+
+
+def test_parse_links_falls_back_to_html5lib(caplog):
+    caplog.set_level(logging.DEBUG)
+    html = (
+        '<html><head><meta charset="latin-1"></head>'
+        '<body><a href="/caf\xe9-1.0.tar.gz"></a></body></html>'
+    )
+    page = HTMLPage(
+        html.encode("latin-1"),
+        encoding=None,
+        url="https://example.com/simple/",
+        cache_link_parsing=False,
+    )
+    link, = parse_links(page)
+    assert link.url == "https://example.com/caf%C3%A9-1.0.tar.gz"
+    assert "Falling back to html5lib" in caplog.text
+
+
 @mock.patch("pip._internal.index.collector.raise_for_status")
 def test_request_http_error(mock_raise_for_status, caplog):
     caplog.set_level(logging.DEBUG)
@@ -488,6 +573,70 @@ def test_make_html_page():
     assert actual.content == b'<content>'
     assert actual.encoding == 'UTF-8'
     assert actual.url == 'https://example.com/index.html'
+    assert not actual.is_json
+
+
+def test_make_html_page_json():
+    response = pretend.stub(
+        content=b'{}',
+        url='https://example.com/simple/pip/',
+        headers={'Content-Type': 'application/vnd.pypi.simple.v1+json'},
+    )
+
+    actual = _make_html_page(response)
+    assert actual.is_json
+
+
+def test_parse_links_json():
+    json_bytes = json.dumps({
+        "meta": {"api-version": "1.0"},
+        "name": "holygrail",
+        "files": [
+            {
+                "filename": "holygrail-1.0.tar.gz",
+                "url": "https://example.com/files/holygrail-1.0.tar.gz",
+                "hashes": {"sha512": "def", "sha256": "abc"},
+                "requires-python": ">=3.7",
+                "yanked": "Had a vulnerability",
+            },
+            {
+                "filename": "holygrail-1.0-py3-none-any.whl",
+                "url": "/files/holygrail-1.0-py3-none-any.whl",
+                "hashes": {"sha256": "def"},
+                "requires-python": ">=3.7",
+                "dist-info-metadata": {"sha256": "aaa"},
+            },
+            {
+                "filename": "holygrail-2.0-py3-none-any.whl",
+                "url": "holygrail-2.0-py3-none-any.whl#sha512=fed",
+                "hashes": {"sha256": "abc"},
+                "yanked": True,
+                "dist-info-metadata": True,
+            },
+        ],
+    }).encode("utf8")
+    page = HTMLPage(
+        json_bytes,
+        encoding=None,
+        url="https://example.com/simple/holygrail/",
+        cache_link_parsing=False,
+        content_type="application/vnd.pypi.simple.v1+json",
+    )
+    links = list(parse_links(page))
+
+    assert [link.url for link in links] == [
+        "https://example.com/files/holygrail-1.0.tar.gz#sha256=abc",
+        "https://example.com/files/holygrail-1.0-py3-none-any.whl#sha256=def",
+        "https://example.com/simple/holygrail/"
+        "holygrail-2.0-py3-none-any.whl#sha512=fed",
+    ]
+    assert [link.requires_python for link in links] == [">=3.7", ">=3.7", None]
+    assert [link.yanked_reason for link in links] == [
+        "Had a vulnerability", None, "",
+    ]
+    assert [link.dist_info_metadata for link in links] == [
+        None, "sha256=aaa", "true",
+    ]
 
 
 @pytest.mark.parametrize(
@@ -527,7 +676,7 @@ def test_get_html_page_invalid_scheme(caplog, url, vcs_scheme):
 def test_get_html_page_invalid_content_type(mock_raise_for_status,
                                             caplog, content_type):
     """`_get_html_page()` should warn if an invalid content-type is given.
-    Only text/html is allowed.
+    Only HTML and PEP 691 JSON are allowed.
     """
     caplog.set_level(logging.DEBUG)
     url = 'https://pypi.org/simple/pip'
@@ -542,12 +691,33 @@ def test_get_html_page_invalid_content_type(mock_raise_for_status,
     mock_raise_for_status.assert_called_once_with(session.get.return_value)
     assert ('pip._internal.index.collector',
             logging.WARNING,
-            'Skipping page {} because the GET request got Content-Type: {}.'
-            'The only supported Content-Type is text/html'.format(
+            'Skipping page {} because the GET request got Content-Type: {}. '
+            'The only supported Content-Types are '
+            'application/vnd.pypi.simple.v1+json, '
+            'application/vnd.pypi.simple.v1+html, text/html'.format(
                 url, content_type)) \
         in caplog.record_tuples
 
 
+@pytest.mark.parametrize("content", [
+    b'{"meta": {"api-version": "1.0"}, "files": [{"url": "a-1.0.tar',
+    b"\xff not json",
+    b'["not", "an", "object"]',
+    b'{"files": {"url": "a-1.0.tar.gz"}}',
+])
+def test_parse_links_json_invalid(content, caplog):
+    page = HTMLPage(
+        content,
+        encoding=None,
+        url="https://example.com/simple/a/",
+        cache_link_parsing=False,
+        content_type="application/vnd.pypi.simple.v1+json",
+    )
+
+    assert list(parse_links(page)) == []
+    assert "Could not parse the JSON page" in caplog.text
+
+
 def make_fake_html_response(url):
     """
     Create a fake requests.Response object.
@@ -697,6 +867,43 @@ class TestLinkCollector:
             url, session=link_collector.session,
         )
 
+    @pytest.mark.parametrize("page, validators", [
+        (None, None),
+        (HTMLPage(b"", None, "https://example.com/", etag='"1"'), ('"1"', None)),
+    ])
+    def test_fetch_page_records_validators(self, page, validators):
+        url = "https://example.com/simple/twine/"
+        link_collector = make_test_link_collector()
+        with patch(
+            "pip._internal.index.collector._get_html_page", return_value=page,
+        ):
+            link_collector.fetch_page(Link(url))
+
+        assert link_collector.page_validators == {url: validators}
+
+    @pytest.mark.parametrize("etag, expected", [
+        ('"1"', ["https://example.com/files/twine-1.0.tar.gz"]),
+        ('"2"', None),
+    ])
+    def test_fetch_unchanged_links(self, etag, expected):
+        url = "https://example.com/simple/twine/"
+        page = HTMLPage(
+            b'<a href="/files/twine-1.0.tar.gz">twine-1.0.tar.gz</a>',
+            encoding=None,
+            url=url,
+            etag=etag,
+        )
+        link_collector = make_test_link_collector()
+        with patch(
+            "pip._internal.index.collector._get_html_page", return_value=page,
+        ):
+            links = link_collector.fetch_unchanged_links({url: ('"1"', None)})
+
+        if expected is None:
+            assert links is None
+        else:
+            assert [link.url for link in links] == expected
+
     def test_collect_sources(self, caplog, data):
         caplog.set_level(logging.DEBUG)
 
@@ -0,0 +1,124 @@
+"""Keep pip's startup fast, by checking which of the slow vendored packages
+each command imports.
+
+Import times are too noisy to assert on, so each command has a budget of
+the slow packages it is allowed to import instead.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pip
+from pip._internal.commands import commands_dict
+
+# Vendored packages that take long to import, and are only needed to access
+# the network, to resolve or build requirements, or by the pkg_resources
+# metadata backend.
+SLOW_PACKAGES = {
+    "cachecontrol",
+    "distlib",
+    "html5lib",
+    "msgpack",
+    "pep517",
+    "pkg_resources",
+    "requests",
+    "resolvelib",
+    "tenacity",
+    "toml",
+    "urllib3",
+}
+
+NETWORK = {"cachecontrol", "msgpack", "requests", "urllib3"}
+REQUIREMENTS = NETWORK | {"distlib", "pep517", "pkg_resources", "toml"}
+
+# The slow packages each command may import when it is created.
+COMMAND_BUDGETS = {
+    "install": REQUIREMENTS,
+    "download": REQUIREMENTS,
+    "uninstall": REQUIREMENTS,
+    "freeze": {"pkg_resources"},
+    "list": {"pkg_resources"},
+    "show": {"pkg_resources"},
+    "check": set(),
+    "config": set(),
+    "search": NETWORK,
+    "cache": set(),
+    "wheel": REQUIREMENTS,
+    "hash": set(),
+    "completion": set(),
+    "debug": set(),
+    "help": set(),
+}
+
+# The slow packages that some invocations may import when they run.
+RUN_BUDGETS = [
+    (["--version"], set()),
+    (["help"], set()),
+    (["freeze"], {"pkg_resources"}),
+    (["list"], {"pkg_resources"}),
+    (["list", "--format=json"], {"pkg_resources"}),
+    (["show", "pip"], {"pkg_resources"}),
+    (["check"], {"pkg_resources"}),
+    (["check", "--use-feature=dist-info-metadata"], set()),
+]
+
+SCRIPT = """
+import os
+import sys
+
+output = sys.argv.pop(1)
+mode = sys.argv.pop(1)
+if mode == "create":
+    from pip._internal.commands import create_command
+    create_command(sys.argv[1])
+else:
+    from pip._internal.cli.main import main
+    try:
+        main(sys.argv[1:])
+    except SystemExit:
+        pass
+with open(output, "w") as f:
+    f.write("\\n".join(sys.modules))
+"""
+
+
+def _slow_imports(tmpdir, mode, args):
+    output = str(tmpdir / "modules.txt")
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.path.dirname(os.path.dirname(pip.__file__)),
+        PIP_DISABLE_PIP_VERSION_CHECK="1",
+    )
+    subprocess.run(
+        [sys.executable, "-c", SCRIPT, output, mode] + args,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    with open(output) as f:
+        modules = f.read().splitlines()
+    return {
+        module.split(".")[2]
+        for module in modules
+        if module.startswith("pip._vendor.")
+    } & SLOW_PACKAGES
+
+
+def test_all_commands_have_a_budget():
+    assert set(COMMAND_BUDGETS) == set(commands_dict)
+
+
+@pytest.mark.parametrize("name", sorted(COMMAND_BUDGETS))
+def test_create_command_imports(tmpdir, name):
+    imported = _slow_imports(tmpdir, "create", [name])
+    assert imported <= COMMAND_BUDGETS[name]
+
+
+@pytest.mark.parametrize("args, budget", RUN_BUDGETS)
+def test_run_command_imports(tmpdir, args, budget):
+    imported = _slow_imports(tmpdir, "run", args)
+    assert imported <= budget
@@ -1,17 +1,22 @@
 import errno
+import logging
 from unittest.mock import patch
 
 import pytest
 from pip._vendor.packaging.requirements import Requirement
 
-from pip._internal.commands import install
+from pip._internal.commands import create_command, install
 from pip._internal.commands.install import (
     create_os_error_message,
     decide_user_install,
     reject_location_related_install_options,
 )
 from pip._internal.exceptions import CommandError
+from pip._internal.metadata import get_environment
+from pip._internal.network.session import PipSession
 from pip._internal.req.req_install import InstallRequirement
+from pip._internal.utils.misc import display_path
+from tests.lib import make_test_finder
 
 
 class TestDecideUserInstall:
@@ -115,3 +120,113 @@ def test_create_os_error_message(
     monkeypatch.setattr(install, "running_under_virtualenv", lambda: False)
     msg = create_os_error_message(error, show_traceback, using_user_site)
     assert msg == expected
+
+
+class TestAllPinsSatisfied:
+
+    @pytest.fixture
+    def environment(self, tmpdir):
+        dist_info = tmpdir / "simple-1.0.dist-info"
+        dist_info.mkdir()
+        dist_info.joinpath("METADATA").write_text(
+            "Metadata-Version: 2.1\nName: simple\nVersion: 1.0\n"
+        )
+        return get_environment([str(tmpdir)])
+
+    @pytest.mark.parametrize("args, satisfied", [
+        (["simple==1.0"], True),
+        (["simple==2.0"], False),
+        (["simple"], False),
+        (["--upgrade", "simple==1.0"], False),
+        (["--force-reinstall", "simple==1.0"], False),
+    ])
+    def test_check_without_session(
+        self, environment, monkeypatch, args, satisfied,
+    ):
+        monkeypatch.setattr(
+            install, "get_default_environment", lambda: environment,
+        )
+        command = create_command("install")
+        options, args = command.parse_args(args)
+        monkeypatch.setattr(command, "get_default_session", None)
+
+        assert command._all_pins_satisfied(args, options) is satisfied
+        if satisfied:
+            assert options.disable_pip_version_check
+
+    def test_remote_requirements_file(self, environment, monkeypatch):
+        monkeypatch.setattr(
+            install, "get_default_environment", lambda: environment,
+        )
+        command = create_command("install")
+        options, args = command.parse_args(
+            ["-r", "https://example.com/requirements.txt"],
+        )
+        monkeypatch.setattr(command, "get_default_session", None)
+
+        assert not command._all_pins_satisfied(args, options)
+
+    def test_requirements_file_read_once(
+        self, tmpdir, environment, monkeypatch,
+    ):
+        monkeypatch.setattr(
+            install, "get_default_environment", lambda: environment,
+        )
+        req_file = tmpdir / "requirements.txt"
+        req_file.write_text("--no-index\nsimple==2.0\n")
+        command = create_command("install")
+        options, args = command.parse_args(["-r", req_file])
+        monkeypatch.setattr(command, "get_default_session", None)
+
+        assert not command._all_pins_satisfied(args, options)
+
+        # The requirements are parsed again without reading the file, which
+        # may be a pipe, and the finder gets its options.
+        req_file.unlink()
+        finder = make_test_finder()
+        reqs = command.get_requirements(args, options, finder, PipSession())
+        assert [str(req.req) for req in reqs] == ["simple==2.0"]
+        assert finder.index_urls == []
+
+    @pytest.mark.parametrize("require_hashes", [False, True])
+    def test_missing_hashes(
+        self, tmpdir, environment, monkeypatch, require_hashes,
+    ):
+        monkeypatch.setattr(
+            install, "get_default_environment", lambda: environment,
+        )
+        (tmpdir / "other-1.0.dist-info").mkdir()
+        (tmpdir / "other-1.0.dist-info" / "METADATA").write_text(
+            "Metadata-Version: 2.1\nName: other\nVersion: 1.0\n"
+        )
+        req_file = tmpdir / "requirements.txt"
+        req_file.write_text(
+            "simple==1.0 --hash=sha256:{}\nother==1.0\n".format("0" * 64)
+        )
+        args = ["-r", req_file]
+        if require_hashes:
+            args.append("--require-hashes")
+        command = create_command("install")
+        options, args = command.parse_args(args)
+        monkeypatch.setattr(command, "get_default_session", None)
+
+        assert not command._all_pins_satisfied(args, options)
+
+    def test_message(self, tmpdir, environment, monkeypatch, caplog):
+        caplog.set_level(logging.INFO)
+        monkeypatch.setattr(
+            install, "get_default_environment", lambda: environment,
+        )
+        req_file = tmpdir / "requirements.txt"
+        req_file.write_text("simple==1.0\n")
+        command = create_command("install")
+        options, args = command.parse_args(["-r", req_file])
+        monkeypatch.setattr(command, "get_default_session", None)
+
+        assert command._all_pins_satisfied(args, options)
+        assert caplog.messages == [
+            "Requirement already satisfied: simple==1.0 in {} "
+            "(from -r {} (line 1)) (1.0)".format(
+                display_path(tmpdir), req_file,
+            ),
+        ]
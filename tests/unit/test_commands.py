@@ -82,7 +82,7 @@ def test_index_group_commands():
         (True, True, False),
     ],
 )
-@patch('pip._internal.cli.req_command.pip_self_version_check')
+@patch('pip._internal.self_outdated_check.pip_self_version_check')
 def test_index_group_handle_pip_version_check(
     mock_version_check, command_name, disable_pip_version_check, no_index,
     expected_called,
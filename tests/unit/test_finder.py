@@ -556,3 +556,28 @@ def test_find_all_candidates_find_links_and_index(data):
     versions = finder.find_all_candidates('simple')
     # first the find-links versions then the page versions
     assert [str(v.version) for v in versions] == ['3.0', '2.0', '1.0', '1.0']
+
+
+def test_find_all_candidates_prefetched(data):
+    finder = make_test_finder(find_links=[data.find_links])
+    with finder.prefetching():
+        finder.prefetch_candidates(['simple'])
+        future = finder._prefetched['simple']
+        versions = finder.find_all_candidates('simple')
+    assert future.done()
+    assert versions == future.result()
+    assert [str(v.version) for v in versions] == ['3.0', '2.0', '1.0']
+
+
+def test_prefetch_candidates_skips_known_projects(data):
+    finder = make_test_finder(find_links=[data.find_links])
+    finder.find_all_candidates('simple')
+    with finder.prefetching():
+        finder.prefetch_candidates(['simple'])
+    assert finder._prefetched == {'simple': None}
+
+
+def test_prefetch_candidates_without_prefetching(data):
+    finder = make_test_finder(find_links=[data.find_links])
+    finder.prefetch_candidates(['simple'])
+    assert not finder._prefetched
@@ -1,4 +1,5 @@
 import logging
+from unittest import mock
 
 import pytest
 from pip._vendor.packaging.specifiers import SpecifierSet
@@ -176,6 +177,35 @@ class TestLinkEvaluator:
         )
         assert actual == expected
 
+    def test_evaluate_links__uses_shared_evaluations(self):
+        evaluations = {}
+        evaluators = [
+            LinkEvaluator(
+                project_name=project_name,
+                canonical_name='twine',
+                formats={'source'},
+                target_python=TargetPython(py_version_info=(3, 6, 5)),
+                allow_yanked=True,
+                evaluations=evaluations,
+            )
+            for project_name in ['twine', 'Twine']
+        ]
+        links = [
+            Link('https://example.com/#egg=twine-1.12', requires_python='>=3'),
+            Link('https://example.com/#egg=twine-1.13', requires_python='>=4'),
+        ]
+        expected = [(links[0], (True, '1.12')), (links[1], (False, None))]
+        assert evaluators[0].evaluate_links(links) == expected
+
+        with mock.patch.object(LinkEvaluator, '_evaluate_link') as evaluate:
+            assert evaluators[1].evaluate_links(links) == expected
+            assert evaluators[1].evaluate_link(links[0]) == (True, '1.12')
+        evaluate.assert_not_called()
+
+        # The link's attributes are part of the key.
+        link = Link('https://example.com/#egg=twine-1.12', requires_python='>=4')
+        assert evaluators[1].evaluate_link(link) == (False, None)
+
 
 @pytest.mark.parametrize('hex_digest, expected_versions', [
     (None, ['1.0', '1.1', '1.2']),
@@ -675,6 +705,12 @@ class TestPackageFinder:
         assert actual_target_python._given_py_version_info == (3, 7)
         assert actual_target_python.py_version_info == (3, 7, 0)
 
+        # Evaluators for the same project share their evaluations.
+        other_evaluator = finder.make_link_evaluator('twine')
+        assert other_evaluator._evaluations is link_evaluator._evaluations
+        other_evaluator = finder.make_link_evaluator('pip')
+        assert other_evaluator._evaluations is not link_evaluator._evaluations
+
     @pytest.mark.parametrize('allow_all_prereleases, prefer_binary', [
         (False, False),
         (False, True),
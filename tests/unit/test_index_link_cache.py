@@ -0,0 +1,151 @@
+import os
+from unittest import mock
+
+import pytest
+
+from pip._internal.index.collector import HTMLPage, LinkCollector
+from pip._internal.index.link_cache import (
+    LinkCache,
+    deserialize_links,
+    serialize_links,
+)
+from pip._internal.models.link import Link
+from pip._internal.models.search_scope import SearchScope
+from pip._internal.network.session import PipSession
+
+PAGE_HTML = (
+    b'<html><body>'
+    b'<a href="/files/pkg-1.0.tar.gz#sha256=abc"'
+    b' data-requires-python="&gt;=3.6">pkg-1.0.tar.gz</a>'
+    b'<a href="/files/pkg-2.0.tar.gz" data-yanked="">pkg-2.0.tar.gz</a>'
+    b'<a href="/files/pkg-3.0-py3-none-any.whl"'
+    b' data-dist-info-metadata="true">pkg-3.0-py3-none-any.whl</a>'
+    b'</body></html>'
+)
+
+
+def make_page(content=PAGE_HTML, url="https://example.com/simple/pkg/",
+              etag='"1234"', last_modified=None):
+    return HTMLPage(
+        content,
+        encoding="utf-8",
+        url=url,
+        cache_link_parsing=False,
+        etag=etag,
+        last_modified=last_modified,
+    )
+
+
+@pytest.fixture
+def link_cache(tmpdir):
+    return LinkCache(os.path.join(tmpdir, "links"))
+
+
+def make_collector(link_cache):
+    return LinkCollector(
+        session=PipSession(),
+        search_scope=SearchScope.create(find_links=[], index_urls=[]),
+        link_cache=link_cache,
+    )
+
+
+def test_serialize_roundtrip():
+    links = [
+        Link("https://example.com/a.tar.gz#sha256=abc", requires_python=">=3"),
+        Link("https://example.com/b.tar.gz", yanked_reason=""),
+        Link("https://example.com/c.whl", dist_info_metadata="sha256=def"),
+    ]
+    page_url, loaded = deserialize_links(
+        serialize_links("https://example.com/simple/", links)
+    )
+
+    assert page_url == "https://example.com/simple/"
+    assert loaded == links
+    assert [
+        (link.requires_python, link.yanked_reason, link.dist_info_metadata)
+        for link in loaded
+    ] == [(">=3", None, None), (None, "", None), (None, None, "sha256=def")]
+    assert all(link.comes_from == page_url for link in loaded)
+
+
+@pytest.mark.parametrize("data", [
+    b"",
+    b"not an entry",
+    serialize_links("https://example.com/", [])[:-3],
+])
+def test_deserialize_invalid(data):
+    with pytest.raises(ValueError):
+        deserialize_links(data)
+
+
+def test_cache_roundtrip(link_cache):
+    page = make_page()
+    assert link_cache.get(page) is None
+
+    links = [Link("https://example.com/files/pkg-1.0.tar.gz")]
+    link_cache.set(page, links)
+
+    assert link_cache.get(page) == links
+    assert link_cache.get(make_page(etag='"5678"')) is None
+    assert link_cache.get(make_page(url="https://example.com/other/")) is None
+
+
+@pytest.mark.parametrize("page", [
+    make_page(etag=None),
+    make_page(url="file:///srv/simple/pkg/index.html"),
+])
+def test_cache_skips_unvalidated_pages(link_cache, page):
+    link_cache.set(page, [Link("https://example.com/files/pkg-1.0.tar.gz")])
+    assert link_cache.get(page) is None
+    assert not os.path.exists(link_cache.directory)
+
+
+def test_cache_ignores_corrupted_entry(link_cache):
+    page = make_page(etag=None, last_modified="Wed, 21 Oct 2015 07:28:00 GMT")
+    link_cache.set(page, [Link("https://example.com/files/pkg-1.0.tar.gz")])
+    path = link_cache._get_cache_path(page)
+    with open(path, "wb") as f:
+        f.write(b"garbage")
+
+    assert link_cache.get(page) is None
+
+
+def test_collector_parse_links_uses_cache(link_cache):
+    collector = make_collector(link_cache)
+    links = collector.parse_links(make_page())
+    assert [link.filename for link in links] == [
+        "pkg-1.0.tar.gz", "pkg-2.0.tar.gz", "pkg-3.0-py3-none-any.whl",
+    ]
+
+    # A revalidated page is not parsed again.
+    with mock.patch("pip._internal.index.collector.parse_links") as parse:
+        cached_links = collector.parse_links(make_page(content=b""))
+    parse.assert_not_called()
+    assert cached_links == links
+    assert [
+        (link.requires_python, link.yanked_reason, link.dist_info_metadata)
+        for link in cached_links
+    ] == [
+        (link.requires_python, link.yanked_reason, link.dist_info_metadata)
+        for link in links
+    ]
+
+
+def test_collector_does_not_cache_pages_without_links(link_cache):
+    collector = make_collector(link_cache)
+    page = HTMLPage(
+        b'{"files": [',
+        encoding=None,
+        url="https://example.com/simple/pkg/",
+        cache_link_parsing=False,
+        etag='"1234"',
+        content_type="application/vnd.pypi.simple.v1+json",
+    )
+    assert collector.parse_links(page) == []
+    assert link_cache.get(page) is None
+
+
+def test_collector_parse_links_without_cache():
+    collector = make_collector(None)
+    links = collector.parse_links(make_page())
+    assert len(links) == 3
@@ -1,3 +1,4 @@
+import io
 import logging
 from threading import Thread
 from unittest.mock import patch
@@ -6,9 +7,12 @@ import pytest
 
 from pip._internal.utils.logging import (
     BrokenStdoutLoggingError,
+    CaptureFilter,
     ColorizedStreamHandler,
     IndentingFormatter,
+    capture_logs,
     indent_log,
+    replay_logs,
 )
 from pip._internal.utils.misc import captured_stderr, captured_stdout
 
@@ -178,3 +182,61 @@ class TestColorizedStreamHandler:
         # Sanity check that the log record was written, since flush() happens
         # after write().
         assert output.startswith('my error')
+
+
+class TestCaptureLogs:
+
+    @pytest.fixture
+    def handler(self):
+        handler = logging.StreamHandler(io.StringIO())
+        handler.addFilter(CaptureFilter())
+        handler.setFormatter(IndentingFormatter(fmt="%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        yield handler
+        logger.removeHandler(handler)
+
+    def emitted(self, handler):
+        return handler.stream.getvalue().splitlines()
+
+    def test_capture_and_replay(self, handler):
+        logger.info("before")
+        with capture_logs() as records:
+            logger.info("first")
+            with indent_log():
+                logger.info("second")
+        assert [record.getMessage() for record in records] == [
+            "first", "second",
+        ]
+        assert self.emitted(handler) == ["before"]
+
+        with indent_log():
+            replay_logs(records)
+        assert self.emitted(handler) == ["before", "  first", "    second"]
+
+    def test_capture_per_thread(self, handler):
+        captured = []
+
+        def thread_function():
+            with capture_logs() as records:
+                logger.info("thread")
+            captured.extend(records)
+
+        with capture_logs() as records:
+            thread = Thread(target=thread_function)
+            thread.start()
+            thread.join()
+        assert [record.getMessage() for record in captured] == ["thread"]
+        assert records == []
+        assert self.emitted(handler) == []
+
+    def test_capture_once_per_record(self, handler):
+        other = logging.StreamHandler(io.StringIO())
+        other.addFilter(handler.filters[0])
+        logger.addHandler(other)
+        try:
+            with capture_logs() as records:
+                logger.info("shared")
+        finally:
+            logger.removeHandler(other)
+        assert len(records) == 1
@@ -0,0 +1,97 @@
+import os
+
+import pytest
+
+from pip._internal import metadata
+from pip._internal.metadata import dist_info, get_environment
+from pip._internal.metadata import pkg_resources as pkg_resources_backend
+from pip._internal.metadata import select_backend
+from pip._internal.models.direct_url import ArchiveInfo, DirectUrl
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+@pytest.fixture
+def site(tmpdir):
+    site = str(tmpdir / "site")
+    info = os.path.join(site, "Simple_Dist-1.0.dist-info")
+    _write(
+        os.path.join(info, "METADATA"),
+        "Metadata-Version: 2.1\n"
+        "Name: Simple-Dist\n"
+        "Version: 1.0\n"
+        "Provides-Extra: test\n"
+        "Requires-Dist: a (>=1)\n"
+        "Requires-Dist: b ; extra == 'test'\n",
+    )
+    _write(os.path.join(info, "INSTALLER"), "pip\n")
+    _write(
+        os.path.join(info, "direct_url.json"),
+        DirectUrl(
+            url="https://example.com/simple_dist-1.0.tar.gz",
+            info=ArchiveInfo(hash="sha256=abc"),
+        ).to_json(),
+    )
+    _write(
+        os.path.join(site, "legacy-2.0-py3.9.egg-info", "PKG-INFO"),
+        "Metadata-Version: 1.1\nName: legacy\nVersion: 2.0\n",
+    )
+    _write(
+        os.path.join(site, "legacy-2.0-py3.9.egg-info", "requires.txt"),
+        "simple-dist\n",
+    )
+    return site
+
+
+@pytest.fixture
+def backend():
+    yield select_backend
+    select_backend("pkg_resources")
+
+
+@pytest.mark.parametrize("name", metadata.BACKENDS)
+def test_backends_agree(site, backend, name):
+    backend(name)
+    env = get_environment([site])
+
+    assert sorted(d.canonical_name for d in env.iter_distributions()) == [
+        "legacy", "simple-dist",
+    ]
+    dist = env.get_distribution("simple.dist")
+    assert dist.canonical_name == "simple-dist"
+    assert str(dist.version) == "1.0"
+    assert dist.metadata_version == "2.1"
+    assert dist.installer == "pip"
+    assert dist.location == site
+    assert not dist.editable
+    assert dist.direct_url.info.hash == "sha256=abc"
+    assert [str(r) for r in dist.iter_dependencies()] == ["a>=1"]
+    assert sorted(r.name for r in dist.iter_dependencies(["test"])) == [
+        "a", "b",
+    ]
+    # Extras that are not provided are ignored.
+    assert [r.name for r in dist.iter_dependencies(["missing"])] == ["a"]
+
+    legacy = env.get_distribution("legacy")
+    assert str(legacy.version) == "2.0"
+    assert legacy.direct_url is None
+    assert [r.name for r in legacy.iter_dependencies()] == ["simple-dist"]
+
+    assert env.get_distribution("missing") is None
+
+
+def test_select_backend(backend):
+    backend("dist-info")
+    assert isinstance(
+        metadata.get_environment([]), dist_info.Environment,
+    )
+    backend("pkg_resources")
+    assert isinstance(
+        metadata.get_environment([]), pkg_resources_backend.Environment,
+    )
+    with pytest.raises(ValueError):
+        backend("missing")
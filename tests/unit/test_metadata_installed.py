@@ -0,0 +1,141 @@
+import os
+from unittest import mock
+
+import pytest
+from pip._vendor import pkg_resources
+from pip._vendor.packaging.requirements import InvalidRequirement
+
+from pip._internal.metadata import get_environment
+from pip._internal.metadata.installed import InstalledIndex
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+@pytest.fixture
+def site(tmpdir):
+    site = str(tmpdir / "site")
+    _write(
+        os.path.join(site, "Foo_Bar-1.0_1.dist-info", "METADATA"),
+        "Metadata-Version: 2.1\n"
+        "Name: Foo-Bar\n"
+        "Version: 1.0-1\n"
+        "Provides-Extra: Test\n"
+        "Requires-Dist: a>=1\n"
+        "Requires-Dist: b; extra == 'test'\n"
+        "Requires-Dist: c; python_version < '3'\n",
+    )
+    _write(
+        os.path.join(site, "egg-2.0-py3.8.egg-info", "PKG-INFO"),
+        "Metadata-Version: 1.1\nName: egg\nVersion: 2.0\n",
+    )
+    _write(
+        os.path.join(site, "egg-2.0-py3.8.egg-info", "requires.txt"),
+        "a\n\n[:python_version < '3']\nc\n\n[Extra One]\nb\n",
+    )
+    _write(
+        os.path.join(site, "single.egg-info"),
+        "Metadata-Version: 1.1\nName: single\nVersion: 3.0\n",
+    )
+    _write(os.path.join(site, "foo_bar", "__init__.py"), "")
+    return site
+
+
+def test_scan(site, tmpdir):
+    hidden = str(tmpdir / "hidden")
+    _write(
+        os.path.join(hidden, "foo_bar-2.0.dist-info", "METADATA"),
+        "Metadata-Version: 2.1\nName: foo-bar\nVersion: 2.0\n",
+    )
+    index = InstalledIndex([site, str(tmpdir / "missing"), hidden])
+
+    assert sorted(p.canonical_name for p in index) == [
+        "egg", "foo-bar", "single",
+    ]
+    project = index.get("FOO.BAR")
+    assert project.location == site
+    assert project.version == "1.0-1"
+    # The version comes from the directory name.
+    assert project._metadata is None
+    assert project.extras == ["test"]
+    assert [str(r) for r in project.iter_requires()] == ["a>=1"]
+    assert [str(r) for r in project.iter_requires(["Test"])] == [
+        "a>=1", 'b; extra == "test"',
+    ]
+    assert "missing" not in index
+
+
+def test_egg_info(site):
+    index = InstalledIndex([site])
+
+    egg = index.get("egg")
+    assert egg.version == "2.0"
+    assert egg.extras == ["extra_one"]
+    assert [str(r) for r in egg.iter_requires()] == ["a"]
+    assert [r.name for r in egg.iter_requires(["Extra One"])] == ["a", "b"]
+    assert index.get("single").version == "3.0"
+    assert index.get("single").requires == []
+
+
+def test_invalidate(site):
+    index = InstalledIndex([site])
+    assert "new" not in index
+    _write(
+        os.path.join(site, "new-1.0.dist-info", "METADATA"),
+        "Metadata-Version: 2.1\nName: new\nVersion: 1.0\n",
+    )
+    assert "new" not in index
+
+    generation = index.generation
+    index.invalidate()
+
+    assert index.generation == generation + 1
+    assert index.get("new").version == "1.0"
+
+
+def test_environment_skips_require_for_missing(site):
+    env = get_environment([site])
+    with mock.patch.object(
+        pkg_resources.WorkingSet, "require", side_effect=AssertionError,
+    ):
+        assert env.get_distribution("missing") is None
+        assert env.get_distribution("foo-bar").canonical_name == "foo-bar"
+
+
+def test_iter_requires_on_names(site):
+    _write(
+        os.path.join(site, "invalid-1.0.dist-info", "METADATA"),
+        "Metadata-Version: 2.1\nName: invalid\nVersion: 1.0\n"
+        "Requires-Dist: a>=1\n"
+        "Requires-Dist: b (>=\n",
+    )
+    project = InstalledIndex([site]).get("invalid")
+
+    # Only the requirements on the given names are parsed.
+    assert [str(r) for r in project.iter_requires(names={"a"})] == ["a>=1"]
+    with pytest.raises(InvalidRequirement):
+        list(project.iter_requires(names={"b"}))
+
+
+def test_metadata_with_blank_continuation_line(site):
+    _write(
+        os.path.join(site, "licensed-1.0.dist-info", "METADATA"),
+        "Metadata-Version: 2.1\nName: licensed\nVersion: 1.0\n"
+        "License: Copyright\n"
+        "        \n"
+        "        All rights reserved.\n"
+        "Provides-Extra: test\n"
+        "Requires-Dist: a>=1\n"
+        "Requires-Dist: b; extra == 'test'\n"
+        "\n"
+        "Requires-Dist: not-a-header\n",
+    )
+    project = InstalledIndex([site]).get("licensed")
+
+    assert project.extras == ["test"]
+    assert [str(r) for r in project.requires] == [
+        "a>=1", 'b; extra == "test"',
+    ]
@@ -171,6 +171,31 @@ class TestWheelFile:
         w = Wheel('simple-0.1-py2-none-TEST.whl')
         assert w.support_index_min(tags=tags) == 0
 
+    def test_supported_tag_priorities(self):
+        """
+        Test wheels are checked against a mapping of tags to priorities
+        """
+        tags = compatibility_tags.get_tag_priorities([
+            Tag('py2', 'none', 'TEST'),
+            Tag('py3', 'none', 'any'),
+        ])
+        assert Wheel('simple-0.1-py2.py3-none-any.whl').supported(tags)
+        assert not Wheel('simple-0.1-py2-none-any.whl').supported(tags)
+
+    def test_find_most_preferred_tag(self):
+        tags = [
+            Tag('py2', 'none', 'TEST'),
+            Tag('py2', 'TEST', 'any'),
+            Tag('py2', 'none', 'any'),
+        ]
+        priorities = compatibility_tags.get_tag_priorities(tags)
+        w = Wheel('simple-0.1-py2-none-any.whl')
+        assert w.find_most_preferred_tag(tags, priorities) == 2
+        w = Wheel('simple-0.1-py2-none-TEST.whl')
+        assert w.find_most_preferred_tag(tags, priorities) == 0
+        with pytest.raises(ValueError):
+            w.find_most_preferred_tag([], {})
+
     def test_support_index_min__none_supported(self):
         """
         Test a wheel not supported by the given tags.
@@ -1,14 +1,20 @@
+import hashlib
 import logging
+import os
 import sys
+import threading
 
 import pytest
 
+from pip._internal.exceptions import HashMismatch
 from pip._internal.models.link import Link
 from pip._internal.network.download import (
+    BatchDownloader,
     _prepare_download,
     parse_content_disposition,
     sanitize_content_filename,
 )
+from pip._internal.utils.hashes import Hashes
 from tests.lib.requests_mocks import MockResponse
 
 
@@ -90,3 +96,64 @@ def test_parse_content_disposition(
 ):
     actual = parse_content_disposition(content_disposition, default_filename)
     assert actual == expected
+
+
+class FakeSession:
+    """Serve files by URL, recording the threads downloading them."""
+
+    def __init__(self, files):
+        self.files = files
+        self.threads = set()
+        self.lock = threading.Lock()
+
+    def get(self, url, headers=None, stream=False):
+        with self.lock:
+            self.threads.add(threading.get_ident())
+        resp = MockResponse(self.files[url])
+        resp.url = url
+        resp.headers = {"Content-Type": "application/octet-stream"}
+        return resp
+
+
+def make_links(count):
+    files = {
+        f"https://example.com/pkg{i}-1.0-py3-none-any.whl": b"wheel %d" % i
+        for i in range(count)
+    }
+    return files, [Link(url) for url in files]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_batch_downloader(tmpdir, max_workers):
+    files, links = make_links(8)
+    session = FakeSession(files)
+    downloader = BatchDownloader(session, progress_bar="on",
+                                 max_workers=max_workers)
+
+    results = list(downloader(links, str(tmpdir)))
+
+    assert [link for link, _ in results] == links
+    for link, (filepath, content_type) in results:
+        assert filepath == os.path.join(str(tmpdir), link.filename)
+        assert content_type == "application/octet-stream"
+        with open(filepath, "rb") as f:
+            assert f.read() == files[link.url]
+    if max_workers == 1:
+        assert len(session.threads) == 1
+
+
+def test_batch_downloader_checks_hashes(tmpdir):
+    files, links = make_links(4)
+    good = {
+        link: Hashes({"sha256": [hashlib.sha256(files[link.url]).hexdigest()]})
+        for link in links
+    }
+    downloader = BatchDownloader(FakeSession(files), progress_bar="on",
+                                 max_workers=4)
+
+    assert len(list(downloader(links, str(tmpdir), hashes=good))) == 4
+
+    bad = dict(good)
+    bad[links[2]] = Hashes({"sha256": ["0" * 64]})
+    with pytest.raises(HashMismatch):
+        list(downloader(links, str(tmpdir), hashes=bad))
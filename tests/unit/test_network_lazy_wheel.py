@@ -5,9 +5,12 @@ from pytest import fixture, mark, raises
 
 from pip._internal.network.lazy_wheel import (
     HTTPRangeRequestUnsupported,
+    LazyZipOverHTTP,
+    _parse_multipart_byteranges,
     dist_from_wheel_url,
 )
 from pip._internal.network.session import PipSession
+from tests.lib.requests_mocks import MockResponse
 from tests.lib.server import file_response
 
 MYPY_0_782_WHL = (
@@ -59,3 +62,121 @@ def test_dist_from_wheel_url_not_zip(session):
     """Test handling with the given URL does not point to a ZIP."""
     with raises(BadZipfile):
         dist_from_wheel_url('python', 'https://www.python.org/', session)
+
+
+class RangeStream:
+    def __init__(self, contents):
+        self.contents = contents
+
+    def stream(self, size, decode_content=None):
+        for i in range(0, len(self.contents), size):
+            yield self.contents[i:i + size]
+
+
+class RangeResponse(MockResponse):
+    def __init__(self, contents):
+        super().__init__(contents)
+        self.raw = RangeStream(contents)
+
+    def close(self):
+        pass
+
+    def raise_for_status(self):
+        pass
+
+
+class RangeSession:
+    """Serve a file, answering range requests like a web server would."""
+
+    boundary = "3d6b6a416f9b5"
+
+    def __init__(self, content, multipart=True):
+        self.content = content
+        self.multipart = multipart
+        self.requests = []
+
+    def _slice(self, spec):
+        start, end = spec.split("-")
+        if not start:
+            start = max(0, len(self.content) - int(end))
+            end = len(self.content) - 1
+        return int(start), min(int(end), len(self.content) - 1)
+
+    def get(self, url, headers, stream):
+        self.requests.append(headers["Range"])
+        ranges = [
+            self._slice(spec) for spec in headers["Range"][6:].split(",")
+        ]
+        length = len(self.content)
+        if len(ranges) == 1 or not self.multipart:
+            start, end = ranges[0]
+            resp = RangeResponse(self.content[start:end + 1])
+            resp.headers = {"Content-Range": f"bytes {start}-{end}/{length}"}
+        else:
+            parts = []
+            for start, end in ranges:
+                parts.append(
+                    f"--{self.boundary}\r\n"
+                    "Content-Type: application/octet-stream\r\n"
+                    f"Content-Range: bytes {start}-{end}/{length}\r\n\r\n"
+                    .encode("ascii")
+                )
+                parts.append(self.content[start:end + 1] + b"\r\n")
+            parts.append(f"--{self.boundary}--\r\n".encode("ascii"))
+            resp = RangeResponse(b"".join(parts))
+            resp.headers = {
+                "Content-Type":
+                    f"multipart/byteranges; boundary={self.boundary}",
+            }
+        resp.status_code = 206
+        resp.reason = "Partial Content"
+        resp.url = url
+        return resp
+
+
+@fixture
+def mypy_whl_content(shared_data):
+    mypy_whl = shared_data.packages / 'mypy-0.782-py3-none-any.whl'
+    return mypy_whl.read_bytes()
+
+
+@mark.parametrize("multipart", [True, False])
+def test_dist_from_wheel_url_read_ahead(mypy_whl_content, multipart):
+    """Test that the metadata of a wheel is fetched in few requests."""
+    session = RangeSession(mypy_whl_content, multipart=multipart)
+    dist = dist_from_wheel_url('mypy', MYPY_0_782_WHL, session)
+    assert dist.version == '0.782'
+    assert set(dist.requires(dist.extras)) == MYPY_0_782_REQS
+    # The central directory of this wheel does not fit in the first
+    # request, but the .dist-info entries are fetched along with the rest
+    # of it.
+    assert session.requests[0] == "bytes=-65536"
+    assert len(session.requests) == 2
+
+
+def test_dist_from_wheel_url_multirange(mypy_whl_content):
+    """Test that several missing intervals are fetched in one request,
+    falling back to one request each if the server does not support it.
+    """
+    for multipart, expected in [(True, 1), (False, 3)]:
+        session = RangeSession(mypy_whl_content, multipart=multipart)
+        with LazyZipOverHTTP(MYPY_0_782_WHL, session) as wheel:
+            del session.requests[:]
+            wheel._download_intervals([(0, 9), (20, 29), (40, 49)])
+            for start in [0, 20, 40]:
+                wheel.seek(start)
+                assert wheel._file.read(10) == mypy_whl_content[start:start + 10]
+        assert len(session.requests) == expected
+
+
+def test_parse_multipart_byteranges():
+    body = (
+        b"--abc\r\nContent-Range: bytes 0-2/10\r\n\r\nfoo\r\n"
+        b"--abc\r\ncontent-range: bytes 7-9/10\r\n\r\nbar\r\n"
+        b"--abc--\r\n"
+    )
+    assert list(_parse_multipart_byteranges(body, "abc")) == [
+        (0, b"foo"), (7, b"bar"),
+    ]
+    with raises(ValueError):
+        list(_parse_multipart_byteranges(body[:40], "abc"))
@@ -0,0 +1,123 @@
+import logging
+import os
+import textwrap
+
+import pytest
+from pip._vendor.pep517.wrappers import Pep517HookCaller
+
+from pip._internal.exceptions import (
+    InstallationError,
+    InstallationSubprocessError,
+)
+from pip._internal.operations.build.backend_workers import BackendWorkerPool
+
+BACKEND = """
+import os
+import sys
+import time
+
+
+def get_requires_for_build_wheel(config_settings=None):
+    print("called in", os.getcwd())
+    return [str(os.getpid())]
+
+
+def build_wheel(wheel_directory, config_settings=None, metadata_directory=None):
+    if "sleep" in config_settings:
+        time.sleep(float(config_settings["sleep"]))
+    if "crash" in config_settings:
+        sys.stdout.flush()
+        os._exit(int(config_settings["crash"]))
+    print("failing")
+    sys.exit(int(config_settings["exit"]))
+"""
+
+
+@pytest.fixture
+def hooks(tmpdir):
+    source_dir = str(tmpdir / "source")
+    os.makedirs(source_dir)
+    with open(os.path.join(source_dir, "backend.py"), "w") as f:
+        f.write(textwrap.dedent(BACKEND))
+    return Pep517HookCaller(source_dir, "backend", backend_path=["."])
+
+
+@pytest.fixture
+def pool():
+    with BackendWorkerPool(timeout=10) as pool:
+        yield pool
+
+
+def _get_pid(pool, hooks, build_env):
+    with hooks.subprocess_runner(pool.get_runner(build_env, "Calling")):
+        [pid] = hooks.get_requires_for_build_wheel()
+    return pid
+
+
+def _build(pool, hooks, build_env, **config_settings):
+    with hooks.subprocess_runner(pool.get_runner(build_env, "Building")):
+        hooks.build_wheel(hooks.source_dir, config_settings)
+
+
+def test_worker_per_build_env(pool, hooks):
+    first, second = object(), object()
+    pid = _get_pid(pool, hooks, first)
+
+    assert pid != str(os.getpid())
+    assert _get_pid(pool, hooks, first) == pid
+    assert _get_pid(pool, hooks, second) != pid
+
+
+def test_output(pool, hooks, caplog):
+    caplog.set_level(logging.DEBUG)
+    _get_pid(pool, hooks, object())
+
+    assert f"called in {hooks.source_dir}" in caplog.messages
+
+
+def test_failure(pool, hooks):
+    build_env = object()
+    pid = _get_pid(pool, hooks, build_env)
+    with pytest.raises(InstallationSubprocessError) as e:
+        _build(pool, hooks, build_env, exit="2")
+
+    assert e.value.returncode == 2
+    assert _get_pid(pool, hooks, build_env) != pid
+
+
+def test_crash(pool, hooks):
+    build_env = object()
+    pid = _get_pid(pool, hooks, build_env)
+    with pytest.raises(InstallationSubprocessError) as e:
+        _build(pool, hooks, build_env, crash="3")
+
+    assert e.value.returncode == 3
+    assert _get_pid(pool, hooks, build_env) != pid
+
+
+def test_timeout(hooks):
+    build_env = object()
+    with BackendWorkerPool(timeout=0.5) as pool:
+        pid = _get_pid(pool, hooks, build_env)
+        with pytest.raises(InstallationError, match="timed out"):
+            _build(pool, hooks, build_env, sleep="10", exit="0")
+
+        assert _get_pid(pool, hooks, build_env) != pid
+
+
+def test_discard(pool, hooks):
+    build_env = object()
+    pid = _get_pid(pool, hooks, build_env)
+    pool.discard(build_env)
+
+    assert _get_pid(pool, hooks, build_env) != pid
+
+
+def test_max_workers(hooks):
+    first, second = object(), object()
+    with BackendWorkerPool(max_workers=1) as pool:
+        first_pid = _get_pid(pool, hooks, first)
+        second_pid = _get_pid(pool, hooks, second)
+
+        assert _get_pid(pool, hooks, second) == second_pid
+        assert _get_pid(pool, hooks, first) != first_pid
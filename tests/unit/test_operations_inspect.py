@@ -0,0 +1,123 @@
+import json
+import os
+
+import pytest
+
+from pip._internal import metadata
+from pip._internal.metadata import get_environment, select_backend
+from pip._internal.operations.inspect import (
+    FIELDS,
+    iter_installed_info,
+    iter_json_lines,
+)
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+@pytest.fixture(params=metadata.BACKENDS)
+def env(request, tmpdir):
+    site = str(tmpdir / "site")
+    info = os.path.join(site, "Simple_Dist-1.0.dist-info")
+    _write(
+        os.path.join(info, "METADATA"),
+        "Metadata-Version: 2.1\n"
+        "Name: Simple-Dist\n"
+        "Version: 1.0\n"
+        "Summary: A simple distribution.\n"
+        "Author: Someone\n"
+        "Classifier: Programming Language :: Python\n"
+        "Classifier: Topic :: Utilities\n"
+        "Requires-Dist: legacy\n"
+        "Requires-Dist: other ; python_version < '3'\n"
+        "\n"
+        "A long description.\n",
+    )
+    _write(os.path.join(info, "INSTALLER"), "pip\n")
+    _write(
+        os.path.join(info, "RECORD"),
+        "simple_dist/__init__.py,,\n"
+        "Simple_Dist-1.0.dist-info/METADATA,,\n",
+    )
+    _write(
+        os.path.join(info, "entry_points.txt"),
+        "[console_scripts]\nsimple = simple_dist:main\n",
+    )
+    egg_info = os.path.join(site, "legacy-2.0-py3.9.egg-info")
+    _write(
+        os.path.join(egg_info, "PKG-INFO"),
+        "Metadata-Version: 1.1\nName: legacy\nVersion: 2.0\n",
+    )
+    _write(os.path.join(egg_info, "installed-files.txt"), "../legacy.py\n")
+    _write(
+        os.path.join(site, "user-3.0.dist-info", "METADATA"),
+        "Metadata-Version: 2.1\nName: user\nVersion: 3.0\n"
+        "Requires-Dist: Simple.Dist (>=1)\n"
+        "Requires-Dist: legacy\n",
+    )
+
+    select_backend(request.param)
+    yield get_environment([site])
+    select_backend("pkg_resources")
+
+
+def _collect(env, names, fields):
+    dists = [env.get_distribution(name) for name in names]
+    return list(iter_installed_info(dists, fields, env))
+
+
+def test_all_fields(env):
+    [info] = _collect(env, ["simple-dist"], FIELDS)
+
+    assert info["name"] == "Simple-Dist"
+    assert info["version"] == "1.0"
+    assert info["metadata-version"] == "2.1"
+    assert info["summary"] == "A simple distribution."
+    assert info["author"] == "Someone"
+    assert info["license"] is None
+    assert info["installer"] == "pip"
+    assert not info["editable"]
+    assert info["classifiers"] == [
+        "Programming Language :: Python", "Topic :: Utilities",
+    ]
+    assert info["requires"] == ["legacy"]
+    assert info["required_by"] == ["user"]
+    assert info["entry_points"] == [
+        "[console_scripts]", "simple = simple_dist:main",
+    ]
+    assert info["files"] == [
+        os.path.join("Simple_Dist-1.0.dist-info", "METADATA"),
+        os.path.join("simple_dist", "__init__.py"),
+    ]
+
+
+def test_only_requested_fields(env):
+    legacy, user = _collect(env, ["legacy", "user"], ["name", "required_by"])
+
+    assert set(legacy) == {"name", "required_by"}
+    assert legacy["name"] == "legacy"
+    assert sorted(legacy["required_by"]) == ["Simple-Dist", "user"]
+    assert user == {"name": "user", "required_by": []}
+
+
+def test_egg_info_files(env):
+    [info] = _collect(env, ["legacy"], ["files", "entry_points"])
+
+    # Files of .egg-info directories are relative to the directory.
+    assert info == {"files": ["legacy.py"]}
+
+
+def test_unknown_field(env):
+    with pytest.raises(ValueError):
+        _collect(env, ["legacy"], ["name", "missing"])
+
+
+@pytest.mark.parametrize("items", [[], [{"a": 1}], [{"a": 1}, {"b": [2]}]])
+def test_iter_json_lines(items):
+    lines = list(iter_json_lines(iter(items)))
+
+    assert len(lines) == max(len(items), 1)
+    assert json.loads("\n".join(lines)) == items
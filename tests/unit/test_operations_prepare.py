@@ -1,3 +1,5 @@
+import functools
+import logging
 import os
 import shutil
 from shutil import rmtree
@@ -6,13 +8,30 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from pip._internal.exceptions import HashMismatch
+from pip._internal.cache import SdistMetadataStore, WheelCache
+from pip._internal.exceptions import HashMismatch, InstallationError
+from pip._internal.locations import get_scheme
+from pip._internal.models.format_control import FormatControl
 from pip._internal.models.link import Link
 from pip._internal.network.download import Downloader
 from pip._internal.network.session import PipSession
-from pip._internal.operations.prepare import _copy_source_tree, unpack_url
+from pip._internal.operations.prepare import (
+    RequirementPreparer,
+    _copy_source_tree,
+    unpack_url,
+)
+from pip._internal.req import install_given_reqs
+from pip._internal.req.constructors import (
+    install_req_from_line,
+    install_req_from_req_string,
+)
+from pip._internal.req.req_tracker import get_requirement_tracker
+from pip._internal.resolution.resolvelib.resolver import Resolver
 from pip._internal.utils.hashes import Hashes
+from pip._internal.utils.temp_dir import global_tempdir_manager
 from pip._internal.utils.urls import path_to_url
+from pip._internal.wheel_builder import build
+from tests.lib import make_test_finder
 from tests.lib.filesystem import get_filelist, make_socket_file, make_unreadable_file
 from tests.lib.path import Path
 from tests.lib.requests_mocks import MockResponse
@@ -241,3 +260,245 @@ def test_unpack_url_excludes_expected_dirs(tmpdir, exclude_dir):
     assert not os.path.isfile(dst_excluded_file)
     assert os.path.isfile(dst_included_file)
     assert os.path.isdir(dst_included_dir)
+
+
+@pytest.fixture
+def lazy_wheel_preparer(tmpdir):
+    return RequirementPreparer(
+        build_dir=os.path.join(tmpdir, "build"),
+        src_dir=os.path.join(tmpdir, "src"),
+        download_dir=None,
+        build_isolation=True,
+        req_tracker=Mock(),
+        session=Mock(),
+        progress_bar="on",
+        download_jobs=1,
+        finder=Mock(),
+        require_hashes=False,
+        use_user_site=False,
+        lazy_wheel=True,
+        in_tree_build=False,
+    )
+
+
+@patch("pip._internal.operations.prepare.dist_from_wheel_url")
+def test_prefetch_metadata(dist_from_wheel_url, lazy_wheel_preparer):
+    link = Link("https://example.com/simple-1.0-py3-none-any.whl")
+    lazy_wheel_preparer.prefetch_metadata(link)
+    lazy_wheel_preparer.prefetch_metadata(link)
+    dist_from_wheel_url.assert_called_once()
+
+    dist = lazy_wheel_preparer._fetch_metadata_using_lazy_wheel(link)
+    assert dist is dist_from_wheel_url.return_value
+    dist_from_wheel_url.assert_called_once()
+
+
+@patch("pip._internal.operations.prepare.dist_from_wheel_url")
+def test_prefetch_metadata_error(dist_from_wheel_url, lazy_wheel_preparer):
+    link = Link("https://example.com/simple-1.0-py3-none-any.whl")
+    dist_from_wheel_url.side_effect = OSError("connection reset")
+    lazy_wheel_preparer.prefetch_metadata(link)
+
+    # The metadata is fetched again when preparing, to fail there.
+    with pytest.raises(OSError):
+        lazy_wheel_preparer._fetch_metadata_using_lazy_wheel(link)
+    assert dist_from_wheel_url.call_count == 2
+
+
+@pytest.mark.parametrize("url", [
+    "https://example.com/simple-1.0.tar.gz",
+    "file:///tmp/simple-1.0-py3-none-any.whl",
+])
+@patch("pip._internal.operations.prepare.dist_from_wheel_url")
+def test_prefetch_metadata_skipped(
+    dist_from_wheel_url, lazy_wheel_preparer, url,
+):
+    lazy_wheel_preparer.prefetch_metadata(Link(url))
+    dist_from_wheel_url.assert_not_called()
+
+
+@pytest.fixture
+def sdist_metadata_preparer(tmpdir):
+    return RequirementPreparer(
+        build_dir=os.path.join(tmpdir, "build"),
+        src_dir=os.path.join(tmpdir, "src"),
+        download_dir=None,
+        build_isolation=True,
+        req_tracker=Mock(),
+        session=Mock(),
+        progress_bar="on",
+        download_jobs=1,
+        finder=Mock(),
+        require_hashes=False,
+        use_user_site=False,
+        lazy_wheel=False,
+        in_tree_build=False,
+        sdist_metadata_store=SdistMetadataStore(
+            os.path.join(tmpdir, "sdist-metadata")
+        ),
+    )
+
+
+def test_stored_sdist_metadata(sdist_metadata_preparer, data, tmpdir):
+    preparer = sdist_metadata_preparer
+    req = install_req_from_line(
+        "simple @ " + path_to_url(data.packages / "simple-1.0.tar.gz")
+    )
+    assert preparer.get_stored_sdist_metadata(req) is None
+
+    metadata_directory = os.path.join(tmpdir, "metadata", "simple.egg-info")
+    os.makedirs(metadata_directory)
+    with open(os.path.join(metadata_directory, "PKG-INFO"), "w") as f:
+        f.write("Metadata-Version: 1.1\nName: simple\nVersion: 1.0\n")
+    preparer.sdist_metadata_store.save(
+        preparer._get_sdist_metadata_key(req), metadata_directory
+    )
+
+    dist = preparer.get_stored_sdist_metadata(req)
+    assert (dist.project_name, dist.version) == ("simple", "1.0")
+    assert req.needs_more_preparation
+
+    # Unnamed requirements are named after the generated metadata.
+    unnamed = install_req_from_line(data.packages / "simple-1.0.tar.gz")
+    assert preparer.get_stored_sdist_metadata(unnamed) is None
+
+
+def test_sdist_metadata_key(sdist_metadata_preparer, data):
+    preparer = sdist_metadata_preparer
+    req = install_req_from_line(data.packages / "simple-1.0.tar.gz")
+    key = preparer._get_sdist_metadata_key(req)
+    assert key is not None
+
+    other = install_req_from_line(data.packages / "simple-2.0.tar.gz")
+    assert preparer._get_sdist_metadata_key(other) != key
+    # Without build isolation, the metadata may depend on what is installed.
+    preparer.build_isolation = False
+    assert preparer._get_sdist_metadata_key(req) is None
+
+
+@pytest.mark.parametrize("line, options", [
+    ("simple-1.0.tar.gz", {"hashes": {"sha256": ["0" * 64]}}),
+    ("simple.dist-0.1-py2.py3-none-any.whl", None),
+    ("https://example.com/simple-1.0.tar.gz", None),
+])
+def test_sdist_metadata_key_not_stored(
+    sdist_metadata_preparer, data, line, options,
+):
+    if not line.startswith("https:"):
+        line = data.packages / line
+    req = install_req_from_line(line, options=options)
+    assert sdist_metadata_preparer._get_sdist_metadata_key(req) is None
+
+
+def _make_sdist_metadata_preparer(tmpdir, finder, tracker, store):
+    # The setup.py shim quotes the paths with repr().
+    tmpdir = str(tmpdir)
+    return RequirementPreparer(
+        build_dir=os.path.join(tmpdir, "build"),
+        src_dir=os.path.join(tmpdir, "src"),
+        download_dir=None,
+        build_isolation=True,
+        req_tracker=tracker,
+        session=PipSession(),
+        progress_bar="off",
+        download_jobs=1,
+        finder=finder,
+        require_hashes=False,
+        use_user_site=False,
+        lazy_wheel=False,
+        in_tree_build=False,
+        sdist_metadata_store=store,
+    )
+
+
+def _resolve_and_install(tmpdir, data, store, prefix):
+    finder = make_test_finder(find_links=[data.find_links])
+    with global_tempdir_manager(), get_requirement_tracker() as tracker:
+        resolver = Resolver(
+            preparer=_make_sdist_metadata_preparer(
+                tmpdir, finder, tracker, store,
+            ),
+            finder=finder,
+            wheel_cache=WheelCache(
+                os.path.join(tmpdir, "cache"), FormatControl(),
+            ),
+            make_install_req=functools.partial(install_req_from_req_string),
+            use_user_site=False,
+            ignore_dependencies=False,
+            ignore_installed=True,
+            ignore_requires_python=False,
+            force_reinstall=False,
+            upgrade_strategy="to-satisfy-only",
+        )
+        req = install_req_from_line("simple==1.0", user_supplied=True)
+        requirement_set = resolver.resolve([req], check_supported_wheels=True)
+        reqs = list(requirement_set.requirements.values())
+        _, build_failures = build(
+            reqs,
+            wheel_cache=resolver.factory._wheel_cache,
+            verify=True,
+            build_options=[],
+            global_options=[],
+        )
+        assert not build_failures
+        install_given_reqs(
+            resolver.get_installation_order(requirement_set),
+            install_options=[],
+            global_options=[],
+            root=None,
+            home=None,
+            prefix=prefix,
+            warn_script_location=False,
+            use_user_site=False,
+            pycompile=False,
+        )
+    return reqs
+
+
+def test_stored_sdist_metadata_resolve_and_install(tmpdir, data, caplog):
+    caplog.set_level(logging.INFO)
+    store = SdistMetadataStore(os.path.join(tmpdir, "sdist-metadata"))
+    _resolve_and_install(
+        os.path.join(tmpdir, "first"), data, store,
+        os.path.join(tmpdir, "first-prefix"),
+    )
+    assert "Using cached metadata" not in caplog.text
+    assert os.listdir(store.directory)
+
+    prefix = os.path.join(tmpdir, "second-prefix")
+    reqs = _resolve_and_install(
+        os.path.join(tmpdir, "second"), data, store, prefix,
+    )
+    assert "Using cached metadata of simple-1.0.tar.gz" in caplog.text
+    req, = reqs
+    # The requirement was still fully prepared, and built to be installed.
+    assert not req.needs_more_preparation
+    assert req.metadata_directory is not None
+    assert req.local_file_path.endswith("simple-1.0-py3-none-any.whl")
+    purelib = get_scheme("", prefix=prefix).purelib
+    assert os.path.isfile(os.path.join(purelib, "simple", "__init__.py"))
+
+
+def test_stored_sdist_metadata_mismatch(tmpdir, data):
+    store = SdistMetadataStore(os.path.join(tmpdir, "sdist-metadata"))
+    finder = make_test_finder(find_links=[data.find_links])
+    req = install_req_from_line(
+        "simple @ " + path_to_url(data.packages / "simple-1.0.tar.gz")
+    )
+    with global_tempdir_manager(), get_requirement_tracker() as tracker:
+        preparer = _make_sdist_metadata_preparer(
+            tmpdir, finder, tracker, store,
+        )
+        key = preparer._get_sdist_metadata_key(req)
+        metadata_directory = os.path.join(tmpdir, "metadata", "simple.egg-info")
+        os.makedirs(metadata_directory)
+        with open(os.path.join(metadata_directory, "PKG-INFO"), "w") as f:
+            f.write("Metadata-Version: 1.1\nName: simple\nVersion: 1.0\n")
+        with open(os.path.join(metadata_directory, "requires.txt"), "w") as f:
+            f.write("simple2\n")
+        store.save(key, metadata_directory)
+        assert preparer.get_stored_sdist_metadata(req) is not None
+
+        with pytest.raises(InstallationError, match="does not match"):
+            preparer.prepare_linked_requirements_more([req])
+    assert store.get(key) is None
@@ -85,6 +85,7 @@ class TestRequirementSet:
                 req_tracker=tracker,
                 session=session,
                 progress_bar='on',
+                download_jobs=1,
                 finder=finder,
                 require_hashes=require_hashes,
                 use_user_site=False,
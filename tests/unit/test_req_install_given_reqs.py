@@ -0,0 +1,113 @@
+import os
+
+import pytest
+
+from pip._internal.locations import get_scheme
+from pip._internal.req import (
+    _find_conflicts,
+    _install_concurrently,
+    install_given_reqs,
+)
+from pip._internal.req.constructors import install_req_from_line
+from tests.lib.wheel import make_wheel
+
+
+def test_find_conflicts():
+    a = os.path.join(os.path.sep, "site", "a")
+    b = os.path.join(os.path.sep, "site", "b")
+    conflicts = _find_conflicts([
+        {os.path.join(a, "x.py")},
+        {os.path.join(b, "y.py")},
+        {os.path.join(a, "x.py"), os.path.join(a, "z.py")},
+        # e.g. an uninstall moving away a whole directory.
+        {a},
+        {os.path.join(b, "z.py")},
+        None,
+        {os.path.join(b, "w.py")},
+    ])
+    assert conflicts == [
+        set(), set(), {0}, {0, 2}, set(), {0, 1, 2, 3, 4}, {5},
+    ]
+
+
+def test_install_concurrently_stops_after_failure():
+    calls = []
+
+    def install(index):
+        calls.append(index)
+        if index == 1:
+            raise ValueError(index)
+
+    with pytest.raises(ValueError):
+        _install_concurrently(
+            ["a", "b", "c"], install, [set(), set(), {1}], max_workers=2,
+        )
+
+    # c waits for b, which failed.
+    assert sorted(calls) == [0, 1]
+
+
+def test_install_given_reqs_concurrently(tmpdir):
+    wheel_dir = str(tmpdir / "wheels")
+    os.makedirs(wheel_dir)
+    home = str(tmpdir / "home")
+
+    wheels = [
+        make_wheel(
+            name, "1.0", extra_files={
+                f"{name}.py": "",
+                # Conflicts with the same file in the other wheels.
+                "shared.txt": name,
+            },
+        ).save_to_dir(wheel_dir)
+        for name in ["a", "b", "c"]
+    ]
+    wheels.append(
+        make_wheel("d", "1.0", extra_files={"d.py": ""}).save_to_dir(wheel_dir)
+    )
+    reqs = [install_req_from_line(path) for path in wheels]
+
+    installed = install_given_reqs(
+        reqs,
+        [],
+        [],
+        root=None,
+        home=home,
+        prefix=None,
+        warn_script_location=False,
+        use_user_site=False,
+        pycompile=False,
+        install_jobs=4,
+    )
+
+    assert [result.name for result in installed] == ["a", "b", "c", "d"]
+    scheme = get_scheme("a", home=home)
+    for name in ["a", "b", "c", "d"]:
+        assert os.path.isfile(os.path.join(scheme.purelib, f"{name}.py"))
+    # The installs writing shared.txt ran in order.
+    with open(os.path.join(scheme.purelib, "shared.txt")) as f:
+        assert f.read() == "c"
+
+
+def test_get_install_paths(tmpdir):
+    wheel_path = make_wheel(
+        "simple",
+        "0.1.0",
+        extra_files={"simple/__init__.py": ""},
+        console_scripts=["simple = simple:main"],
+    ).save_to_dir(tmpdir)
+    req = install_req_from_line(wheel_path)
+    home = str(tmpdir / "home")
+
+    paths = req.get_install_paths(home=home)
+
+    scheme = get_scheme("simple", home=home)
+    assert os.path.normcase(
+        os.path.join(scheme.purelib, "simple", "__init__.py")
+    ) in {os.path.normcase(os.path.realpath(path)) for path in paths}
+    assert any(os.path.basename(path) == "simple" for path in paths)
+
+
+def test_get_install_paths_of_sdist():
+    req = install_req_from_line("simple==1.0")
+    assert req.get_install_paths() is None
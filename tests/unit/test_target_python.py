@@ -100,3 +100,12 @@ class TestTargetPython:
         target_python._valid_tags = ['tag-1', 'tag-2']
         actual = target_python.get_tags()
         assert actual == ['tag-1', 'tag-2']
+
+    def test_get_tag_priorities(self):
+        target_python = TargetPython(py_version_info=None)
+        target_python._valid_tags = ['tag-1', 'tag-2', 'tag-1']
+        actual = target_python.get_tag_priorities()
+        assert actual == {'tag-1': 0, 'tag-2': 1}
+
+        # Check that the value was cached.
+        assert target_python.get_tag_priorities() is actual
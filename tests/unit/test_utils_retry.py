@@ -0,0 +1,24 @@
+from unittest import mock
+
+import pytest
+
+from pip._internal.utils.retry import retry
+
+
+def test_retry_until_success():
+    func = mock.Mock(side_effect=[OSError, OSError, "result"])
+    with mock.patch("time.sleep") as sleep:
+        assert retry(wait=1, stop_after_delay=10)(func)("arg") == "result"
+    func.assert_called_with("arg")
+    assert func.call_count == 3
+    sleep.assert_called_with(1)
+
+
+def test_retry_reraises_last_error():
+    errors = [OSError("first"), OSError("last")]
+    func = mock.Mock(side_effect=errors)
+    with mock.patch("time.monotonic", side_effect=[0, 1, 5]):
+        with mock.patch("time.sleep"):
+            with pytest.raises(OSError, match="last"):
+                retry(wait=1, stop_after_delay=3)(func)()
+    assert func.call_count == 2
@@ -1,5 +1,6 @@
 import locale
 import sys
+import threading
 from logging import DEBUG, ERROR, INFO, WARNING
 from textwrap import dedent
 
@@ -14,6 +15,7 @@ from pip._internal.utils.subprocess import (
     make_command,
     make_subprocess_output_error,
     subprocess_logger,
+    thread_environ,
 )
 
 
@@ -412,3 +414,26 @@ def test_unicode_decode_error(caplog):
     assert len(caplog.records) == 2
     # First log record is "Running command ..."
     assert caplog.record_tuples[1] == ("pip.subprocessor", INFO, "\\xff")
+
+
+def test_thread_environ(monkeypatch):
+    monkeypatch.setenv("PIP_TEST_THREAD_ENVIRON", "process")
+    script = [
+        sys.executable, "-c",
+        "import os; print(os.environ['PIP_TEST_THREAD_ENVIRON'])",
+    ]
+    outputs = {}
+
+    def run(name):
+        outputs[name] = call_subprocess(script).strip()
+
+    with thread_environ({"PIP_TEST_THREAD_ENVIRON": "thread"}):
+        run("thread")
+        other = threading.Thread(target=run, args=("other",))
+        other.start()
+        other.join()
+    run("after")
+
+    assert outputs == {
+        "thread": "thread", "other": "process", "after": "process",
+    }
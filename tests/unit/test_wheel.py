@@ -1,5 +1,6 @@
 """Tests for wheel binary packages and .dist-info."""
 import csv
+import errno
 import logging
 import os
 import textwrap
@@ -9,6 +10,7 @@ from unittest.mock import patch
 import pytest
 from pip._vendor.packaging.requirements import Requirement
 
+from pip._internal.cache import UnpackedWheelStore
 from pip._internal.exceptions import InstallationError
 from pip._internal.locations import get_scheme
 from pip._internal.models.direct_url import (
@@ -188,6 +190,35 @@ def test_get_csv_rows_for_installed(tmpdir, caplog):
     assert len(caplog.records) == 0
 
 
+def test_get_csv_rows_for_installed__known_hashes(tmpdir):
+    lib_dir = str(tmpdir)
+    with open(os.path.join(lib_dir, "c"), "wb") as f:
+        f.write(b"c")
+    record_rows = [["a", "sha256=old", "1"], ["b", "sha256=old", "1"]]
+    known_hashes = {
+        "a": ("sha256=known", "2"),
+        "INSTALLER": ("sha256=installer", "4"),
+    }
+
+    with patch.object(wheel, "rehash", wraps=wheel.rehash) as rehash:
+        outrows = wheel.get_csv_rows_for_installed(
+            record_rows,
+            installed={"a": "a", "b": "c"},
+            changed={"a", "c"},
+            generated=[os.path.join(lib_dir, "INSTALLER")],
+            lib_dir=lib_dir,
+            known_hashes=known_hashes,
+        )
+
+    # Only the changed file without a known hash is read back.
+    rehash.assert_called_once_with(os.path.join(lib_dir, "c"))
+    assert outrows == [
+        ("a", "sha256=known", "2"),
+        ("c", wheel.hash_bytes(b"c")[0], "1"),
+        ("INSTALLER", "sha256=installer", "4"),
+    ]
+
+
 def test_get_csv_rows_for_installed__long_lines(tmpdir, caplog):
     text = textwrap.dedent("""\
     a,b,c,d
@@ -223,6 +254,26 @@ def test_wheel_root_is_purelib(text, expected):
     assert wheel.wheel_root_is_purelib(message_from_string(text)) == expected
 
 
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_bytecode_compiler_compile(tmpdir, jobs):
+    paths = []
+    for name, source in [("a", "x = 1\n"), ("b", "x = (\n"), ("c", "y = 2\n")]:
+        path = os.path.join(str(tmpdir), f"{name}.py")
+        with open(path, "w") as f:
+            f.write(source)
+        paths.append(path)
+
+    compiler = wheel.BytecodeCompiler(jobs=jobs)
+    try:
+        compiled = compiler.compile(paths)
+    finally:
+        compiler.finish()
+
+    # b.py has a syntax error.
+    assert list(compiled) == [paths[0], paths[2]]
+    assert all(os.path.isfile(pyc_path) for pyc_path in compiled.values())
+
+
 class TestWheelFile:
 
     def test_unpack_wheel_no_flatten(self, tmpdir):
@@ -401,6 +452,249 @@ class TestInstallUnpackedWheel:
         with open(os.path.join(self.dest_dist_info, "RECORD")) as f:
             assert DIRECT_URL_METADATA_NAME in f.read()
 
+    def test_std_install_with_extract_jobs(self, data, tmpdir):
+        self.prep(data, tmpdir)
+        wheel.install_wheel(
+            self.name,
+            self.wheelpath,
+            scheme=self.scheme,
+            req_description=str(self.req),
+            extract_jobs=4,
+        )
+        self.assert_installed(0o644)
+        with open(os.path.join(self.dest_dist_info, "RECORD")) as f:
+            record = f.read()
+
+        # RECORD is the same as when the files are extracted sequentially.
+        assert record == self.install_sequentially(tmpdir)
+
+    def install_sequentially(self, tmpdir):
+        """Install the sample wheel as usual, in another directory, and
+        return its RECORD.
+        """
+        dest = os.path.join(str(tmpdir), 'dest-sequential')
+        scheme = Scheme(
+            purelib=os.path.join(dest, 'lib'),
+            platlib=os.path.join(dest, 'lib'),
+            headers=os.path.join(dest, 'headers'),
+            scripts=os.path.join(dest, 'bin'),
+            data=os.path.join(dest, 'data'),
+        )
+        wheel.install_wheel(
+            self.name,
+            self.wheelpath,
+            scheme=scheme,
+            req_description=str(self.req),
+        )
+        dist_info = os.path.join(scheme.purelib, 'sample-1.2.0.dist-info')
+        with open(os.path.join(dist_info, "RECORD")) as f:
+            return f.read()
+
+    def test_std_install_with_compile_jobs(self, data, tmpdir):
+        self.prep(data, tmpdir)
+        compiler = wheel.BytecodeCompiler(jobs=2)
+        try:
+            wheel.install_wheel(
+                self.name,
+                self.wheelpath,
+                scheme=self.scheme,
+                req_description=str(self.req),
+                compiler=compiler,
+            )
+        finally:
+            compiler.finish()
+
+        with open(os.path.join(self.dest_dist_info, "RECORD")) as f:
+            record = f.read()
+        assert "__pycache__" in record
+        assert record == self.install_sequentially(tmpdir)
+
+    def test_std_install_with_deferred_compile(self, data, tmpdir):
+        self.prep(data, tmpdir)
+        compiler = wheel.BytecodeCompiler(defer=True)
+        wheel.install_wheel(
+            self.name,
+            self.wheelpath,
+            scheme=self.scheme,
+            req_description=str(self.req),
+            compiler=compiler,
+        )
+        pycache = os.path.join(self.scheme.purelib, 'sample', '__pycache__')
+        record_path = os.path.join(self.dest_dist_info, "RECORD")
+        assert not os.path.exists(pycache)
+        with open(record_path) as f:
+            assert "__pycache__" not in f.read()
+
+        compiler.finish()
+
+        assert os.listdir(pycache)
+        self.assert_permission(record_path, 0o644)
+        with open(record_path) as f:
+            assert f.read() == self.install_sequentially(tmpdir)
+
+    def test_std_install_with_wheel_store(self, data, tmpdir):
+        self.prep(data, tmpdir)
+        store = UnpackedWheelStore(os.path.join(str(tmpdir), 'unpacked'))
+        for _ in range(2):
+            wheel.install_wheel(
+                self.name,
+                self.wheelpath,
+                scheme=self.scheme,
+                req_description=str(self.req),
+                wheel_store=store,
+            )
+        # Hardlinks share the read-only mode of the files of the store.
+        self.assert_installed(0o444)
+
+        pkg_data = os.path.join(
+            self.scheme.purelib, 'sample', 'package_data.dat')
+        with open(pkg_data) as f:
+            assert f.read() == "some data"
+        stored = store.get(self.wheelpath).get_path('sample/package_data.dat')
+        if os.path.samefile(pkg_data, stored):
+            assert not os.stat(pkg_data).st_mode & 0o222
+        with open(os.path.join(self.dest_dist_info, "RECORD")) as f:
+            assert f.read() == self.install_sequentially(tmpdir)
+
+    def test_wheel_store_falls_back_to_copying(self, data, tmpdir):
+        self.prep(data, tmpdir)
+        store = UnpackedWheelStore(os.path.join(str(tmpdir), 'unpacked'))
+        error = OSError(errno.EXDEV, "Invalid cross-device link")
+        with patch.object(wheel.os, "link", side_effect=error):
+            wheel.install_wheel(
+                self.name,
+                self.wheelpath,
+                scheme=self.scheme,
+                req_description=str(self.req),
+                wheel_store=store,
+            )
+
+        self.assert_installed(0o644)
+        pkg_data = os.path.join(
+            self.scheme.purelib, 'sample', 'package_data.dat')
+        stored = store.get(self.wheelpath).get_path('sample/package_data.dat')
+        assert not os.path.samefile(pkg_data, stored)
+        # Copies are writable, unlike the files of the store.
+        self.assert_permission(pkg_data, 0o644)
+        assert not os.stat(stored).st_mode & 0o222
+
+    def test_wheel_store_does_not_link_scripts(self, data, tmpdir):
+        self.prep(data, tmpdir)
+        wheel_path = make_wheel(
+            "simple",
+            "0.1.0",
+            extra_data_files={"scripts/simple": "#!python\nprint(1)\n"},
+        ).save_to_dir(tmpdir)
+        store = UnpackedWheelStore(os.path.join(str(tmpdir), 'unpacked'))
+        wheel.install_wheel(
+            "simple",
+            str(wheel_path),
+            scheme=self.scheme,
+            req_description="simple",
+            wheel_store=store,
+        )
+
+        with open(os.path.join(self.scheme.scripts, "simple")) as f:
+            assert not f.readline().startswith("#!python")
+        stored = store.get(str(wheel_path)).get_path(
+            "simple-0.1.0.data/scripts/simple"
+        )
+        with open(stored) as f:
+            assert f.readline() == "#!python\n"
+
+    def test_wheel_store_hashes_in_record(self, data, tmpdir):
+        self.prep(data, tmpdir)
+
+        def tamper(records):
+            # A RECORD hash that does not match the file.
+            return [
+                (path, "sha256=wrong", size) if path == "simple/a.txt"
+                else (path, digest, size)
+                for path, digest, size in records
+            ]
+
+        wheel_path = make_wheel(
+            "simple",
+            "0.1.0",
+            extra_files={"simple/a.txt": "a\n"},
+            record_callback=tamper,
+        ).save_to_dir(tmpdir)
+        store = UnpackedWheelStore(os.path.join(str(tmpdir), 'unpacked'))
+        with patch.object(wheel, "rehash", wraps=wheel.rehash) as rehash:
+            wheel.install_wheel(
+                "simple",
+                str(wheel_path),
+                scheme=self.scheme,
+                req_description="simple",
+                wheel_store=store,
+            )
+
+        # The RECORD hashes of linked files are those of the store.
+        rehash.assert_not_called()
+        dist_info = os.path.join(self.scheme.purelib, "simple-0.1.0.dist-info")
+        with open(os.path.join(dist_info, "RECORD")) as f:
+            rows = {row[0]: tuple(row[1:]) for row in csv.reader(f)}
+        path = os.path.join(self.scheme.purelib, "simple", "a.txt")
+        assert rows["simple/a.txt"] == wheel.rehash(path)
+        assert rows["simple-0.1.0.dist-info/RECORD"] == ("", "")
+
+    def test_install_records_hashes_of_fixed_scripts(self, data, tmpdir):
+        self.prep(data, tmpdir)
+        wheel_path = make_wheel(
+            "simple",
+            "0.1.0",
+            extra_data_files={"scripts/simple": "#!python\nprint(1)\n"},
+            console_scripts=["simple-cmd = simple:main"],
+        ).save_to_dir(tmpdir)
+        with patch.object(wheel, "rehash", wraps=wheel.rehash) as rehash:
+            wheel.install_wheel(
+                "simple",
+                str(wheel_path),
+                scheme=self.scheme,
+                req_description="simple",
+                requested=True,
+            )
+
+        # Nothing written by the installer is read back to hash it.
+        rehash.assert_not_called()
+        dist_info = os.path.join(self.scheme.purelib, "simple-0.1.0.dist-info")
+        with open(os.path.join(dist_info, "RECORD")) as f:
+            rows = {row[0]: tuple(row[1:]) for row in csv.reader(f)}
+        for path in [
+            os.path.join(self.scheme.scripts, "simple"),
+            os.path.join(self.scheme.scripts, "simple-cmd"),
+            os.path.join(dist_info, "INSTALLER"),
+            os.path.join(dist_info, "REQUESTED"),
+        ]:
+            record_path = os.path.relpath(path, self.scheme.purelib)
+            assert rows[record_path.replace(os.path.sep, "/")] == (
+                wheel.rehash(path)
+            )
+
+    @pytest.mark.parametrize("extract_jobs", [1, 4])
+    def test_install_same_destination_keeps_order(
+        self, data, tmpdir, extract_jobs
+    ):
+        self.prep(data, tmpdir)
+        wheel_path = make_wheel(
+            "simple",
+            "0.1.0",
+            extra_files={"simple/data.txt": "root\n"},
+            extra_data_files={"purelib/simple/data.txt": "data\n"},
+        ).save_to_dir(tmpdir)
+        wheel.install_wheel(
+            "simple",
+            str(wheel_path),
+            scheme=self.scheme,
+            req_description="simple",
+            extract_jobs=extract_jobs,
+        )
+
+        # Files in .data are moved after those in the wheel root.
+        path = os.path.join(self.scheme.purelib, "simple", "data.txt")
+        with open(path) as f:
+            assert f.read() == "data\n"
+
     def test_install_prefix(self, data, tmpdir):
         prefix = os.path.join(os.path.sep, 'some', 'path')
         self.prep(data, tmpdir)
@@ -443,7 +737,10 @@ class TestInstallUnpackedWheel:
         "path",
         ["/tmp/example", "../example", "./../example"]
     )
-    def test_wheel_install_rejects_bad_paths(self, data, tmpdir, path):
+    @pytest.mark.parametrize("extract_jobs", [1, 4])
+    def test_wheel_install_rejects_bad_paths(
+        self, data, tmpdir, path, extract_jobs
+    ):
         self.prep(data, tmpdir)
         wheel_path = make_wheel(
             "simple", "0.1.0", extra_files={path: "example contents\n"}
@@ -454,6 +751,7 @@ class TestInstallUnpackedWheel:
                 str(wheel_path),
                 scheme=self.scheme,
                 req_description="simple",
+                extract_jobs=extract_jobs,
             )
 
         exc_text = str(e.value)
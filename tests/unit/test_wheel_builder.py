@@ -1,4 +1,5 @@
 import logging
+import time
 from unittest.mock import patch
 
 import pytest
@@ -6,6 +7,7 @@ import pytest
 from pip._internal import wheel_builder
 from pip._internal.models.link import Link
 from pip._internal.operations.build.wheel_legacy import format_command_result
+from pip._internal.utils.logging import CaptureFilter
 from tests.lib import _create_test_package
 
 
@@ -215,3 +217,63 @@ def test_format_command_result__empty_output(caplog, log_level):
         "Command arguments: arg1 arg2",
         'Command output: None',
     ]
+
+
+def _fake_build_one(durations):
+    """A _build_one() taking the given time for each requirement, and failing
+    for those without a duration.
+    """
+    def build_one(req, output_dir, verify, build_options, global_options):
+        wheel_builder.logger.info("Building %s", req.name)
+        if durations.get(req.name) is None:
+            return None
+        time.sleep(durations[req.name])
+        wheel_builder.logger.info("Built %s", req.name)
+        return "/tmp/wheels/{}-1.0-py3-none-any.whl".format(req.name)
+
+    return build_one
+
+
+@pytest.mark.parametrize("build_jobs", [1, 3])
+def test_build_jobs(caplog, build_jobs):
+    caplog.set_level(logging.INFO)
+    caplog.handler.addFilter(CaptureFilter())
+    reqs = [ReqMock(name=name) for name in ["a", "b", "c", "d"]]
+    durations = {"a": 0.2, "b": 0.1, "d": 0}
+
+    with patch.object(wheel_builder, "_get_cache_dir"), \
+            patch.object(wheel_builder, "_build_one",
+                         _fake_build_one(durations)):
+        successes, failures = wheel_builder.build(
+            reqs, wheel_cache=None, verify=False, build_options=[],
+            global_options=[], build_jobs=build_jobs,
+        )
+
+    assert [req.name for req in successes] == ["a", "b", "d"]
+    assert [req.name for req in failures] == ["c"]
+    assert reqs[0].link.filename == "a-1.0-py3-none-any.whl"
+    # The logs of each build are not interleaved with the others.
+    assert caplog.messages[1:-2] == [
+        "Building a", "Built a",
+        "Building b", "Built b",
+        "Building c",
+        "Building d", "Built d",
+    ]
+
+
+def test_build_jobs_error():
+    reqs = [ReqMock(name=name) for name in ["a", "b", "c"]]
+
+    def build_one(req, output_dir, verify, build_options, global_options):
+        if req.name == "b":
+            time.sleep(0.1)
+        raise ValueError(req.name)
+
+    with patch.object(wheel_builder, "_get_cache_dir"), \
+            patch.object(wheel_builder, "_build_one", build_one):
+        # b is the first to fail in order, even though c fails first.
+        with pytest.raises(ValueError, match="^b$"):
+            wheel_builder.build(
+                reqs[1:] + reqs[:1], wheel_cache=None, verify=False,
+                build_options=[], global_options=[], build_jobs=3,
+            )
@@ -0,0 +1,113 @@
+"""Compare the startup cost of the pkg_resources and dist-info metadata
+backends, listing the installed distributions and checking their
+dependencies as ``pip list`` and ``pip check`` do.
+
+Usage::
+
+    python tools/benchmarks/metadata_backends.py [DISTRIBUTIONS]
+
+Each run is a fresh interpreter, with a site directory of DISTRIBUTIONS
+(default 500) wheel-installed distributions first on its path, and
+includes importing the backend, since pkg_resources scans the path when
+it is imported.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+ROUNDS = 5
+
+SCRIPT = """
+import sys
+import time
+
+start = time.perf_counter()
+from pip._internal.metadata import get_default_environment, select_backend
+
+select_backend(sys.argv[1])
+env = get_default_environment()
+# Make sure the pkg_resources backend is imported.
+env.get_distribution("pip")
+created_at = time.perf_counter()
+listed = [
+    (dist.canonical_name, str(dist.version))
+    for dist in env.iter_installed_distributions(local_only=False)
+]
+listed_at = time.perf_counter()
+missing = [
+    req
+    for dist in env.iter_installed_distributions(local_only=False)
+    for req in dist.iter_dependencies()
+    if env.get_distribution(req.name) is None
+]
+checked_at = time.perf_counter()
+print(
+    len(listed),
+    len(missing),
+    created_at - start,
+    listed_at - created_at,
+    checked_at - listed_at,
+)
+"""
+
+
+def make_site(site, count):
+    for i in range(count):
+        info = os.path.join(site, "project{}-1.{}.dist-info".format(i, i))
+        os.makedirs(info)
+        requires = "".join(
+            "Requires-Dist: project{} (>=1)\n".format(dep)
+            for dep in range(i + 1, min(i + 4, count))
+        )
+        with open(os.path.join(info, "METADATA"), "w") as f:
+            f.write(
+                "Metadata-Version: 2.1\n"
+                "Name: project{0}\n"
+                "Version: 1.{0}\n"
+                "Summary: A project.\n"
+                "{1}"
+                "\n"
+                "{2}".format(i, requires, "A long description.\n" * 200)
+            )
+        for name, text in [("INSTALLER", "pip\n"), ("WHEEL", "")]:
+            with open(os.path.join(info, name), "w") as f:
+                f.write(text)
+        with open(os.path.join(info, "RECORD"), "w") as f:
+            f.write("project{}/__init__.py,,\n".format(i))
+
+
+def run(site, backend):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([site, SRC]))
+    best = None
+    for _ in range(ROUNDS):
+        output = subprocess.check_output(
+            [sys.executable, "-c", SCRIPT, backend], env=env,
+        )
+        listed, missing, *times = output.split()
+        if best is None or sum(map(float, times)) < sum(best):
+            best = [float(t) for t in times]
+    assert best is not None
+    return int(listed), int(missing), best
+
+
+def main(count=500):
+    with tempfile.TemporaryDirectory() as site:
+        make_site(site, count)
+        print("{} distributions".format(count))
+        print("  {:<14} {:>8} {:>8} {:>8}  (ms)".format(
+            "backend", "create", "list", "check",
+        ))
+        for backend in ["pkg_resources", "dist-info"]:
+            listed, missing, times = run(site, backend)
+            assert missing == 0
+            print("  {:<14} {:8.2f} {:8.2f} {:8.2f}  ({} listed)".format(
+                backend, *(t * 1000 for t in times), listed,
+            ))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,101 @@
+"""Compare the anchor parser used by parse_links() against html5lib.
+
+Usage::
+
+    python tools/benchmarks/parse_links.py [PAGE ...]
+
+Each PAGE is a simple repository page saved to disk, e.g. with
+``curl -o numpy.html https://pypi.org/simple/numpy/``. Without arguments,
+a synthetic page shaped like a PyPI project page with thousands of files is
+used instead.
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from pip._internal.index.collector import (  # noqa: E402
+    HTMLPage,
+    _parse_links_html5lib,
+    parse_links,
+)
+
+ROUNDS = 5
+
+
+def make_synthetic_page(releases=500, files_per_release=10):
+    anchors = []
+    for release in range(releases):
+        for build in range(files_per_release):
+            filename = "example-1.{}.0-cp39-cp39-manylinux_2_{}_x86_64.whl".format(
+                release, build,
+            )
+            anchors.append(
+                '<a href="https://files.example.com/packages/ab/cd/ef/{0}'
+                '#sha256={1}" data-requires-python="&gt;=3.6">{0}</a><br/>'.format(
+                    filename, "0123456789abcdef" * 4,
+                )
+            )
+    html = (
+        "<!DOCTYPE html><html><head><title>Links for example</title></head>"
+        "<body><h1>Links for example</h1>{}</body></html>"
+    ).format("\n".join(anchors))
+    return HTMLPage(
+        html.encode("utf-8"),
+        encoding="utf-8",
+        url="https://pypi.org/simple/example/",
+        cache_link_parsing=False,
+    )
+
+
+def load_page(path):
+    with open(path, "rb") as f:
+        content = f.read()
+    return HTMLPage(
+        content,
+        encoding="utf-8",
+        url="https://pypi.org/simple/{}/".format(
+            os.path.splitext(os.path.basename(path))[0]
+        ),
+        cache_link_parsing=False,
+    )
+
+
+def measure(func, page):
+    seconds = min(
+        timeit.repeat(lambda: list(func(page)), number=1, repeat=ROUNDS)
+    )
+    tracemalloc.start()
+    list(func(page))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main(paths):
+    if paths:
+        pages = [(path, load_page(path)) for path in paths]
+    else:
+        pages = [("synthetic", make_synthetic_page())]
+
+    for name, page in pages:
+        links = list(parse_links(page))
+        assert links == list(_parse_links_html5lib(page)), name
+        print("{} ({} links, {} KiB)".format(
+            name, len(links), len(page.content) // 1024,
+        ))
+        for label, func in [
+            ("html5lib", _parse_links_html5lib),
+            ("parse_links", parse_links),
+        ]:
+            seconds, peak = measure(func, page)
+            print("  {:<12} {:8.1f} ms  {:8.1f} MiB peak".format(
+                label, seconds * 1000, peak / 2 ** 20,
+            ))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
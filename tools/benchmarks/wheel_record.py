@@ -0,0 +1,131 @@
+"""Compare writing the RECORD of an installed wheel by reading changed and
+generated files back to hash them, against reusing the hashes computed as
+they were written.
+
+Usage::
+
+    python tools/benchmarks/wheel_record.py [SCRIPTS [MODULES]]
+
+The wheel is shaped like one of a large project shipping many scripts:
+SCRIPTS scripts (default 2000) starting with ``#!python``, each also
+exposed as a console entry point, and MODULES modules (default 2000).
+"""
+
+import contextlib
+import csv
+import hashlib
+import io
+import os
+import sys
+import tempfile
+import timeit
+import zipfile
+from base64 import urlsafe_b64encode
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from pip._internal.models.scheme import Scheme  # noqa: E402
+from pip._internal.operations.install import wheel  # noqa: E402
+
+ROUNDS = 5
+
+
+def make_wheel(path, scripts, modules):
+    files = {}
+    for i in range(modules):
+        files["example/mod{}.py".format(i)] = b"x = 1\n" * 500
+    for i in range(scripts):
+        files["example-1.0.data/scripts/tool{}".format(i)] = (
+            b"#!python\n" + b"print('tool')\n" * 200
+        )
+    files["example-1.0.dist-info/METADATA"] = (
+        b"Metadata-Version: 2.1\nName: example\nVersion: 1.0\n"
+    )
+    files["example-1.0.dist-info/WHEEL"] = (
+        b"Wheel-Version: 1.0\nRoot-Is-Purelib: true\nTag: py3-none-any\n"
+    )
+    files["example-1.0.dist-info/entry_points.txt"] = "".join(
+        ["[console_scripts]\n"]
+        + ["cmd{0} = example.mod{0}:main\n".format(i) for i in range(scripts)]
+    ).encode("utf-8")
+
+    record = io.StringIO()
+    writer = csv.writer(record)
+    for name, data in files.items():
+        digest = urlsafe_b64encode(hashlib.sha256(data).digest()).rstrip(b"=")
+        writer.writerow([name, "sha256=" + digest.decode("ascii"), len(data)])
+    writer.writerow(["example-1.0.dist-info/RECORD", "", ""])
+    files["example-1.0.dist-info/RECORD"] = record.getvalue().encode("utf-8")
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        for name, data in files.items():
+            z.writestr(name, data)
+
+
+def install(wheel_path, dest):
+    scheme = Scheme(
+        purelib=os.path.join(dest, "lib"),
+        platlib=os.path.join(dest, "lib"),
+        headers=os.path.join(dest, "headers"),
+        scripts=os.path.join(dest, "bin"),
+        data=os.path.join(dest, "data"),
+    )
+    wheel.install_wheel(
+        "example",
+        wheel_path,
+        scheme=scheme,
+        req_description="example",
+        pycompile=False,
+        warn_script_location=False,
+    )
+
+
+def read_back(get_csv_rows_for_installed):
+    """Ignore the known hashes, reading every changed and generated file
+    back instead.
+    """
+    def get_rows(*args, **kwargs):
+        kwargs.pop("known_hashes", None)
+        return get_csv_rows_for_installed(*args, **kwargs)
+    return get_rows
+
+
+def main(scripts=2000, modules=2000):
+    with tempfile.TemporaryDirectory() as tmp:
+        wheel_path = os.path.join(tmp, "example-1.0-py3-none-any.whl")
+        make_wheel(wheel_path, scripts, modules)
+        print("{} scripts, {} modules".format(scripts, modules))
+
+        for label, patch in [
+            ("read back", mock.patch.object(
+                wheel,
+                "get_csv_rows_for_installed",
+                read_back(wheel.get_csv_rows_for_installed),
+            )),
+            ("reuse", contextlib.nullcontext()),
+        ]:
+            read = []
+
+            def rehash(path, *args):
+                read.append(os.path.getsize(path))
+                return original_rehash(path, *args)
+
+            original_rehash = wheel.rehash
+            counter = mock.patch.object(wheel, "rehash", rehash)
+            dests = iter(range(ROUNDS))
+            with patch, counter:
+                seconds = min(timeit.repeat(
+                    lambda: install(
+                        wheel_path, os.path.join(tmp, label, str(next(dests)))
+                    ),
+                    number=1,
+                    repeat=ROUNDS,
+                ))
+            print("  {:<10} {:8.2f} ms, {:6d} files ({:8d} bytes) read back"
+                  .format(label, seconds * 1000, len(read) // ROUNDS,
+                          sum(read) // ROUNDS))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
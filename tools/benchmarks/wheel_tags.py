@@ -0,0 +1,93 @@
+"""Compare checking and ranking wheel tags by scanning the list of supported
+tags against looking them up in TargetPython.get_tag_priorities().
+
+Usage::
+
+    python tools/benchmarks/wheel_tags.py [PLATFORM ...]
+
+The files are shaped like those of a large binary project on PyPI: wheels
+for several CPython versions and platforms, for every release. PLATFORMs
+(e.g. ``manylinux2014_x86_64``) select the target; the default is the
+running interpreter's platform.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from pip._internal.models.target_python import TargetPython  # noqa: E402
+from pip._internal.models.wheel import Wheel  # noqa: E402
+
+ROUNDS = 5
+
+PLATFORMS = [
+    "manylinux1_x86_64",
+    "manylinux2010_x86_64",
+    "manylinux2014_x86_64",
+    "manylinux2014_aarch64",
+    "macosx_10_9_x86_64",
+    "macosx_11_0_arm64",
+    "win32",
+    "win_amd64",
+]
+
+
+def make_filenames(releases=100):
+    filenames = []
+    for release in range(releases):
+        version = "1.{}.0".format(release)
+        filenames.append("example-{}.tar.gz".format(version))
+        for minor in range(6, 14):
+            for platform in PLATFORMS:
+                filenames.append("example-{0}-cp3{1}-cp3{1}-{2}.whl".format(
+                    version, minor, platform,
+                ))
+    return filenames
+
+
+def scan_list(wheels, tags):
+    """The checks before priorities were precomputed."""
+    ranks = []
+    for wheel in wheels:
+        if not wheel.file_tags.isdisjoint(tags):
+            ranks.append(wheel.support_index_min(tags))
+    return ranks
+
+
+def look_up(wheels, priorities):
+    ranks = []
+    for wheel in wheels:
+        if wheel.supported(priorities):
+            ranks.append(wheel.find_most_preferred_tag([], priorities))
+    return ranks
+
+
+def main(platforms):
+    target_python = TargetPython(platforms=platforms or None)
+    tags = target_python.get_tags()
+    wheels = [
+        Wheel(filename) for filename in make_filenames()
+        if filename.endswith(".whl")
+    ]
+    priorities = target_python.get_tag_priorities()
+    assert scan_list(wheels, tags) == look_up(wheels, priorities)
+
+    print("{} wheels, {} supported tags, {} compatible wheels".format(
+        len(wheels), len(tags), len(look_up(wheels, priorities)),
+    ))
+    for label, func in [
+        ("list scan", lambda: scan_list(wheels, tags)),
+        ("priorities", lambda: look_up(wheels, priorities)),
+        # Include computing the mapping, as TargetPython does once.
+        ("priorities+", lambda: look_up(
+            wheels, TargetPython(platforms=platforms or None).get_tag_priorities()
+        )),
+    ]:
+        seconds = min(timeit.repeat(func, number=1, repeat=ROUNDS))
+        print("  {:<12} {:8.2f} ms".format(label, seconds * 1000))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])